@@ -4,13 +4,23 @@ Slack Response Router Module
 This module determines whether a bot should respond to messages in a Slack thread
 or remain silent. It uses an LLM to analyze the conversation context and make
 intelligent decisions about when the bot should engage.
+
+Obvious cases are decided by cheap rules before the LLM is asked (the latest
+message was written by a bot, mentions this agent, or only mentions someone
+else), and LLM decisions are cached by a hash of the thread content.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import re
+import threading
 import traceback
+from collections import OrderedDict
+from collections.abc import Collection
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -26,6 +36,16 @@ def _get_llm_classes():
 # Env var for silence model override
 _ENV_SILENCE_MODEL = "DCAF_SILENCE_MODEL_ID"
 
+# "@name" mentions (not e-mail addresses)
+_MENTION = re.compile(r"(?<![\w.])@([\w][\w.-]*)")
+
+ROUTING_TOOL_NAME = "slack_routing_decision"
+
+
+def _mention_name(name: str) -> str:
+    """Return how an agent name appears in an @mention (lowercase, no spaces)."""
+    return name.lower().replace(" ", "")
+
 
 class ChannelResponseRouter:
     """
@@ -35,6 +55,15 @@ class ChannelResponseRouter:
     def should_agent_respond(self, *args: Any, **kwargs: Any) -> Any:
         pass
 
+    async def should_agent_respond_async(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Async version of :meth:`should_agent_respond`.
+
+        The default runs the sync method in a worker thread; routers that can
+        decide without blocking should override it.
+        """
+        return await asyncio.to_thread(self.should_agent_respond, *args, **kwargs)
+
 
 class SlackResponseRouter(ChannelResponseRouter):
     """
@@ -53,6 +82,9 @@ class SlackResponseRouter(ChannelResponseRouter):
         agent_name: str = "Assistant",
         agent_description: str = "",
         model_id: str | None = None,
+        cache_size: int = 256,
+        prefilter: bool = True,
+        other_agents: Collection[str] = (),
     ):
         """
         Initialize the Slack Response Router.
@@ -63,6 +95,11 @@ class SlackResponseRouter(ChannelResponseRouter):
             agent_description: The description of the agent for context in decision making
             model_id: Model ID override. If None, uses DCAF_SILENCE_MODEL_ID env var
                       or provider default.
+            cache_size: LLM decisions kept, keyed by thread content (0 disables)
+            prefilter: Decide obvious cases with rules, without the LLM
+            other_agents: Names of the other agents in the channel; a message
+                          @mentioning one of them but not this agent is left to
+                          them without an LLM call
         """
         _LLM, _LLMResponse, _create_llm = _get_llm_classes()
 
@@ -78,6 +115,11 @@ class SlackResponseRouter(ChannelResponseRouter):
 
         self.agent_name = agent_name
         self.agent_description = agent_description
+        self.prefilter = prefilter
+        self.other_agents = {_mention_name(name) for name in other_agents}
+        self._cache_size = cache_size
+        self._decisions: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
 
     def _get_system_prompt(self) -> str:
         """
@@ -178,12 +220,111 @@ Focus primarily on the LATEST message, but use thread context to understand if t
         Returns:
             dict: {"should_respond": bool, "reasoning": str}
         """
+        decision = self._prefilter(slack_thread)
+        if decision is not None:
+            return decision
+
+        thread_text = self._thread_text(slack_thread)
+        key = self._cache_key(thread_text)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Call LLM with forced tool use — uses the DCAF LLM layer
+            response = self.llm_client.invoke(**self._routing_request(thread_text))
+        except Exception as e:
+            return self._router_error(e)
+
+        return self._store(key, self._parse_decision(response))
+
+    async def should_agent_respond_async(
+        self, slack_thread: str | list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Async version of :meth:`should_agent_respond` for use in async routes.
+
+        Uses ``llm_client.ainvoke`` when available, so the event loop is not
+        blocked while the LLM decides.
+        """
+        decision = self._prefilter(slack_thread)
+        if decision is not None:
+            return decision
+
+        thread_text = self._thread_text(slack_thread)
+        key = self._cache_key(thread_text)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        request = self._routing_request(thread_text)
+        try:
+            if hasattr(self.llm_client, "ainvoke"):
+                response = await self.llm_client.ainvoke(**request)
+            else:
+                response = await asyncio.to_thread(self.llm_client.invoke, **request)
+        except Exception as e:
+            return self._router_error(e)
+
+        return self._store(key, self._parse_decision(response))
+
+    def clear_cache(self) -> None:
+        """Forget all cached decisions."""
+        with self._lock:
+            self._decisions.clear()
+
+    def _prefilter(self, slack_thread: str | list[dict[str, Any]]) -> dict[str, Any] | None:
+        """
+        Decide obvious cases from the latest message without the LLM.
+
+        Only message lists are pre-filtered (a pre-formatted string does not
+        say reliably who wrote the latest message).  Returns None when the
+        LLM has to decide.
+        """
+        if not self.prefilter or not isinstance(slack_thread, list) or not slack_thread:
+            return None
+
+        latest = slack_thread[-1]
+        content = latest.get("content") or ""
+        if latest.get("role") == "assistant" or self._is_bot_author(latest) or not content.strip():
+            return {"should_respond": False, "reasoning": ""}
+        return self._mention_decision(content)
+
+    def _mention_decision(self, content: str) -> dict[str, Any] | None:
+        """
+        Respond when this agent is mentioned or addressed; stay silent for other agents.
+
+        Other mentions (people, ``@here``, raw user IDs) are left to the LLM.
+        """
+        mentions = {m.rstrip(".").lower() for m in _MENTION.findall(content)}
+        own_names = {self.agent_name.lower(), _mention_name(self.agent_name)}
+        if mentions & own_names:
+            return {"should_respond": True, "reasoning": f"{self.agent_name} was mentioned"}
+        if mentions & self.other_agents:
+            return {"should_respond": False, "reasoning": ""}
+
+        if re.match(rf"\s*(hey |hi )?{re.escape(self.agent_name)}\b", content, re.IGNORECASE):
+            return {"should_respond": True, "reasoning": f"Message addressed to {self.agent_name}"}
+
+        return None
+
+    @staticmethod
+    def _is_bot_author(message: dict[str, Any]) -> bool:
+        user = message.get("user")
+        if isinstance(user, dict) and (user.get("is_bot") or user.get("bot_id")):
+            return True
+        return bool(message.get("bot_id"))
+
+    def _thread_text(self, slack_thread: str | list[dict[str, Any]]) -> str:
         if isinstance(slack_thread, list):
-            slack_thread = self._format_slack_messages(slack_thread)
+            return self._format_slack_messages(slack_thread)
+        return slack_thread
 
+    def _routing_request(self, thread_text: str) -> dict[str, Any]:
+        """Build the LLM call deciding whether to respond."""
         # Tool schema for structured response
         routing_tool = {
-            "name": "slack_routing_decision",
+            "name": ROUTING_TOOL_NAME,
             "description": "Make a decision about whether the agent should respond to the latest Slack message",
             "input_schema": {
                 "type": "object",
@@ -201,51 +342,72 @@ Focus primarily on the LATEST message, but use thread context to understand if t
             },
         }
 
-        system_prompt = self._get_system_prompt()
-
         # Prepare messages for LLM
         messages = [
             {
                 "role": "user",
-                "content": f"Here is the complete Slack thread:\n\n{slack_thread}\n\nShould the agent respond to the latest message?",
+                "content": f"Here is the complete Slack thread:\n\n{thread_text}\n\nShould the agent respond to the latest message?",
             }
         ]
 
-        try:
-            # Call LLM with forced tool use — uses the DCAF LLM layer
-            response = self.llm_client.invoke(
-                messages=messages,
-                system_prompt=system_prompt,
-                tools=[routing_tool],
-                tool_choice={"name": "slack_routing_decision"},
-                max_tokens=200,
-                temperature=0.0,
-            )
-
-            logger.info("Slack Channel Router LLM Response: %s", response)
-
-            # Extract tool call result from normalized LLMResponse
-            if response.tool_calls:
-                tool_input = response.tool_calls[0].get("input", {})
-                return {
-                    "should_respond": tool_input.get("should_respond", False),
-                    "reasoning": tool_input.get("reasoning", "No reasoning provided"),
-                }
-
-            # Fallback: if model returned text instead of tool call
-            if response.text:
-                return {
-                    "should_respond": response.text.strip() == "1",
-                    "reasoning": "Inferred from text response",
-                }
+        return {
+            "messages": messages,
+            "system_prompt": self._get_system_prompt(),
+            "tools": [routing_tool],
+            "tool_choice": {"name": ROUTING_TOOL_NAME},
+            "max_tokens": 200,
+            "temperature": 0.0,
+        }
+
+    @staticmethod
+    def _parse_decision(response: Any) -> dict[str, Any]:
+        logger.info("Slack Channel Router LLM Response: %s", response)
 
+        # Extract tool call result from normalized LLMResponse
+        if response.tool_calls:
+            tool_input = response.tool_calls[0].get("input", {})
             return {
-                "should_respond": False,
-                "reasoning": "No tool call or text in response",
+                "should_respond": tool_input.get("should_respond", False),
+                "reasoning": tool_input.get("reasoning", "No reasoning provided"),
             }
 
-        except Exception as e:
-            # Fail safe - default to not responding if router fails
-            # Log the entire error stack trace
-            logger.error("Stack trace: %s", traceback.format_exc())
-            return {"should_respond": False, "reasoning": f"Router error: {str(e)}"}
+        # Fallback: if model returned text instead of tool call
+        if response.text:
+            return {
+                "should_respond": response.text.strip() == "1",
+                "reasoning": "Inferred from text response",
+            }
+
+        return {
+            "should_respond": False,
+            "reasoning": "No tool call or text in response",
+        }
+
+    @staticmethod
+    def _router_error(error: Exception) -> dict[str, Any]:
+        # Fail safe - default to not responding if router fails
+        # Log the entire error stack trace
+        logger.error("Stack trace: %s", traceback.format_exc())
+        return {"should_respond": False, "reasoning": f"Router error: {str(error)}"}
+
+    @staticmethod
+    def _cache_key(thread_text: str) -> str:
+        return hashlib.sha256(thread_text.encode()).hexdigest()
+
+    def _get_cached(self, key: str) -> dict[str, Any] | None:
+        if self._cache_size <= 0:
+            return None
+        with self._lock:
+            decision = self._decisions.get(key)
+            if decision is None:
+                return None
+            self._decisions.move_to_end(key)
+            return dict(decision)
+
+    def _store(self, key: str, decision: dict[str, Any]) -> dict[str, Any]:
+        if self._cache_size > 0:
+            with self._lock:
+                self._decisions[key] = dict(decision)
+                while len(self._decisions) > self._cache_size:
+                    self._decisions.popitem(last=False)
+        return decision
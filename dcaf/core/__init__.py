@@ -101,7 +101,7 @@ from .interceptors import (
 )
 
 # LLM Layer (for direct LLM calls without agent orchestration)
-from .llm import LLM, create_llm
+from .llm import LLM, InferenceConfig, LLMStreamChunk, create_llm
 from .llm import LLMResponse as LLMResponseBase
 from .models import ChatMessage, PlatformContext
 
@@ -180,6 +180,8 @@ __all__ = [
     # LLM Layer (direct LLM calls)
     "LLM",
     "LLMResponseBase",
+    "InferenceConfig",
+    "LLMStreamChunk",
     "create_llm",
     # Primitives API (for custom agent functions)
     "AgentResult",
@@ -10,6 +10,8 @@ Examples:
     - Message queue consumers
 """
 
+from .execution import ExecutionEngine
+from .history_compaction import HistoryCompactor
 from .server_adapter import ExecutorFn, ServerAdapter
 
-__all__ = ["ExecutorFn", "ServerAdapter"]
+__all__ = ["ExecutionEngine", "ExecutorFn", "HistoryCompactor", "ServerAdapter"]
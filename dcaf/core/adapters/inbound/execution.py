@@ -0,0 +1,217 @@
+"""
+Async execution engine for approved commands and tools.
+
+``ServerAdapter`` executes approvals inside ``async def invoke`` /
+``invoke_stream``.  Running ``subprocess.run`` or a synchronous tool there
+blocks the event loop for every other connected client, so the adapter goes
+through ``ExecutionEngine`` instead:
+
+- Shell commands run with ``asyncio.create_subprocess_shell``
+- Synchronous callables (tools, custom executors) run on a bounded thread pool
+- Every call has a timeout and an output size cap
+- ``gather`` runs calls one after the other, or concurrently when
+  ``max_concurrency`` > 1 (for independent calls), and returns results in order
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT_SECONDS = 300.0
+DEFAULT_MAX_OUTPUT_BYTES = 1_000_000
+DEFAULT_MAX_WORKERS = 8
+# Approvals of a request run in order by default: a command may depend on the one before
+DEFAULT_MAX_CONCURRENCY = 1
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+class ExecutionTimeoutError(TimeoutError):
+    """A command or tool did not finish within the engine's timeout."""
+
+
+@dataclass
+class ShellResult:
+    """Output of a shell command (both streams already capped)."""
+
+    stdout: str
+    stderr: str
+    returncode: int | None
+
+
+def cap_output(text: str, max_bytes: int) -> str:
+    """Truncate ``text`` to ``max_bytes`` (UTF-8), noting how much was dropped."""
+    data = text.encode()
+    if max_bytes <= 0 or len(data) <= max_bytes:
+        return text
+    kept = data[:max_bytes].decode(errors="ignore")
+    return f"{kept}\n... [output truncated: {len(data) - max_bytes} more bytes]"
+
+
+class ExecutionEngine:
+    """
+    Runs approved commands and tools without blocking the event loop.
+
+    Args:
+        timeout: Seconds each command or tool call may take
+        max_output_bytes: Output kept per stream / per tool result
+        max_workers: Threads for synchronous tools and executors
+        max_concurrency: Calls of one ``gather`` running at the same time (1: in order)
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self._max_workers = max_workers
+        self._max_concurrency = max(1, max_concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def from_env(cls) -> ExecutionEngine:
+        """
+        Create an engine from environment variables.
+
+        Environment Variables:
+            DCAF_EXECUTION_TIMEOUT_SECONDS: Per-call timeout (default 300)
+            DCAF_EXECUTION_MAX_OUTPUT_BYTES: Output cap (default 1000000)
+            DCAF_EXECUTION_MAX_WORKERS: Threads for sync tools (default 8)
+            DCAF_EXECUTION_MAX_CONCURRENCY: Parallel calls per request (default 1)
+        """
+        return cls(
+            timeout=float(
+                os.getenv("DCAF_EXECUTION_TIMEOUT_SECONDS", str(DEFAULT_TIMEOUT_SECONDS))
+            ),
+            max_output_bytes=int(
+                os.getenv("DCAF_EXECUTION_MAX_OUTPUT_BYTES", str(DEFAULT_MAX_OUTPUT_BYTES))
+            ),
+            max_workers=int(os.getenv("DCAF_EXECUTION_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+            max_concurrency=int(
+                os.getenv("DCAF_EXECUTION_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+            ),
+        )
+
+    async def gather(self, calls: Sequence[Callable[[], Awaitable[T]]]) -> list[T]:
+        """
+        Run calls; results are in the order given.
+
+        With ``max_concurrency`` 1 the calls run one after the other;
+        otherwise at most ``max_concurrency`` run at once, so the calls must
+        not depend on each other.  Exceptions propagate as with
+        ``asyncio.gather``.
+        """
+        if len(calls) <= 1 or self._max_concurrency == 1:
+            return [await call() for call in calls]
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def bounded(call: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                return await call()
+
+        return list(await asyncio.gather(*(bounded(call) for call in calls)))
+
+    async def run_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a synchronous callable on the thread pool.
+
+        Raises:
+            ExecutionTimeoutError: If it does not finish within the timeout.
+                The thread cannot be interrupted and finishes in the
+                background.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), lambda: fn(*args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except TimeoutError as e:
+            raise ExecutionTimeoutError(
+                f"{getattr(fn, '__name__', 'call')} timed out after {self.timeout:g}s"
+            ) from e
+
+    async def run_shell(self, command: str, cwd: str | None = None) -> ShellResult:
+        """
+        Run a shell command asynchronously.
+
+        The command runs in its own process group so that a timeout kills
+        everything it started, not only the shell.
+
+        Raises:
+            ExecutionTimeoutError: If the command does not finish within the
+                timeout (the process group is killed first).
+        """
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=True,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        try:
+            # One deadline covers both the output and the exit, so a command
+            # that closes its pipes and keeps running still gets self.timeout.
+            async with asyncio.timeout(self.timeout):
+                stdout, stderr = await asyncio.gather(
+                    self._read_capped(process.stdout),
+                    self._read_capped(process.stderr),
+                )
+                await process.wait()
+        except TimeoutError as e:
+            self._kill(process)
+            await process.wait()
+            raise ExecutionTimeoutError(
+                f"Command timed out after {self.timeout:g}s: {command}"
+            ) from e
+        except asyncio.CancelledError:
+            self._kill(process)
+            raise
+        return ShellResult(stdout=stdout, stderr=stderr, returncode=process.returncode)
+
+    def shutdown(self) -> None:
+        """Stop the thread pool (running calls are not interrupted)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="dcaf-exec"
+            )
+        return self._executor
+
+    async def _read_capped(self, stream: asyncio.StreamReader) -> str:
+        """Read a whole stream, keeping at most ``max_output_bytes`` of it."""
+        kept = bytearray()
+        dropped = 0
+        while chunk := await stream.read(_READ_CHUNK_BYTES):
+            room = self.max_output_bytes - len(kept) if self.max_output_bytes > 0 else len(chunk)
+            kept += chunk[:room]
+            dropped += len(chunk) - min(room, len(chunk))
+        text = kept.decode(errors="replace")
+        if dropped:
+            text += f"\n... [output truncated: {dropped} more bytes]"
+        return text
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(process.pid, signal.SIGKILL)
@@ -0,0 +1,118 @@
+"""
+Bounded compaction of re-injected execution history.
+
+Clients send back every earlier ``executed_cmds`` / ``executed_tool_calls`` /
+``executed_approvals`` entry on each request, and ``ServerAdapter`` folds them
+into the user messages so the model keeps context across turns.  Left alone,
+a long kubectl session resends all of that output on every turn.
+
+``HistoryCompactor`` bounds it, newest output first:
+
+- Identical outputs are sent once; older copies point to the newer one
+- Outputs over ``max_output_bytes`` keep only a head and tail excerpt
+- Once ``max_total_bytes`` is used up, older outputs are omitted (the command
+  or tool name stays, so the model still knows what was run)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+
+DEFAULT_MAX_OUTPUT_BYTES = 8_000
+DEFAULT_MAX_TOTAL_BYTES = 64_000
+
+DUPLICATE_OUTPUT = "[same output as a later execution]"
+
+
+@dataclass(frozen=True)
+class HistoryCompactor:
+    """
+    Compacts the outputs of previously executed commands and tools.
+
+    Attributes:
+        max_output_bytes: Per-output limit before head/tail excerpting
+                          (0 disables excerpting)
+        max_total_bytes: Budget for all re-injected outputs together
+                         (0 disables the budget)
+        dedupe: Replace repeated identical outputs with a reference
+    """
+
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES
+    max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES
+    dedupe: bool = True
+
+    @classmethod
+    def from_env(cls) -> HistoryCompactor:
+        """
+        Create a compactor from environment variables.
+
+        Environment Variables:
+            DCAF_HISTORY_OUTPUT_MAX_BYTES: Per-output limit (default 8000)
+            DCAF_HISTORY_OUTPUT_BUDGET_BYTES: Total budget (default 64000)
+        """
+        return cls(
+            max_output_bytes=int(
+                os.getenv("DCAF_HISTORY_OUTPUT_MAX_BYTES", str(DEFAULT_MAX_OUTPUT_BYTES))
+            ),
+            max_total_bytes=int(
+                os.getenv("DCAF_HISTORY_OUTPUT_BUDGET_BYTES", str(DEFAULT_MAX_TOTAL_BYTES))
+            ),
+        )
+
+    def compact(self, outputs: list[str]) -> list[str]:
+        """
+        Compact a conversation's execution outputs.
+
+        Args:
+            outputs: All re-injected outputs, oldest first
+
+        Returns:
+            The outputs to send, in the same order
+        """
+        result = list(outputs)
+        seen: set[bytes] = set()
+        remaining = self.max_total_bytes
+
+        for i in range(len(outputs) - 1, -1, -1):
+            output = outputs[i]
+            size = len(output.encode())
+
+            if self.dedupe and size > len(DUPLICATE_OUTPUT):
+                digest = hashlib.sha256(output.encode()).digest()
+                if digest in seen:
+                    result[i] = DUPLICATE_OUTPUT
+                    continue
+                seen.add(digest)
+
+            if self.max_output_bytes > 0 and size > self.max_output_bytes:
+                output = excerpt(output, self.max_output_bytes)
+                size = len(output.encode())
+
+            if self.max_total_bytes > 0:
+                if size > remaining:
+                    output = f"[output omitted: {len(outputs[i].encode())} bytes]"
+                else:
+                    remaining -= size
+
+            result[i] = output
+
+        return result
+
+
+def excerpt(text: str, max_bytes: int) -> str:
+    """
+    Keep the head and tail of ``text`` within about ``max_bytes``.
+
+    Command output usually carries its headers at the top and the errors or
+    summary at the bottom, so both ends are kept.
+    """
+    data = text.encode()
+    if len(data) <= max_bytes:
+        return text
+    half = max_bytes // 2
+    head = data[:half].decode(errors="ignore")
+    tail = data[-half:].decode(errors="ignore")
+    omitted = len(data) - 2 * half
+    return f"{head}\n... [{omitted} bytes omitted] ...\n{tail}"
@@ -17,10 +17,11 @@ Example:
 import logging
 import os
 import shutil
-import subprocess
 import tempfile
 from collections.abc import AsyncIterator, Callable
-from typing import Any, cast
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Generic, TypeVar, cast
 
 from ....schemas.events import (
     ApprovalsEvent,
@@ -40,11 +41,33 @@ from ....schemas.messages import (
     ExecutedToolCall,
 )
 from ...agent import Agent
+from .execution import ExecutionEngine, ExecutionTimeoutError, cap_output
+from .history_compaction import HistoryCompactor
 
 logger = logging.getLogger(__name__)
 
 ExecutorFn = Callable[[str, list[dict[str, Any]] | None, dict[str, Any] | None], str]
 
+T = TypeVar("T")
+
+
+@dataclass
+class _Pending(Generic[T]):
+    """
+    One approval from the latest message, planned for execution.
+
+    Exactly one of ``output`` (rejections), ``command`` or ``tool_name`` is set.
+    ``make_result`` builds the Executed* model from the output.
+    """
+
+    make_result: Callable[..., T]
+    command: str | None = None
+    tool_name: str | None = None
+    tool_input: dict[str, Any] = field(default_factory=dict)
+    files: list[dict[str, Any]] | None = None
+    context: dict[str, Any] | None = None
+    output: str | None = None
+
 
 class ServerAdapter:
     """
@@ -68,6 +91,12 @@ class ServerAdapter:
             Use this for domain-specific execution: kubeconfig injection, sandboxing,
             timeouts, environment setup. ``context`` carries the full platform_context
             including ``thread_id`` if sent by the client.
+        history_compactor: Bounds the prior command/tool output re-injected into
+            the conversation (see :class:`HistoryCompactor`). Defaults to
+            ``HistoryCompactor.from_env()``.
+        execution_engine: Runs approved commands and tools off the event loop,
+            concurrently, with timeouts and output caps (see
+            :class:`ExecutionEngine`). Defaults to ``ExecutionEngine.from_env()``.
 
     Example:
         from dcaf.core import Agent
@@ -104,9 +133,13 @@ class ServerAdapter:
         self,
         agent: Agent,
         execute_cmd: ExecutorFn | None = None,
+        history_compactor: HistoryCompactor | None = None,
+        execution_engine: ExecutionEngine | None = None,
     ) -> None:
         self.agent = agent
         self._cmd_executor = execute_cmd
+        self._history_compactor = history_compactor or HistoryCompactor.from_env()
+        self._engine = execution_engine or ExecutionEngine.from_env()
 
     async def invoke(self, messages: dict[str, list[dict[str, Any]]]) -> AgentMessage:
         """
@@ -133,14 +166,10 @@ class ServerAdapter:
         request_fields: dict[str, Any] = messages.get("_request_fields", {})  # type: ignore[assignment]
         context = {**request_fields, **platform_context} if request_fields else platform_context
 
-        # Check for approved tool calls that need to be processed
-        executed_tool_calls = self._process_approved_tool_calls(messages_list, context)
-
-        # Process legacy command approvals
-        executed_commands = self._process_approved_commands(messages_list, context)
-
-        # Process unified approvals
-        executed_approvals = self._process_approvals(messages_list, context)
+        # Execute approved tool calls, legacy commands and unified approvals
+        executed_tool_calls, executed_commands, executed_approvals = await self._execute_approvals(
+            messages_list, context
+        )
 
         # Convert to Core format and inject execution results
         core_messages = self._convert_messages(messages_list)
@@ -204,18 +233,14 @@ class ServerAdapter:
         request_fields: dict[str, Any] = messages.get("_request_fields", {})  # type: ignore[assignment]
         context = {**request_fields, **platform_context} if request_fields else platform_context
 
-        # Execute any approved tool calls before streaming
-        executed_tool_calls = self._process_approved_tool_calls(messages_list, context)
+        # Execute approved tool calls, legacy commands and unified approvals before streaming
+        executed_tool_calls, executed_commands, executed_approvals = await self._execute_approvals(
+            messages_list, context
+        )
         if executed_tool_calls:
             yield ExecutedToolCallsEvent(executed_tool_calls=executed_tool_calls)
-
-        # Process legacy command approvals
-        executed_commands = self._process_approved_commands(messages_list, context)
         if executed_commands:
             yield ExecutedCommandsEvent(executed_cmds=executed_commands)
-
-        # Process unified approvals
-        executed_approvals = self._process_approvals(messages_list, context)
         if executed_approvals:
             yield ExecutedApprovalsEvent(executed_approvals=executed_approvals)
 
@@ -261,6 +286,22 @@ class ServerAdapter:
             logger.exception(f"Stream error: {e}")
             yield ErrorEvent(error=str(e))
 
+    async def _execute_approvals(
+        self,
+        messages_list: list[dict[str, Any]],
+        context: dict[str, Any],
+    ) -> tuple[list[ExecutedToolCall], list[ExecutedCommand], list[ExecutedApproval]]:
+        """
+        Execute every approval of the latest message, off the event loop.
+
+        Tool calls, commands and unified approvals run in that order; within
+        each, see :meth:`_arun_pending`.
+        """
+        executed_tool_calls = await self._aprocess_approved_tool_calls(messages_list, context)
+        executed_commands = await self._aprocess_approved_commands(messages_list, context)
+        executed_approvals = await self._aprocess_approvals(messages_list, context)
+        return executed_tool_calls, executed_commands, executed_approvals
+
     def _inject_execution_results(
         self,
         core_messages: list[dict[str, Any]],
@@ -300,6 +341,8 @@ class ServerAdapter:
         Core format is simple: [{"role": "...", "content": "..."}]
         """
         core_messages = []
+        # Per user message: (label, output) of each prior execution
+        executions: list[list[tuple[str, str]]] = []
 
         for msg in messages_list:
             role = msg.get("role")
@@ -310,15 +353,41 @@ class ServerAdapter:
                 # Re-inject prior execution history so the LLM has context across
                 # turns. Clients send back executed_cmds / executed_tool_calls /
                 # executed_approvals from previous turns in every request.
+                entries: list[tuple[str, str]] = []
                 if role == "user":
                     data = msg.get("data", {})
                     for ec in data.get("executed_cmds", []):
-                        content += f"\n\nPreviously executed: {ec.get('command', '')}\nOutput: {ec.get('output', '')}"
+                        entries.append(
+                            (f"Previously executed: {ec.get('command', '')}", ec.get("output", ""))
+                        )
                     for tc in data.get("executed_tool_calls", []):
-                        content += f"\n\nPreviously executed tool: {tc.get('name', '')} with inputs {tc.get('input', {})}\nOutput: {tc.get('output', '')}"
+                        entries.append(
+                            (
+                                f"Previously executed tool: {tc.get('name', '')} "
+                                f"with inputs {tc.get('input', {})}",
+                                tc.get("output", ""),
+                            )
+                        )
                     for ea in data.get("executed_approvals", []):
-                        content += f"\n\nPreviously executed: {ea.get('name', '')} with inputs {ea.get('input', {})}\nOutput: {ea.get('output', '')}"
+                        entries.append(
+                            (
+                                f"Previously executed: {ea.get('name', '')} "
+                                f"with inputs {ea.get('input', {})}",
+                                ea.get("output", ""),
+                            )
+                        )
                 core_messages.append({"role": role, "content": content})
+                executions.append(entries)
+
+        # Bound the re-injected outputs across the whole conversation
+        outputs = self._history_compactor.compact(
+            [str(output or "") for entries in executions for _, output in entries]
+        )
+        position = 0
+        for message, entries in zip(core_messages, executions, strict=True):
+            for label, _ in entries:
+                message["content"] += f"\n\n{label}\nOutput: {outputs[position]}"
+                position += 1
 
         return core_messages
 
@@ -341,7 +410,7 @@ class ServerAdapter:
                     return platform_context if isinstance(platform_context, dict) else {}
         return {}
 
-    def _process_approved_tool_calls(
+    async def _aprocess_approved_tool_calls(
         self,
         messages_list: list[dict[str, Any]],
         platform_context: dict[str, Any],
@@ -352,10 +421,18 @@ class ServerAdapter:
         When the user approves tool calls, they come back in the
         message data. We execute them here and return results.
         """
-        executed_tools: list[ExecutedToolCall] = []
+        return await self._arun_pending(self._plan_tool_calls(messages_list, platform_context))
+
+    def _plan_tool_calls(
+        self,
+        messages_list: list[dict[str, Any]],
+        platform_context: dict[str, Any],
+    ) -> list[_Pending[ExecutedToolCall]]:
+        """Collect approved/rejected tool calls from the latest message."""
+        pending: list[_Pending[ExecutedToolCall]] = []
 
         if not messages_list:
-            return executed_tools
+            return pending
 
         # Get the latest message's data
         latest_message = messages_list[-1]
@@ -366,30 +443,25 @@ class ServerAdapter:
             tool_name = tool_call.get("name")
             tool_input = tool_call.get("input", {})
             tool_id = tool_call.get("id")
+            make_result = partial(ExecutedToolCall, id=tool_id, name=tool_name, input=tool_input)
 
             if tool_call.get("execute", False):
                 # User approved - execute the tool
-                result = self._execute_tool(tool_name, tool_input, platform_context)
-                executed_tools.append(
-                    ExecutedToolCall(
-                        id=tool_id,
-                        name=tool_name,
-                        input=tool_input,
-                        output=result,
+                pending.append(
+                    _Pending(
+                        make_result,
+                        tool_name=tool_name,
+                        tool_input=tool_input,
+                        context=platform_context,
                     )
                 )
             elif tool_call.get("rejection_reason"):
                 # User rejected
-                executed_tools.append(
-                    ExecutedToolCall(
-                        id=tool_id,
-                        name=tool_name,
-                        input=tool_input,
-                        output=f"Tool rejected: {tool_call['rejection_reason']}",
-                    )
+                pending.append(
+                    _Pending(make_result, output=f"Tool rejected: {tool_call['rejection_reason']}")
                 )
 
-        return executed_tools
+        return pending
 
     def _execute_tool(
         self,
@@ -413,56 +485,55 @@ class ServerAdapter:
 
         return f"Tool '{tool_name}' not found"
 
-    def _execute_cmd(
+    async def _aexecute_tool(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        platform_context: dict[str, Any],
+    ) -> str:
+        """Run :meth:`_execute_tool` on the execution engine's thread pool."""
+        try:
+            output = await self._engine.run_sync(
+                self._execute_tool, tool_name, tool_input, platform_context
+            )
+        except ExecutionTimeoutError as e:
+            return f"Error executing {tool_name}: {e}"
+        text = str(output) if output is not None else ""
+        return cap_output(text, self._engine.max_output_bytes)
+
+    async def _aexecute_cmd(
         self,
         command: str,
         files: list[dict[str, Any]] | None = None,
         context: dict[str, Any] | None = None,
     ) -> str:
-        """Execute a shell command. If a custom executor was provided at construction,
-        it is called instead of the built-in subprocess implementation.
+        """
+        Execute a shell command without blocking the event loop.
+
+        The built-in path runs the command as an asyncio subprocess; a custom
+        executor provided at construction is called instead, on the execution
+        engine's thread pool. Both are subject to the engine's timeout and
+        output cap.
 
         If files are provided (in the default path), they are written to a temporary
         directory which is used as the working directory for the command. The directory
         is always cleaned up after execution, even on error.
         """
         if self._cmd_executor is not None:
-            return self._cmd_executor(command, files, context)
+            try:
+                output = await self._engine.run_sync(self._cmd_executor, command, files, context)
+            except ExecutionTimeoutError as e:
+                logger.error("Error executing command: %s", e)
+                return f"Error executing command: {e}"
+            # Custom executors are not guaranteed to return a string
+            text = str(output) if output is not None else ""
+            return cap_output(text, self._engine.max_output_bytes)
 
         work_dir: str | None = None
         try:
-            if files:
-                work_dir = tempfile.mkdtemp()
-                written_names: set[str] = set()
-                for f in files:
-                    # Use basename only — never allow path traversal.
-                    # The `or "file"` guard handles the empty-string case
-                    # (f.get default only fires when the key is absent).
-                    safe_name = os.path.basename(f.get("file_path", "") or "file")
-                    if safe_name in written_names:
-                        logger.warning(
-                            "Duplicate filename '%s' in files list; overwriting previous content",
-                            safe_name,
-                        )
-                    written_names.add(safe_name)
-                    with open(os.path.join(work_dir, safe_name), "w") as fh:
-                        fh.write(f.get("file_content", ""))
-
-            result = subprocess.run(  # noqa: S602
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=work_dir,
-            )
-            output = result.stdout
-            if result.stderr:
-                output = (
-                    (output + f"\n\nErrors:\n{result.stderr}")
-                    if output
-                    else f"Errors:\n{result.stderr}"
-                )
-            return output or "Command executed successfully with no output."
+            work_dir = self._write_files(files)
+            result = await self._engine.run_shell(command, cwd=work_dir)
+            return self._format_cmd_output(result.stdout, result.stderr)
         except Exception as e:
             logger.error("Error executing command: %s", e)
             return f"Error executing command: {e}"
@@ -470,7 +541,43 @@ class ServerAdapter:
             if work_dir:
                 shutil.rmtree(work_dir, ignore_errors=True)
 
-    def _process_approved_commands(
+    @staticmethod
+    def _write_files(files: list[dict[str, Any]] | None) -> str | None:
+        """Write command files to a new temporary directory and return it.
+
+        The directory is removed again if writing fails.
+        """
+        if not files:
+            return None
+        work_dir = tempfile.mkdtemp()
+        written_names: set[str] = set()
+        try:
+            for f in files:
+                # Use basename only — never allow path traversal.
+                # The `or "file"` guard handles the empty-string case
+                # (f.get default only fires when the key is absent).
+                safe_name = os.path.basename(f.get("file_path", "") or "file")
+                if safe_name in written_names:
+                    logger.warning(
+                        "Duplicate filename '%s' in files list; overwriting previous content",
+                        safe_name,
+                    )
+                written_names.add(safe_name)
+                with open(os.path.join(work_dir, safe_name), "w") as fh:
+                    fh.write(f.get("file_content", ""))
+        except Exception:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+        return work_dir
+
+    @staticmethod
+    def _format_cmd_output(stdout: str, stderr: str) -> str:
+        output = stdout
+        if stderr:
+            output = (output + f"\n\nErrors:\n{stderr}") if output else f"Errors:\n{stderr}"
+        return output or "Command executed successfully with no output."
+
+    async def _aprocess_approved_commands(
         self,
         messages_list: list[dict[str, Any]],
         context: dict[str, Any] | None = None,
@@ -479,12 +586,21 @@ class ServerAdapter:
         Process approved/rejected commands from the legacy cmds field.
 
         Reads data.cmds[] from the latest message. Approved commands are
-        executed via subprocess; rejected commands record the rejection reason.
+        executed via :meth:`_aexecute_cmd`; rejected commands record the
+        rejection reason.
         """
-        executed: list[ExecutedCommand] = []
+        return await self._arun_pending(self._plan_commands(messages_list, context))
+
+    def _plan_commands(
+        self,
+        messages_list: list[dict[str, Any]],
+        context: dict[str, Any] | None,
+    ) -> list[_Pending[ExecutedCommand]]:
+        """Collect approved/rejected commands from the latest message."""
+        pending: list[_Pending[ExecutedCommand]] = []
 
         if not messages_list:
-            return executed
+            return pending
 
         latest_message = messages_list[-1]
         cmds = latest_message.get("data", {}).get("cmds", [])
@@ -492,21 +608,16 @@ class ServerAdapter:
         for cmd in cmds:
             command = cmd.get("command", "")
             files = cmd.get("files") or None  # list[dict] | None
+            make_result = partial(ExecutedCommand, command=command)
             if cmd.get("execute", False):
                 logger.info("Executing approved command: %s", command)
-                output = self._execute_cmd(command, files=files, context=context)
-                executed.append(ExecutedCommand(command=command, output=output))
+                pending.append(_Pending(make_result, command=command, files=files, context=context))
             elif cmd.get("rejection_reason"):
-                executed.append(
-                    ExecutedCommand(
-                        command=command,
-                        output=f"Rejected: {cmd['rejection_reason']}",
-                    )
-                )
+                pending.append(_Pending(make_result, output=f"Rejected: {cmd['rejection_reason']}"))
 
-        return executed
+        return pending
 
-    def _process_approvals(
+    async def _aprocess_approvals(
         self,
         messages_list: list[dict[str, Any]],
         platform_context: dict[str, Any],
@@ -515,49 +626,83 @@ class ServerAdapter:
         Process approved/rejected items from the unified approvals field.
 
         Reads data.approvals[] from the latest message. For each:
-        - If execute=True: runs the tool via _execute_tool() and captures output
+        - If execute=True: runs the tool (or command) and captures output
         - If rejection_reason is set: captures the rejection as output
         """
-        executed: list[ExecutedApproval] = []
+        return await self._arun_pending(self._plan_approvals(messages_list, platform_context))
+
+    def _plan_approvals(
+        self,
+        messages_list: list[dict[str, Any]],
+        platform_context: dict[str, Any],
+    ) -> list[_Pending[ExecutedApproval]]:
+        """Collect approved/rejected unified approvals from the latest message."""
+        pending: list[_Pending[ExecutedApproval]] = []
 
         if not messages_list:
-            return executed
+            return pending
 
         latest_message = messages_list[-1]
         data = latest_message.get("data", {})
         approvals = data.get("approvals", [])
 
         for approval in approvals:
-            approval_id = approval.get("id", "")
             approval_type = approval.get("type", "")
             name = approval.get("name", "")
             tool_input = approval.get("input", {})
+            make_result = partial(
+                ExecutedApproval,
+                id=approval.get("id", ""),
+                type=approval_type,
+                name=name,
+                input=tool_input,
+            )
 
             if approval.get("execute", False):
                 if approval_type == "command":
-                    result = self._execute_cmd(
-                        tool_input.get("command", name), files=None, context=platform_context
+                    pending.append(
+                        _Pending(
+                            make_result,
+                            command=tool_input.get("command", name),
+                            context=platform_context,
+                        )
                     )
                 else:
-                    result = self._execute_tool(name, tool_input, platform_context)
-                executed.append(
-                    ExecutedApproval(
-                        id=approval_id,
-                        type=approval_type,
-                        name=name,
-                        input=tool_input,
-                        output=result,
+                    pending.append(
+                        _Pending(
+                            make_result,
+                            tool_name=name,
+                            tool_input=tool_input,
+                            context=platform_context,
+                        )
                     )
-                )
             elif approval.get("rejection_reason"):
-                executed.append(
-                    ExecutedApproval(
-                        id=approval_id,
-                        type=approval_type,
-                        name=name,
-                        input=tool_input,
-                        output=f"Rejected: {approval['rejection_reason']}",
-                    )
+                pending.append(
+                    _Pending(make_result, output=f"Rejected: {approval['rejection_reason']}")
                 )
 
-        return executed
+        return pending
+
+    async def _arun_pending(self, pending: list[_Pending[T]]) -> list[T]:
+        """
+        Execute planned approvals; results keep their order.
+
+        They run one after the other unless the engine allows concurrency
+        (``max_concurrency`` > 1), in which case they must be independent.
+        """
+
+        async def run(item: _Pending[T]) -> str:
+            if item.output is not None:
+                return item.output
+            if item.command is not None:
+                return await self._aexecute_cmd(
+                    item.command, files=item.files, context=item.context
+                )
+            return await self._aexecute_tool(
+                item.tool_name or "", item.tool_input, item.context or {}
+            )
+
+        outputs = await self._engine.gather([partial(run, item) for item in pending])
+        return [
+            item.make_result(output=output) for item, output in zip(pending, outputs, strict=True)
+        ]
@@ -11,6 +11,9 @@ Components:
     - AgnoAdapter: Implements RuntimeAdapter protocol
     - AgnoToolConverter: Converts dcaf Tools to Agno format
     - AgnoMessageConverter: Converts messages bidirectionally
+    - BedrockClientPool: Long-lived Bedrock clients shared across calls
+    - PromptCacheStats: Prompt-cache hit/miss accounting per model and prompt
+    - RoutedModelFactory: Failover and hedged requests across several models
     - create_adapter: Factory function for dynamic loading
 
 Usage:
@@ -34,10 +37,13 @@ Dynamic Loading:
 from typing import Any
 
 from .adapter import AgnoAdapter
+from .bedrock_client_pool import BedrockClientPool, get_bedrock_client_pool
 from .gcp_metadata import GCPMetadataManager, get_default_gcp_metadata_manager
 from .message_converter import AgnoMessageConverter
 from .model_factory import AgnoModelFactory, ModelConfig
+from .prompt_cache_stats import PromptCacheStats, get_prompt_cache_stats
 from .response_converter import AgnoMetrics, AgnoResponseConverter
+from .routed_model import ModelRouter, RoutedModelFactory, RoutingPolicy, route_model
 from .tool_converter import AgnoToolConverter
 
 
@@ -80,8 +86,16 @@ __all__ = [
     "AgnoModelFactory",
     "AgnoResponseConverter",
     "AgnoToolConverter",
+    "BedrockClientPool",
     "GCPMetadataManager",
     "ModelConfig",
+    "ModelRouter",
+    "PromptCacheStats",
+    "RoutedModelFactory",
+    "RoutingPolicy",
     "create_adapter",
+    "get_bedrock_client_pool",
     "get_default_gcp_metadata_manager",
+    "get_prompt_cache_stats",
+    "route_model",
 ]
@@ -14,9 +14,13 @@ This adapter incorporates production-proven patterns for Bedrock compatibility,
 including message history filtering and parallel tool execution workarounds.
 """
 
+import functools
+import inspect
 import logging
 import os
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
 # Agno SDK imports
@@ -42,12 +46,20 @@ from ....events import Event, EventRegistry
 from ....llm import LLM as DcafLLM
 from ....services.skill_manager import SkillManager
 from ....services.skill_translator import translate_skills
+from .context_window import (
+    ConversationWindow,
+    WindowReport,
+    default_history_budget,
+    model_summarizer,
+)
 from .gcp_metadata import GCPMetadataManager, get_default_gcp_metadata_manager
 from .message_converter import AgnoMessageConverter
 from .model_factory import AgnoModelFactory, ModelConfig
 from .response_converter import AgnoResponseConverter
+from .run_context import _active_platform_context, run_scope
 from .tool_converter import AgnoToolConverter
 from .types import (
+    DEFAULT_AGENT_CACHE_SIZE,
     DEFAULT_AWS_REGION,
     DEFAULT_MAX_TOKENS,
     DEFAULT_MODEL_ID,
@@ -59,6 +71,18 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _CachedAgent:
+    """A compiled AgnoAgent plus the tool objects its cache key refers to.
+
+    Holding ``tools`` keeps the tool objects alive, so the ``id()`` values in
+    the cache key cannot be recycled while the entry exists.
+    """
+
+    agent: AgnoAgent
+    tools: tuple[Any, ...]
+
+
 def _sync_agno_log_level() -> None:
     """
     Sync Agno's debug mode with DCAF's logging level.
@@ -147,6 +171,7 @@ class AgnoAdapter:
         tool_call_limit: int | None = None,
         disable_history: bool = False,
         disable_tool_filtering: bool = False,
+        agent_cache_size: int | None = None,
         # LLM layer (optional — if provided, model creation is delegated)
         llm: DcafLLM | None = None,
         **kwargs: Any,
@@ -185,6 +210,15 @@ class AgnoAdapter:
             tool_call_limit: Max concurrent tool calls per agent turn
             disable_history: If True, don't pass message history
             disable_tool_filtering: If True, skip tool message filtering
+            agent_cache_size: Max compiled Agno agents kept for reuse across
+                              requests (default 16, 0 disables the cache)
+
+            model_config may also set ``max_history_tokens`` (history budget,
+            0 disables trimming; env AGNO_MAX_HISTORY_TOKENS) and
+            ``summarize_history`` (default True: older turns become a rolling
+            summary instead of being dropped), and ``tokens_per_minute`` /
+            ``requests_per_minute`` (process-wide rate limit for this model;
+            env DCAF_RATE_LIMIT_TOKENS_PER_MINUTE / _REQUESTS_PER_MINUTE).
 
             **kwargs: Additional arguments passed to the model
         """
@@ -218,6 +252,22 @@ class AgnoAdapter:
         self._disable_tool_filtering = disable_tool_filtering or (
             os.getenv("DISABLE_TOOL_FILTERING", "false").lower() == "true"
         )
+        max_history_tokens = self._model_config.get("max_history_tokens")
+        if max_history_tokens is None:
+            max_history_tokens = int(
+                os.getenv("AGNO_MAX_HISTORY_TOKENS", str(default_history_budget(model_id)))
+            )
+        self._agent_cache_size = (
+            agent_cache_size
+            if agent_cache_size is not None
+            else int(os.getenv("AGNO_AGENT_CACHE_SIZE", str(DEFAULT_AGENT_CACHE_SIZE)))
+        )
+
+        # Compiled agents keyed by (version, tools, prompt, stream, ...).
+        # Bumping the version invalidates every entry without racing builds
+        # that are still in flight.
+        self._agent_cache: OrderedDict[tuple[Any, ...], _CachedAgent] = OrderedDict()
+        self._agent_cache_version = 0
 
         self._extra_config = kwargs
 
@@ -226,10 +276,6 @@ class AgnoAdapter:
         self._message_converter = AgnoMessageConverter()
         self._response_converter = AgnoResponseConverter()
 
-        # System prompt parts for caching
-        self._static_system: str | None = None
-        self._dynamic_system: str | None = None
-
         # LLM layer — if provided, delegate model creation to it.
         # Otherwise, create our own model factory (backward compatible).
         self._llm = llm
@@ -251,10 +297,25 @@ class AgnoAdapter:
                     google_project_id=google_project_id,
                     google_location=google_location,
                     cache_system_prompt=self._model_config.get("cache_system_prompt", False),
+                    cache_tools=self._model_config.get("cache_tools", False),
+                    cache_messages=self._model_config.get("cache_messages", False),
+                    tokens_per_minute=self._model_config.get("tokens_per_minute"),
+                    requests_per_minute=self._model_config.get("requests_per_minute"),
                 ),
                 gcp_metadata_manager=self._gcp_metadata_manager,
             )
 
+        # Keeps long histories within budget; older turns become a rolling summary
+        self._conversation_window = ConversationWindow(
+            model_id=model_id,
+            max_tokens=max_history_tokens,
+            summarizer=(
+                model_summarizer(self._get_or_create_model_async)
+                if self._model_config.get("summarize_history", True)
+                else None
+            ),
+        )
+
         # Sync Agno's logging with DCAF's logging level
         _sync_agno_log_level()
 
@@ -312,17 +373,26 @@ class AgnoAdapter:
         logger.debug(f"  Dynamic System Prompt: {dynamic_system}")
         logger.debug(f"  Platform Context: {platform_context}")
 
-        # Store system prompt parts for model creation (if using caching)
-        self._static_system = static_system
-        self._dynamic_system = dynamic_system
+        # Publish per-request state (tool context, system prompt parts) for the
+        # shared model and cached agents instead of storing it on them
+        with run_scope(platform_context, static_system, dynamic_system):
+            return await self._invoke_agent(messages, tools, system_prompt, platform_context)
 
-        # Create the Agno agent with tools (context injected into tool wrappers)
+    async def _invoke_agent(
+        self,
+        messages: list[Any],
+        tools: list[Any],
+        system_prompt: str | None,
+        platform_context: dict[str, Any] | None,
+    ) -> AgentResponse:
+        """Run the (possibly cached) Agno agent once and convert its output."""
+        # Get the Agno agent with tools (context resolved by the tool wrappers)
         agno_agent = await self._create_agent_async(
             tools, system_prompt, platform_context=platform_context
         )
 
         # Build the message list for Agno
-        messages_to_send = self._build_message_list(messages)
+        messages_to_send, window_report = await self._prepare_messages(messages)
 
         # Extract tracing parameters from platform_context
         tracing_kwargs = self._extract_tracing_kwargs(platform_context)
@@ -345,17 +415,22 @@ class AgnoAdapter:
             if metrics:
                 logger.info(
                     f"Agno Metrics: tokens={metrics.total_tokens} "
-                    f"(in={metrics.input_tokens}, out={metrics.output_tokens}), "
+                    f"(in={metrics.input_tokens}, out={metrics.output_tokens}, "
+                    f"cache_read={metrics.cache_read_tokens}, "
+                    f"cache_write={metrics.cache_write_tokens}), "
                     f"duration={metrics.duration:.3f}s"
                 )
 
             # Convert the RunOutput to our AgentResponse
-            return self._response_converter.convert_run_output(
+            response = self._response_converter.convert_run_output(
                 run_output=run_output,
                 conversation_id=conversation_id,
                 metrics=metrics,
                 tracing_context=tracing_kwargs,
             )
+            if window_report.trimmed_messages:
+                response.metadata["context_window"] = window_report.to_dict()
+            return response
 
         except Exception as e:
             logger.error(f"Agno invocation failed: {e}", exc_info=True)
@@ -406,23 +481,39 @@ class AgnoAdapter:
         logger.debug(f"  Dynamic System Prompt: {dynamic_system}")
         logger.debug(f"  Platform Context: {platform_context}")
 
-        # Store system prompt parts for model creation (if using caching)
-        self._static_system = static_system
-        self._dynamic_system = dynamic_system
+        # Publish per-request state (tool context, system prompt parts) for the
+        # shared model and cached agents instead of storing it on them
+        with run_scope(platform_context, static_system, dynamic_system):
+            async for stream_event in self._invoke_agent_stream(
+                messages, tools, system_prompt, platform_context, event_registry
+            ):
+                yield stream_event
 
-        # Create the Agno agent with tools and streaming enabled (context injected)
+    async def _invoke_agent_stream(
+        self,
+        messages: list[Any],
+        tools: list[Any],
+        system_prompt: str | None,
+        platform_context: dict[str, Any] | None,
+        event_registry: EventRegistry | None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream one run of the (possibly cached) Agno agent."""
+        # Get the Agno agent with tools and streaming enabled
         agno_agent = await self._create_agent_async(
             tools, system_prompt, stream=True, platform_context=platform_context
         )
 
         # Build the message list for Agno
-        messages_to_send = self._build_message_list(messages)
+        messages_to_send, window_report = await self._prepare_messages(messages)
 
         # Extract tracing parameters from platform_context
         tracing_kwargs = self._extract_tracing_kwargs(platform_context)
         if tracing_kwargs:
             logger.info(f"Agno: Streaming with tracing context: {tracing_kwargs}")
 
+        # Usage from the RunCompleted event, for the final message_end
+        final_metrics = None
+
         try:
             yield StreamEvent.message_start()
 
@@ -433,6 +524,9 @@ class AgnoAdapter:
                 stream_events=True,  # Enable all event types
                 **tracing_kwargs,
             ):
+                if type(event).__name__ in ("RunCompletedEvent", "RunCompleted"):
+                    final_metrics = self._response_converter.extract_metrics(event)
+
                 stream_event = self._response_converter.convert_stream_event(event)
                 if stream_event:
                     yield stream_event
@@ -460,8 +554,11 @@ class AgnoAdapter:
                     response = self._response_converter.convert_run_output(
                         run_output=event.run_output,
                         conversation_id=conv_id,
+                        metrics=final_metrics,
                         tracing_context=tracing_kwargs,
                     )
+                    if window_report.trimmed_messages:
+                        response.metadata["context_window"] = window_report.to_dict()
                     yield StreamEvent.message_end(response)
                     return
 
@@ -471,6 +568,7 @@ class AgnoAdapter:
                     conversation_id=tracing_kwargs.get("run_id", ""),
                     text="",
                     is_complete=True,
+                    metadata={"usage": final_metrics.usage()} if final_metrics else {},
                 )
             )
 
@@ -503,6 +601,27 @@ class AgnoAdapter:
     # Message Building (Bedrock-Compatible)
     # =========================================================================
 
+    async def _prepare_messages(
+        self, messages: list[Any]
+    ) -> tuple[list[dict[str, Any]], WindowReport]:
+        """
+        Build the message list and fit it into the history token budget.
+
+        Returns:
+            Tuple of (messages for Agno's arun(), what the window trimmed)
+        """
+        messages_to_send, report = await self._conversation_window.fit(
+            self._build_message_list(messages)
+        )
+        if report.trimmed_messages:
+            logger.info(
+                f"Agno: Context window replaced {report.trimmed_messages} older messages "
+                f"(~{report.trimmed_tokens} tokens) with a summary (~{report.summary_tokens} "
+                f"tokens, new={report.summarized}); sending ~{report.sent_tokens} of "
+                f"~{report.history_tokens} history tokens"
+            )
+        return messages_to_send, report
+
     def _build_message_list(
         self,
         messages: list[Any],
@@ -642,13 +761,20 @@ class AgnoAdapter:
         platform_context: dict[str, Any] | None = None,
     ) -> AgnoAgent:
         """
-        Create an Agno Agent with async session.
+        Get or create an Agno Agent with async session.
+
+        Agents are cached per (tool list, system prompt, stream flag, model) so
+        repeated requests skip tool conversion and agent construction. Cached
+        agents never capture ``platform_context``: their tool wrappers read it
+        from the run context that ``invoke`` / ``invoke_stream`` publish.
+        Requests carrying skills are built fresh, because skills are resolved
+        per request from ``platform_context``.
 
         Args:
             tools: List of dcaf Tool objects
             system_prompt: Optional system prompt
             stream: Whether streaming is enabled
-            platform_context: Optional platform context to inject into tools
+            platform_context: Optional platform context (used for skills)
 
         Returns:
             Configured AgnoAgent
@@ -656,12 +782,22 @@ class AgnoAdapter:
         # Create the model with async session
         model = await self._get_or_create_model_async()
 
-        # Convert tools to Agno format and optionally prepend default toolkits
-        agno_tools = self._prepare_tools_with_defaults(tools, platform_context)
-
         # Resolve skills from platform context
         agno_skills = await self._resolve_skills(platform_context)
 
+        cache_key: tuple[Any, ...] | None = None
+        if agno_skills is None and self._agent_cache_size > 0:
+            cache_key = self._agent_cache_key(tools, system_prompt, stream, model)
+            cached = self._agent_cache.get(cache_key)
+            if cached is not None:
+                self._agent_cache.move_to_end(cache_key)
+                logger.debug(f"Agno: Reusing cached agent ({len(tools)} tools, stream={stream})")
+                return cached.agent
+
+        # Convert tools to Agno format and optionally prepend default toolkits.
+        # Wrappers resolve platform_context at call time, so they are reusable.
+        agno_tools = self._prepare_tools_with_defaults(tools)
+
         logger.info(
             f"Agno: Creating agent with {len(agno_tools)} tools "
             f"(stream={stream}, tool_limit={self._tool_call_limit}, "
@@ -679,8 +815,41 @@ class AgnoAdapter:
             telemetry=False,
         )
 
+        if cache_key is not None and cache_key[0] == self._agent_cache_version:
+            self._agent_cache[cache_key] = _CachedAgent(agent=agent, tools=tuple(tools))
+            while len(self._agent_cache) > self._agent_cache_size:
+                self._agent_cache.popitem(last=False)
+
         return agent
 
+    def _agent_cache_key(
+        self,
+        tools: list[Any],
+        system_prompt: str | None,
+        stream: bool,
+        model: Any,
+    ) -> tuple[Any, ...]:
+        """Build the agent cache key for a request."""
+        default_toolkit = os.getenv(EnvVars.DEFAULT_TOOLKIT, "false").lower() == "true"
+        return (
+            self._agent_cache_version,
+            tuple(id(t) for t in tools),
+            system_prompt,
+            stream,
+            default_toolkit,
+            id(model),
+        )
+
+    def invalidate_agent_cache(self) -> None:
+        """
+        Drop all cached Agno agents.
+
+        Call this after mutating a tool in place (e.g. changing its
+        description); adding or removing tools is detected automatically.
+        """
+        self._agent_cache_version += 1
+        self._agent_cache.clear()
+
     async def _resolve_skills(self, platform_context: dict[str, Any] | None) -> Skills | None:
         """
         Extract and resolve skills from platform context.
@@ -765,13 +934,12 @@ class AgnoAdapter:
         Delegates to the ModelFactory for provider-specific model creation.
         For Bedrock, this uses aioboto3 for true async AWS calls.
 
+        The model is shared by all requests; per-request system prompt parts
+        reach it through the run context (see ``run_context.run_scope``).
+
         Returns:
             An Agno model instance
         """
-        # Update model factory's caching config with current system prompts
-        self._model_factory._config.static_system = self._static_system
-        self._model_factory._config.dynamic_system = self._dynamic_system
-
         return await self._model_factory.create_model()
 
     # =========================================================================
@@ -793,14 +961,17 @@ class AgnoAdapter:
         For tools that require platform_context, this method creates wrapper
         functions that automatically inject the context when Agno executes them.
         This bridges the gap between interceptor-set context and tool execution.
+        Unless a context is bound explicitly, the wrapper reads the context of
+        the active run, so converted tools can be cached and shared.
 
         Also handles DCAF MCPTool instances by extracting the underlying
         Agno Toolkit and passing it through directly.
 
         Args:
             tools: List of dcaf Tool objects or MCPTool instances
-            platform_context: Optional platform context to inject into tools
+            platform_context: Optional platform context to bind into tools
                              that declare a `platform_context` parameter
+                             (default: resolved per run)
 
         Returns:
             List of Agno-compatible tools (decorated functions or Toolkits)
@@ -844,19 +1015,23 @@ class AgnoAdapter:
             tool_schema = self._tool_converter.to_agno(tool_obj)
 
             # Determine which function to wrap with Agno's decorator
-            if tool_obj.requires_platform_context and platform_context is not None:
+            if tool_obj.requires_platform_context:
                 # Create a wrapper that injects platform_context
                 # IMPORTANT: We must preserve the function signature (minus platform_context)
                 # so that Agno can infer the parameter schema correctly.
-                import functools
-                import inspect
 
                 def create_context_wrapper(original_func: Any, ctx: Any) -> Any:
-                    """Create a closure that injects platform_context while preserving signature."""
+                    """Create a closure that injects platform_context while preserving signature.
+
+                    An explicitly bound ``ctx`` wins; otherwise the context of the
+                    run currently executing is used, so the wrapper can be cached.
+                    """
 
                     @functools.wraps(original_func)
                     def wrapper(*args: Any, **kwargs: Any) -> Any:
-                        kwargs["platform_context"] = ctx
+                        run_ctx = ctx if ctx is not None else _active_platform_context.get()
+                        if run_ctx is not None:
+                            kwargs["platform_context"] = run_ctx
                         return original_func(*args, **kwargs)
 
                     # Copy the signature but REMOVE platform_context parameter
@@ -973,6 +1148,7 @@ class AgnoAdapter:
 
     async def cleanup(self) -> None:
         """Clean up cached resources."""
+        self.invalidate_agent_cache()
         await self._model_factory.cleanup()
         logger.info("Agno: Cleaned up cached resources")
 
@@ -0,0 +1,294 @@
+"""
+Long-lived bedrock-runtime clients shared across LLM calls.
+
+Opening an aiobotocore client builds a botocore ``Config``, resolves
+endpoints and - on first use - pays a fresh TCP/TLS handshake.  Doing that
+for every model round trip (an agent turn with five tool iterations makes
+five of them) adds latency for nothing.  ``BedrockClientPool`` keeps one open
+client per (event loop, session, region, credentials) so steady-state calls reuse warm
+keep-alive connections from the client's connection pool.
+
+Clients are bound to the event loop they were opened on (aiohttp sessions
+cannot be shared between loops), so the loop is part of the key.  Entries
+whose loop has been closed are dropped on the next acquire.
+
+Clients are always opened lazily, by the first call with a given session,
+region and credentials: each model factory creates its own session, so
+there is nothing to open before the first request.  The server logs the
+pool settings at lifespan start and closes the clients on shutdown; outside
+a server the clients are closed at interpreter exit by the OS.  Use
+:func:`get_bedrock_client_pool` to access it.
+
+Environment:
+    BOTO3_MAX_POOL_CONNECTIONS: HTTP connections per client (default: 50)
+    BEDROCK_CLIENT_POOL_MAX_CLIENTS: Open clients kept before the least
+        recently used one is closed (default: 8)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+DEFAULT_MAX_CLIENTS = 8
+
+# (id(loop), id(session), region, credentials fingerprint)
+_PoolKey = tuple[int, int, str | None, str | None]
+
+
+@dataclass
+class _PooledClient:
+    """An open client and the context manager that closes it."""
+
+    client: Any
+    context: Any
+    loop: asyncio.AbstractEventLoop
+    # Held so id(session) in the key cannot be reused while the entry lives
+    session: Any
+    # Leases, taken in _acquire before any await so the entry is never evicted under a caller
+    in_flight: int = 0
+
+
+def _credentials_fingerprint(client_kwargs: dict[str, Any]) -> str | None:
+    """Hash explicit credentials so they can key the pool without being stored."""
+    access_key = client_kwargs.get("aws_access_key_id")
+    if not access_key:
+        return None
+    material = "\0".join(
+        [
+            access_key,
+            client_kwargs.get("aws_secret_access_key") or "",
+            client_kwargs.get("aws_session_token") or "",
+        ]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class BedrockClientPool:
+    """
+    Keeps open aiobotocore bedrock-runtime clients for reuse.
+
+    Example:
+        pool = get_bedrock_client_pool()
+        async with pool.client(session, client_kwargs, config_factory) as client:
+            response = await client.converse(...)
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: int | None = None,
+        max_clients: int | None = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            max_pool_connections: HTTP connections per client. Falls back to
+                ``BOTO3_MAX_POOL_CONNECTIONS``.
+            max_clients: Open clients kept before evicting the least recently
+                used. Falls back to ``BEDROCK_CLIENT_POOL_MAX_CLIENTS``.
+        """
+        if max_pool_connections is None:
+            max_pool_connections = int(
+                os.getenv("BOTO3_MAX_POOL_CONNECTIONS", str(DEFAULT_MAX_POOL_CONNECTIONS))
+            )
+        if max_clients is None:
+            max_clients = int(
+                os.getenv("BEDROCK_CLIENT_POOL_MAX_CLIENTS", str(DEFAULT_MAX_CLIENTS))
+            )
+        self.max_pool_connections = max(1, max_pool_connections)
+        self.max_clients = max(1, max_clients)
+
+        self._clients: OrderedDict[_PoolKey, _PooledClient] = OrderedDict()
+        self._open_locks: dict[_PoolKey, asyncio.Lock] = {}
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @contextlib.asynccontextmanager
+    async def client(
+        self,
+        session: Any,
+        client_kwargs: dict[str, Any],
+        config_factory: Callable[[int], Any],
+    ) -> AsyncIterator[Any]:
+        """
+        Lease an open client for the duration of the ``async with`` block.
+
+        The client is not closed on exit; it stays in the pool for the next
+        call with the same session, region and credentials.
+
+        Args:
+            session: aioboto3 session used to open the client on a miss
+            client_kwargs: Keyword arguments for ``session.client()``
+                (without ``config``)
+            config_factory: Builds the botocore ``Config`` given the pool size;
+                only called when a new client is opened
+        """
+        entry = await self._acquire(session, client_kwargs, config_factory)
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            yield entry.client
+        finally:
+            entry.in_flight -= 1
+            self._in_flight -= 1
+
+    async def _acquire(
+        self,
+        session: Any,
+        client_kwargs: dict[str, Any],
+        config_factory: Callable[[int], Any],
+    ) -> _PooledClient:
+        """Return a leased entry (``in_flight`` already counts the caller)."""
+        loop = asyncio.get_running_loop()
+        self._drop_dead_loops()
+        # The session is part of the key: sessions created from a profile or
+        # explicit keys carry credentials that are not in client_kwargs.
+        key: _PoolKey = (
+            id(loop),
+            id(session),
+            client_kwargs.get("region_name"),
+            _credentials_fingerprint(client_kwargs),
+        )
+
+        entry = self._clients.get(key)
+        if entry is not None and entry.loop is loop:
+            self._clients.move_to_end(key)
+            self._hits += 1
+            entry.in_flight += 1
+            return entry
+
+        lock = self._open_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another task may have opened it while we waited
+            entry = self._clients.get(key)
+            if entry is not None and entry.loop is loop:
+                self._hits += 1
+                entry.in_flight += 1
+                return entry
+
+            context = session.client(
+                **client_kwargs, config=config_factory(self.max_pool_connections)
+            )
+            client = await context.__aenter__()
+            entry = _PooledClient(
+                client=client, context=context, loop=loop, session=session, in_flight=1
+            )
+            self._clients[key] = entry
+            self._misses += 1
+            logger.info(
+                f"Bedrock client pool: opened client for region={key[2]} "
+                f"(max_pool_connections={self.max_pool_connections}, "
+                f"open_clients={len(self._clients)})"
+            )
+
+        self._open_locks.pop(key, None)
+        try:
+            await self._evict_over_limit()
+        except BaseException:
+            entry.in_flight -= 1
+            raise
+        return entry
+
+    def _drop_dead_loops(self) -> None:
+        """Forget clients whose event loop has been closed; they cannot be reused."""
+        for key in [k for k, e in self._clients.items() if e.loop.is_closed()]:
+            del self._clients[key]
+            self._evictions += 1
+
+    async def _evict_over_limit(self) -> None:
+        """Close the least recently used clients above ``max_clients`` that are not leased."""
+        while len(self._clients) > self.max_clients:
+            key = next((k for k, e in self._clients.items() if e.in_flight == 0), None)
+            if key is None:
+                return
+            entry = self._clients.pop(key)
+            self._evictions += 1
+            await self._close_entry(entry)
+
+    async def _close_entry(self, entry: _PooledClient) -> None:
+        """Close a client on the loop that owns it."""
+        if entry.loop.is_closed():
+            return
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        try:
+            if entry.loop is current:
+                await entry.context.__aexit__(None, None, None)
+            elif entry.loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(
+                    entry.context.__aexit__(None, None, None), entry.loop
+                )
+                await asyncio.wrap_future(future)
+        except Exception as e:
+            logger.warning(f"Bedrock client pool: error closing client: {e}")
+
+    async def open(self) -> None:
+        """
+        Log the pool settings; no client is opened.
+
+        Clients are keyed by the caller's session, which does not exist
+        until a model makes its first call, so they cannot be opened ahead
+        of time.  The first call per session, region and credentials pays
+        the client setup and TLS handshake.
+        """
+        logger.info(
+            f"Bedrock client pool: ready (max_pool_connections={self.max_pool_connections}, "
+            f"max_clients={self.max_clients})"
+        )
+
+    async def close(self) -> None:
+        """Close every open client. The pool can be used again afterwards."""
+        entries = list(self._clients.values())
+        self._clients.clear()
+        self._open_locks.clear()
+        for entry in entries:
+            await self._close_entry(entry)
+        if entries:
+            logger.info(f"Bedrock client pool: closed {len(entries)} client(s)")
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return pool usage counters.
+
+        Keys: ``open_clients``, ``in_flight``, ``peak_in_flight``, ``hits``,
+        ``misses``, ``evictions``, ``max_pool_connections``, ``max_clients``.
+        """
+        return {
+            "open_clients": len(self._clients),
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "max_pool_connections": self.max_pool_connections,
+            "max_clients": self.max_clients,
+        }
+
+
+_default_pool: BedrockClientPool | None = None
+
+
+def get_bedrock_client_pool() -> BedrockClientPool:
+    """Return the process-wide client pool, creating it on first use."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = BedrockClientPool()
+    return _default_pool
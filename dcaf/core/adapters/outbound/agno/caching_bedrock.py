@@ -8,7 +8,6 @@ native prompt caching support (expected in future release).
 Once Agno supports caching natively, this module should be removed.
 """
 
-import json
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -16,11 +15,19 @@ from typing import Any
 
 from agno.models.aws import AwsBedrock
 from agno.models.message import Message
+from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
 from botocore.config import Config
 from pydantic import BaseModel
 
+from dcaf.llm.tokens import cache_min_tokens, count_tokens
+
+from ....infrastructure.llm_capture import get_llm_capture
+from .bedrock_client_pool import get_bedrock_client_pool
+from .prompt_cache_stats import cache_token_counts, get_prompt_cache_stats, hash_prompt
+from .run_context import get_system_parts
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,10 +41,25 @@ class CachingAwsBedrock(AwsBedrock):
 
     TEMPORARY: Remove once Agno adds native caching support.
 
+    One instance is shared by all requests of an adapter.  Per-request
+    system prompt parts are therefore read from the run context
+    (``run_context.run_scope``) at format time; the constructor values are
+    only used when no run is active, e.g. when the model is used directly.
+
+    Besides the system prompt, checkpoints can be placed after the tool
+    definitions (``toolConfig``) and on the conversation prefix.  Conversation
+    checkpoints roll forward as the conversation grows: the newest user turn
+    gets one so the next agent-loop iteration reads the whole prefix from the
+    cache, and the previous user turn keeps one so this request hits the
+    entry written by the last iteration.  At most ``MAX_CACHE_CHECKPOINTS``
+    are used per request, in the order system, tools, conversation.
+
     Attributes:
         cache_system_prompt: Whether to add cache checkpoint to system prompt
-        static_system: Static portion of system prompt (cached)
-        dynamic_system: Dynamic portion of system prompt (not cached)
+        cache_tools: Whether to add a cache checkpoint after the tool definitions
+        cache_messages: Whether to add rolling checkpoints to the conversation
+        static_system: Default static portion of system prompt (cached)
+        dynamic_system: Default dynamic portion of system prompt (not cached)
 
     Example:
         model = CachingAwsBedrock(
@@ -48,15 +70,23 @@ class CachingAwsBedrock(AwsBedrock):
         )
     """
 
-    # Minimum tokens required for caching (varies by model)
-    # Claude 3.7 Sonnet: 1024, Claude 3.5 Haiku: 2048
+    # Minimum tokens required for caching when the model family is unknown;
+    # known families use dcaf.llm.tokens.CACHE_MIN_TOKENS
     MIN_CACHE_TOKENS = 1024
 
+    # Bedrock accepts at most 4 cachePoint blocks per request
+    MAX_CACHE_CHECKPOINTS = 4
+
+    # Rolling conversation checkpoints: newest user turn + previous user turn
+    MAX_MESSAGE_CHECKPOINTS = 2
+
     def __init__(
         self,
         cache_system_prompt: bool = False,
         static_system: str | None = None,
         dynamic_system: str | None = None,
+        cache_tools: bool = False,
+        cache_messages: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -66,25 +96,40 @@ class CachingAwsBedrock(AwsBedrock):
             cache_system_prompt: Whether to add cache checkpoint to system prompt
             static_system: Static portion (cached)
             dynamic_system: Dynamic portion (not cached)
+            cache_tools: Whether to add a cache checkpoint after the tool definitions
+            cache_messages: Whether to add rolling checkpoints to the conversation
             **kwargs: Passed to parent AwsBedrock class
         """
         super().__init__(**kwargs)
         self._cache_system_prompt = cache_system_prompt
+        self._cache_tools = cache_tools
+        self._cache_messages = cache_messages
         self._static_system = static_system
         self._dynamic_system = dynamic_system
 
-        if cache_system_prompt:
-            logger.info(f"CachingAwsBedrock: Prompt caching enabled for model {self.id}")
+        if cache_system_prompt or cache_tools or cache_messages:
+            logger.info(
+                f"CachingAwsBedrock: Prompt caching enabled for model {self.id} "
+                f"(system={cache_system_prompt}, tools={cache_tools}, messages={cache_messages})"
+            )
 
     def get_async_client(self) -> Any:
         """
-        Get the async Bedrock client context manager with timeout configuration.
+        Lease a pooled async Bedrock client.
+
+        Overrides the parent method, which opens (and later closes) a new
+        client for every call.  The returned async context manager yields a
+        long-lived client from :class:`BedrockClientPool`, shared by all calls
+        with the same region and credentials, so requests reuse warm
+        keep-alive connections.  Leaving the ``async with`` block does not
+        close the client.
 
-        Overrides parent method to add timeout and retry settings from environment variables:
+        Client configuration comes from environment variables:
             BOTO3_READ_TIMEOUT: Read timeout in seconds (default: 20)
             BOTO3_CONNECT_TIMEOUT: Connect timeout in seconds (default: 10)
             BOTO3_MAX_ATTEMPTS: Max retry attempts (default: 3)
             BOTO3_RETRY_MODE: Retry mode - 'standard', 'adaptive', or 'legacy' (default: 'standard')
+            BOTO3_MAX_POOL_CONNECTIONS: HTTP connections per client (default: 50)
 
         Returns:
             The async Bedrock client context manager.
@@ -99,32 +144,15 @@ class CachingAwsBedrock(AwsBedrock):
             self.aws_region = self.aws_region or os.getenv("AWS_REGION")
             self.async_session = aioboto3.Session()
 
-        # Build timeout and retry configuration from environment variables
-        read_timeout = int(os.getenv("BOTO3_READ_TIMEOUT", "20"))
-        connect_timeout = int(os.getenv("BOTO3_CONNECT_TIMEOUT", "10"))
-        max_attempts = int(os.getenv("BOTO3_MAX_ATTEMPTS", "3"))
-        retry_mode = os.getenv("BOTO3_RETRY_MODE", "standard")
-
-        boto3_config = Config(
-            read_timeout=read_timeout,
-            connect_timeout=connect_timeout,
-            tcp_keepalive=True,
-            retries={
-                "max_attempts": max_attempts,
-                "mode": retry_mode,
-            },
-        )
-
-        logger.debug(
-            f"Bedrock client config: read_timeout={read_timeout}s, "
-            f"connect_timeout={connect_timeout}s, max_attempts={max_attempts}, "
-            f"retry_mode={retry_mode}"
+        return get_bedrock_client_pool().client(
+            self.async_session, self._client_kwargs(), self._client_config
         )
 
-        client_kwargs = {
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Build the region and credential arguments for ``session.client()``."""
+        client_kwargs: dict[str, Any] = {
             "service_name": "bedrock-runtime",
             "region_name": self.aws_region,
-            "config": boto3_config,
         }
 
         if self.aws_sso_auth:
@@ -154,7 +182,32 @@ class CachingAwsBedrock(AwsBedrock):
                 if session_token:
                     client_kwargs["aws_session_token"] = session_token
 
-        return self.async_session.client(**client_kwargs)
+        return client_kwargs
+
+    @staticmethod
+    def _client_config(max_pool_connections: int) -> Config:
+        """Build the botocore client config; called only when the pool opens a client."""
+        read_timeout = int(os.getenv("BOTO3_READ_TIMEOUT", "20"))
+        connect_timeout = int(os.getenv("BOTO3_CONNECT_TIMEOUT", "10"))
+        max_attempts = int(os.getenv("BOTO3_MAX_ATTEMPTS", "3"))
+        retry_mode = os.getenv("BOTO3_RETRY_MODE", "standard")
+
+        logger.debug(
+            f"Bedrock client config: read_timeout={read_timeout}s, "
+            f"connect_timeout={connect_timeout}s, max_attempts={max_attempts}, "
+            f"retry_mode={retry_mode}, max_pool_connections={max_pool_connections}"
+        )
+
+        return Config(
+            read_timeout=read_timeout,
+            connect_timeout=connect_timeout,
+            tcp_keepalive=True,
+            max_pool_connections=max_pool_connections,
+            retries={
+                "max_attempts": max_attempts,
+                "mode": retry_mode,
+            },
+        )
 
     def _format_messages(
         self, messages: list[Message], compress_tool_results: bool = False
@@ -187,8 +240,9 @@ class CachingAwsBedrock(AwsBedrock):
         formatted_messages = self._merge_parallel_tool_results(formatted_messages)
 
         # If we have static/dynamic parts, build custom system message
-        if self._static_system or self._dynamic_system:
-            system_message = self._build_cached_system_message()
+        static_system, dynamic_system = self._resolve_system_parts()
+        if static_system or dynamic_system:
+            system_message = self._build_cached_system_message(static_system, dynamic_system)
         elif self._cache_system_prompt and system_message:
             # Just add checkpoint to existing system message
             system_message = self._add_cache_checkpoint(system_message)
@@ -239,7 +293,24 @@ class CachingAwsBedrock(AwsBedrock):
             i += 1
         return merged
 
-    def _build_cached_system_message(self) -> list[dict[str, Any]] | None:
+    def _resolve_system_parts(self) -> tuple[str | None, str | None]:
+        """
+        Return the (static, dynamic) system prompt parts for the current call.
+
+        Parts published by the active run take precedence over the values
+        given to the constructor, so concurrent requests sharing this model
+        each get their own system prompt.
+        """
+        parts = get_system_parts()
+        if parts is not None:
+            return parts.static, parts.dynamic
+        return self._static_system, self._dynamic_system
+
+    def _build_cached_system_message(
+        self,
+        static_system: str | None = None,
+        dynamic_system: str | None = None,
+    ) -> list[dict[str, Any]] | None:
         """
         Build system message with cache checkpoint between static and dynamic parts.
 
@@ -250,39 +321,46 @@ class CachingAwsBedrock(AwsBedrock):
             {"text": "dynamic content..."}
         ]
 
+        Args:
+            static_system: Static portion; defaults to the current run's part
+            dynamic_system: Dynamic portion; defaults to the current run's part
+
         Returns:
             System message content blocks, or None if no content
         """
+        if static_system is None and dynamic_system is None:
+            static_system, dynamic_system = self._resolve_system_parts()
+
         parts: list[dict[str, Any]] = []
 
         # Add static part
-        if self._static_system:
+        if static_system:
             # Check if it meets minimum token threshold
-            if self._cache_system_prompt and not self._check_token_threshold(self._static_system):
+            if self._cache_system_prompt and not self._check_token_threshold(static_system):
                 logger.warning(
                     "Static system prompt below minimum token threshold for caching. "
                     "Caching disabled for this request."
                 )
                 # Disable caching for this request, just concatenate
-                combined = "\n\n".join(
-                    [p for p in [self._static_system, self._dynamic_system] if p]
-                )
+                combined = "\n\n".join([p for p in [static_system, dynamic_system] if p])
                 return [{"text": combined}] if combined else None
 
-            parts.append({"text": self._static_system})
+            parts.append({"text": static_system})
 
         # Add cache checkpoint (only if we have static content to cache)
-        if self._static_system and self._cache_system_prompt:
+        if static_system and self._cache_system_prompt:
             parts.append({"cachePoint": {"type": "default"}})
             logger.debug(
                 f"Added cache checkpoint after static system prompt "
-                f"(~{len(self._static_system) // 4} tokens)"
+                f"(~{count_tokens(static_system, self.id)} tokens)"
             )
 
         # Add dynamic part
-        if self._dynamic_system:
-            parts.append({"text": self._dynamic_system})
-            logger.debug(f"Added dynamic system context (~{len(self._dynamic_system) // 4} tokens)")
+        if dynamic_system:
+            parts.append({"text": dynamic_system})
+            logger.debug(
+                f"Added dynamic system context (~{count_tokens(dynamic_system, self.id)} tokens)"
+            )
 
         return parts if parts else None
 
@@ -326,13 +404,13 @@ class CachingAwsBedrock(AwsBedrock):
         Returns:
             True if text is long enough to cache, False otherwise
         """
-        # Rough estimate: 4 chars ≈ 1 token
-        estimated_tokens = len(text) // 4
+        estimated_tokens = count_tokens(text, self.id)
+        min_tokens = cache_min_tokens(self.id, default=self.MIN_CACHE_TOKENS)
 
-        if estimated_tokens < self.MIN_CACHE_TOKENS:
+        if estimated_tokens < min_tokens:
             logger.warning(
                 f"System prompt (~{estimated_tokens} tokens) below minimum "
-                f"threshold ({self.MIN_CACHE_TOKENS} tokens). "
+                f"threshold ({min_tokens} tokens) for {self.id}. "
                 f"Consider longer instructions or disable caching."
             )
             return False
@@ -340,20 +418,57 @@ class CachingAwsBedrock(AwsBedrock):
         logger.info(f"System prompt (~{estimated_tokens} tokens) meets caching threshold")
         return True
 
+    @property
+    def _caching_enabled(self) -> bool:
+        return self._cache_system_prompt or self._cache_tools or self._cache_messages
+
+    def _get_metrics(self, response_usage: dict[str, Any]) -> Metrics:
+        """
+        Parse Bedrock usage into Agno metrics, including prompt-cache tokens.
+
+        The parent only reads input/output tokens.  Both the non-streaming
+        response and the stream's metadata chunk go through here, so the run
+        metrics (and the AgentResponse built from them) carry cache usage.
+        """
+        metrics = super()._get_metrics(response_usage)
+        metrics.cache_read_tokens, metrics.cache_write_tokens = cache_token_counts(response_usage)
+        return metrics
+
+    def _record_cache_usage(self, body: dict[str, Any], usage: dict[str, Any] | None) -> None:
+        """Add one response's cache usage to the prompt-cache stats and log it."""
+        if not usage or not self._caching_enabled:
+            return
+        get_prompt_cache_stats().record(self.id, self._static_prompt_hash(body), usage)
+        self._log_cache_metrics({"usage": usage})
+
+    @staticmethod
+    def _static_prompt_hash(body: dict[str, Any]) -> str:
+        """
+        Hash the system prompt text up to its first cache checkpoint.
+
+        This is the part expected to stay identical between requests; when it
+        changes, the stats start a new entry.
+        """
+        parts: list[str] = []
+        for block in body.get("system") or []:
+            if "cachePoint" in block:
+                break
+            parts.append(block.get("text", ""))
+        return hash_prompt("\n".join(parts))
+
     def _log_cache_metrics(self, response: dict[str, Any]) -> None:
         """
         Log cache performance metrics from Bedrock response.
 
         Bedrock returns cache metrics in the response under 'usage':
         - cacheReadInputTokens: Tokens retrieved from cache (cache HIT)
-        - cacheCreationInputTokens: Tokens cached for first time (cache MISS)
+        - cacheWriteInputTokens / cacheCreationInputTokens: Tokens cached for
+          first time (cache MISS)
 
         Args:
             response: The Bedrock API response
         """
-        usage = response.get("usage", {})
-        cache_hit = usage.get("cacheReadInputTokens", 0)
-        cache_miss = usage.get("cacheCreationInputTokens", 0)
+        cache_hit, cache_miss = cache_token_counts(response.get("usage", {}))
 
         if cache_hit > 0:
             logger.info(
@@ -363,7 +478,7 @@ class CachingAwsBedrock(AwsBedrock):
             logger.info(
                 f"📝 Cache MISS: {cache_miss} tokens cached for next request (cache created)"
             )
-        elif self._cache_system_prompt:
+        elif self._caching_enabled:
             logger.warning(
                 "⚠️ Caching enabled but no cache metrics in response. "
                 "Possible reasons: system prompt too short, caching not supported "
@@ -381,10 +496,11 @@ class CachingAwsBedrock(AwsBedrock):
         compress_tool_results: bool = False,
     ) -> ModelResponse:
         """
-        Async invoke the Bedrock API with raw request/response logging.
+        Async invoke the Bedrock API with raw request/response capture.
 
-        This override adds debug logging to capture the exact request sent
-        to Bedrock and the exact response received, for debugging and auditing.
+        This override hands the exact request sent to Bedrock and the exact
+        response received to the raw LLM capture (see
+        ``dcaf.core.infrastructure.llm_capture``), which is off by default.
 
         Args:
             messages: List of messages to send
@@ -398,30 +514,10 @@ class CachingAwsBedrock(AwsBedrock):
         Returns:
             ModelResponse: The parsed response from Bedrock
         """
-        # Format messages and build request body (same as parent)
-        formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
+        formatted_messages, body = self._build_request(messages, tools, compress_tool_results)
 
-        tool_config = None
-        if tools:
-            tool_config = {"tools": self._format_tools_for_request(tools)}
-
-        body = {
-            "system": system_message,
-            "toolConfig": tool_config,
-            "inferenceConfig": self._get_inference_config(),
-        }
-        body = {k: v for k, v in body.items() if v is not None}
-
-        if self.request_params:
-            body.update(**self.request_params)
-
-        # 🔍 LOG RAW REQUEST - This is the exact data sent to Bedrock
-        logger.info("🔍 RAW LLM REQUEST TO BEDROCK:")
-        logger.info(f"  Model ID: {self.id}")
-        logger.info(f"  Messages ({len(formatted_messages)} total):")
-        logger.info(f"{json.dumps(formatted_messages, indent=4, default=str)}")
-        logger.info("  Request Body:")
-        logger.info(f"{json.dumps(body, indent=4, default=str)}")
+        logger.debug(f"Bedrock converse: model={self.id}, messages={len(formatted_messages)}")
+        call_id = self._capture_request(formatted_messages, body, stream=False)
 
         if run_response and run_response.metrics:
             run_response.metrics.set_time_to_first_token()
@@ -434,13 +530,12 @@ class CachingAwsBedrock(AwsBedrock):
 
         assistant_message.metrics.stop_timer()
 
-        # 🔍 LOG RAW RESPONSE - This is the exact data returned from Bedrock
-        logger.info("🔍 RAW LLM RESPONSE FROM BEDROCK:")
-        logger.info(f"{json.dumps(response, indent=4, default=str)}")
+        if call_id:
+            get_llm_capture().capture(
+                call_id, "response", response, provider="bedrock", model=self.id
+            )
 
-        # Log cache metrics if caching is enabled
-        if self._cache_system_prompt:
-            self._log_cache_metrics(response)
+        self._record_cache_usage(body, response.get("usage"))
 
         model_response = self._parse_provider_response(response, response_format=response_format)
 
@@ -457,10 +552,14 @@ class CachingAwsBedrock(AwsBedrock):
         compress_tool_results: bool = False,
     ) -> AsyncIterator[ModelResponse]:
         """
-        Async invoke the Bedrock API with streaming and raw request logging.
+        Async invoke the Bedrock API with streaming and raw request capture.
 
-        This override adds debug logging to capture the exact request sent
-        to Bedrock. Response logging is done per chunk in the stream.
+        This override hands the exact request sent to Bedrock to the raw LLM
+        capture (off by default).  The response is captured once the stream
+        ends: a chunk count and the final chunk (Bedrock's usage metadata),
+        plus every chunk if ``DCAF_LLM_CAPTURE_STREAM_CHUNKS`` is set.  A
+        stream that fails or is abandoned part-way is still captured, with
+        an ``error`` field naming what ended it.
 
         Args:
             messages: List of messages to send
@@ -474,12 +573,81 @@ class CachingAwsBedrock(AwsBedrock):
         Yields:
             ModelResponse: Streaming response chunks from Bedrock
         """
-        # Format messages and build request body (same as parent)
+        formatted_messages, body = self._build_request(messages, tools, compress_tool_results)
+
+        logger.debug(
+            f"Bedrock converse_stream: model={self.id}, messages={len(formatted_messages)}"
+        )
+        call_id = self._capture_request(formatted_messages, body, stream=True)
+        recorder = get_llm_capture().stream_recorder(call_id, provider="bedrock", model=self.id)
+
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+
+        # Make the actual Bedrock streaming API call
+        error: BaseException | None = None
+        try:
+            async with self.get_async_client() as client:
+                response = await client.converse_stream(
+                    modelId=self.id, messages=formatted_messages, **body
+                )
+
+                chunk_count = 0
+                current_tool: dict[str, Any] = {}
+                async for chunk in response.get("stream"):
+                    chunk_count += 1
+                    recorder.add(chunk)
+                    if "metadata" in chunk:
+                        self._record_cache_usage(body, chunk["metadata"].get("usage"))
+
+                    model_response, current_tool = self._parse_provider_response_delta(
+                        chunk, current_tool
+                    )
+
+                    if model_response:
+                        yield model_response
+
+                logger.debug(f"Bedrock converse_stream: received {chunk_count} chunks")
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            recorder.finish(error)
+
+        assistant_message.metrics.stop_timer()
+
+    def _build_request(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None,
+        compress_tool_results: bool,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """
+        Format messages and build the Converse request body, placing cache checkpoints.
+
+        Returns:
+            Tuple of (formatted_messages, body)
+        """
         formatted_messages, system_message = self._format_messages(messages, compress_tool_results)
 
+        # System checkpoints were placed by _format_messages; the rest share what is left
+        budget = self.MAX_CACHE_CHECKPOINTS - sum(
+            1 for block in system_message or [] if "cachePoint" in block
+        )
+
         tool_config = None
         if tools:
             tool_config = {"tools": self._format_tools_for_request(tools)}
+            if self._cache_tools and budget > 0:
+                tool_config["tools"].append({"cachePoint": {"type": "default"}})
+                budget -= 1
+
+        if self._cache_messages and budget > 0:
+            formatted_messages = self._add_message_checkpoints(
+                formatted_messages, min(budget, self.MAX_MESSAGE_CHECKPOINTS)
+            )
 
         body = {
             "system": system_message,
@@ -491,51 +659,58 @@ class CachingAwsBedrock(AwsBedrock):
         if self.request_params:
             body.update(**self.request_params)
 
-        # 🔍 LOG RAW REQUEST - This is the exact data sent to Bedrock
-        logger.info("🔍 RAW LLM REQUEST TO BEDROCK (STREAMING):")
-        logger.info(f"  Model ID: {self.id}")
-        logger.info(f"  Messages ({len(formatted_messages)} total):")
-        logger.info(f"{json.dumps(formatted_messages, indent=4, default=str)}")
-        logger.info("  Request Body:")
-        logger.info(f"{json.dumps(body, indent=4, default=str)}")
-
-        if run_response and run_response.metrics:
-            run_response.metrics.set_time_to_first_token()
+        return formatted_messages, body
 
-        assistant_message.metrics.start_timer()
-
-        # Make the actual Bedrock streaming API call
-        async with self.get_async_client() as client:
-            response = await client.converse_stream(
-                modelId=self.id, messages=formatted_messages, **body
-            )
-
-            # 🔍 Log that we're starting to receive chunks
-            logger.info(
-                "🔍 RAW LLM RESPONSE FROM BEDROCK (STREAMING): Starting to receive chunks..."
-            )
-
-            chunk_count = 0
-            current_tool: dict[str, Any] = {}
-            async for chunk in response.get("stream"):
-                chunk_count += 1
-                # Log each chunk at INFO level
-                logger.info(
-                    f"🔍 Stream chunk #{chunk_count}: {json.dumps(chunk, indent=2, default=str)}"
-                )
-
-                model_response, current_tool = self._parse_provider_response_delta(
-                    chunk, current_tool
-                )
+    @staticmethod
+    def _add_message_checkpoints(
+        messages: list[dict[str, Any]], count: int
+    ) -> list[dict[str, Any]]:
+        """
+        Add a cachePoint to the last ``count`` user messages.
 
-                if model_response:
-                    yield model_response
+        On each agent-loop iteration the newest user turn (the question or the
+        latest tool results) gets a checkpoint, so the next iteration can read
+        the whole prefix from the cache.  The previous user turn keeps its
+        checkpoint, which is where this request's cache hit comes from.
 
-            logger.info(
-                f"🔍 RAW LLM RESPONSE FROM BEDROCK (STREAMING): Received {chunk_count} total chunks"
-            )
+        Returns:
+            A new list; the checkpointed messages are copied, not mutated.
+        """
+        result = list(messages)
+        placed = 0
+        for index in range(len(result) - 1, -1, -1):
+            if placed >= count:
+                break
+            message = result[index]
+            content = message.get("content")
+            if message.get("role") != "user" or not isinstance(content, list) or not content:
+                continue
+            result[index] = {**message, "content": [*content, {"cachePoint": {"type": "default"}}]}
+            placed += 1
+        return result
+
+    def _capture_request(
+        self, formatted_messages: list[dict[str, Any]], body: dict[str, Any], stream: bool
+    ) -> str | None:
+        """
+        Hand the raw Bedrock request to the LLM capture if this call is sampled.
 
-        assistant_message.metrics.stop_timer()
+        Returns:
+            The capture call ID, or None when the call is not captured
+        """
+        capture = get_llm_capture()
+        if not capture.sample():
+            return None
+        call_id = capture.new_call()
+        capture.capture(
+            call_id,
+            "request",
+            {"modelId": self.id, "messages": formatted_messages, **body},
+            provider="bedrock",
+            model=self.id,
+            stream=stream,
+        )
+        return call_id
 
 
 # Note: We intentionally don't export a create_caching_model() factory
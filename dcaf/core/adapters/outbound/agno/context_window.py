@@ -0,0 +1,305 @@
+"""
+Token-budgeted conversation window.
+
+Long HelpDesk threads would otherwise send the whole history on every turn.
+``ConversationWindow`` keeps the most recent turns verbatim and collapses
+everything older into a rolling summary:
+
+    [summary of turns 1..k]  [turn k+1] ... [newest turn]
+
+Summaries are cached by a hash of the prefix they cover, so one is generated
+once and reused on every later turn of the same conversation.  When the kept
+turns outgrow the budget again, the cut moves forward and the next summary is
+built from the previous summary plus the newly dropped turns.
+
+Each compaction shrinks the kept turns to ``low_watermark`` of the budget, so
+a conversation is summarized every few turns, not on every turn.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from dcaf.llm.tokens import context_window_tokens, count_tokens
+
+from .run_context import run_scope
+
+logger = logging.getLogger(__name__)
+
+# Default history budget, capped at a quarter of the model's context window
+DEFAULT_MAX_HISTORY_TOKENS = 24_000
+
+# Per-message framing overhead (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PROMPT = (
+    "Summarize the earlier part of a conversation between a user and an AI "
+    "assistant so the assistant can continue it without the full transcript. "
+    "Keep facts, decisions, names and identifiers of resources, commands that "
+    "were run and their outcomes, and open questions. Be concise; do not add "
+    "commentary."
+)
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n\n"
+
+SUMMARY_ACK = "Understood. I will continue from that summary."
+
+# (previous summary or None, newly dropped messages) -> new summary
+Summarizer = Callable[[str | None, list[dict[str, Any]]], Awaitable[str]]
+
+
+def default_history_budget(model_id: str) -> int:
+    """Return the default history budget for a model."""
+    return min(DEFAULT_MAX_HISTORY_TOKENS, context_window_tokens(model_id) // 4)
+
+
+def build_summary_request(previous: str | None, messages: list[dict[str, Any]]) -> str:
+    """Build the prompt asking a model to (re)summarize dropped turns."""
+    parts = [SUMMARY_PROMPT]
+    if previous:
+        parts.append(f"Summary so far:\n{previous}")
+    transcript = "\n\n".join(f"{m['role']}: {_content_text(m['content'])}" for m in messages)
+    parts.append(f"Conversation to add to the summary:\n{transcript}")
+    return "\n\n".join(parts)
+
+
+def model_summarizer(get_model: Callable[[], Awaitable[Any]]) -> Summarizer:
+    """
+    Create a summarizer that asks an Agno model for the summary.
+
+    Args:
+        get_model: Coroutine function returning the Agno model to use
+    """
+    from agno.models.message import Message
+
+    async def summarize(previous: str | None, messages: list[dict[str, Any]]) -> str:
+        model = await get_model()
+        # Keep the agent's system prompt (published for the run) off this call
+        with run_scope(None, None, None):
+            response = await model.ainvoke(
+                messages=[Message(role="user", content=build_summary_request(previous, messages))],
+                assistant_message=Message(role="assistant"),
+            )
+        return (response.content or "").strip()
+
+    return summarize
+
+
+@dataclass
+class WindowReport:
+    """
+    What the window did to one request's history.
+
+    Attributes:
+        history_tokens: Tokens of the full history
+        sent_tokens: Tokens actually sent (kept turns plus summary)
+        trimmed_messages: Older messages replaced by the summary
+        trimmed_tokens: Tokens of those messages
+        summary_tokens: Tokens of the summary (0 if none)
+        summarized: Whether a new summary was generated for this request
+    """
+
+    history_tokens: int = 0
+    sent_tokens: int = 0
+    trimmed_messages: int = 0
+    trimmed_tokens: int = 0
+    summary_tokens: int = 0
+    summarized: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ConversationWindow:
+    """
+    Fits a conversation into a token budget.
+
+    Messages are ``{"role", "content"}`` dicts as built by
+    ``AgnoAdapter._build_message_list`` (user first, alternating roles).
+
+    Args:
+        model_id: Model the history is sent to (used for token counting)
+        max_tokens: History budget in tokens; 0 disables the window
+        summarizer: Produces the rolling summary; without one, older turns are
+                    dropped
+        low_watermark: Share of the budget the kept turns are shrunk to when
+                       compacting
+        min_recent_messages: Messages always kept verbatim
+        cache_size: Summaries kept for reuse
+    """
+
+    # Room left for the summary when choosing which turns to keep
+    SUMMARY_RESERVE_TOKENS = 1024
+
+    def __init__(
+        self,
+        model_id: str,
+        max_tokens: int,
+        summarizer: Summarizer | None = None,
+        low_watermark: float = 0.5,
+        min_recent_messages: int = 2,
+        cache_size: int = 256,
+    ) -> None:
+        self._model_id = model_id
+        self._max_tokens = max_tokens
+        self._summarizer = summarizer
+        self._low_watermark = low_watermark
+        self._min_recent_messages = min_recent_messages
+        self._cache_size = cache_size
+        # prefix hash -> summary of that prefix ("" when dropped unsummarized)
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_tokens(self) -> int:
+        return self._max_tokens
+
+    async def fit(
+        self, messages: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], WindowReport]:
+        """
+        Return the messages to send and a report of what was trimmed.
+
+        Args:
+            messages: Full history, oldest first, ending with the newest turn
+
+        Returns:
+            Tuple of (messages to send, report)
+        """
+        costs = [self._message_tokens(m) for m in messages]
+        total = sum(costs)
+        report = WindowReport(history_tokens=total, sent_tokens=total)
+        if self._max_tokens <= 0 or len(messages) <= self._min_recent_messages:
+            return messages, report
+
+        hashes = self._prefix_hashes(messages)
+
+        # Reuse the newest cached summary (its cut stays put between turns)
+        cut, summary = 0, ""
+        for i in range(len(messages) - 1, 0, -1):
+            cached = self._get_summary(hashes[i])
+            if cached is not None:
+                cut, summary = i, cached
+                break
+
+        if self._summary_tokens(summary) + sum(costs[cut:]) > self._max_tokens:
+            target = int(self._max_tokens * self._low_watermark) - self.SUMMARY_RESERVE_TOKENS
+            new_cut = self._find_cut(messages, costs, target, start=cut)
+            if new_cut > cut:
+                rolled = await self._roll_summary(summary, messages[cut:new_cut])
+                cut = new_cut
+                if rolled is not None:
+                    summary = rolled
+                    report.summarized = self._summarizer is not None
+                    self._put_summary(hashes[cut], summary)
+
+        if cut == 0:
+            return messages, report
+
+        summary_tokens = self._summary_tokens(summary)
+        report.trimmed_messages = cut
+        report.trimmed_tokens = sum(costs[:cut])
+        report.summary_tokens = summary_tokens
+        report.sent_tokens = summary_tokens + sum(costs[cut:])
+        return self._assemble(summary, messages[cut:]), report
+
+    def clear(self) -> None:
+        """Forget all cached summaries."""
+        with self._lock:
+            self._summaries.clear()
+
+    # -------------------------------------------------------------------------
+
+    def _find_cut(
+        self, messages: list[dict[str, Any]], costs: list[int], target: int, start: int
+    ) -> int:
+        """Return the index of the oldest message to keep, on a user turn."""
+        cut, kept = len(messages), 0
+        while cut > start and (
+            len(messages) - cut < self._min_recent_messages or kept + costs[cut - 1] <= target
+        ):
+            cut -= 1
+            kept += costs[cut]
+
+        # The kept window must start with a user message
+        while cut < len(messages) and messages[cut]["role"] != "user":
+            cut += 1
+        return cut if cut < len(messages) else start
+
+    async def _roll_summary(self, previous: str, dropped: list[dict[str, Any]]) -> str | None:
+        """
+        Fold newly dropped messages into the summary.
+
+        Returns None if the summarizer failed; the turns are then dropped for
+        this request only and summarizing is retried on the next one.
+        """
+        if self._summarizer is None:
+            return previous
+        try:
+            return await self._summarizer(previous or None, dropped)
+        except Exception as e:
+            logger.warning(f"Conversation summary failed, dropping older turns: {e}")
+            return None
+
+    def _assemble(self, summary: str, kept: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not summary:
+            return list(kept)
+        return [
+            {"role": "user", "content": SUMMARY_PREFIX + summary},
+            {"role": "assistant", "content": SUMMARY_ACK},
+            *kept,
+        ]
+
+    def _message_tokens(self, message: dict[str, Any]) -> int:
+        return (
+            count_tokens(_content_text(message.get("content")), self._model_id)
+            + MESSAGE_OVERHEAD_TOKENS
+        )
+
+    def _summary_tokens(self, summary: str) -> int:
+        if not summary:
+            return 0
+        return (
+            count_tokens(SUMMARY_PREFIX + summary + SUMMARY_ACK, self._model_id)
+            + 2 * MESSAGE_OVERHEAD_TOKENS
+        )
+
+    @staticmethod
+    def _prefix_hashes(messages: list[dict[str, Any]]) -> list[str]:
+        """hashes[i] identifies messages[:i]; each extends the previous one."""
+        hashes = [""]
+        digest = hashlib.sha256()
+        for message in messages:
+            digest.update(message["role"].encode())
+            digest.update(_content_text(message["content"]).encode())
+            digest.update(b"\x00")
+            hashes.append(digest.copy().hexdigest())
+        return hashes
+
+    def _get_summary(self, prefix_hash: str) -> str | None:
+        with self._lock:
+            summary = self._summaries.get(prefix_hash)
+            if summary is not None:
+                self._summaries.move_to_end(prefix_hash)
+            return summary
+
+    def _put_summary(self, prefix_hash: str, summary: str) -> None:
+        with self._lock:
+            self._summaries[prefix_hash] = summary
+            while len(self._summaries) > self._cache_size:
+                self._summaries.popitem(last=False)
+
+
+def _content_text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if content is None:
+        return ""
+    return json.dumps(content, default=str)
@@ -15,8 +15,10 @@ from typing import Any
 
 import aioboto3
 
+from ....infrastructure.rate_limiter import get_rate_limiter_registry
 from .caching_bedrock import CachingAwsBedrock
 from .gcp_metadata import GCPMetadataManager, get_default_gcp_metadata_manager
+from .rate_limit import apply_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +47,17 @@ class ModelConfig:
 
     # Caching configuration
     cache_system_prompt: bool = False
+    cache_tools: bool = False
+    cache_messages: bool = False
+    # Defaults only: the adapter passes per-request parts through the run context
     static_system: str | None = None
     dynamic_system: str | None = None
 
+    # Rate limits shared by all models of this provider, model and region
+    # (default: DCAF_RATE_LIMIT_TOKENS_PER_MINUTE / DCAF_RATE_LIMIT_REQUESTS_PER_MINUTE)
+    tokens_per_minute: int | None = None
+    requests_per_minute: int | None = None
+
 
 class AgnoModelFactory:
     """
@@ -145,8 +155,31 @@ class AgnoModelFactory:
                 f"Unsupported provider: '{provider}'. Supported providers: {supported}"
             )
 
+        self._apply_rate_limiter(self._model)
         return self._model
 
+    def _apply_rate_limiter(self, model: Any) -> None:
+        """
+        Attach the process-wide rate limiter for this provider, model and region.
+
+        Nothing is attached if no limits are configured.
+        """
+        config = self._config
+        region = (
+            getattr(model, "aws_region", None)
+            or getattr(model, "region", None)
+            or getattr(model, "location", None)
+        )
+        limiter = get_rate_limiter_registry().get(
+            config.provider,
+            config.model_id,
+            region,
+            tokens_per_minute=config.tokens_per_minute,
+            requests_per_minute=config.requests_per_minute,
+        )
+        if limiter is not None:
+            apply_rate_limiter(model, limiter)
+
     async def _create_bedrock_model(self) -> Any:
         """
         Create an AWS Bedrock model with async session.
@@ -190,7 +223,8 @@ class AgnoModelFactory:
         logger.info(
             f"Agno: Initialized Bedrock model {config.model_id} "
             f"(temperature={config.temperature}, max_tokens={config.max_tokens}, "
-            f"cache_system_prompt={config.cache_system_prompt})"
+            f"cache_system_prompt={config.cache_system_prompt}, "
+            f"cache_tools={config.cache_tools}, cache_messages={config.cache_messages})"
         )
 
         # Always use CachingAwsBedrock for raw logging support
@@ -202,6 +236,8 @@ class AgnoModelFactory:
             temperature=config.temperature,
             max_tokens=config.max_tokens,
             cache_system_prompt=config.cache_system_prompt,
+            cache_tools=config.cache_tools,
+            cache_messages=config.cache_messages,
             static_system=config.static_system,
             dynamic_system=config.dynamic_system,
         )
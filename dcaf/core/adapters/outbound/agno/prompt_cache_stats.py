@@ -0,0 +1,149 @@
+"""
+In-process prompt-cache telemetry.
+
+``CachingAwsBedrock`` records the cache usage Bedrock reports for every call
+made with caching enabled.  Calls are grouped by model and by a hash of the
+cached (static) prompt prefix, so a prompt change shows up as a new group:
+if caching silently stops working - e.g. a timestamp crept into the static
+prompt - the new group has writes and misses but no reads.
+
+Example:
+    from dcaf.core.adapters.outbound.agno import get_prompt_cache_stats
+
+    for entry in get_prompt_cache_stats().snapshot():
+        print(entry["model_id"], entry["prompt_hash"], entry["token_hit_ratio"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+def hash_prompt(text: str) -> str:
+    """Return a short stable hash identifying a cached prompt prefix."""
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+@dataclass
+class _Entry:
+    calls: int = 0
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    hits: int = 0
+    writes: int = 0
+    misses: int = 0
+    consecutive_misses: int = 0
+    last_call_at: float = 0.0
+    last_hit_at: float | None = None
+
+
+class PromptCacheStats:
+    """
+    Aggregates prompt-cache usage per (model, static prompt hash).
+
+    A call is a *hit* if it read tokens from the cache, a *write* if it only
+    wrote to it, and a *miss* if it did neither.  Thread-safe.
+
+    Args:
+        max_entries: Groups kept; the least recently called are forgotten
+                     first, so prompts that change on every call stay bounded
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, model_id: str, prompt_hash: str, usage: dict[str, Any]) -> None:
+        """
+        Record the usage block of one Bedrock response.
+
+        Args:
+            model_id: Model the call was made with
+            prompt_hash: Hash of the cached prompt prefix (see :func:`hash_prompt`)
+            usage: Bedrock ``usage`` dict (``inputTokens``, ``cacheReadInputTokens``, ...)
+        """
+        cache_read, cache_write = cache_token_counts(usage)
+        now = time.time()
+        with self._lock:
+            key = (model_id, prompt_hash)
+            entry = self._entries.setdefault(key, _Entry())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            entry.calls += 1
+            entry.input_tokens += usage.get("inputTokens", 0) or 0
+            entry.cache_read_tokens += cache_read
+            entry.cache_write_tokens += cache_write
+            entry.last_call_at = now
+            if cache_read:
+                entry.hits += 1
+                entry.consecutive_misses = 0
+                entry.last_hit_at = now
+            elif cache_write:
+                entry.writes += 1
+                entry.consecutive_misses += 1
+            else:
+                entry.misses += 1
+                entry.consecutive_misses += 1
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """
+        Return one dict per (model, prompt hash), most recently used first.
+
+        Besides the raw counters each entry has ``hit_ratio`` (share of calls
+        that read from the cache) and ``token_hit_ratio`` (share of input
+        tokens served from the cache).
+        """
+        with self._lock:
+            items = [(key, _Entry(**vars(entry))) for key, entry in self._entries.items()]
+
+        result = []
+        for (model_id, prompt_hash), entry in items:
+            total_input = entry.input_tokens + entry.cache_read_tokens + entry.cache_write_tokens
+            result.append(
+                {
+                    "model_id": model_id,
+                    "prompt_hash": prompt_hash,
+                    **vars(entry),
+                    "hit_ratio": entry.hits / entry.calls if entry.calls else 0.0,
+                    "token_hit_ratio": (
+                        entry.cache_read_tokens / total_input if total_input else 0.0
+                    ),
+                }
+            )
+        result.sort(key=lambda e: e["last_call_at"], reverse=True)
+        return result
+
+    def reset(self) -> None:
+        """Forget all recorded usage."""
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_token_counts(usage: dict[str, Any]) -> tuple[int, int]:
+    """
+    Return (cache read, cache write) tokens from a Bedrock usage dict.
+
+    The Converse API reports writes as ``cacheWriteInputTokens``; some
+    responses use ``cacheCreationInputTokens``.
+    """
+    cache_read = usage.get("cacheReadInputTokens", 0) or 0
+    cache_write = (
+        usage.get("cacheWriteInputTokens", 0) or usage.get("cacheCreationInputTokens", 0) or 0
+    )
+    return cache_read, cache_write
+
+
+_default_stats = PromptCacheStats()
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """Return the process-wide prompt-cache statistics."""
+    return _default_stats
@@ -0,0 +1,113 @@
+"""
+Rate limiting for Agno models.
+
+``AgnoModelFactory`` attaches the process-wide ``RateLimiter`` of a
+(provider, model, region) to the models it creates (see
+``dcaf.core.infrastructure.rate_limiter``).  Every model request - agent
+runs, ``LLM.ainvoke``/``astream``, channel routing, and each retry Agno
+makes - then reserves its estimated input tokens first and settles them
+against the reported usage afterwards.
+
+Limiting hooks into the four Agno request methods (see ``request_hooks``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+from dcaf.llm.tokens import count_tokens
+
+from ....infrastructure.rate_limiter import RateLimiter
+from .request_hooks import hook_requests
+
+
+def estimate_input_tokens(
+    messages: list[Message], tools: list[dict[str, Any]] | None, model_id: str | None = None
+) -> int:
+    """Estimate the input tokens of a model request."""
+    parts = [message.get_content_string() for message in messages]
+    if tools:
+        parts.append(json.dumps(tools, default=str))
+    return count_tokens("\n".join(parts), model_id)
+
+
+def used_tokens(response: ModelResponse) -> int | None:
+    """Return the tokens a response reports as used, or None if it reports none."""
+    usage = response.response_usage
+    if not isinstance(usage, Metrics):
+        return None
+    return usage.total_tokens or (usage.input_tokens + usage.output_tokens) or None
+
+
+class _RateLimitedRequests:
+    """Request hooks reserving limiter capacity around each model request."""
+
+    rate_limiter: RateLimiter
+    # The hooked model class; its methods are called with this instance
+    _unhooked: Any
+
+    def _estimate(self, kwargs: dict[str, Any]) -> int:
+        return estimate_input_tokens(
+            kwargs.get("messages") or [], kwargs.get("tools"), getattr(self, "id", None)
+        )
+
+    async def ainvoke(self, **kwargs: Any) -> ModelResponse:
+        reservation = await self.rate_limiter.acquire(self._estimate(kwargs))
+        response: ModelResponse | None = None
+        try:
+            response = await self._unhooked.ainvoke(self, **kwargs)
+            return response
+        finally:
+            reservation.settle(used_tokens(response) if response else None)
+
+    def invoke(self, **kwargs: Any) -> ModelResponse:
+        reservation = self.rate_limiter.acquire_sync(self._estimate(kwargs))
+        response: ModelResponse | None = None
+        try:
+            response = self._unhooked.invoke(self, **kwargs)
+            return response
+        finally:
+            reservation.settle(used_tokens(response) if response else None)
+
+    async def ainvoke_stream(self, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        reservation = await self.rate_limiter.acquire(self._estimate(kwargs))
+        used = None
+        try:
+            async for delta in self._unhooked.ainvoke_stream(self, **kwargs):
+                used = used_tokens(delta) or used
+                yield delta
+        finally:
+            reservation.settle(used)
+
+    def invoke_stream(self, **kwargs: Any) -> Iterator[ModelResponse]:
+        reservation = self.rate_limiter.acquire_sync(self._estimate(kwargs))
+        used = None
+        try:
+            for delta in self._unhooked.invoke_stream(self, **kwargs):
+                used = used_tokens(delta) or used
+                yield delta
+        finally:
+            reservation.settle(used)
+
+
+def apply_rate_limiter(model: Any, limiter: RateLimiter) -> Any:
+    """
+    Make every request of ``model`` go through ``limiter``.
+
+    Args:
+        model: An Agno model instance
+        limiter: The limiter shared by all models of the same provider,
+                 model and region
+
+    Returns:
+        The same model instance
+    """
+    hook_requests(model, _RateLimitedRequests)
+    model.rate_limiter = limiter
+    return model
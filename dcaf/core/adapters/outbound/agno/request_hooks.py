@@ -0,0 +1,58 @@
+"""
+Replacing the request methods of Agno model instances.
+
+Agno's orchestration (``aresponse`` and friends, tool-result formatting,
+retries) lives on the model class and calls four request methods:
+``invoke``, ``ainvoke``, ``invoke_stream`` and ``ainvoke_stream``.  To put
+something in front of the provider call - rate limiting, routing - an
+instance is switched to a subclass of its own class whose request methods
+come from a hooks class.  The subclass keeps the class name, so provider
+detection by class name still works, and everything else is inherited.
+
+The hook methods are copied into the subclass rather than mixed in, so that
+existing instances can switch classes in place; they reach the original
+methods through ``self._unhooked``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+REQUEST_METHODS = ("invoke", "ainvoke", "invoke_stream", "ainvoke_stream")
+
+# (model class, hooks class) -> hooked subclass, so each pair is created once
+_hooked_classes: dict[tuple[type, type], type] = {}
+
+
+def _hooked_class(cls: type, hooks: type) -> type:
+    hooked = _hooked_classes.get((cls, hooks))
+    if hooked is not None:
+        return hooked
+    namespace: dict[str, Any] = {
+        name: value for name, value in vars(hooks).items() if not name.startswith("__")
+    }
+    namespace.update(
+        _unhooked=cls,
+        _request_hooks=hooks,
+        __qualname__=cls.__qualname__,
+        __module__=cls.__module__,
+    )
+    # setdefault: a class created concurrently by another thread wins
+    return _hooked_classes.setdefault((cls, hooks), type(cls.__name__, (cls,), namespace))
+
+
+def has_request_hooks(model: Any, hooks: type) -> bool:
+    """Whether ``model``'s class already uses ``hooks``."""
+    return vars(type(model)).get("_request_hooks") is hooks
+
+
+def hook_requests(model: Any, hooks: type) -> Any:
+    """
+    Switch ``model`` to a subclass of its class using ``hooks``' methods.
+
+    Returns:
+        The same model instance (unchanged if it already uses ``hooks``)
+    """
+    if not has_request_hooks(model, hooks):
+        model.__class__ = _hooked_class(type(model), hooks)
+    return model
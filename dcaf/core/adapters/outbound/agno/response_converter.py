@@ -37,10 +37,22 @@ class AgnoMetrics:
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     duration: float = 0.0
     time_to_first_token: float | None = None
     response_timer: float | None = None
 
+    def usage(self) -> dict[str, int]:
+        """Token usage for ``AgentResponse.metadata["usage"]``."""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+        }
+
 
 class AgnoResponseConverter:
     """
@@ -58,8 +70,11 @@ class AgnoResponseConverter:
         """
         Extract metrics from Agno's RunOutput.
 
+        Also works for streaming ``RunCompletedEvent``s, which carry the same
+        ``metrics`` attribute.
+
         Args:
-            run_output: The RunOutput from Agno
+            run_output: The RunOutput (or RunCompletedEvent) from Agno
 
         Returns:
             AgnoMetrics or None if no metrics available
@@ -72,6 +87,8 @@ class AgnoResponseConverter:
             input_tokens=getattr(m, "input_tokens", 0) or 0,
             output_tokens=getattr(m, "output_tokens", 0) or 0,
             total_tokens=getattr(m, "total_tokens", 0) or 0,
+            cache_read_tokens=getattr(m, "cache_read_tokens", 0) or 0,
+            cache_write_tokens=getattr(m, "cache_write_tokens", 0) or 0,
             duration=getattr(m, "duration", 0.0) or 0.0,
             time_to_first_token=getattr(m, "time_to_first_token", None),
             response_timer=getattr(m, "response_timer", None),
@@ -81,7 +98,7 @@ class AgnoResponseConverter:
         self,
         run_output: Any,
         conversation_id: str,
-        metrics: AgnoMetrics | None = None,  # noqa: ARG002
+        metrics: AgnoMetrics | None = None,
         tracing_context: dict[str, Any] | None = None,
     ) -> AgentResponse:
         """
@@ -90,7 +107,9 @@ class AgnoResponseConverter:
         Args:
             run_output: The RunOutput from Agno
             conversation_id: ID for this conversation
-            metrics: Optional extracted metrics (currently unused but kept for API compatibility)
+            metrics: Optional extracted metrics; extracted from run_output if omitted.
+                Token usage (including prompt-cache reads/writes) is added to the
+                response metadata under ``usage``.
             tracing_context: Optional tracing context to include in response metadata
 
         Returns:
@@ -110,8 +129,11 @@ class AgnoResponseConverter:
         # Wrap tool calls in DataDTO (AgentResponse expects data, not tool_calls)
         data = DataDTO(tool_calls=tool_calls)
 
-        # Build metadata with tracing context
+        # Build metadata with tracing context and token usage
         response_metadata = self._build_response_metadata(tracing_context)
+        metrics = metrics or self.extract_metrics(run_output)
+        if metrics:
+            response_metadata["usage"] = metrics.usage()
 
         return AgentResponse(
             conversation_id=conversation_id,
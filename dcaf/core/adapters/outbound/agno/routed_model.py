@@ -0,0 +1,508 @@
+"""
+Failover and hedged requests across several model targets.
+
+``AgnoModelFactory`` binds one provider and region, so a degraded region
+shows up directly in latency and errors.  ``RoutedModelFactory`` creates one
+model per ``ModelConfig`` (other regions, other providers) and returns a
+routed model that sends each request to the first healthy target:
+
+- **Failover**: a request that fails with a transient error (throttling,
+  5xx, timeout, connection) is retried on the next target.  Other errors -
+  validation or permission errors, bad arguments - are raised right away
+  and do not count against the target.
+- **Circuit breaker**: a target that fails ``failure_threshold`` times in a
+  row is skipped for ``cooldown_seconds``; afterwards it is tried again and
+  a single failure opens the circuit again.
+- **Hedging** (optional): if the first target has not answered - for
+  streams: produced its first chunk - within a percentile of its recent
+  latencies, a duplicate request goes to the next target and the first
+  answer wins.  The other request is cancelled.
+
+Example:
+    from dcaf.core.adapters.outbound.agno import ModelConfig, RoutedModelFactory, RoutingPolicy
+
+    factory = RoutedModelFactory(
+        [
+            ModelConfig(model_id=model_id, provider="bedrock", aws_region="us-east-1"),
+            ModelConfig(model_id=model_id, provider="bedrock", aws_region="us-west-2"),
+        ],
+        policy=RoutingPolicy(hedge=True),
+    )
+    model = await factory.create_model()
+    factory.router.stats()
+
+The routed model is a copy of the first target's model (Agno's message and
+tool-result formatting follow it), so targets should use the same provider
+family.  Per-call settings reach the targets through the routed model's
+``target_view`` (see ``InferenceConfig.apply``).  Use ``RoutedModelFactory`` with targets built from fakes, or
+:func:`route_model` directly, to test routing locally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from agno.models.response import ModelResponse
+
+from ....infrastructure.retry import is_retryable
+from .gcp_metadata import GCPMetadataManager
+from .model_factory import AgnoModelFactory, ModelConfig
+from .request_hooks import hook_requests
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Any = object()
+
+# Returns the model a request is made with, given a target's model
+ModelView = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class RoutingPolicy:
+    """
+    How a routed model picks targets.
+
+    Attributes:
+        hedge: Send a duplicate request to the next target when the first is slow
+        hedge_percentile: Latency percentile of the first target after which
+                          to hedge (0.95 = slower than 95% of its recent requests)
+        hedge_min_delay: Lower bound of the hedge delay in seconds
+        hedge_max_delay: Upper bound of the hedge delay in seconds (also used
+                         until ``min_samples`` latencies were recorded, so a
+                         cold target is not hedged on every request)
+        min_samples: Latencies needed before the percentile is used
+        latency_window: Recent latencies kept per target
+        failure_threshold: Consecutive failures that open a target's circuit
+        cooldown_seconds: How long an open circuit skips the target
+    """
+
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_delay: float = 0.5
+    hedge_max_delay: float = 10.0
+    min_samples: int = 20
+    latency_window: int = 200
+    failure_threshold: int = 3
+    cooldown_seconds: float = 30.0
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    ``closed``: requests pass.  ``open``: the target is skipped until the
+    cooldown ends.  ``half_open``: after the cooldown, requests pass again;
+    one failure reopens the circuit, one success closes it.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_until = 0.0
+        self._half_open = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_until > time.monotonic():
+            return "open"
+        return "half_open" if self._half_open else "closed"
+
+    def available(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self._half_open or self.consecutive_failures >= self.failure_threshold:
+            self.opened_until = time.monotonic() + self.cooldown_seconds
+            self._half_open = True
+
+
+class RouteTarget:
+    """
+    One model a routed model can send requests to, with its health.
+
+    Args:
+        name: Name used in logs and stats (e.g. ``bedrock/<model>/us-west-2``)
+        model: The Agno model
+        policy: Routing policy (breaker and latency settings)
+    """
+
+    def __init__(self, name: str, model: Any, policy: RoutingPolicy) -> None:
+        self.name = name
+        self.model = model
+        self.breaker = CircuitBreaker(policy.failure_threshold, policy.cooldown_seconds)
+        self._latencies: deque[float] = deque(maxlen=policy.latency_window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(latency)
+            self.breaker.record_success()
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            self.breaker.record_failure()
+        logger.warning(f"Model target {self.name} failed ({self.breaker.state}): {error}")
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the recent latencies, or None without samples."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(percentile * len(samples)))]
+
+    def hedge_delay(self, policy: RoutingPolicy) -> float:
+        """Seconds to wait for this target before hedging."""
+        if len(self._latencies) < policy.min_samples:
+            return policy.hedge_max_delay
+        delay = self.latency_percentile(policy.hedge_percentile) or policy.hedge_min_delay
+        return min(policy.hedge_max_delay, max(policy.hedge_min_delay, delay))
+
+    def stats(self) -> dict[str, Any]:
+        p50 = self.latency_percentile(0.5)
+        p95 = self.latency_percentile(0.95)
+        return {
+            "state": self.breaker.state,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p95_ms": p95 * 1000 if p95 is not None else None,
+        }
+
+
+@dataclass
+class _Attempt:
+    target: RouteTarget
+    hedged: bool
+
+
+class ModelRouter:
+    """
+    Sends model requests to targets with failover, circuit breaking and hedging.
+
+    The request methods take an optional ``model_view``, called with a
+    target's model to get the model the request is made with (e.g. a copy
+    with per-call settings).
+
+    Args:
+        targets: Targets in order of preference
+        policy: Routing policy
+    """
+
+    def __init__(self, targets: Sequence[RouteTarget], policy: RoutingPolicy | None = None) -> None:
+        if not targets:
+            raise ValueError("A model router needs at least one target")
+        self.targets = list(targets)
+        self.policy = policy or RoutingPolicy()
+
+    def candidates(self) -> list[RouteTarget]:
+        """
+        Return the targets to try, in order.
+
+        Targets with an open circuit are skipped; if all are open, all are
+        tried, the one reopening first leading.
+        """
+        available = [t for t in self.targets if t.breaker.available()]
+        return available or sorted(self.targets, key=lambda t: t.breaker.opened_until)
+
+    async def ainvoke(self, model_view: ModelView | None = None, **kwargs: Any) -> ModelResponse:
+        """Make a request, failing over and hedging as configured."""
+        response: ModelResponse = await self._race(kwargs, self._request, model_view)
+        return response
+
+    async def ainvoke_stream(
+        self, model_view: ModelView | None = None, **kwargs: Any
+    ) -> AsyncIterator[ModelResponse]:
+        """Make a streaming request; failover and hedging apply until the first chunk."""
+        stream, first, target = await self._race(kwargs, self._open_stream, model_view)
+        if first is _EMPTY:
+            return
+        yield first
+        try:
+            async for delta in stream:
+                yield delta
+        except Exception as e:
+            _record_failure(target, e)
+            raise
+        finally:
+            await stream.aclose()
+
+    def invoke(self, model_view: ModelView | None = None, **kwargs: Any) -> ModelResponse:
+        """Synchronous request with failover (no hedging)."""
+        last_error: Exception | None = None
+        for target in self.candidates():
+            started = time.monotonic()
+            try:
+                response: ModelResponse = _model(target, model_view).invoke(**kwargs)
+            except Exception as e:
+                _record_failure(target, e)
+                last_error = e
+                continue
+            target.record_success(time.monotonic() - started)
+            return response
+        raise last_error or RuntimeError("No model target available")
+
+    def invoke_stream(
+        self, model_view: ModelView | None = None, **kwargs: Any
+    ) -> Iterator[ModelResponse]:
+        """Synchronous streaming request with failover until the first chunk."""
+        last_error: Exception | None = None
+        for target in self.candidates():
+            started = time.monotonic()
+            stream = _model(target, model_view).invoke_stream(**kwargs)
+            try:
+                first = next(stream, _EMPTY)
+            except Exception as e:
+                _record_failure(target, e)
+                last_error = e
+                continue
+            target.record_success(time.monotonic() - started)
+            if first is _EMPTY:
+                return
+            yield first
+            try:
+                yield from stream
+            except Exception as e:
+                _record_failure(target, e)
+                raise
+            return
+        raise last_error or RuntimeError("No model target available")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return health and latency stats per target."""
+        return {target.name: target.stats() for target in self.targets}
+
+    async def _race(self, kwargs: dict[str, Any], call: Any, model_view: ModelView | None) -> Any:
+        """
+        Run ``call(target, model, kwargs)`` on the candidates until one succeeds.
+
+        The next target is started when the current one fails, or - with
+        hedging - when it is slower than its hedge delay (at most two
+        requests are in flight).  A non-retryable error is raised at once.
+        """
+        queue = self.candidates()
+        pending: dict[asyncio.Task[Any], _Attempt] = {}
+        last_error: BaseException | None = None
+        try:
+            while queue or pending:
+                if not pending:
+                    attempt = _Attempt(queue.pop(0), hedged=False)
+                    model = _model(attempt.target, model_view)
+                    pending[asyncio.create_task(call(attempt.target, model, kwargs))] = attempt
+                hedge_delay = None
+                if self.policy.hedge and queue and len(pending) == 1:
+                    (first,) = pending.values()
+                    hedge_delay = first.target.hedge_delay(self.policy)
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    attempt = _Attempt(queue.pop(0), hedged=True)
+                    attempt.target.hedges += 1
+                    logger.info(f"Hedging model request to {attempt.target.name}")
+                    model = _model(attempt.target, model_view)
+                    task = asyncio.create_task(call(attempt.target, model, _isolated(kwargs)))
+                    pending[task] = attempt
+                    continue
+
+                for task in done:
+                    attempt = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        attempt.target.hedge_wins += attempt.hedged
+                        return task.result()
+                    if not is_retryable(error):
+                        raise error
+                    last_error = error
+            raise last_error or RuntimeError("No model target available")
+        finally:
+            for task in pending:
+                task.cancel()
+            await _close_losers(pending)
+
+    @staticmethod
+    async def _request(target: RouteTarget, model: Any, kwargs: dict[str, Any]) -> ModelResponse:
+        started = time.monotonic()
+        try:
+            response: ModelResponse = await model.ainvoke(**kwargs)
+        except Exception as e:
+            _record_failure(target, e)
+            raise
+        target.record_success(time.monotonic() - started)
+        return response
+
+    @staticmethod
+    async def _open_stream(
+        target: RouteTarget, model: Any, kwargs: dict[str, Any]
+    ) -> tuple[Any, Any, Any]:
+        """Start a stream and wait for its first chunk."""
+        started = time.monotonic()
+        stream = model.ainvoke_stream(**kwargs)
+        try:
+            first = await anext(stream, _EMPTY)
+        except BaseException as e:
+            # Failed, or cancelled because another target answered first
+            await stream.aclose()
+            if isinstance(e, Exception):
+                _record_failure(target, e)
+            raise
+        target.record_success(time.monotonic() - started)
+        return stream, first, target
+
+
+def _record_failure(target: RouteTarget, error: Exception) -> None:
+    """Count a transient error against the target; re-raise any other error."""
+    if not is_retryable(error):
+        raise error
+    target.record_failure(error)
+
+
+def _model(target: RouteTarget, model_view: ModelView | None) -> Any:
+    return model_view(target.model) if model_view is not None else target.model
+
+
+async def _close_losers(pending: dict[asyncio.Task[Any], _Attempt]) -> None:
+    """Wait for cancelled requests; close streams that had already started."""
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    for result in results:
+        if isinstance(result, tuple) and hasattr(result[0], "aclose"):
+            await result[0].aclose()
+
+
+def _isolated(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Give a hedged request its own assistant message (providers update its metrics)."""
+    message = kwargs.get("assistant_message")
+    if message is None or not hasattr(message, "model_copy"):
+        return kwargs
+    return {**kwargs, "assistant_message": message.model_copy(deep=True)}
+
+
+class _RoutedRequests:
+    """Request hooks sending every request through the model's router."""
+
+    router: ModelRouter
+    # Set on per-call copies of the routed model to apply their settings to the targets
+    target_view: ModelView | None = None
+
+    def invoke(self, **kwargs: Any) -> ModelResponse:
+        return self.router.invoke(self.target_view, **kwargs)
+
+    async def ainvoke(self, **kwargs: Any) -> ModelResponse:
+        return await self.router.ainvoke(self.target_view, **kwargs)
+
+    def invoke_stream(self, **kwargs: Any) -> Iterator[ModelResponse]:
+        return self.router.invoke_stream(self.target_view, **kwargs)
+
+    def ainvoke_stream(self, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        return self.router.ainvoke_stream(self.target_view, **kwargs)
+
+
+def route_model(router: ModelRouter) -> Any:
+    """
+    Return a model that sends its requests through ``router``.
+
+    The model is a copy of the first target's model, so Agno formats
+    messages and tool results the way that provider expects.
+    """
+    model = hook_requests(copy.copy(router.targets[0].model), _RoutedRequests)
+    model.router = router
+    return model
+
+
+def target_name(config: ModelConfig) -> str:
+    """Return a readable target name for a model config."""
+    region = config.aws_region or config.google_location
+    return "/".join(filter(None, (config.provider, config.model_id, region)))
+
+
+class RoutedModelFactory:
+    """
+    Creates a routed model over several model configs.
+
+    Has the same interface as ``AgnoModelFactory`` and can be used wherever
+    one is expected (e.g. ``LLM(..., routes=[...])``).
+
+    Args:
+        configs: Model configs in order of preference
+        policy: Routing policy
+        gcp_metadata_manager: Optional GCP metadata manager for testing
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[ModelConfig],
+        policy: RoutingPolicy | None = None,
+        gcp_metadata_manager: GCPMetadataManager | None = None,
+    ) -> None:
+        if not configs:
+            raise ValueError("RoutedModelFactory needs at least one ModelConfig")
+        self._configs = list(configs)
+        self._policy = policy or RoutingPolicy()
+        self._factories = [
+            AgnoModelFactory(config, gcp_metadata_manager=gcp_metadata_manager)
+            for config in self._configs
+        ]
+        self._router: ModelRouter | None = None
+        self._model: Any = None
+
+    @property
+    def model_id(self) -> str:
+        """Get the model identifier of the preferred target."""
+        return self._configs[0].model_id
+
+    @property
+    def provider(self) -> str:
+        """Get the provider name of the preferred target."""
+        return self._configs[0].provider
+
+    @property
+    def router(self) -> ModelRouter | None:
+        """The router, once the model was created."""
+        return self._router
+
+    async def create_model(self) -> Any:
+        """Create or retrieve the cached routed model."""
+        if self._model is not None:
+            return self._model
+
+        targets = [
+            RouteTarget(target_name(config), await factory.create_model(), self._policy)
+            for config, factory in zip(self._configs, self._factories, strict=True)
+        ]
+        logger.info(f"Routed model over {', '.join(t.name for t in targets)}")
+
+        self._router = ModelRouter(targets, self._policy)
+        self._model = route_model(self._router)
+        return self._model
+
+    async def cleanup(self) -> None:
+        """Clean up the targets' resources."""
+        for factory in self._factories:
+            await factory.cleanup()
+        self._model = None
+        self._router = None
@@ -0,0 +1,75 @@
+"""Per-run state for the Agno adapter.
+
+The adapter shares one model instance (and client) across requests and
+caches compiled ``AgnoAgent`` instances, including the tool wrappers inside
+them.  Anything that differs between requests must therefore not be stored
+on those shared objects.  Instead, ``AgnoAdapter`` publishes it in
+:class:`contextvars.ContextVar` slots for the duration of a run, and the
+shared objects read it back at call time:
+
+* the platform context, read by the tool injection wrappers;
+* the static/dynamic system prompt parts, read by ``CachingAwsBedrock``
+  when it formats the request.
+
+Because ``asyncio`` tasks and ``asyncio.to_thread`` copy the current context,
+values set here are visible whether Agno runs code on the event loop or in a
+worker thread, and concurrent runs never see each other's values.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SystemPromptParts:
+    """The cacheable and per-request halves of a system prompt."""
+
+    static: str | None = None
+    dynamic: str | None = None
+
+
+# Internal ContextVars — not exported.  Set by run_scope(); read through the
+# getters below.
+_active_platform_context: ContextVar[dict[str, Any] | None] = ContextVar(
+    "_active_platform_context", default=None
+)
+_active_system_parts: ContextVar[SystemPromptParts | None] = ContextVar(
+    "_active_system_parts", default=None
+)
+
+
+def get_platform_context() -> dict[str, Any] | None:
+    """Return the platform context of the run currently executing, if any."""
+    return _active_platform_context.get()
+
+
+def get_system_parts() -> SystemPromptParts | None:
+    """Return the system prompt parts of the run currently executing, if any."""
+    return _active_system_parts.get()
+
+
+@contextlib.contextmanager
+def run_scope(
+    platform_context: dict[str, Any] | None = None,
+    static_system: str | None = None,
+    dynamic_system: str | None = None,
+) -> Iterator[None]:
+    """Publish per-run state for the duration of the ``with`` block.
+
+    Safe to use inside async generators: if the generator is finalized from
+    a different context (e.g. garbage collected), the reset is skipped.
+    """
+    context_token = _active_platform_context.set(platform_context)
+    parts_token = _active_system_parts.set(SystemPromptParts(static_system, dynamic_system))
+    try:
+        yield
+    finally:
+        with contextlib.suppress(ValueError):
+            _active_system_parts.reset(parts_token)
+        with contextlib.suppress(ValueError):
+            _active_platform_context.reset(context_token)
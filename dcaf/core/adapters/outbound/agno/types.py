@@ -79,6 +79,7 @@ DEFAULT_FRAMEWORK = "agno"
 DEFAULT_MAX_TOKENS = 4096
 DEFAULT_TEMPERATURE = 0.1
 DEFAULT_TOOL_CALL_LIMIT = 5
+DEFAULT_AGENT_CACHE_SIZE = 16
 DEFAULT_AWS_REGION = "us-west-2"
 
 # Supported providers
@@ -50,15 +50,23 @@ if TYPE_CHECKING:
 
 from ..schemas.messages import ToolCall as SchemaToolCall
 from .adapters.loader import load_adapter
-from .adapters.outbound.agno.types import DEFAULT_FRAMEWORK, DEFAULT_MODEL_ID, DEFAULT_PROVIDER
+from .adapters.outbound.agno.types import (
+    DEFAULT_FRAMEWORK,
+    DEFAULT_MODEL_ID,
+    DEFAULT_PROVIDER,
+    DEFAULT_TEMPERATURE,
+)
 from .adapters.outbound.persistence import InMemoryConversationRepository
 from .application.dto import AgentRequest
 from .application.services import AgentService, ApprovalService
+from .application.services.agent_service import request_fingerprint
 from .domain.entities import Conversation, ToolCall
 from .domain.value_objects import PlatformContext
 from .events import EventRegistry
 
 # Import interceptor types and utilities
+from .infrastructure.response_cache import ResponseCache
+from .infrastructure.single_flight import SingleFlight, request_key
 from .interceptors import (
     InterceptorError,
     InterceptorPipeline,
@@ -372,6 +380,14 @@ class Agent:
                      - cache_system_prompt (bool): Enable Bedrock prompt caching.
                        Requires static system prompt ≥1024 tokens.
                        Example: model_config={'cache_system_prompt': True}
+                     - cache_tools (bool): Also cache the tool definitions (Bedrock).
+                     - cache_messages (bool): Add rolling cache checkpoints to the
+                       conversation so agent-loop iterations reuse the prefix (Bedrock).
+                     - max_history_tokens (int): Token budget for the conversation
+                       history sent each turn (default: min(24000, a quarter of the
+                       model's context window); 0 disables trimming).
+                     - summarize_history (bool): Replace trimmed turns with a rolling
+                       summary generated by the model (default True).
 
         on_event: Callback function(s) for domain events. Useful for logging,
                  notifications, or audit trails.
@@ -429,6 +445,23 @@ class Agent:
                     Falls back to system_prompt if not provided.
                     Example: description="Manages Kubernetes clusters"
 
+        coalesce_requests: Share one run between identical concurrent calls
+                          to run() (default: False). A call with the same
+                          messages, context, tools and session as a run that
+                          is still in progress - a retried webhook, a double
+                          click - receives that run's response instead of
+                          starting another. Stats via coalescing_stats().
+
+        response_cache: ResponseCache serving repeated run() calls from
+                       memory (or its SQLite tier) instead of the model.
+                       Keyed by model, settings, system prompt, tools,
+                       messages, session and platform context, and scoped
+                       per tenant. Only complete responses without pending
+                       approvals are stored, and request interceptors run
+                       before the lookup, response interceptors after it.
+                       Use it for agents whose tools only read: a cached
+                       answer does not run the tools again.
+
     PROVIDER EXAMPLES:
     ==================
 
@@ -495,6 +528,9 @@ class Agent:
         description: str | None = None,
         # System event configuration
         system_events: "list[SystemEvent] | bool | None" = None,
+        # Request coalescing and caching
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
     ) -> None:
         """
         Create a new Agent.
@@ -580,10 +616,15 @@ class Agent:
             model_config=self._model_config,
         )
         self._conversations = InMemoryConversationRepository()
+        self._coalescer: SingleFlight[Any] | None = (
+            SingleFlight(name=self.name) if coalesce_requests else None
+        )
+        self._response_cache = response_cache
         self._agent_service = AgentService(
             runtime=self._runtime,  # type: ignore[arg-type]
             conversations=self._conversations,
             events=self._create_event_publisher(),
+            coalescer=self._coalescer,
         )
         self._approval_service = ApprovalService(
             conversations=self._conversations,
@@ -631,6 +672,15 @@ class Agent:
 
         return decorator
 
+    def coalescing_stats(self) -> dict[str, Any] | None:
+        """
+        Return request coalescing metrics, or None without coalesce_requests.
+
+        Includes ``executions`` (runs started), ``coalesced`` (calls that
+        joined a run in progress), ``coalesce_ratio`` and ``in_flight``.
+        """
+        return self._coalescer.stats() if self._coalescer else None
+
     def _build_system_parts(
         self, platform_context: dict | None = None
     ) -> tuple[str | None, str | None]:
@@ -824,7 +874,7 @@ class Agent:
             session=prepared.session.to_dict(),
         )
 
-        internal_response = await self._agent_service.execute(internal_request)
+        internal_response = await self._execute(internal_request)
 
         # === RUN RESPONSE INTERCEPTORS ===
         effective_session = prepared.session
@@ -859,6 +909,27 @@ class Agent:
 
         return self._convert_response(internal_response, session=effective_session)
 
+    async def _execute(self, request: AgentRequest) -> Any:
+        """Execute a request, through the response cache when one is set."""
+        cache = self._response_cache
+        if cache is None or not cache.cacheable(DEFAULT_TEMPERATURE):
+            return await self._agent_service.execute(request)
+
+        context = PlatformContext.from_dict(request.context or {})
+        scope = context.tenant_id or context.tenant_name
+        key = request_key(
+            self.provider, self.model, self._model_config, request_fingerprint(request)
+        )
+        cached = await cache.aget(key, scope=scope)
+        if cached is not None:
+            cached.metadata.update(context.get_tracing_dict(), response_cache="hit")
+            return cached
+
+        response = await self._agent_service.execute(request)
+        if response.is_complete and not response.has_pending_approvals:
+            await cache.aset(key, response, scope=scope)
+        return response
+
     async def chat(
         self,
         messages: list[ChatMessage | dict],
@@ -1061,6 +1132,8 @@ class Agent:
             # Prevents duplicate status messages when both the framework system
             # event AND user code (emit_update) fire the same text.
             seen_update_texts: set[str] = set()
+            # Token usage (incl. prompt-cache reads/writes) from message_end
+            usage: dict[str, Any] = {}
 
             # Set up the user-emit queue so tool/handler code can push events
             # into the stream via dcaf.core.emit().
@@ -1086,6 +1159,8 @@ class Agent:
                         if self._is_new_update(evt, seen_update_texts):
                             yield evt
 
+                    usage = self._stream_usage(event) or usage
+
                     # Convert internal stream events to server stream events
                     server_event = self._convert_stream_event(event, pending_tool_calls)
                     if server_event and self._is_new_update(server_event, seen_update_texts):
@@ -1102,7 +1177,7 @@ class Agent:
                     yield ToolCallsEvent(tool_calls=pending_tool_calls)
 
                 # Always end with a done event
-                yield DoneEvent()
+                yield DoneEvent(meta_data={"usage": usage} if usage else {})
             finally:
                 _active_queue.reset(_queue_token)
 
@@ -1157,6 +1232,20 @@ class Agent:
             return IntermittentUpdateEvent(text=text)
         return None
 
+    @staticmethod
+    def _stream_usage(internal_event: Any) -> dict[str, Any]:
+        """Return the token usage carried by a message_end event, if any."""
+        from .application.dto.responses import StreamEvent as CoreStreamEvent
+        from .application.dto.responses import StreamEventType
+
+        if (
+            not isinstance(internal_event, CoreStreamEvent)
+            or internal_event.event_type != StreamEventType.MESSAGE_END
+        ):
+            return {}
+        response = internal_event.data.get("response") or {}
+        return dict((response.get("metadata") or {}).get("usage") or {})
+
     def _convert_stream_event(
         self,
         internal_event: Any,
@@ -1307,6 +1396,7 @@ class Agent:
             conversation_id=internal.conversation_id,
             is_complete=getattr(internal, "is_complete", True),
             session=session_data,
+            usage=(getattr(internal, "metadata", None) or {}).get("usage", {}),
             _agent=self,
         )
 
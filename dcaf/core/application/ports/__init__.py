@@ -13,6 +13,7 @@ from .approval_callback import ApprovalCallback
 from .conversation_repository import ConversationRepository
 from .event_publisher import EventPublisher
 from .mcp_protocol import MCPToolLike
+from .request_coalescer import RequestCoalescer
 
 __all__ = [
     "AgentRuntime",
@@ -20,4 +21,5 @@ __all__ = [
     "ApprovalCallback",
     "EventPublisher",
     "MCPToolLike",
+    "RequestCoalescer",
 ]
@@ -0,0 +1,40 @@
+"""RequestCoalescer port - interface for sharing identical in-flight executions."""
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+T = TypeVar("T")
+
+
+@runtime_checkable
+class RequestCoalescer(Protocol):
+    """
+    Port for coalescing concurrent executions of the same request.
+
+    Callers passing the key of an execution that is still in flight attach
+    to it instead of starting their own.
+
+    Implementations:
+        - SingleFlight: In-process, per event loop
+          (dcaf.core.infrastructure.single_flight)
+    """
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of ``fn()``, shared with concurrent callers of ``key``.
+
+        Args:
+            key: Normalized request key
+            fn: Starts the execution
+        """
+        ...
+
+    def stream(self, key: Hashable, fn: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+        """
+        Yield the events of ``fn()``, shared with concurrent callers of ``key``.
+
+        Args:
+            key: Normalized request key
+            fn: Starts the streaming execution
+        """
+        ...
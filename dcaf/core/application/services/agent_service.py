@@ -1,5 +1,7 @@
 """AgentService - main agent execution orchestration."""
 
+import hashlib
+import json
 import logging
 from collections.abc import AsyncIterator
 from typing import Any
@@ -19,6 +21,7 @@ from ..ports.agent_runtime import AgentRuntime
 from ..ports.conversation_repository import ConversationRepository
 from ..ports.event_publisher import EventPublisher
 from ..ports.mcp_protocol import MCPToolLike
+from ..ports.request_coalescer import RequestCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +61,7 @@ class AgentService:
         conversations: ConversationRepository,
         events: EventPublisher | None = None,
         approval_policy: ApprovalPolicy | None = None,
+        coalescer: RequestCoalescer | None = None,
     ) -> None:
         """
         Initialize the service.
@@ -67,16 +71,23 @@ class AgentService:
             conversations: Repository for conversation persistence
             events: Optional event publisher
             approval_policy: Optional custom approval policy
+            coalescer: Optional coalescer; concurrent identical requests
+                       (same messages, tools, system prompt and context)
+                       then share one execution
         """
         self._runtime = runtime
         self._conversations = conversations
         self._events = events
         self._policy = approval_policy or ApprovalPolicy()
+        self._coalescer = coalescer
 
     async def execute(self, request: AgentRequest) -> AgentResponse:
         """
         Execute an agent turn.
 
+        With a coalescer, a request identical to one still executing
+        receives that execution's response.
+
         This is the main entry point for agent execution.
         It handles the full lifecycle of a turn:
         1. Get or create conversation
@@ -91,6 +102,13 @@ class AgentService:
         Returns:
             AgentResponse with the agent's response
         """
+        if self._coalescer is not None:
+            return await self._coalescer.run(
+                request_fingerprint(request), lambda: self._execute(request)
+            )
+        return await self._execute(request)
+
+    async def _execute(self, request: AgentRequest) -> AgentResponse:
         from dcaf.core.services.credential_manager import CredentialManager
 
         # 1. Get or create conversation
@@ -137,6 +155,8 @@ class AgentService:
 
         Yields StreamEvent objects as the response is generated.
         The final event will be MESSAGE_END with the complete response.
+        With a coalescer, a request identical to one still streaming
+        receives that stream's events (from the start).
 
         Args:
             request: The agent request
@@ -144,6 +164,16 @@ class AgentService:
         Yields:
             StreamEvent objects
         """
+        if self._coalescer is None:
+            events = self._execute_stream(request)
+        else:
+            events = self._coalescer.stream(
+                request_fingerprint(request), lambda: self._execute_stream(request)
+            )
+        async for event in events:
+            yield event
+
+    async def _execute_stream(self, request: AgentRequest) -> AsyncIterator[StreamEvent]:
         from dcaf.core.services.credential_manager import CredentialManager
 
         # 1. Get or create conversation
@@ -441,3 +471,39 @@ class AgentService:
         if self._events:
             events = conversation.clear_events()
             self._events.publish_all(events)
+
+
+def request_fingerprint(request: AgentRequest) -> str:
+    """
+    Return a hash of what determines the result of a request.
+
+    Covers content, history, tools, system prompt, platform context,
+    session and user, but not correlation IDs, which differ between
+    duplicate submissions.  Used as the coalescing and caching key.
+    """
+    parts = {
+        "content": request.content,
+        "messages": request.messages,
+        "conversation_id": request.conversation_id,
+        "context": PlatformContext.from_dict(request.context or {})
+        .without_correlation_ids()
+        .to_dict(),
+        "tools": [_tool_fingerprint(tool) for tool in request.tools],
+        "system_prompt": request.system_prompt,
+        "static_system": request.static_system,
+        "dynamic_system": request.dynamic_system,
+        "session": request.session,
+        "user_id": request.user_id,
+    }
+    canonical = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _tool_fingerprint(tool: Any) -> Any:
+    if isinstance(tool, dict):
+        return tool
+    return {
+        "name": getattr(tool, "name", None) or repr(tool),
+        "description": getattr(tool, "description", None),
+        "schema": getattr(tool, "input_schema", None),
+    }
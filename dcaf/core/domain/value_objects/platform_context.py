@@ -1,6 +1,6 @@
 """Runtime context value object."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 from dcaf.core.domain.value_objects.scope import Scope
@@ -129,6 +129,16 @@ class PlatformContext:
             _extra=self._extra,
         )
 
+    def without_correlation_ids(self) -> "PlatformContext":
+        """
+        Return a copy without session_id, run_id and request_id.
+
+        These identify a particular request rather than what it asks for,
+        so they are left out when comparing requests (caching, coalescing).
+        The user_id is kept.
+        """
+        return replace(self, session_id=None, run_id=None, request_id=None)
+
     def with_scope(self, scope: "Scope") -> "PlatformContext":
         """Return a new PlatformContext with the given scope appended."""
         return PlatformContext(
@@ -4,13 +4,35 @@ Infrastructure Layer - Cross-cutting Concerns.
 This layer contains infrastructure code that supports the application:
     - Configuration management
     - Logging setup
+    - Worker pool for synchronous agent handlers
+    - Background event loop for sync-over-async calls
+    - Process-wide LLM rate limiters
+    - Single-flight coalescing of identical in-flight calls
+    - Response cache for deterministic calls
+    - Classifying errors as transient (worth retrying) or not
     - Shared utilities
 """
 
+from .background_loop import BackgroundLoop, get_background_loop, run_sync
 from .config import CoreConfig
+from .handler_pool import HandlerPool
 from .logging import setup_logging
+from .rate_limiter import RateLimiter, get_rate_limiter_registry
+from .response_cache import ResponseCache, cache_mode
+from .retry import is_retryable
+from .single_flight import SingleFlight
 
 __all__ = [
+    "BackgroundLoop",
     "CoreConfig",
+    "HandlerPool",
+    "RateLimiter",
+    "ResponseCache",
+    "SingleFlight",
+    "cache_mode",
+    "get_background_loop",
+    "get_rate_limiter_registry",
+    "is_retryable",
+    "run_sync",
     "setup_logging",
 ]
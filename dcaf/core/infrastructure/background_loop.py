@@ -0,0 +1,140 @@
+"""
+Process-wide background event loop for sync-over-async calls.
+
+Sync entry points such as ``LLM.invoke`` used to wrap every call in
+``asyncio.run``, which builds and tears down an event loop each time, so
+loop-bound resources (aioboto3 clients, HTTP connections) were never reused.
+They now submit their coroutines to one long-lived loop running in a daemon
+thread, and clients opened on it stay warm across calls.
+
+Example:
+    from dcaf.core.infrastructure.background_loop import run_sync
+
+    response = run_sync(llm.ainvoke(messages=[...]))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    An event loop running forever in a daemon thread.
+
+    The thread is started on first use and restarted if it died (e.g. in a
+    forked child process).
+    """
+
+    def __init__(self, name: str = "dcaf-background-loop") -> None:
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait; the coroutine is cancelled on timeout
+
+        Raises:
+            RuntimeError: If called from the background loop itself (it would
+                          wait for itself forever)
+            TimeoutError: If the coroutine did not finish within ``timeout``
+        """
+        loop = self._ensure_started()
+        if _running_loop() is loop:
+            coro.close()
+            raise RuntimeError("Cannot block on the background loop from inside it; await instead")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timeout or KeyboardInterrupt: don't leave the call running
+            future.cancel()
+            raise
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background loop (started if needed)."""
+        return self._ensure_started()
+
+    def is_running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop and wait for its thread to finish."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_forever, args=(loop, ready), name=self._name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            logger.debug(f"Background event loop started ({self._name})")
+            return loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Cancel what is left so that clients' cleanup code runs
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_default_loop = BackgroundLoop()
+atexit.register(_default_loop.shutdown)
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Return the process-wide background loop."""
+    return _default_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """Run a coroutine on the process-wide background loop and return its result."""
+    return _default_loop.run(coro, timeout)
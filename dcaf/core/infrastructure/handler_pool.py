@@ -0,0 +1,202 @@
+"""
+Worker pool for synchronous agent handlers.
+
+``serve(my_agent)`` wraps a plain function in ``CallableAdapter``.  A
+synchronous handler that calls an LLM or boto3 would block the event loop
+for its whole duration if called from the ``async`` route directly, so the
+adapter runs it through a ``HandlerPool`` instead:
+
+- ``thread`` mode (default): a bounded thread pool, for I/O-bound handlers
+- ``process`` mode: a process pool, for CPU-bound handlers (the handler and
+  its arguments and result must be picklable)
+
+At most ``max_workers`` calls are handed to the executor at once; further
+calls wait in the pool's queue, whose depth is reported by :meth:`stats`.
+
+Example:
+    from dcaf.core import serve
+    from dcaf.core.server import CallableAdapter
+    from dcaf.core.infrastructure.handler_pool import HandlerPool
+
+    serve(CallableAdapter(my_agent, pool=HandlerPool(max_workers=16)))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PoolMode = Literal["thread", "process"]
+
+DEFAULT_MODE: PoolMode = "thread"
+
+_EXHAUSTED: Any = object()
+
+
+def default_max_workers(mode: PoolMode) -> int:
+    """Return the default pool size for a mode (as ``concurrent.futures`` does)."""
+    cpus = os.cpu_count() or 1
+    return cpus if mode == "process" else min(32, cpus + 4)
+
+
+class HandlerPool:
+    """
+    Runs synchronous handler calls on a bounded thread or process pool.
+
+    Args:
+        mode: ``"thread"`` or ``"process"``
+        max_workers: Calls running at the same time (default depends on mode)
+    """
+
+    def __init__(self, mode: PoolMode = DEFAULT_MODE, max_workers: int | None = None) -> None:
+        if mode not in ("thread", "process"):
+            raise ValueError(f"mode must be 'thread' or 'process', got {mode!r}")
+        self.mode: PoolMode = mode
+        self.max_workers = max(1, max_workers or default_max_workers(mode))
+        self._executor: Executor | None = None
+        # One gate per event loop (asyncio primitives are loop-bound)
+        self._gates: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._peak_queued = 0
+        self._total_wait = 0.0
+
+    @classmethod
+    def from_env(cls) -> HandlerPool:
+        """
+        Create a pool from environment variables.
+
+        Environment Variables:
+            DCAF_HANDLER_POOL_MODE: "thread" (default) or "process"
+            DCAF_HANDLER_POOL_WORKERS: Pool size (default: CPU-based)
+        """
+        mode = os.getenv("DCAF_HANDLER_POOL_MODE", DEFAULT_MODE).strip().lower()
+        workers = os.getenv("DCAF_HANDLER_POOL_WORKERS")
+        return cls(
+            mode=mode,  # type: ignore[arg-type]
+            max_workers=int(workers) if workers else None,
+        )
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``fn(*args)`` on the pool and return its result.
+
+        Waits in the queue while all workers are busy; exceptions raised by
+        ``fn`` propagate.
+        """
+        loop = asyncio.get_running_loop()
+        gate = self._gate(loop)
+
+        enqueued_at = time.monotonic()
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            await gate.acquire()
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._total_wait += time.monotonic() - enqueued_at
+        call = functools.partial(fn, *args)
+        if self.mode == "thread":
+            # The handler sees the caller's context variables (e.g. the cache mode)
+            call = functools.partial(contextvars.copy_context().run, fn, *args)
+        failed = False
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            gate.release()
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._failed += failed
+
+    async def iterate(self, items: Iterator[T]) -> AsyncIterator[T]:
+        """
+        Consume a synchronous iterator (e.g. a generator handler) off the loop.
+
+        Each item is produced by a worker.  Generators cannot be sent to
+        another process, so in process mode they are advanced on threads.
+        """
+        step = functools.partial(next, items, _EXHAUSTED)
+        while True:
+            if self.mode == "process":
+                item = await asyncio.to_thread(step)
+            else:
+                item = await self.run(step)
+            if item is _EXHAUSTED:
+                return
+            yield item
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return pool metrics.
+
+        ``queued`` is the current queue depth (calls waiting for a worker),
+        ``peak_queued`` the largest depth seen and ``avg_wait_ms`` the mean
+        time calls spent queued.
+        """
+        with self._lock:
+            started = self._running + self._completed
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "peak_queued": self._peak_queued,
+                "avg_wait_ms": (self._total_wait / started * 1000) if started else 0.0,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the executor; it is recreated on the next call."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _gate(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        with self._lock:
+            gate = self._gates.get(loop)
+            if gate is None:
+                gate = self._gates[loop] = asyncio.Semaphore(self.max_workers)
+            return gate
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="dcaf-handler"
+                    )
+                logger.info(f"Handler pool started: {self.mode} mode, {self.max_workers} workers")
+            return self._executor
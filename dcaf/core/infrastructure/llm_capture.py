@@ -0,0 +1,436 @@
+"""
+Raw LLM request/response capture.
+
+Writing full provider payloads to the application log is expensive (every
+call pretty-prints the whole conversation) and floods log pipelines.  This
+module captures them to a dedicated rotating JSONL file instead:
+
+- **Off by default.**  When disabled, :meth:`LLMCapture.sample` returns
+  ``False`` and callers skip all capture work.
+- **Sampling.**  A fraction of calls is captured; the request and response
+  of a sampled call share a ``call_id``.
+- **Size caps and redaction.**  Long strings are truncated, binary content
+  is replaced with its size, and credential-looking keys and values are
+  redacted.
+- **Off the hot path.**  Records go through a bounded queue to a background
+  writer thread.  When the queue is full, records are dropped and counted
+  rather than blocking the model call.
+
+Payloads are serialized by the writer thread, so callers must not mutate
+them after passing them to :meth:`LLMCapture.capture`.
+
+Environment:
+    DCAF_LLM_CAPTURE: Enable capture (default: false)
+    DCAF_LLM_CAPTURE_PATH: Output file (default: llm_capture.jsonl)
+    DCAF_LLM_CAPTURE_SAMPLE_RATE: Fraction of calls captured, 0.0-1.0 (default: 1.0)
+    DCAF_LLM_CAPTURE_MAX_FIELD_CHARS: Max characters per string field (default: 4096)
+    DCAF_LLM_CAPTURE_STREAM_CHUNKS: Also capture every stream chunk (default: false)
+    DCAF_LLM_CAPTURE_MAX_BYTES: Rotate the file at this size (default: 10 MB)
+    DCAF_LLM_CAPTURE_BACKUP_COUNT: Rotated files kept (default: 5)
+    DCAF_LLM_CAPTURE_QUEUE_SIZE: Records buffered for the writer (default: 1000)
+
+Example:
+    capture = get_llm_capture()
+    call_id = capture.new_call() if capture.sample() else None
+    if call_id:
+        capture.capture(call_id, "request", {"messages": messages}, model=model_id)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[REDACTED]"
+
+# Keys whose values are always redacted (compared case-insensitively)
+DEFAULT_REDACT_KEYS = frozenset(
+    {
+        "authorization",
+        "api_key",
+        "apikey",
+        "password",
+        "secret",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+        "aws_session_token",
+        "x-amz-security-token",
+    }
+)
+
+# Credential-looking substrings redacted inside any string value
+DEFAULT_REDACT_PATTERNS: tuple[str, ...] = (
+    r"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b",  # AWS access key IDs
+    r"(?i)\bbearer\s+[a-z0-9._\-]+",  # Bearer tokens
+    r"\bsk-[A-Za-z0-9_\-]{20,}\b",  # OpenAI/Anthropic-style API keys
+)
+
+_STOP = object()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+@dataclass
+class LLMCaptureConfig:
+    """
+    Settings for :class:`LLMCapture`.
+
+    Attributes:
+        enabled: Capture anything at all
+        path: JSONL output file
+        sample_rate: Fraction of calls captured (0.0-1.0)
+        max_field_chars: Strings longer than this are truncated
+        capture_stream_chunks: Record every stream chunk, not just a summary
+        max_bytes: Rotate the file when it reaches this size
+        backup_count: Rotated files kept
+        queue_size: Records buffered for the writer thread
+        redact_keys: Keys whose values are replaced with ``[REDACTED]``
+        redact_patterns: Regexes redacted inside string values
+    """
+
+    enabled: bool = False
+    path: str = "llm_capture.jsonl"
+    sample_rate: float = 1.0
+    max_field_chars: int = 4096
+    capture_stream_chunks: bool = False
+    max_bytes: int = 10 * 1024 * 1024
+    backup_count: int = 5
+    queue_size: int = 1000
+    redact_keys: frozenset[str] = DEFAULT_REDACT_KEYS
+    redact_patterns: tuple[str, ...] = DEFAULT_REDACT_PATTERNS
+
+    @classmethod
+    def from_env(cls) -> LLMCaptureConfig:
+        """Build a config from ``DCAF_LLM_CAPTURE_*`` environment variables."""
+        defaults = cls()
+        try:
+            return cls(
+                enabled=_env_bool("DCAF_LLM_CAPTURE", defaults.enabled),
+                path=os.getenv("DCAF_LLM_CAPTURE_PATH", defaults.path),
+                sample_rate=float(
+                    os.getenv("DCAF_LLM_CAPTURE_SAMPLE_RATE", str(defaults.sample_rate))
+                ),
+                max_field_chars=int(
+                    os.getenv("DCAF_LLM_CAPTURE_MAX_FIELD_CHARS", str(defaults.max_field_chars))
+                ),
+                capture_stream_chunks=_env_bool(
+                    "DCAF_LLM_CAPTURE_STREAM_CHUNKS", defaults.capture_stream_chunks
+                ),
+                max_bytes=int(os.getenv("DCAF_LLM_CAPTURE_MAX_BYTES", str(defaults.max_bytes))),
+                backup_count=int(
+                    os.getenv("DCAF_LLM_CAPTURE_BACKUP_COUNT", str(defaults.backup_count))
+                ),
+                queue_size=int(os.getenv("DCAF_LLM_CAPTURE_QUEUE_SIZE", str(defaults.queue_size))),
+            )
+        except ValueError as e:
+            logger.warning(f"Invalid DCAF_LLM_CAPTURE_* setting ({e}); raw LLM capture disabled")
+            return defaults
+
+
+class LLMCapture:
+    """
+    Samples, sanitizes and writes raw LLM payloads to a rotating JSONL file.
+
+    All public methods are safe to call from any thread.  The writer thread
+    and output file are created on the first captured record.
+    """
+
+    def __init__(self, config: LLMCaptureConfig | None = None) -> None:
+        self.config = config or LLMCaptureConfig()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, self.config.queue_size))
+        self._patterns = [re.compile(p) for p in self.config.redact_patterns]
+        self._redact_keys = {k.lower() for k in self.config.redact_keys}
+        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._handler: logging.handlers.RotatingFileHandler | None = None
+        self._closed = False
+
+        # Metrics
+        self._sampled = 0
+        self._skipped = 0
+        self._enqueued = 0
+        self._dropped = 0
+        self._written = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether capture is switched on."""
+        return self.config.enabled and not self._closed
+
+    @property
+    def capture_stream_chunks(self) -> bool:
+        """Whether individual stream chunks should be captured."""
+        return self.config.capture_stream_chunks
+
+    # -------------------------------------------------------------------------
+    # Hot path
+    # -------------------------------------------------------------------------
+
+    def sample(self) -> bool:
+        """Decide whether the current call is captured. Cheap when disabled."""
+        if not self.enabled:
+            return False
+        if self.config.sample_rate >= 1.0 or random.random() < self.config.sample_rate:  # noqa: S311
+            self._sampled += 1
+            return True
+        self._skipped += 1
+        return False
+
+    @staticmethod
+    def new_call() -> str:
+        """Return an ID tying together the records of one call."""
+        return uuid.uuid4().hex
+
+    def capture(self, call_id: str, kind: str, payload: Any, **fields: Any) -> None:
+        """
+        Queue a record for writing. Never blocks; drops the record if the queue is full.
+
+        Args:
+            call_id: ID from :meth:`new_call`
+            kind: Record type, e.g. ``"request"`` or ``"response"``
+            payload: Raw provider payload (sanitized by the writer thread)
+            **fields: Extra top-level fields, e.g. ``provider`` and ``model``
+        """
+        if not self.enabled:
+            return
+        record = {"ts": time.time(), "call_id": call_id, "kind": kind, **fields}
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((record, payload))
+            self._enqueued += 1
+        except queue.Full:
+            self._dropped += 1
+
+    def stream_recorder(self, call_id: str | None, **fields: Any) -> StreamRecorder:
+        """
+        Return a recorder that captures a streamed response when it finishes.
+
+        With ``call_id=None`` (call not sampled) the recorder does nothing.
+        """
+        return StreamRecorder(self if call_id else None, call_id or "", fields)
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._run_writer, name="dcaf-llm-capture", daemon=True
+            )
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                record, payload = item
+                record["payload"] = self.sanitize(payload)
+                self._write(json.dumps(record, default=str, ensure_ascii=False))
+                self._written += 1
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"LLM capture: failed to write record: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, line: str) -> None:
+        if self._handler is None:
+            directory = os.path.dirname(self.config.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.config.path,
+                maxBytes=self.config.max_bytes,
+                backupCount=self.config.backup_count,
+                encoding="utf-8",
+            )
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._handler.handle(logging.makeLogRecord({"msg": line, "levelno": logging.INFO}))
+
+    # -------------------------------------------------------------------------
+    # Sanitizing
+    # -------------------------------------------------------------------------
+
+    def sanitize(self, value: Any) -> Any:
+        """Return a JSON-safe copy of ``value`` with redaction and size caps applied."""
+        if isinstance(value, dict):
+            return {
+                k: REDACTED if str(k).lower() in self._redact_keys else self.sanitize(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list | tuple):
+            return [self.sanitize(v) for v in value]
+        if isinstance(value, bytes | bytearray):
+            return f"<{len(value)} bytes>"
+        if isinstance(value, str):
+            return self._sanitize_str(value)
+        if value is None or isinstance(value, bool | int | float):
+            return value
+        return self._sanitize_str(str(value))
+
+    def _sanitize_str(self, value: str) -> str:
+        # Redact before truncating so a cut cannot leave half a secret behind
+        for pattern in self._patterns:
+            value = pattern.sub(REDACTED, value)
+        limit = self.config.max_field_chars
+        if len(value) > limit:
+            value = f"{value[:limit]}...[truncated {len(value) - limit} chars]"
+        return value
+
+    # -------------------------------------------------------------------------
+    # Lifecycle and metrics
+    # -------------------------------------------------------------------------
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued record has been written.
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        if self._writer is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        if self._handler is not None:
+            self._handler.flush()
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out queued records, stop the writer and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join(timeout)
+        if self._handler is not None:
+            self._handler.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return capture counters.
+
+        Keys: ``sampled``, ``skipped``, ``enqueued``, ``dropped``, ``written``,
+        ``errors``, ``queue_depth``.
+        """
+        return {
+            "sampled": self._sampled,
+            "skipped": self._skipped,
+            "enqueued": self._enqueued,
+            "dropped": self._dropped,
+            "written": self._written,
+            "errors": self._errors,
+            "queue_depth": self._queue.qsize(),
+        }
+
+
+class StreamRecorder:
+    """
+    Collects a streamed response for a single ``"response"`` record.
+
+    Keeps the chunk count and the final chunk (providers put usage there);
+    keeps every chunk only when ``capture_stream_chunks`` is enabled.
+    """
+
+    __slots__ = ("_capture", "_call_id", "_fields", "_count", "_last", "_chunks")
+
+    def __init__(self, capture: LLMCapture | None, call_id: str, fields: dict[str, Any]) -> None:
+        self._capture = capture
+        self._call_id = call_id
+        self._fields = fields
+        self._count = 0
+        self._last: Any = None
+        self._chunks: list[Any] | None = (
+            [] if capture is not None and capture.capture_stream_chunks else None
+        )
+
+    def add(self, chunk: Any) -> None:
+        """Record one stream chunk."""
+        if self._capture is None:
+            return
+        self._count += 1
+        self._last = chunk
+        if self._chunks is not None:
+            self._chunks.append(chunk)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """
+        Queue the response record; later calls are no-ops.
+
+        Pass the exception that ended the stream early (including
+        ``GeneratorExit`` for an abandoned stream) to mark the record
+        incomplete.
+        """
+        capture, self._capture = self._capture, None
+        if capture is None:
+            return
+        payload: dict[str, Any] = {"chunk_count": self._count, "final_chunk": self._last}
+        if self._chunks is not None:
+            payload["chunks"] = self._chunks
+        if error is not None:
+            message = str(error)
+            payload["error"] = (
+                f"{type(error).__name__}: {message}" if message else type(error).__name__
+            )
+        capture.capture(self._call_id, "response", payload, stream=True, **self._fields)
+
+
+_default_capture: LLMCapture | None = None
+_default_lock = threading.Lock()
+
+
+def get_llm_capture() -> LLMCapture:
+    """Return the process-wide capture, configured from the environment on first use."""
+    global _default_capture
+    if _default_capture is None:
+        with _default_lock:
+            if _default_capture is None:
+                _default_capture = LLMCapture(LLMCaptureConfig.from_env())
+                atexit.register(_default_capture.close)
+    return _default_capture
+
+
+def configure_llm_capture(config: LLMCaptureConfig) -> LLMCapture:
+    """
+    Replace the process-wide capture, closing the previous one.
+
+    Example:
+        configure_llm_capture(LLMCaptureConfig(enabled=True, sample_rate=0.1))
+    """
+    global _default_capture
+    with _default_lock:
+        previous, _default_capture = _default_capture, LLMCapture(config)
+        atexit.register(_default_capture.close)
+    if previous is not None:
+        previous.close()
+    return _default_capture
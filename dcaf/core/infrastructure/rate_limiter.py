@@ -0,0 +1,374 @@
+"""
+Process-wide rate limiting for LLM calls.
+
+Providers enforce tokens-per-minute and requests-per-minute quotas per
+account and region (for Bedrock: per model and region).  Without a limiter
+every ``Agent``, ``LLM`` and router calls the provider independently and
+only finds out about the quota through throttling errors and botocore
+retries.  A ``RateLimiter`` is shared by all calls to the same
+(provider, model, region) in the process and makes callers wait for
+capacity instead:
+
+- Before a call, the estimated input tokens (and one request) are reserved.
+  If the bucket does not hold enough, the caller sleeps until it will.
+- After the call, the reservation is settled against the usage the provider
+  reported, so output tokens and estimation errors are accounted for.
+
+Reservations are taken in arrival order and each waiter sleeps until its own
+share has refilled, so callers are served first come, first served.  The
+limiter holds no asyncio primitives and can be shared across event loops
+and threads.
+
+Example:
+    from dcaf.core.infrastructure.rate_limiter import get_rate_limiter_registry
+
+    limiter = get_rate_limiter_registry().get(
+        "bedrock", "anthropic.claude-3-sonnet", "us-east-1", tokens_per_minute=200_000
+    )
+    reservation = await limiter.acquire(estimated_input_tokens)
+    try:
+        response = await call_model()
+    finally:
+        reservation.settle(used_tokens)
+
+    get_rate_limiter_registry().stats()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """
+    A token bucket refilled continuously at ``per_minute / 60`` per second.
+
+    The level may go negative: that is capacity already promised to callers
+    who are waiting for it.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return the seconds until it is covered."""
+        self.refill(now)
+        self.level -= amount
+        return max(0.0, -self.level / self.rate)
+
+    def give_back(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+def _resized(bucket: _Bucket | None, per_minute: int | None, now: float) -> _Bucket | None:
+    """Return a bucket for ``per_minute`` that keeps the level of ``bucket``."""
+    if not per_minute:
+        return None
+    resized = _Bucket(per_minute)
+    if bucket is not None:
+        bucket.refill(now)
+        resized.level = min(resized.capacity, bucket.level)
+        resized.updated = now
+    return resized
+
+
+class Reservation:
+    """
+    Capacity reserved for one call.
+
+    Call :meth:`settle` once the call finished (with the tokens it used) or
+    :meth:`cancel` if it never reached the provider.  Both are idempotent.
+    """
+
+    def __init__(self, limiter: RateLimiter, tokens: int, wait_seconds: float) -> None:
+        self.limiter = limiter
+        self.tokens = tokens
+        self.wait_seconds = wait_seconds
+        self._done = False
+
+    def settle(self, used_tokens: int | None = None) -> None:
+        """
+        Reconcile the reservation with the actual usage.
+
+        Args:
+            used_tokens: Tokens the call consumed (input and output).  None
+                         keeps the estimate (e.g. the provider reported no usage).
+        """
+        if not self._done:
+            self._done = True
+            self.limiter._settle(self, self.tokens if used_tokens is None else used_tokens)
+
+    def cancel(self) -> None:
+        """Return the whole reservation (the call was not made)."""
+        if not self._done:
+            self._done = True
+            self.limiter._cancel(self)
+
+
+class RateLimiter:
+    """
+    Tokens-per-minute and requests-per-minute limiter.
+
+    Either limit may be None (not limited).  Thread-safe; copies of a limiter
+    are the limiter itself, so models holding one can be copied freely.
+
+    Args:
+        tokens_per_minute: Token budget per minute
+        requests_per_minute: Request budget per minute
+        name: Name used in logs and stats
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int | None = None,
+        requests_per_minute: int | None = None,
+        name: str = "",
+    ) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._tokens: _Bucket | None = None
+        self._requests: _Bucket | None = None
+        self.configure(tokens_per_minute, requests_per_minute)
+
+        self._acquired = 0
+        self._waited = 0
+        self._waiting = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._tokens_reserved = 0
+        self._tokens_used = 0
+
+    def configure(
+        self, tokens_per_minute: int | None = None, requests_per_minute: int | None = None
+    ) -> None:
+        """
+        Change the limits.
+
+        Capacity already used (or promised to waiters) stays used, so
+        reconfiguring does not refill the buckets; new buckets start full.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = _resized(self._tokens, tokens_per_minute, now)
+            self._requests = _resized(self._requests, requests_per_minute, now)
+
+    @property
+    def tokens_per_minute(self) -> int | None:
+        return int(self._tokens.capacity) if self._tokens else None
+
+    @property
+    def requests_per_minute(self) -> int | None:
+        return int(self._requests.capacity) if self._requests else None
+
+    async def acquire(self, tokens: int = 0) -> Reservation:
+        """
+        Reserve capacity for a call, waiting until it is available.
+
+        Args:
+            tokens: Estimated input tokens of the call (capped at the
+                    per-minute budget, so one large call cannot wait forever)
+        """
+        reservation = self._reserve(tokens)
+        if reservation.wait_seconds:
+            try:
+                await asyncio.sleep(reservation.wait_seconds)
+            except BaseException:
+                reservation.cancel()
+                raise
+            finally:
+                self._done_waiting()
+        return reservation
+
+    def acquire_sync(self, tokens: int = 0) -> Reservation:
+        """Blocking variant of :meth:`acquire` for synchronous calls."""
+        reservation = self._reserve(tokens)
+        if reservation.wait_seconds:
+            try:
+                time.sleep(reservation.wait_seconds)
+            finally:
+                self._done_waiting()
+        return reservation
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return limiter metrics.
+
+        ``waiting`` is the number of callers currently queued, ``waited`` the
+        calls that had to wait at all, and ``avg_wait_ms`` the mean wait over
+        all calls.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for bucket in (self._tokens, self._requests):
+                if bucket is not None:
+                    bucket.refill(now)
+            return {
+                "tokens_per_minute": self.tokens_per_minute,
+                "requests_per_minute": self.requests_per_minute,
+                "available_tokens": int(self._tokens.level) if self._tokens else None,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "waiting": self._waiting,
+                "avg_wait_ms": (self._total_wait / self._acquired * 1000)
+                if self._acquired
+                else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+                "tokens_reserved": self._tokens_reserved,
+                "tokens_used": self._tokens_used,
+            }
+
+    def _reserve(self, tokens: int) -> Reservation:
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._tokens is not None:
+                tokens = min(tokens, int(self._tokens.capacity))
+                wait = self._tokens.take(tokens, now)
+            if self._requests is not None:
+                wait = max(wait, self._requests.take(1, now))
+
+            self._acquired += 1
+            self._tokens_reserved += tokens
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if wait:
+                self._waited += 1
+                self._waiting += 1
+
+        if wait:
+            logger.debug(f"Rate limiter {self.name}: waiting {wait:.2f}s for capacity")
+        return Reservation(self, tokens, wait)
+
+    def _done_waiting(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def _settle(self, reservation: Reservation, used_tokens: int) -> None:
+        with self._lock:
+            self._tokens_used += used_tokens
+            if self._tokens is not None:
+                self._tokens.give_back(reservation.tokens - used_tokens, time.monotonic())
+
+    def _cancel(self, reservation: Reservation) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens_reserved -= reservation.tokens
+            if self._tokens is not None:
+                self._tokens.give_back(reservation.tokens, now)
+            if self._requests is not None:
+                self._requests.give_back(1, now)
+
+    def __copy__(self) -> RateLimiter:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RateLimiter:
+        return self
+
+
+def default_limits() -> tuple[int | None, int | None]:
+    """
+    Read the default limits from environment variables.
+
+    Environment Variables:
+        DCAF_RATE_LIMIT_TOKENS_PER_MINUTE: Token budget per model (default: unlimited)
+        DCAF_RATE_LIMIT_REQUESTS_PER_MINUTE: Request budget per model (default: unlimited)
+    """
+    tokens = os.getenv("DCAF_RATE_LIMIT_TOKENS_PER_MINUTE")
+    requests = os.getenv("DCAF_RATE_LIMIT_REQUESTS_PER_MINUTE")
+    return (int(tokens) if tokens else None, int(requests) if requests else None)
+
+
+class RateLimiterRegistry:
+    """Process-wide limiters, one per (provider, model, region)."""
+
+    def __init__(self) -> None:
+        self._limiters: dict[tuple[str, str, str], RateLimiter] = {}
+        # Conflicting limits already warned about, per limiter
+        self._conflicts: set[tuple[tuple[str, str, str], int | None, int | None]] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        provider: str,
+        model_id: str,
+        region: str | None = None,
+        tokens_per_minute: int | None = None,
+        requests_per_minute: int | None = None,
+    ) -> RateLimiter | None:
+        """
+        Return the limiter for a model, creating it on first use.
+
+        Limits not given fall back to :func:`default_limits`.  Returns None
+        if neither limit is set.  The quota belongs to the model, so the
+        first limits set for it are kept: different limits passed for an
+        existing limiter are ignored with a warning (use
+        :meth:`RateLimiter.configure` to change them).
+        """
+        env_tokens, env_requests = default_limits()
+        tokens_per_minute = tokens_per_minute or env_tokens
+        requests_per_minute = requests_per_minute or env_requests
+
+        key = (provider.lower(), model_id, region or "")
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                if not (tokens_per_minute or requests_per_minute):
+                    return None
+                limiter = self._limiters[key] = RateLimiter(
+                    tokens_per_minute, requests_per_minute, name="/".join(filter(None, key))
+                )
+                logger.info(
+                    f"Rate limiter for {limiter.name}: "
+                    f"{tokens_per_minute or 'unlimited'} tokens/min, "
+                    f"{requests_per_minute or 'unlimited'} requests/min"
+                )
+            elif (tokens_per_minute, requests_per_minute) != (
+                limiter.tokens_per_minute,
+                limiter.requests_per_minute,
+            ) and (tokens_per_minute or requests_per_minute):
+                conflict = (key, tokens_per_minute, requests_per_minute)
+                if conflict not in self._conflicts:
+                    self._conflicts.add(conflict)
+                    logger.warning(
+                        f"Rate limiter for {limiter.name} already limits to "
+                        f"{limiter.tokens_per_minute or 'unlimited'} tokens/min, "
+                        f"{limiter.requests_per_minute or 'unlimited'} requests/min; "
+                        f"ignoring {tokens_per_minute or 'unlimited'} tokens/min, "
+                        f"{requests_per_minute or 'unlimited'} requests/min"
+                    )
+            return limiter
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the stats of every limiter, keyed by ``provider/model/region``."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.stats() for limiter in limiters}
+
+    def clear(self) -> None:
+        """Forget all limiters (models created afterwards get new ones)."""
+        with self._lock:
+            self._limiters.clear()
+            self._conflicts.clear()
+
+
+_default_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Return the process-wide rate limiter registry."""
+    return _default_registry
@@ -0,0 +1,372 @@
+"""
+Response cache for deterministic LLM and agent calls.
+
+At temperature 0 (and in practice at the low default of 0.1) the same
+prompt gets the same answer, yet every call pays seconds of model latency
+and its tokens.  A ``ResponseCache`` stores responses under a key computed
+from everything that determines them - model, inference settings, system
+prompt, tool schemas and messages - so a repeated question is answered from
+memory:
+
+- An in-memory LRU tier with a TTL serves hits in microseconds.
+- An optional SQLite tier (``path=...``) keeps entries across restarts and
+  between worker processes on the same host.
+
+Entries are stored per scope (the tenant for agents), so one tenant's
+answers are never served to another and ``invalidate(scope)`` drops a
+tenant's entries.  Values are pickled; keep the SQLite file private.
+
+Callers can skip the cache for a request with ``cache_mode("refresh")``
+(do not read, store the new response) or ``cache_mode("bypass")`` (neither).
+The server sets the mode from the ``X-DCAF-Cache`` and ``Cache-Control``
+request headers.
+
+On an event loop use ``aget`` / ``aset`` / ``ainvalidate``: they use the
+SQLite tier in a worker thread, while memory hits are still served inline.
+The SQLite tier has its own lock, so memory hits never wait for the disk.
+
+Example:
+    cache = ResponseCache(max_entries=1024, ttl_seconds=600, path="/tmp/dcaf-cache.db")
+    key = request_key(model_id, temperature, system_prompt, tools, messages)
+
+    response = await cache.aget(key, scope="tenant-a")
+    if response is None:
+        response = await llm.ainvoke(...)
+        await cache.aset(key, response, scope="tenant-a")
+
+    cache.stats()  # {"hits": 10, "misses": 3, "hit_ratio": 0.77, ...}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+# Header carrying the cache mode of a request ("use", "refresh" or "bypass")
+CACHE_MODE_HEADER = "x-dcaf-cache"
+
+_cache_mode: ContextVar[str] = ContextVar("_cache_mode", default="use")
+
+# Expired SQLite rows are deleted every this many stores
+_PRUNE_INTERVAL = 100
+
+
+@contextmanager
+def cache_mode(mode: str) -> Iterator[None]:
+    """
+    Set the cache mode for calls made inside the block.
+
+    Args:
+        mode: "use" (default), "refresh" (skip lookups but store responses)
+              or "bypass" (skip lookups and stores)
+    """
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode: {mode!r}. Expected one of {CACHE_MODES}")
+    token = _cache_mode.set(mode)
+    try:
+        yield
+    finally:
+        _cache_mode.reset(token)
+
+
+def current_cache_mode() -> str:
+    """Return the cache mode of the current context."""
+    return _cache_mode.get()
+
+
+def cache_mode_from_headers(headers: Mapping[str, str]) -> str:
+    """
+    Return the cache mode requested by HTTP headers.
+
+    ``X-DCAF-Cache: refresh|bypass`` is used when present; otherwise
+    ``Cache-Control: no-store`` means "bypass" and ``no-cache`` "refresh".
+    """
+    lowered = {k.lower(): v for k, v in headers.items()}
+    explicit = lowered.get(CACHE_MODE_HEADER, "").strip().lower()
+    if explicit in CACHE_MODES:
+        return explicit
+    directives = {d.strip().lower() for d in lowered.get("cache-control", "").split(",")}
+    if "no-store" in directives:
+        return "bypass"
+    if "no-cache" in directives:
+        return "refresh"
+    return "use"
+
+
+def _unpickle(blob: bytes) -> Any:
+    # Only blobs written by ResponseCache.set() are loaded
+    return pickle.loads(blob)  # noqa: S301
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of responses, with an optional SQLite tier.
+
+    Thread-safe; one instance can be shared by all agents and LLMs of a
+    process.
+
+    Args:
+        max_entries: Entries kept in memory (least recently used evicted first)
+        ttl_seconds: Lifetime of an entry
+        path: SQLite file for the on-disk tier (default: memory only)
+        max_temperature: Calls sampled above this temperature are not cached
+        name: Name used in logs
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 600.0,
+        path: str | None = None,
+        max_temperature: float = 0.1,
+        name: str = "responses",
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self.name = name
+        self._entries: OrderedDict[tuple[str, str], tuple[float, bytes]] = OrderedDict()
+        # Guards the memory tier and counters; _db_lock guards the SQLite tier
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            ("memory_hits", "disk_hits", "misses", "bypassed", "stores", "evictions"), 0
+        )
+        self._db = self._open(path) if path else None
+        self._stores_since_prune = 0
+
+    def cacheable(self, temperature: float | None) -> bool:
+        """Whether calls at ``temperature`` are deterministic enough to cache."""
+        return temperature is None or temperature <= self.max_temperature
+
+    def get(self, key: str, scope: str | None = None) -> Any | None:
+        """
+        Return a copy of the response stored under ``key``, or None.
+
+        Always None when the current cache mode is "refresh" or "bypass".
+        Reads the SQLite tier on the calling thread; use :meth:`aget` on an
+        event loop.
+        """
+        if not self._readable():
+            return None
+        entry_key, now = (scope or "", key), time.time()
+        entry = self._from_memory(entry_key, now)
+        if entry is None:
+            entry = self._from_disk(entry_key, self._load(entry_key, now))
+        return _unpickle(entry[1]) if entry is not None else None
+
+    async def aget(self, key: str, scope: str | None = None) -> Any | None:
+        """Like :meth:`get`, reading the SQLite tier in a worker thread."""
+        if not self._readable():
+            return None
+        entry_key, now = (scope or "", key), time.time()
+        entry = self._from_memory(entry_key, now)
+        if entry is None:
+            loaded = (
+                await asyncio.to_thread(self._load, entry_key, now)
+                if self._db is not None
+                else None
+            )
+            entry = self._from_disk(entry_key, loaded)
+        return _unpickle(entry[1]) if entry is not None else None
+
+    def set(self, key: str, value: Any, scope: str | None = None) -> None:
+        """
+        Store a copy of ``value`` under ``key``.
+
+        Skipped when the current cache mode is "bypass" or the value
+        cannot be pickled.  Writes the SQLite tier on the calling thread; use
+        :meth:`aset` on an event loop.
+        """
+        stored = self._store(key, value, scope)
+        if stored is not None:
+            self._save(*stored)
+
+    async def aset(self, key: str, value: Any, scope: str | None = None) -> None:
+        """Like :meth:`set`, writing the SQLite tier in a worker thread."""
+        stored = self._store(key, value, scope)
+        if stored is not None and self._db is not None:
+            await asyncio.to_thread(self._save, *stored)
+
+    def invalidate(self, scope: str | None = None) -> None:
+        """
+        Drop the entries of ``scope``, or all entries when scope is None.
+
+        Deletes from the SQLite tier on the calling thread; use
+        :meth:`ainvalidate` on an event loop.
+        """
+        self._forget(scope)
+        self._delete(scope)
+
+    async def ainvalidate(self, scope: str | None = None) -> None:
+        """Like :meth:`invalidate`, deleting from the SQLite tier in a worker thread."""
+        self._forget(scope)
+        if self._db is not None:
+            await asyncio.to_thread(self._delete, scope)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return cache metrics.
+
+        ``hits`` is the sum of ``memory_hits`` and ``disk_hits``;
+        ``bypassed`` counts lookups skipped because of the cache mode.
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            entries = len(self._entries)
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        lookups = hits + counts["misses"]
+        return {
+            "hits": hits,
+            **counts,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite tier."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, entry_key: tuple[str, str], entry: tuple[float, bytes]) -> None:
+        self._entries[entry_key] = entry
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counts["evictions"] += 1
+
+    def _readable(self) -> bool:
+        if current_cache_mode() != "use":
+            self._count("bypassed")
+            return False
+        return True
+
+    def _from_memory(self, entry_key: tuple[str, str], now: float) -> tuple[float, bytes] | None:
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[entry_key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                self._counts["memory_hits"] += 1
+            return entry
+
+    def _from_disk(
+        self, entry_key: tuple[str, str], entry: tuple[float, bytes] | None
+    ) -> tuple[float, bytes] | None:
+        """Count a lookup that missed memory, keeping a ``_load`` result in memory."""
+        with self._lock:
+            if entry is None:
+                self._counts["misses"] += 1
+            else:
+                self._remember(entry_key, entry)
+                self._counts["disk_hits"] += 1
+        return entry
+
+    def _store(
+        self, key: str, value: Any, scope: str | None
+    ) -> tuple[tuple[str, str], tuple[float, bytes]] | None:
+        """Keep a pickled copy of ``value`` in memory; return it for ``_save``."""
+        if current_cache_mode() == "bypass":
+            return None
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Response cache {self.name}: value not cacheable ({e})")
+            return None
+
+        entry_key = (scope or "", key)
+        entry = (time.time() + self.ttl_seconds, blob)
+        with self._lock:
+            self._remember(entry_key, entry)
+            self._counts["stores"] += 1
+        return entry_key, entry
+
+    def _forget(self, scope: str | None) -> None:
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+            else:
+                for entry_key in [k for k in self._entries if k[0] == scope]:
+                    del self._entries[entry_key]
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    # -------------------------------------------------------------------------
+    # SQLite tier
+    # -------------------------------------------------------------------------
+
+    def _open(self, path: str) -> sqlite3.Connection | None:
+        try:
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "scope TEXT NOT NULL, key TEXT NOT NULL, expires REAL NOT NULL, "
+                "value BLOB NOT NULL, PRIMARY KEY (scope, key))"
+            )
+            db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache {self.name}: cannot open {path} ({e}), memory only")
+            return None
+        logger.info(f"Response cache {self.name}: on-disk tier at {path}")
+        return db
+
+    def _load(self, entry_key: tuple[str, str], now: float) -> tuple[float, bytes] | None:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            row = self._execute(
+                "SELECT expires, value FROM responses WHERE scope = ? AND key = ? AND expires > ?",
+                (*entry_key, now),
+            )
+        return (row[0], bytes(row[1])) if row else None
+
+    def _save(self, entry_key: tuple[str, str], entry: tuple[float, bytes]) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._execute(
+                "INSERT OR REPLACE INTO responses (scope, key, expires, value) VALUES (?, ?, ?, ?)",
+                (*entry_key, *entry),
+            )
+            self._stores_since_prune += 1
+            if self._stores_since_prune >= _PRUNE_INTERVAL:
+                self._stores_since_prune = 0
+                self._execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+
+    def _delete(self, scope: str | None) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            if scope is None:
+                self._execute("DELETE FROM responses", ())
+            else:
+                self._execute("DELETE FROM responses WHERE scope = ?", (scope,))
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> Any:
+        """Run one statement (``_db_lock`` held); SQLite errors are logged, not raised."""
+        assert self._db is not None
+        try:
+            return self._db.execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache {self.name}: SQLite error ({e})")
+            return None
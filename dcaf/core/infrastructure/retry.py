@@ -0,0 +1,92 @@
+"""
+Classifying model errors as transient or not.
+
+Failover, circuit breakers and retries only help when an error depends on
+the provider's state: throttling, 5xx responses, timeouts and dropped
+connections.  An error caused by the request itself - a Bedrock
+``ValidationException`` for oversized input or a bad tool schema,
+``AccessDeniedException``, a ``TypeError`` from bad keyword arguments -
+fails the same way everywhere, so sending it again only multiplies it.
+
+Example:
+    try:
+        response = await model.ainvoke(...)
+    except Exception as e:
+        if not is_retryable(e):
+            raise
+        ...
+
+Providers wrap their errors (Agno raises ``ModelProviderError`` from the
+botocore ``ClientError``), so the whole ``__cause__`` chain is inspected.
+"""
+
+from __future__ import annotations
+
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
+
+# Error codes of AWS responses that are worth sending again
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "InternalFailure",
+        "InternalServerError",
+        "InternalServerException",
+        "ModelNotReadyException",
+        "ModelTimeoutException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "ThrottledException",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+    }
+)
+
+# HTTP statuses that are worth sending again (besides 5xx)
+RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Return whether ``error`` is transient (throttling, 5xx, timeout, connection).
+
+    Anything else - validation and permission errors, programming errors,
+    errors without a status - is treated as a problem with the request.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        verdict = _classify(current)
+        if verdict is not None:
+            return verdict
+        current = current.__cause__
+    return False
+
+
+def _classify(error: BaseException) -> bool | None:
+    """Classify one error; None if it carries no information and its cause decides."""
+    if isinstance(error, TimeoutError | ConnectionError | HTTPClientError | BotoConnectionError):
+        return True
+
+    response = getattr(error, "response", None)
+    if isinstance(response, dict) and "Error" in response:
+        # botocore ClientError
+        if response["Error"].get("Code") in RETRYABLE_ERROR_CODES:
+            return True
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return _retryable_status(status)
+
+    if error.__cause__ is not None:
+        # Wrappers (e.g. Agno's ModelProviderError) report a generic status
+        return None
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(response, "status_code", None)
+    return _retryable_status(status)
+
+
+def _retryable_status(status: object) -> bool:
+    return isinstance(status, int) and (status in RETRYABLE_STATUS_CODES or status >= 500)
@@ -0,0 +1,200 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+Duplicate submissions are common - Slack retries, HelpDesk double-clicks,
+several router replicas looking at the same thread - and each would start
+its own agent run or LLM call.  A ``SingleFlight`` runs one execution per
+key at a time: callers arriving with the key of an execution that is still
+in flight attach to it and receive its result (or its stream of events)
+instead of starting another.  Nothing is cached once the execution ends.
+
+Example:
+    flight = SingleFlight(name="llm")
+    key = request_key(messages, system_prompt, tools)
+
+    response = await flight.run(key, lambda: llm.ainvoke(...))
+
+    async for event in flight.stream(key, lambda: service.execute_stream(request)):
+        ...
+
+    flight.stats()  # {"executions": 10, "coalesced": 4, "in_flight": 1, ...}
+
+An execution is cancelled only when every caller attached to it has gone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def request_key(*parts: Any) -> str:
+    """
+    Return a stable key for a request made of JSON-like parts.
+
+    Dict keys are sorted, so equal requests produce equal keys regardless
+    of key order; values that are not JSON serializable use ``str()``.
+    """
+    canonical = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class _Flight:
+    """One in-flight execution and the callers attached to it."""
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class _Broadcast:
+    """Events of an in-flight stream, replayed to every subscriber."""
+
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.changed = asyncio.Condition()
+        self.subscribers = 0
+        self.task: asyncio.Task[None] | None = None
+
+    async def pump(self, source: AsyncIterator[Any]) -> None:
+        try:
+            async for event in source:
+                async with self.changed:
+                    self.events.append(event)
+                    self.changed.notify_all()
+        except BaseException as e:
+            self.error = e
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            async with self.changed:
+                self.done = True
+                self.changed.notify_all()
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        index = 0
+        while True:
+            async with self.changed:
+                while index >= len(self.events) and not self.done:
+                    await self.changed.wait()
+                events = self.events[index:]
+                finished = self.done
+            for event in events:
+                yield event
+            index += len(events)
+            if finished and index >= len(self.events):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    Flights are tracked per event loop.  Thread-safe stats.
+
+    Args:
+        name: Name used in logs
+    """
+
+    def __init__(self, name: str = "") -> None:
+        self.name = name
+        self._flights: dict[tuple[int, Hashable], _Flight] = {}
+        self._streams: dict[tuple[int, Hashable], _Broadcast] = {}
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._coalesced = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of ``fn()``, shared with concurrent callers of ``key``.
+
+        Exceptions raised by the execution are raised to every caller.
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda _: self._flights.pop(flight_key, None))
+            self._record(coalesced=False)
+        else:
+            self._record(coalesced=True)
+            logger.debug(f"Single-flight {self.name}: joined in-flight call")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def stream(
+        self, key: Hashable, fn: Callable[[], AsyncIterator[Any]]
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the events of ``fn()``, shared with concurrent callers of ``key``.
+
+        Callers that join late first receive the events produced so far.
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        broadcast = self._streams.get(flight_key)
+        if broadcast is None:
+            broadcast = _Broadcast()
+            broadcast.task = asyncio.create_task(broadcast.pump(fn()))
+            self._streams[flight_key] = broadcast
+            broadcast.task.add_done_callback(lambda _: self._streams.pop(flight_key, None))
+            self._record(coalesced=False)
+        else:
+            self._record(coalesced=True)
+            logger.debug(f"Single-flight {self.name}: joined in-flight stream")
+
+        broadcast.subscribers += 1
+        try:
+            async for event in broadcast.subscribe():
+                yield event
+        finally:
+            broadcast.subscribers -= 1
+            if broadcast.subscribers == 0 and broadcast.task and not broadcast.task.done():
+                # Every caller left: stop the execution
+                broadcast.task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return coalescing metrics.
+
+        ``executions`` counts calls that started an execution and
+        ``coalesced`` calls that joined one; ``coalesce_ratio`` is the share
+        of calls that were coalesced.
+        """
+        with self._lock:
+            calls = self._executions + self._coalesced
+            return {
+                "calls": calls,
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "coalesce_ratio": self._coalesced / calls if calls else 0.0,
+                "in_flight": len(self._flights) + len(self._streams),
+            }
+
+    def _record(self, coalesced: bool) -> None:
+        with self._lock:
+            if coalesced:
+                self._coalesced += 1
+            else:
+                self._executions += 1
@@ -36,21 +36,33 @@ Quick Start::
     )
 """
 
-import asyncio
+import copy
 import logging
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from agno.models.message import Message as AgnoMessage
+from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse
 
 from .adapters.outbound.agno.gcp_metadata import get_default_gcp_metadata_manager
 from .adapters.outbound.agno.model_factory import AgnoModelFactory, ModelConfig
+from .adapters.outbound.agno.routed_model import ModelRouter, RoutedModelFactory
 from .config import (
     PROVIDER_MODEL_DEFAULTS,
     EnvVars,
     get_env,
 )
+from .infrastructure.background_loop import run_sync
+from .infrastructure.response_cache import ResponseCache
+from .infrastructure.single_flight import SingleFlight, request_key
+from .llm_batch import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+    BatchRun,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +89,8 @@ class LLMResponse:
         tool_calls: Raw tool calls from the model. Each entry is a dict with
                     at minimum ``name`` and ``input`` keys.
         usage: Token usage metrics (``input_tokens``, ``output_tokens``,
-               ``total_tokens``).
+               ``total_tokens``, plus ``cache_read_tokens`` /
+               ``cache_write_tokens`` when prompt caching was used).
         raw: The underlying Agno ``ModelResponse`` for callers who need
              full access to provider-specific fields.
     """
@@ -88,6 +101,98 @@ class LLMResponse:
     raw: ModelResponse | None = field(default=None, repr=False)
 
 
+@dataclass
+class LLMStreamChunk:
+    """
+    One increment of a streamed LLM call (see :meth:`LLM.astream`).
+
+    A chunk carries text, completed tool calls, or the final usage - usually
+    just one of them.
+
+    Attributes:
+        text: Text delta, or None.
+        tool_calls: Tool calls completed in this chunk, normalized like
+                    ``LLMResponse.tool_calls`` (``name`` and ``input``).
+        usage: Token usage, reported once near the end of the stream.
+    """
+
+    text: str | None = None
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    usage: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class InferenceConfig:
+    """
+    Inference settings for a single LLM call.
+
+    Calls never change the shared model instance; the settings are applied to
+    a per-call copy, so one ``LLM`` can serve concurrent calls with different
+    settings (router, summarizer and agent traffic alike).
+
+    Attributes:
+        max_tokens: Maximum tokens in the response, or None for the model's default.
+        temperature: Sampling temperature, or None for the model's default.
+    """
+
+    max_tokens: int | None = None
+    temperature: float | None = None
+
+    def is_default(self) -> bool:
+        """Whether the call uses the model's own settings."""
+        return self.max_tokens is None and self.temperature is None
+
+    def apply(self, model: Any) -> Any:
+        """
+        Return the model to use for the call.
+
+        With default settings this is ``model`` itself.  Otherwise it is a
+        shallow copy sharing the model's clients, with the settings applied
+        under the provider's attribute names (for a routed model, to each
+        target's model as its request is made).
+        """
+        if self.is_default():
+            return model
+
+        _open_shared_clients(model)
+        view = copy.copy(model)
+        for name, value in self._attributes_for(model).items():
+            setattr(view, name, value)
+        if hasattr(model, "target_view"):
+            # A routed model makes its requests with the targets' models
+            view.target_view = self.apply
+        return view
+
+    def _attributes_for(self, model: Any) -> dict[str, Any]:
+        """Map the settings to the model class's attribute names."""
+        if hasattr(model, "max_tokens") or hasattr(model, "max_output_tokens"):
+            # Gemini calls it max_output_tokens
+            tokens = "max_output_tokens" if hasattr(model, "max_output_tokens") else "max_tokens"
+            values = {tokens: self.max_tokens, "temperature": self.temperature}
+            return {name: value for name, value in values.items() if value is not None}
+        if hasattr(model, "options"):  # Ollama
+            values = {"num_predict": self.max_tokens, "temperature": self.temperature}
+            options = {k: v for k, v in values.items() if v is not None}
+            return {"options": {**(model.options or {}), **options}}
+        return {}
+
+
+def _open_shared_clients(model: Any) -> None:
+    """
+    Create the model's lazily-created client state before it is copied.
+
+    Otherwise every per-call copy would create (and drop) its own client or
+    boto session instead of sharing the model's.
+    """
+    get_async_client = getattr(model, "get_async_client", None)
+    if get_async_client is None:
+        return
+    if getattr(model, "async_session", True) is None or (
+        not hasattr(model, "async_session") and getattr(model, "async_client", True) is None
+    ):
+        get_async_client()
+
+
 # =============================================================================
 # LLM class
 # =============================================================================
@@ -108,12 +213,23 @@ class LLM:
                ``anthropic.claude-3-5-haiku-20241022-v1:0``).
         temperature: Sampling temperature (0.0–1.0).
         max_tokens: Maximum tokens in the response.
+        coalesce: Share one call between concurrent identical ``ainvoke``/
+                  ``invoke`` calls (same messages, system prompt, tools and
+                  settings); see :attr:`coalescer` for metrics.
+        cache: ``ResponseCache`` for responses of calls at or below its
+               ``max_temperature``; identical calls are then answered from
+               the cache.
         **provider_kwargs: Provider-specific configuration passed through to
             ``AgnoModelFactory``. Supported keys include:
             - ``aws_profile``, ``aws_region``, ``aws_access_key``,
               ``aws_secret_key`` (for Bedrock)
             - ``api_key`` (for Anthropic, OpenAI, Azure)
             - ``google_project_id``, ``google_location`` (for Google)
+            - ``routes``: Further targets to fail over (and optionally hedge)
+              to, each a dict of ``ModelConfig`` fields overriding this
+              configuration (``model`` is accepted for ``model_id``), e.g.
+              ``[{"aws_region": "us-west-2"}]``
+            - ``routing_policy``: ``RoutingPolicy`` for ``routes``
 
     Example::
 
@@ -132,12 +248,18 @@ class LLM:
         model: str,
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        coalesce: bool = False,
+        cache: ResponseCache | None = None,
         **provider_kwargs: Any,
     ) -> None:
         self._provider = provider.lower()
         self._model_id = model
         self._temperature = temperature
         self._max_tokens = max_tokens
+        self._coalescer: SingleFlight[LLMResponse] | None = (
+            SingleFlight(name=f"llm:{model}") if coalesce else None
+        )
+        self._cache = cache
 
         # Build the model config for the factory
         config = ModelConfig(
@@ -158,10 +280,19 @@ class LLM:
             "gcp_metadata_manager", get_default_gcp_metadata_manager()
         )
 
-        self._model_factory = AgnoModelFactory(
-            config=config,
-            gcp_metadata_manager=gcp_metadata,
-        )
+        routes = provider_kwargs.get("routes")
+        self._model_factory: AgnoModelFactory | RoutedModelFactory
+        if routes:
+            self._model_factory = RoutedModelFactory(
+                [config, *(_route_config(config, route) for route in routes)],
+                policy=provider_kwargs.get("routing_policy"),
+                gcp_metadata_manager=gcp_metadata,
+            )
+        else:
+            self._model_factory = AgnoModelFactory(
+                config=config,
+                gcp_metadata_manager=gcp_metadata,
+            )
 
         logger.info(
             f"LLM initialized: provider={self._provider}, model={model}, "
@@ -178,6 +309,23 @@ class LLM:
         """The provider name."""
         return self._provider
 
+    @property
+    def coalescer(self) -> SingleFlight[LLMResponse] | None:
+        """The coalescer when ``coalesce=True`` (``coalescer.stats()`` reports metrics)."""
+        return self._coalescer
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache, if one was given."""
+        return self._cache
+
+    @property
+    def router(self) -> ModelRouter | None:
+        """The model router when ``routes`` were given (available after ``get_model()``)."""
+        if isinstance(self._model_factory, RoutedModelFactory):
+            return self._model_factory.router
+        return None
+
     async def get_model(self) -> Any:
         """
         Get the underlying Agno model instance.
@@ -215,19 +363,52 @@ class LLM:
             max_tokens: Override max tokens for this call.
             temperature: Override temperature for this call.
 
+        Overrides apply to this call only (see :class:`InferenceConfig`);
+        concurrent calls with different overrides do not affect each other.
+        With ``coalesce=True``, a call identical to one still in flight
+        returns that call's response.  With a ``cache``, a call identical to
+        an earlier one returns a copy of its cached response.
+
         Returns:
             ``LLMResponse`` with text, tool_calls, usage, and raw response.
         """
-        model = await self.get_model()
+        call = (messages, system_prompt, tools, tool_choice, max_tokens, temperature)
+        effective_temperature = self._temperature if temperature is None else temperature
+        cache = (
+            self._cache
+            if self._cache is not None and self._cache.cacheable(effective_temperature)
+            else None
+        )
+        if cache is not None:
+            key = request_key(
+                self._provider, self._model_id, self._max_tokens, self._temperature, *call
+            )
+            cached: LLMResponse | None = await cache.aget(key)
+            if cached is not None:
+                return cached
+
+        if self._coalescer is not None:
+            response = await self._coalescer.run(request_key(*call), lambda: self._ainvoke(*call))
+        else:
+            response = await self._ainvoke(*call)
 
-        # Apply per-call overrides
-        if max_tokens is not None:
-            model.max_tokens = max_tokens
-        elif self._max_tokens:
-            model.max_tokens = self._max_tokens
+        if cache is not None:
+            await cache.aset(key, response)
+        return response
 
-        if temperature is not None:
-            model.temperature = temperature
+    async def _ainvoke(
+        self,
+        messages: list[dict[str, Any]],
+        system_prompt: str | None,
+        tools: list[dict[str, Any]] | None,
+        tool_choice: str | dict[str, Any] | None,
+        max_tokens: int | None,
+        temperature: float | None,
+    ) -> LLMResponse:
+        # Per-call settings go on a copy; the cached model is shared
+        model = InferenceConfig(max_tokens=max_tokens, temperature=temperature).apply(
+            await self.get_model()
+        )
 
         # Build Agno message list
         agno_messages = self._build_messages(messages, system_prompt)
@@ -264,7 +445,9 @@ class LLM:
         Make a synchronous direct LLM call.
 
         Convenience wrapper around :meth:`ainvoke` for non-async contexts
-        (e.g., ``SlackResponseRouter``).
+        (e.g., ``SlackResponseRouter``). The call runs on a process-wide
+        background event loop, so it must not be made from inside that loop;
+        async code should await :meth:`ainvoke` instead.
 
         Args:
             messages: List of message dicts with ``role`` and ``content`` keys.
@@ -277,39 +460,117 @@ class LLM:
         Returns:
             ``LLMResponse`` with text, tool_calls, usage, and raw response.
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            # We're inside an async context — use a thread to avoid blocking
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    self.ainvoke(
-                        messages=messages,
-                        system_prompt=system_prompt,
-                        tools=tools,
-                        tool_choice=tool_choice,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                    ),
-                )
-                return future.result()
-        else:
-            return asyncio.run(
-                self.ainvoke(
-                    messages=messages,
-                    system_prompt=system_prompt,
-                    tools=tools,
-                    tool_choice=tool_choice,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
+        # One long-lived loop for all sync calls, so the model's clients are
+        # reused instead of rebuilt with a fresh asyncio.run() loop each time
+        return run_sync(
+            self.ainvoke(
+                messages=messages,
+                system_prompt=system_prompt,
+                tools=tools,
+                tool_choice=tool_choice,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+        )
+
+    async def astream(
+        self,
+        messages: list[dict[str, Any]],
+        system_prompt: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | dict[str, Any] | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Make a streaming direct LLM call.
+
+        Same arguments as :meth:`ainvoke`, but text is yielded as the model
+        produces it, so the first words arrive long before the full
+        completion.
+
+        Yields:
+            ``LLMStreamChunk`` with a text delta, completed tool calls or
+            the final usage.
+
+        Example::
+
+            async for chunk in llm.astream(messages=[{"role": "user", "content": "Hi"}]):
+                if chunk.text:
+                    print(chunk.text, end="")
+        """
+        model = InferenceConfig(max_tokens=max_tokens, temperature=temperature).apply(
+            await self.get_model()
+        )
+        agno_messages = self._build_messages(messages, system_prompt)
+
+        logger.info(
+            f"LLM.astream: {len(agno_messages)} messages, "
+            f"tools={len(tools) if tools else 0}, "
+            f"model={self._model_id}"
+        )
+
+        async for delta in model.ainvoke_stream(
+            messages=agno_messages,
+            assistant_message=AgnoMessage(role="assistant"),
+            tools=tools,
+            tool_choice=tool_choice,
+        ):
+            chunk = LLMStreamChunk(
+                text=self._extract_text(delta.content) or None,
+                tool_calls=[self._normalize_tc(tc) for tc in delta.tool_calls or []],
+                usage=self._usage_from_metrics(delta.response_usage),
+            )
+            if chunk.text or chunk.tool_calls or chunk.usage:
+                yield chunk
+
+    def abatch(
+        self,
+        requests: Iterable[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: int | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+    ) -> BatchRun:
+        """
+        Run many independent calls with bounded concurrency.
+
+        All calls share this LLM's model and pooled client.  Iterate the
+        returned :class:`BatchRun` to get results as they complete; its
+        ``stats`` report throughput and token usage.
+
+        Args:
+            requests: One dict of :meth:`ainvoke` keyword arguments per call.
+            max_concurrency: Calls in flight at the same time.
+            tokens_per_minute: Optional token budget to pace calls to
+                (estimated input tokens are reserved before each call and
+                settled against the reported usage).
+            max_retries: Retries per item; items that still fail are
+                yielded with their error.
+            retry_backoff: Initial retry backoff in seconds (exponential).
+
+        Returns:
+            ``BatchRun`` - ``async for result in llm.abatch(...)`` or
+            ``await llm.abatch(...).collect()``.
+
+        Example::
+
+            batch = llm.abatch(
+                [{"messages": [{"role": "user", "content": t}]} for t in tickets],
+                max_concurrency=16,
             )
+            async for result in batch:
+                print(result.index, result.response.text if result.ok else result.error)
+            print(batch.stats.to_dict())
+        """
+        return BatchRun(
+            self,
+            requests,
+            max_concurrency=max_concurrency,
+            tokens_per_minute=tokens_per_minute,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+        )
 
     async def cleanup(self) -> None:
         """Release any resources held by the underlying model factory."""
@@ -371,6 +632,20 @@ class LLM:
                 arguments = json.loads(arguments)
         return {"name": name, "input": arguments}
 
+    @staticmethod
+    def _usage_from_metrics(metrics: Any) -> dict[str, int]:
+        """Convert Agno ``Metrics`` (e.g. a stream's final usage) to a usage dict."""
+        if not isinstance(metrics, Metrics):
+            return {}
+        usage = {
+            "input_tokens": metrics.input_tokens,
+            "output_tokens": metrics.output_tokens,
+            "total_tokens": metrics.total_tokens,
+            "cache_read_tokens": metrics.cache_read_tokens,
+            "cache_write_tokens": metrics.cache_write_tokens,
+        }
+        return {key: value for key, value in usage.items() if value}
+
     @staticmethod
     def _convert_response(model_response: ModelResponse) -> LLMResponse:
         """Convert Agno ModelResponse to LLMResponse."""
@@ -385,6 +660,12 @@ class LLM:
             usage["output_tokens"] = model_response.output_tokens
         if model_response.total_tokens is not None:
             usage["total_tokens"] = model_response.total_tokens
+        response_usage = model_response.response_usage
+        if isinstance(response_usage, Metrics):
+            if response_usage.cache_read_tokens:
+                usage["cache_read_tokens"] = response_usage.cache_read_tokens
+            if response_usage.cache_write_tokens:
+                usage["cache_write_tokens"] = response_usage.cache_write_tokens
 
         return LLMResponse(
             text=text,
@@ -423,6 +704,14 @@ def _provider_env_kwargs(provider: str) -> dict[str, Any]:
     }
 
 
+def _route_config(config: ModelConfig, route: dict[str, Any]) -> ModelConfig:
+    """Return ``config`` with a route's overrides applied."""
+    overrides = dict(route)
+    if "model" in overrides:
+        overrides["model_id"] = overrides.pop("model")
+    return replace(config, **overrides)
+
+
 def create_llm(
     provider: str | None = None,
     model: str | None = None,
@@ -0,0 +1,269 @@
+"""
+Bounded-concurrency batches of direct LLM calls.
+
+``LLM.abatch`` runs many independent prompts (ticket triage, summarizing
+Slack threads, ...) through one ``LLM`` - and so one cached model and pooled
+client - and yields results as they complete:
+
+    batch = llm.abatch(
+        [{"messages": [{"role": "user", "content": text}]} for text in threads],
+        max_concurrency=16,
+        tokens_per_minute=200_000,
+    )
+    async for result in batch:
+        if result.ok:
+            print(result.index, result.response.text)
+        else:
+            print(result.index, "failed:", result.error)
+
+    print(batch.stats.to_dict())
+
+Each request is a dict of :meth:`LLM.ainvoke` keyword arguments.  Calls that
+fail with a transient error (throttling, 5xx, timeout, connection) are
+retried with exponential backoff; other errors are not.  An item that still
+fails is reported with its error instead of aborting the batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from dcaf.llm.tokens import count_tokens
+
+from .infrastructure.rate_limiter import RateLimiter
+from .infrastructure.retry import is_retryable
+
+if TYPE_CHECKING:
+    from .llm import LLM, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
+MAX_RETRY_BACKOFF_SECONDS = 30.0
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one batch item.
+
+    Attributes:
+        index: Position of the request in the batch
+        request: The request (``ainvoke`` keyword arguments)
+        response: The response, or None if the item failed
+        error: The last error, or None if the item succeeded
+        attempts: Calls made for this item (1 + retries)
+        latency: Seconds from the first attempt to the result
+    """
+
+    index: int
+    request: dict[str, Any] = field(repr=False)
+    response: LLMResponse | None = None
+    error: Exception | None = None
+    attempts: int = 0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    """
+    Aggregate progress of a batch (updated while it runs).
+
+    Attributes:
+        completed: Items finished (succeeded or failed)
+        succeeded: Items with a response
+        failed: Items that failed after all retries
+        retries: Retried calls across all items
+        input_tokens: Input tokens reported by the model
+        output_tokens: Output tokens reported by the model
+        elapsed_seconds: Time since the batch started
+    """
+
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.completed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def tokens_per_minute(self) -> float:
+        tokens = self.input_tokens + self.output_tokens
+        return tokens * 60 / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "requests_per_second": self.requests_per_second,
+            "tokens_per_minute": self.tokens_per_minute,
+        }
+
+
+def estimate_request_tokens(request: dict[str, Any], model_id: str | None = None) -> int:
+    """Estimate the input tokens of an ``ainvoke`` request."""
+    parts = [request.get("system_prompt") or ""]
+    for message in request.get("messages", []):
+        content = message.get("content", "")
+        parts.append(content if isinstance(content, str) else json.dumps(content, default=str))
+    if request.get("tools"):
+        parts.append(json.dumps(request["tools"], default=str))
+    return count_tokens("\n".join(parts), model_id)
+
+
+class BatchRun:
+    """
+    A running (or not yet started) batch; iterate it to get results.
+
+    Results are yielded in completion order.  Iteration starts the batch;
+    leaving the loop early cancels the calls still in flight.  ``stats`` is
+    updated as results complete.
+
+    Args:
+        llm: The LLM making the calls
+        requests: ``ainvoke`` keyword arguments, one dict per item (may be a
+                  lazy iterable)
+        max_concurrency: Calls in flight at the same time
+        tokens_per_minute: Optional token budget to pace calls to
+        max_retries: Retries per item after the first attempt
+        retry_backoff: Initial backoff in seconds (doubles per retry, with jitter)
+    """
+
+    def __init__(
+        self,
+        llm: LLM,
+        requests: Iterable[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: int | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+    ) -> None:
+        self._llm = llm
+        self._requests = requests
+        self._max_concurrency = max(1, max_concurrency)
+        # Private to this batch; calls also pass through the model's shared limiter, if any
+        self._budget = RateLimiter(tokens_per_minute, name="batch") if tokens_per_minute else None
+        self._max_retries = max(0, max_retries)
+        self._retry_backoff = retry_backoff
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._stats = BatchStats()
+
+    @property
+    def stats(self) -> BatchStats:
+        if self._started_at is not None:
+            end = self._finished_at or time.monotonic()
+            self._stats.elapsed_seconds = end - self._started_at
+        return self._stats
+
+    def __aiter__(self) -> AsyncIterator[BatchResult]:
+        return self._run()
+
+    async def collect(self) -> list[BatchResult]:
+        """Run the whole batch and return the results in request order."""
+        results = [result async for result in self]
+        return sorted(results, key=lambda r: r.index)
+
+    async def _run(self) -> AsyncIterator[BatchResult]:
+        if self._started_at is not None:
+            raise RuntimeError("A batch can only be iterated once")
+        self._started_at = time.monotonic()
+
+        # Create the shared model once, before the calls fan out
+        await self._llm.get_model()
+
+        items: Iterator[tuple[int, dict[str, Any]]] = enumerate(self._requests)
+        results: asyncio.Queue[BatchResult | None] = asyncio.Queue()
+
+        async def worker() -> None:
+            try:
+                for index, request in items:
+                    await results.put(await self._call(index, request))
+            finally:
+                await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self._max_concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                self._record(result)
+                yield result
+            # Surface errors raised outside the per-item handling
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._finished_at = time.monotonic()
+
+    async def _call(self, index: int, request: dict[str, Any]) -> BatchResult:
+        result = BatchResult(index=index, request=request)
+        started = time.monotonic()
+        estimate = (
+            estimate_request_tokens(request, self._llm.model_id) if self._budget is not None else 0
+        )
+
+        while True:
+            result.attempts += 1
+            reservation = await self._budget.acquire(estimate) if self._budget else None
+            try:
+                result.response = await self._llm.ainvoke(**request)
+                result.error = None
+            except Exception as e:
+                result.error = e
+
+            if reservation is not None:
+                reservation.settle(_total_tokens(result.response) if result.response else None)
+
+            if result.ok or result.attempts > self._max_retries:
+                break
+            if result.error is not None and not is_retryable(result.error):
+                # Validation, permission or programming errors fail the same way again
+                break
+            self._stats.retries += 1
+            delay = min(MAX_RETRY_BACKOFF_SECONDS, self._retry_backoff * 2 ** (result.attempts - 1))
+            logger.warning(
+                f"LLM batch item {index} failed (attempt {result.attempts}), "
+                f"retrying in {delay:.1f}s: {result.error}"
+            )
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))  # noqa: S311
+
+        result.latency = time.monotonic() - started
+        return result
+
+    def _record(self, result: BatchResult) -> None:
+        stats = self._stats
+        stats.completed += 1
+        if result.ok and result.response is not None:
+            stats.succeeded += 1
+            stats.input_tokens += result.response.usage.get("input_tokens", 0)
+            stats.output_tokens += result.response.usage.get("output_tokens", 0)
+        else:
+            stats.failed += 1
+            logger.error(f"LLM batch item {result.index} failed: {result.error}")
+
+
+def _total_tokens(response: LLMResponse) -> int:
+    usage = response.usage
+    return usage.get("total_tokens") or usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
@@ -0,0 +1,343 @@
+"""Bounded in-memory buffer of job statuses and events for :class:`NatsJobQueue`.
+
+Every event a worker emits is also published to ``DCAF_JOBS_OUT``, so the
+in-memory copy is only a fast read path for the SSE endpoint and does not
+have to keep everything.  :class:`JobBuffer` applies a retention policy:
+
+- a job is dropped ``finished_ttl_seconds`` after its terminal event (or its
+  ``completed`` / ``failed`` status);
+- at most ``max_events_per_job`` events are kept per job.  Older events are
+  *spilled*: the queue re-reads them from JetStream when a reader asks for
+  them;
+- at most ``max_jobs`` jobs and ``max_bytes`` of serialized events are kept.
+  Least recently used finished jobs are dropped.  Unfinished jobs are not
+  dropped for the caps: their events are spilled instead, and their status
+  and sequence counter stay;
+- any job, finished or not, is dropped once it was not updated or read for
+  ``idle_ttl_seconds``.  This covers jobs that never reach a terminal state
+  (crashed or stalled workers, jobs handled by another process).
+
+Not thread-safe: the buffer is used from the event loop of its queue.
+"""
+
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from .models import TERMINAL_EVENT_TYPES, JobEvent, JobStatus
+
+
+@dataclass(frozen=True)
+class BufferLimits:
+    """Retention policy of a :class:`JobBuffer`.
+
+    Args:
+        finished_ttl_seconds: Seconds a job is kept after it finished
+        idle_ttl_seconds: Seconds a job is kept without being updated or read
+        max_jobs: Jobs kept in memory; unfinished jobs beyond it keep no events
+        max_bytes: Serialized size of the events kept in memory, all jobs together
+        max_events_per_job: Newest events kept in memory per job
+    """
+
+    finished_ttl_seconds: float = 3600.0
+    idle_ttl_seconds: float = 24 * 3600.0
+    max_jobs: int = 10_000
+    max_bytes: int = 64 * 1024 * 1024
+    max_events_per_job: int = 1000
+
+    @classmethod
+    def from_env(cls) -> "BufferLimits":
+        """
+        Create limits from environment variables.
+
+        Environment Variables:
+            DCAF_JOBS_BUFFER_TTL_SECONDS: Seconds a finished job is kept (default: 3600)
+            DCAF_JOBS_BUFFER_IDLE_TTL_SECONDS: Seconds an idle job is kept (default: 86400)
+            DCAF_JOBS_BUFFER_MAX_JOBS: Jobs kept in memory (default: 10000)
+            DCAF_JOBS_BUFFER_MAX_BYTES: Event bytes kept in memory (default: 64 MiB)
+            DCAF_JOBS_BUFFER_MAX_EVENTS_PER_JOB: Events kept per job (default: 1000)
+        """
+        ttl = os.getenv("DCAF_JOBS_BUFFER_TTL_SECONDS")
+        idle_ttl = os.getenv("DCAF_JOBS_BUFFER_IDLE_TTL_SECONDS")
+        max_jobs = os.getenv("DCAF_JOBS_BUFFER_MAX_JOBS")
+        max_bytes = os.getenv("DCAF_JOBS_BUFFER_MAX_BYTES")
+        per_job = os.getenv("DCAF_JOBS_BUFFER_MAX_EVENTS_PER_JOB")
+        return cls(
+            finished_ttl_seconds=float(ttl) if ttl else cls.finished_ttl_seconds,
+            idle_ttl_seconds=float(idle_ttl) if idle_ttl else cls.idle_ttl_seconds,
+            max_jobs=int(max_jobs) if max_jobs else cls.max_jobs,
+            max_bytes=int(max_bytes) if max_bytes else cls.max_bytes,
+            max_events_per_job=int(per_job) if per_job else cls.max_events_per_job,
+        )
+
+
+class _Job:
+    """Status and newest events of one job."""
+
+    __slots__ = (
+        "status",
+        "events",
+        "first_seq",
+        "next_seq",
+        "size",
+        "expires_at",
+        "replayed",
+        "touched_at",
+        "terminal_seq",
+    )
+
+    def __init__(self) -> None:
+        self.status: JobStatus | None = None
+        # (event, serialized size) pairs with consecutive seq numbers
+        self.events: deque[tuple[JobEvent, int]] = deque()
+        # seq of events[0]; earlier events were spilled
+        self.first_seq = 0
+        self.next_seq = 0
+        self.size = 0
+        # Set when the job finished
+        self.expires_at: float | None = None
+        self.replayed = False
+        # Last update or read
+        self.touched_at = time.monotonic()
+        # seq of the done/error event, once buffered
+        self.terminal_seq: int | None = None
+
+    def spill(self, keep: int) -> tuple[int, int]:
+        """Drop all but the newest ``keep`` events; return (events, bytes) dropped."""
+        dropped = freed = 0
+        while len(self.events) > keep:
+            _, size = self.events.popleft()
+            self.first_seq += 1
+            dropped += 1
+            freed += size
+        self.size -= freed
+        return dropped, freed
+
+
+class JobBuffer:
+    """Job statuses and events kept in memory under a :class:`BufferLimits` policy.
+
+    Args:
+        limits: Retention policy (default: :meth:`BufferLimits.from_env`)
+    """
+
+    def __init__(self, limits: BufferLimits | None = None) -> None:
+        self.limits = limits or BufferLimits.from_env()
+        self._jobs: OrderedDict[str, _Job] = OrderedDict()
+        # (expires_at, job_id) in expiry order — the TTL is the same for every job
+        self._expiries: deque[tuple[float, str]] = deque()
+        self._bytes = 0
+        self._events = 0
+        self._counts = dict.fromkeys(
+            ("spilled_events", "evicted_jobs", "expired_jobs", "idle_jobs"), 0
+        )
+
+    # ── statuses ────────────────────────────────────────────────────────────
+
+    def get_status(self, job_id: str) -> JobStatus | None:
+        job = self._get(job_id)
+        return job.status if job else None
+
+    def set_status(self, status: JobStatus) -> None:
+        """Record the status of a job; ``completed`` and ``failed`` finish it."""
+        job = self._get(status.job_id, create=True)
+        assert job is not None
+        job.status = status
+        if status.status in ("completed", "failed"):
+            self._finish(status.job_id, job)
+        self._enforce(status.job_id)
+
+    # ── events ──────────────────────────────────────────────────────────────
+
+    def next_seq(self, job_id: str) -> int:
+        """Return the seq of the next event of a job, and count it as used."""
+        job = self._get(job_id, create=True)
+        assert job is not None
+        job.next_seq += 1
+        return job.next_seq - 1
+
+    def append(self, event: JobEvent, size: int) -> None:
+        """Buffer ``event``; a terminal event finishes the job.
+
+        Args:
+            event: Event to buffer, with its seq from :meth:`next_seq`
+            size: Serialized size of the event in bytes
+        """
+        job = self._get(event.job_id, create=True)
+        assert job is not None
+        self._add(job, event, size)
+        if event.event_type in TERMINAL_EVENT_TYPES:
+            job.terminal_seq = event.seq
+            self._finish(event.job_id, job)
+        self._enforce(event.job_id)
+
+    def events(self, job_id: str, after: int = 0) -> list[JobEvent]:
+        """Return the buffered events of a job with seq >= ``after``."""
+        job = self._get(job_id)
+        if job is None:
+            return []
+        start = max(0, after - job.first_seq)
+        return [event for event, _ in islice(job.events, start, None)]
+
+    def terminal_seq(self, job_id: str) -> int | None:
+        """Return the seq of a job's ``done``/``error`` event, or None if not buffered."""
+        job = self._jobs.get(job_id)
+        return job.terminal_seq if job else None
+
+    def spilled_before(self, job_id: str) -> int:
+        """Return the seq of the oldest buffered event; older events were spilled."""
+        job = self._jobs.get(job_id)
+        return job.first_seq if job else 0
+
+    def needs_replay(self, job_id: str) -> bool:
+        """Whether the events of a job should be restored from JetStream.
+
+        True for jobs that are not buffered (never seen by this process, or
+        dropped) and for jobs without events that were not replayed yet.
+        """
+        self._expire()
+        job = self._jobs.get(job_id)
+        return job is None or (job.next_seq == 0 and not job.replayed)
+
+    def restore(self, job_id: str, events: list[tuple[JobEvent, int]]) -> None:
+        """Buffer events read back from JetStream, as ``(event, size)`` pairs.
+
+        Ignored when events were buffered for the job in the meantime.
+        """
+        job = self._jobs.get(job_id)
+        if job is None and not events:
+            return
+        job = self._get(job_id, create=True)
+        assert job is not None
+        job.replayed = True
+        if job.next_seq or not events:
+            return
+        newest = events[-self.limits.max_events_per_job :]
+        job.first_seq = newest[0][0].seq
+        job.next_seq = newest[-1][0].seq + 1
+        for event, size in newest:
+            self._add(job, event, size)
+        if events[-1][0].event_type in TERMINAL_EVENT_TYPES:
+            job.terminal_seq = events[-1][0].seq
+            self._finish(job_id, job)
+        self._enforce(job_id)
+
+    # ── metrics ─────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return buffer gauges and counters.
+
+        ``jobs``, ``finished_jobs``, ``events`` and ``bytes`` describe what is
+        in memory now; ``spilled_events``, ``evicted_jobs`` (dropped for the
+        caps), ``expired_jobs`` (dropped for the finished TTL) and ``idle_jobs``
+        (dropped for the idle TTL) count since start.
+        """
+        self._expire()
+        return {
+            "jobs": len(self._jobs),
+            "finished_jobs": sum(1 for job in self._jobs.values() if job.expires_at is not None),
+            "events": self._events,
+            "bytes": self._bytes,
+            **self._counts,
+        }
+
+    # ── internals ───────────────────────────────────────────────────────────
+
+    def _get(self, job_id: str, create: bool = False) -> _Job | None:
+        self._expire()
+        job = self._jobs.get(job_id)
+        if job is None and create:
+            job = self._jobs[job_id] = _Job()
+        if job is not None:
+            job.touched_at = time.monotonic()
+            self._jobs.move_to_end(job_id)
+        return job
+
+    def _add(self, job: _Job, event: JobEvent, size: int) -> None:
+        job.events.append((event, size))
+        job.size += size
+        self._events += 1
+        self._bytes += size
+        self._spill(job, self.limits.max_events_per_job)
+
+    def _finish(self, job_id: str, job: _Job) -> None:
+        if job.expires_at is None:
+            job.expires_at = time.monotonic() + self.limits.finished_ttl_seconds
+            self._expiries.append((job.expires_at, job_id))
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, job_id = self._expiries.popleft()
+            job = self._jobs.get(job_id)
+            # Skip jobs dropped (and perhaps seen again) since they finished
+            if job is not None and job.expires_at == expires_at:
+                self._drop(job_id)
+                self._counts["expired_jobs"] += 1
+
+        # _jobs is in least recently used order, so idle jobs come first
+        idle_before = now - self.limits.idle_ttl_seconds
+        while self._jobs:
+            job_id, job = next(iter(self._jobs.items()))
+            if job.touched_at > idle_before:
+                break
+            self._drop(job_id)
+            self._counts["idle_jobs"] += 1
+
+    def _enforce(self, current: str) -> None:
+        """Apply the job and byte caps, sparing ``current`` as long as possible."""
+        excess = len(self._jobs) - self.limits.max_jobs
+        while excess > 0 and (victim := self._victim(current)) is not None:
+            self._drop(victim)
+            self._counts["evicted_jobs"] += 1
+            excess -= 1
+        if excess > 0:
+            # Only unfinished jobs left: keep them, without the events of the
+            # least recently used ones
+            for job_id, job in self._jobs.items():
+                if excess <= 0:
+                    break
+                if job_id != current:
+                    self._spill(job, 0)
+                    excess -= 1
+
+        while self._bytes > self.limits.max_bytes:
+            victim = self._victim(current)
+            if victim is not None:
+                self._drop(victim)
+                self._counts["evicted_jobs"] += 1
+                continue
+            # Only unfinished jobs left: spill their events, oldest job first
+            # and the newest event of the current job last
+            for job_id, job in self._jobs.items():
+                if job.events and (job_id != current or len(job.events) > 1):
+                    self._spill(job, 1 if job_id == current else 0)
+                    break
+            else:
+                return
+
+    def _victim(self, current: str) -> str | None:
+        """Return the least recently used finished job other than ``current``."""
+        return next(
+            (
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.expires_at is not None and job_id != current
+            ),
+            None,
+        )
+
+    def _spill(self, job: _Job, keep: int) -> None:
+        dropped, freed = job.spill(keep)
+        self._events -= dropped
+        self._bytes -= freed
+        self._counts["spilled_events"] += dropped
+
+    def _drop(self, job_id: str) -> None:
+        job = self._jobs.pop(job_id)
+        self._events -= len(job.events)
+        self._bytes -= job.size
@@ -32,12 +32,14 @@ import asyncio
 import contextlib
 import json
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Collection
 from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel, Field
 
+from .publisher import EventCoalescer, PipelinedPublisher
+
 logger = logging.getLogger(__name__)
 
 # ─── Stream / subject constants ───────────────────────────────────────────────
@@ -48,6 +50,10 @@ CHANNEL_IN_SUBJECT_PATTERN = "dcaf.channel.in.>"
 CHANNEL_OUT_STREAM = "DCAF_CHANNEL_OUT"
 CHANNEL_OUT_SUBJECT_PATTERN = "dcaf.channel.out.>"
 
+# OUT events after which a run ends or waits for the external system; pending
+# publishes are flushed around them.
+_FLUSH_EVENT_TYPES = frozenset({"complete", "error", "question", "checkpoint"})
+
 
 def channel_in_subject(agent_name: str) -> str:
     """Return the IN subject for *agent_name*.
@@ -149,6 +155,13 @@ class AgentChannel:
         await channel.emit(thread_id, "status", message="Running iac.plan_changes")
         await channel.emit(thread_id, "complete", data={"pr_url": "..."})
 
+    By default ``emit`` waits for the JetStream acknowledgement of each
+    event.  Pass ``async_publish=True`` to publish without waiting (at most
+    *max_pending_publishes* unacknowledged; flushed around ``complete``,
+    ``error``, ``question`` and ``checkpoint`` events and on ``close()``),
+    and ``coalesce_event_types`` to merge consecutive message-only events of
+    those types per thread, held for at most *coalesce_window* seconds.
+
     Publishing tasks (external system → IN)
     ----------------------------------------
     ::
@@ -156,7 +169,15 @@ class AgentChannel:
         await channel.publish({"type": "task", "thread_id": "t-1", "messages": [...]})
     """
 
-    def __init__(self, agent_name: str, nats_url: str | None = None) -> None:
+    def __init__(
+        self,
+        agent_name: str,
+        nats_url: str | None = None,
+        async_publish: bool = False,
+        max_pending_publishes: int = 256,
+        coalesce_event_types: Collection[str] = (),
+        coalesce_window: float = 0.05,
+    ) -> None:
         import os
 
         # nats_url is optional: callers (HelpDesk, simulator) should not need
@@ -168,6 +189,17 @@ class AgentChannel:
         self._js = None
         # per-thread sequence counter for OUT events
         self._seqs: dict[str, int] = {}
+        self._publisher = PipelinedPublisher(
+            lambda subject, payload: self._js.publish(subject, payload),  # type: ignore[attr-defined]
+            pipelined=async_publish,
+            max_pending=max_pending_publishes,
+            name="AgentChannel.emit",
+        )
+        self._coalescer = (
+            EventCoalescer(self._emit, coalesce_event_types, coalesce_window)
+            if coalesce_event_types
+            else None
+        )
 
     # ── lifecycle ─────────────────────────────────────────────────────────────
 
@@ -182,6 +214,9 @@ class AgentChannel:
         logger.info("AgentChannel connected to %s (agent=%s)", self._url, self._agent_name)
 
     async def close(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+        await self._publisher.flush()
         if self._nc:
             with contextlib.suppress(Exception):
                 await self._nc.drain()
@@ -317,21 +352,34 @@ class AgentChannel:
         gaps.  Non-fatal: a publish failure is logged as a warning and never
         propagated to the caller.
         """
-        seq = self._seqs.get(thread_id, 0)
-        self._seqs[thread_id] = seq + 1
-
         evt = AgentEvent(
             thread_id=thread_id,
             event_type=event_type,
             message=message,
             data=data,
-            seq=seq,
         )
-        subject = channel_out_subject(self._agent_name, thread_id)
-        try:
-            await self._js.publish(subject, evt.model_dump_json().encode())  # type: ignore[attr-defined]
-        except Exception:
-            logger.warning("AgentChannel.emit: NATS OUT publish failed for thread_id=%s", thread_id)
+        if self._coalescer is not None:
+            await self._coalescer.add(thread_id, evt)
+        else:
+            await self._emit(evt)
+
+    def publish_stats(self) -> dict[str, Any]:
+        """Return publish metrics of emitted events (see :class:`PipelinedPublisher`)."""
+        stats = self._publisher.stats()
+        stats["coalesced"] = self._coalescer.coalesced if self._coalescer else 0
+        return stats
+
+    async def _emit(self, evt: AgentEvent) -> None:
+        evt.seq = self._seqs.get(evt.thread_id, 0)
+        self._seqs[evt.thread_id] = evt.seq + 1
+
+        subject = channel_out_subject(self._agent_name, evt.thread_id)
+        flush = evt.event_type in _FLUSH_EVENT_TYPES
+        if flush:
+            await self._publisher.flush()
+        await self._publisher.submit(subject, evt.model_dump_json().encode())
+        if flush:
+            await self._publisher.flush()
 
     # ── external system: publish task/answer/checkpoint to IN ────────────────
 
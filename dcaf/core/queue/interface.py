@@ -2,12 +2,15 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from pydantic import BaseModel
 
-from .models import JobEvent, JobRequest, JobStatus
+from .models import TERMINAL_EVENT_TYPES, JobEvent, JobRequest, JobStatus
+
+# Polling interval of the default watch_events() implementation
+_WATCH_POLL_INTERVAL = 0.5
 
 
 class JobMessageHandle(ABC):
@@ -40,8 +43,8 @@ class JobQueue(ABC):
 
     Server side
     -----------
-    Call :meth:`enqueue` to publish a job, then poll :meth:`get_status`
-    and :meth:`get_events` to track progress.
+    Call :meth:`enqueue` to publish a job, then use :meth:`get_status`
+    and :meth:`watch_events` (or :meth:`get_events`) to track progress.
 
     Worker side
     -----------
@@ -70,9 +73,45 @@ class JobQueue(ABC):
 
     @abstractmethod
     async def get_events(self, job_id: str, after: int = 0) -> list[JobEvent]:
-        """Return all events for a job with seq > after."""
+        """Return all events for a job with seq >= after."""
         ...
 
+    async def watch_events(
+        self,
+        job_id: str,
+        after: int = 0,
+        keepalive: float | None = None,
+    ) -> AsyncIterator[list[JobEvent]]:
+        """Yield batches of a job's events (seq >= after) as they are emitted.
+
+        The iterator ends after a terminal event (``done`` or ``error``), and
+        right away when the job already finished before *after* (a client
+        resuming after it received the terminal event).
+        If *keepalive* is set, an empty batch is yielded whenever that many
+        seconds pass without events, so callers can keep connections alive.
+
+        This default implementation polls :meth:`get_events`; queues that can
+        notify watchers when :meth:`emit_event` runs override it.
+        """
+        loop = asyncio.get_running_loop()
+        cursor = after
+        last_yield = loop.time()
+        while True:
+            events = await self.get_events(job_id, cursor)
+            if events:
+                batch = self._until_terminal(events)
+                yield batch
+                if batch[-1].event_type in TERMINAL_EVENT_TYPES:
+                    return
+                cursor = batch[-1].seq + 1
+                last_yield = loop.time()
+            elif cursor == after and await self._finished_before(job_id, cursor):
+                return
+            elif keepalive is not None and loop.time() - last_yield >= keepalive:
+                yield []
+                last_yield = loop.time()
+            await asyncio.sleep(_WATCH_POLL_INTERVAL)
+
     @abstractmethod
     async def subscribe_jobs(
         self,
@@ -123,3 +162,29 @@ class JobQueue(ABC):
         Handler receives ``(parsed_message, JobMessageHandle)`` and must ack/nak.
         """
         ...
+
+    async def _terminal_seq(self, job_id: str) -> int | None:
+        """Return the seq of a job's terminal event, or None while it has none.
+
+        This default implementation reads all events of the job; queues that
+        track finished jobs override it.
+        """
+        for event in await self.get_events(job_id):
+            if event.event_type in TERMINAL_EVENT_TYPES:
+                return event.seq
+        return None
+
+    async def _finished_before(self, job_id: str, cursor: int) -> bool:
+        """Whether the job's terminal event comes before *cursor*."""
+        if cursor == 0:
+            return False
+        terminal_seq = await self._terminal_seq(job_id)
+        return terminal_seq is not None and terminal_seq < cursor
+
+    @staticmethod
+    def _until_terminal(events: list[JobEvent]) -> list[JobEvent]:
+        """Return *events* up to and including the first terminal event."""
+        for index, event in enumerate(events):
+            if event.event_type in TERMINAL_EVENT_TYPES:
+                return events[: index + 1]
+        return events
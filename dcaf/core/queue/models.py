@@ -6,6 +6,9 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+#: Event types after which a job emits nothing more.
+TERMINAL_EVENT_TYPES = frozenset({"done", "error"})
+
 
 def _now() -> datetime:
     return datetime.now(UTC)
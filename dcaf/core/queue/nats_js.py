@@ -3,16 +3,31 @@
 import asyncio
 import contextlib
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection
 from typing import Any
 
 from pydantic import BaseModel
 
+from ..infrastructure.single_flight import SingleFlight
+from .buffer import BufferLimits, JobBuffer
 from .interface import JobMessageHandle, JobQueue, JobRequestHandler
-from .models import JobEvent, JobRequest, JobStatus
+from .models import TERMINAL_EVENT_TYPES, JobEvent, JobRequest, JobStatus
+from .publisher import EventCoalescer, PipelinedPublisher
 
 logger = logging.getLogger(__name__)
 
+#: Jobs a subscriber runs at the same time (matches AgentWorker's default).
+DEFAULT_MAX_IN_FLIGHT = 3
+
+#: Seconds between ``in_progress()`` signals for a running job.
+HEARTBEAT_INTERVAL = 30.0
+
+#: Seconds a stopping subscriber waits for running jobs before cancelling them.
+SHUTDOWN_TIMEOUT = 300.0
+
+# Seconds without a message after which a replay is abandoned
+_REPLAY_STALL_TIMEOUT = 10.0
+
 # ─── NATS stream / subject constants ────────────────────────────────────────
 
 #: Jobs-in stream — published by dcaf server, consumed by agent workers.
@@ -68,6 +83,17 @@ class NatsJobMessageHandle(JobMessageHandle):
         await self._msg.in_progress()  # type: ignore[attr-defined]
 
 
+async def _heartbeat(handle: JobMessageHandle, interval: float) -> None:
+    """Send ``in_progress()`` every *interval* seconds to prevent redelivery."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await handle.in_progress()
+        except Exception:
+            logger.warning("heartbeat in_progress() failed — job may be redelivered")
+            return
+
+
 # ─── NatsJobQueue ─────────────────────────────────────────────────────────────
 
 
@@ -90,7 +116,7 @@ class NatsJobQueue(JobQueue):
 
     Co-location requirement
     -----------------------
-    The in-memory event buffer (``self._events``, ``self._status``) is
+    The in-memory buffer of statuses and events (``self._buffer``) is
     the read path for the SSE endpoint.  This works **only** when the
     worker and the HTTP server share the **same** ``NatsJobQueue`` instance
     — i.e. the worker runs as a background ``asyncio`` task inside the
@@ -104,22 +130,81 @@ class NatsJobQueue(JobQueue):
         asyncio.create_task(queue.subscribe_jobs(my_handler))
 
     If a worker runs out-of-process, ``emit_event`` updates that process's
-    dict, not the server's, and the SSE endpoint will return stale data.
+    buffer, not the server's, and the SSE endpoint will return stale data.
+
+    Retention
+    ---------
+    The buffer (:class:`~dcaf.core.queue.buffer.JobBuffer`) is bounded by
+    *buffer_limits*: finished jobs are dropped after a TTL, the least
+    recently used jobs beyond the job and byte caps are dropped, and only
+    the newest events of each job stay in memory.  Events that are no
+    longer in memory are re-read from ``DCAF_JOBS_OUT`` by
+    :meth:`get_events`; :meth:`buffer_stats` reports the buffer size.
+
+    Concurrency
+    -----------
+    :meth:`subscribe` runs up to *max_in_flight* handlers at the same time
+    and only fetches as many messages as there are free slots, so
+    undelivered jobs stay available to other workers.  While a handler
+    runs, ``in_progress()`` is sent every *heartbeat_interval* seconds
+    (``None`` disables it) so long jobs are not redelivered.  When
+    *stop_event* is set, running handlers get *shutdown_timeout* seconds to
+    finish before they are cancelled (and nak-ed).
+
+    Publishing
+    ----------
+    By default :meth:`emit_event` waits for the JetStream acknowledgement of
+    each event.  With *async_publish* events are published without waiting
+    (at most *max_pending_publishes* unacknowledged), and all of them are
+    acknowledged before a terminal event is published and before
+    :meth:`emit_event` returns for it.  Consecutive events of a job whose
+    type is in *coalesce_event_types* and that carry only a ``message`` are
+    merged into one event, held for at most *coalesce_window* seconds.
+    :meth:`publish_stats` reports published, failed and pending messages.
 
     Notes
     -----
-    The in-memory event buffer is lost on process restart.  For production
-    deployments consider replacing ``self._events`` and ``self._status``
-    with a persistent backend (e.g. NATS KV / Redis).
+    The in-memory buffer is lost on process restart; events are restored
+    from ``DCAF_JOBS_OUT`` when read, job statuses are not.
     """
 
-    def __init__(self, nats_url: str, agent_name: str) -> None:
+    def __init__(
+        self,
+        nats_url: str,
+        agent_name: str,
+        buffer_limits: BufferLimits | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        heartbeat_interval: float | None = HEARTBEAT_INTERVAL,
+        shutdown_timeout: float = SHUTDOWN_TIMEOUT,
+        async_publish: bool = False,
+        max_pending_publishes: int = 256,
+        coalesce_event_types: Collection[str] = (),
+        coalesce_window: float = 0.05,
+    ) -> None:
         self._url = nats_url
         self._agent_name = agent_name
+        self._max_in_flight = max(1, max_in_flight)
+        self._heartbeat_interval = heartbeat_interval
+        self._shutdown_timeout = shutdown_timeout
         self._nc = None
         self._js = None
-        self._status: dict[str, JobStatus] = {}
-        self._events: dict[str, list[JobEvent]] = {}
+        self._buffer = JobBuffer(buffer_limits)
+        self._replays: SingleFlight[list[tuple[JobEvent, int]]] = SingleFlight(name="job-replay")
+        self._publisher = PipelinedPublisher(
+            lambda subject, payload: self._js.publish(subject, payload),  # type: ignore[attr-defined]
+            pipelined=async_publish,
+            max_pending=max_pending_publishes,
+            name="emit_event",
+        )
+        self._coalescer = (
+            EventCoalescer(self._emit, coalesce_event_types, coalesce_window)
+            if coalesce_event_types
+            else None
+        )
+        # Set (and dropped) by emit_event to wake the watchers of a job, and
+        # how many watchers are waiting per job
+        self._new_events: dict[str, asyncio.Event] = {}
+        self._waiting: dict[str, int] = {}
 
     # ── lifecycle ────────────────────────────────────────────────────────────
 
@@ -134,6 +219,9 @@ class NatsJobQueue(JobQueue):
         logger.info("NatsJobQueue connected to %s", self._url)
 
     async def close(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+        await self._publisher.flush()
         if self._nc:
             await self._nc.close()
         logger.info("NatsJobQueue closed")
@@ -216,11 +304,13 @@ class NatsJobQueue(JobQueue):
         subject = jobs_in_subject(request.agent_name)
         payload = request.model_dump_json().encode()
         await self._js.publish(subject, payload)  # type: ignore[attr-defined]
-        self._status[request.job_id] = JobStatus(
-            job_id=request.job_id,
-            status="queued",
-            agent_name=request.agent_name,
-            created_at=request.created_at,
+        self._buffer.set_status(
+            JobStatus(
+                job_id=request.job_id,
+                status="queued",
+                agent_name=request.agent_name,
+                created_at=request.created_at,
+            )
         )
         logger.info("Enqueued job %s → %s", request.job_id, subject)
         return request.job_id
@@ -228,70 +318,141 @@ class NatsJobQueue(JobQueue):
     # ── read ──────────────────────────────────────────────────────────────────
 
     async def get_status(self, job_id: str) -> JobStatus | None:
-        return self._status.get(job_id)
+        return self._buffer.get_status(job_id)
 
     async def get_events(self, job_id: str, after: int = 0) -> list[JobEvent]:
-        # Cold-start: buffer empty — try to restore from JetStream once.
-        if job_id not in self._events and after == 0:
+        # Cold start or dropped from the buffer: restore from JetStream.
+        if self._buffer.needs_replay(job_id):
             await self._replay_from_jetstream(job_id)
-        return self._events.get(job_id, [])[after:]
+        events = self._buffer.events(job_id, after)
+        spilled_before = self._buffer.spilled_before(job_id)
+        if after < spilled_before:
+            # Older events were spilled from memory: re-read them
+            older = [
+                event
+                for event, _ in await self._read_from_jetstream(job_id)
+                if after <= event.seq < spilled_before
+            ]
+            events = older + events
+        return events
+
+    def buffer_stats(self) -> dict[str, Any]:
+        """Return the gauges and counters of the in-memory buffer.
+
+        See :meth:`~dcaf.core.queue.buffer.JobBuffer.stats`.
+        """
+        return self._buffer.stats()
+
+    async def watch_events(
+        self,
+        job_id: str,
+        after: int = 0,
+        keepalive: float | None = None,
+    ) -> AsyncIterator[list[JobEvent]]:
+        """Yield batches of a job's events as :meth:`emit_event` buffers them.
+
+        Watchers wait on a per-job :class:`asyncio.Event` that
+        :meth:`emit_event` sets, so events are delivered as soon as they are
+        emitted and idle watchers cost nothing.  Ends right away when the
+        job already finished before *after*.  Must run on the event loop
+        that calls :meth:`emit_event`.
+        """
+        cursor = after
+        while True:
+            events = await self.get_events(job_id, cursor)
+            if events:
+                batch = self._until_terminal(events)
+                yield batch
+                if batch[-1].event_type in TERMINAL_EVENT_TYPES:
+                    return
+                cursor = batch[-1].seq + 1
+                continue
+            terminal_seq = self._buffer.terminal_seq(job_id)
+            if terminal_seq is not None and terminal_seq < cursor:
+                # Resumed after the terminal event: nothing more will come
+                return
+
+            # No await between the read above and registering here, so no
+            # event can be emitted unseen in between.
+            new_events = self._new_events.setdefault(job_id, asyncio.Event())
+            self._waiting[job_id] = self._waiting.get(job_id, 0) + 1
+            try:
+                woken: bool = await asyncio.wait_for(new_events.wait(), keepalive)
+            except TimeoutError:
+                woken = False
+            finally:
+                self._stop_waiting(job_id, new_events)
+            if not woken:
+                yield []
+
+    def _stop_waiting(self, job_id: str, new_events: asyncio.Event) -> None:
+        """Forget the wake-up event of a job once its last watcher stops waiting."""
+        self._waiting[job_id] -= 1
+        if not self._waiting[job_id]:
+            del self._waiting[job_id]
+            if self._new_events.get(job_id) is new_events:
+                del self._new_events[job_id]
 
     async def _replay_from_jetstream(self, job_id: str) -> None:
         """Restore job events from DCAF_JOBS_OUT into the in-memory buffer."""
-        import uuid
+        events = await self._read_from_jetstream(job_id)
+        # Not applied if a live worker buffered events in the meantime
+        self._buffer.restore(job_id, events)
+        if events:
+            logger.info(
+                "_replay_from_jetstream: restored %d events for job %s", len(events), job_id
+            )
 
+    async def _read_from_jetstream(self, job_id: str) -> list[tuple[JobEvent, int]]:
+        """Read all events of a job from DCAF_JOBS_OUT as (event, size) pairs.
+
+        Concurrent reads of the same job (e.g. SSE clients reconnecting
+        after a deploy) share one read.
+        """
+        return await self._replays.run(job_id, lambda: self._read_subject(job_id))
+
+    async def _read_subject(self, job_id: str) -> list[tuple[JobEvent, int]]:
+        """Read the OUT subject of a job up to its current last message.
+
+        The last stream sequence of the subject is looked up first; the
+        messages are then delivered by an ordered ephemeral consumer (no
+        acks, removed by the server once unsubscribed) until that sequence
+        arrives, so the end is known without waiting for a fetch timeout.
+        """
         import nats.js.errors
-        from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
 
         subject = jobs_out_subject(self._agent_name, job_id)
-        durable = f"replay-{uuid.uuid4().hex[:12]}"
-
-        cfg = ConsumerConfig(
-            durable_name=durable,
-            filter_subject=subject,
-            deliver_policy=DeliverPolicy.ALL,
-            ack_policy=AckPolicy.EXPLICIT,
-            ack_wait=30,
-            max_deliver=1,
-        )
+        try:
+            last = await self._js.get_last_msg(JOBS_OUT_STREAM, subject)  # type: ignore[attr-defined]
+        except nats.js.errors.NotFoundError:
+            return []  # no events on the subject yet — normal for new jobs
+        except Exception:
+            logger.exception("_read_from_jetstream failed for job %s", job_id)
+            return []
 
-        events: list[JobEvent] = []
+        events: list[tuple[JobEvent, int]] = []
+        sub = None
         try:
-            await self._js.add_consumer(JOBS_OUT_STREAM, cfg)  # type: ignore[attr-defined]
-            sub = await self._js.pull_subscribe(  # type: ignore[attr-defined]
-                subject, durable=durable, stream=JOBS_OUT_STREAM
+            sub = await self._js.subscribe(  # type: ignore[attr-defined]
+                subject, stream=JOBS_OUT_STREAM, ordered_consumer=True
             )
             while True:
+                # The timeout only guards against a stalled server
+                msg = await sub.next_msg(timeout=_REPLAY_STALL_TIMEOUT)
                 try:
-                    msgs = await sub.fetch(100, timeout=1.0)
-                    for msg in msgs:
-                        try:
-                            e = JobEvent.model_validate_json(msg.data.decode("utf-8"))
-                            events.append(e)
-                            await msg.ack()
-                        except Exception:
-                            logger.exception("replay: bad event payload for job %s", job_id)
-                            with contextlib.suppress(Exception):
-                                await msg.nak()
-                except TimeoutError:
-                    break  # no more messages
-        except nats.js.errors.NotFoundError:
-            pass  # stream or subject doesn't exist yet — normal for new jobs
+                    e = JobEvent.model_validate_json(msg.data.decode("utf-8"))
+                    events.append((e, len(msg.data)))
+                except Exception:
+                    logger.exception("replay: bad event payload for job %s", job_id)
+                if msg.metadata.sequence.stream >= last.seq:
+                    return events
         except Exception:
-            logger.exception("_replay_from_jetstream failed for job %s", job_id)
-            return
+            logger.exception("_read_from_jetstream failed for job %s", job_id)
+            return []
         finally:
-            with contextlib.suppress(Exception):
-                await self._js.delete_consumer(JOBS_OUT_STREAM, durable)  # type: ignore[attr-defined]
-
-        if events:
-            self._events.setdefault(job_id, [])
-            # Only populate if still empty (avoid overwriting events from a live worker).
-            if not self._events[job_id]:
-                self._events[job_id] = events
-            logger.info(
-                "_replay_from_jetstream: restored %d events for job %s", len(events), job_id
-            )
+            if sub is not None:
+                with contextlib.suppress(Exception):
+                    await sub.unsubscribe()
 
     # ── generic publish / subscribe ───────────────────────────────────────────
 
@@ -311,36 +472,105 @@ class NatsJobQueue(JobQueue):
 
         Parses bytes with ``model_class.model_validate_json``.
         Handler receives ``(parsed_message, JobMessageHandle)`` and must ack/nak.
+        Up to ``max_in_flight`` handlers run concurrently; a handler that
+        raises or is cancelled has its message nak-ed.
         """
         await self._ensure_consumer(durable=durable, filter_subject=subject)
         sub = await self._js.pull_subscribe(subject, durable=durable, stream=JOBS_IN_STREAM)  # type: ignore[attr-defined]
-        logger.info("subscribe listening on %s (durable=%s)", subject, durable)
-
-        while not (stop_event and stop_event.is_set()):
-            try:
-                msgs = await sub.fetch(10, timeout=1.0)
-            except TimeoutError:
-                continue
-            except Exception:
-                logger.exception("subscribe fetch failed durable=%s", durable)
-                await asyncio.sleep(0.5)
-                continue
+        logger.info(
+            "subscribe listening on %s (durable=%s, max_in_flight=%d)",
+            subject,
+            durable,
+            self._max_in_flight,
+        )
 
-            for msg in msgs:
-                if stop_event and stop_event.is_set():
-                    with contextlib.suppress(Exception):
-                        await msg.nak()
-                    continue
-                try:
-                    obj = model_class.model_validate_json(msg.data.decode("utf-8"))
-                    await handler(obj, NatsJobMessageHandle(msg))
-                except Exception:
-                    logger.exception("subscribe handler failed durable=%s", durable)
-                    with contextlib.suppress(Exception):
-                        await msg.nak()
+        slots = asyncio.Semaphore(self._max_in_flight)
+        running: set[asyncio.Task[None]] = set()
+        try:
+            while not (stop_event and stop_event.is_set()):
+                msgs = await self._fetch(sub, slots, durable)
+                for msg in msgs:
+                    if stop_event and stop_event.is_set():
+                        slots.release()
+                        with contextlib.suppress(Exception):
+                            await msg.nak()
+                        continue
+                    task = asyncio.create_task(
+                        self._run_handler(msg, model_class, handler, slots, durable)
+                    )
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+
+            if running:
+                logger.info(
+                    "subscribe waiting for %d running handler(s) durable=%s", len(running), durable
+                )
+                await asyncio.wait(set(running), timeout=self._shutdown_timeout)
+        finally:
+            # Cancelled, or handlers still running after the shutdown timeout
+            for task in list(running):
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
         logger.info("subscribe exiting (stop_event set) durable=%s", durable)
 
+    async def _fetch(self, sub: Any, slots: asyncio.Semaphore, durable: str) -> list[Any]:
+        """Fetch one message per free slot, waiting up to a second for a free slot.
+
+        Returns the messages with one slot acquired for each.
+        """
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=1.0)
+        except TimeoutError:
+            return []  # all slots busy: let the caller check stop_event
+        free = 1
+        while free < self._max_in_flight and not slots.locked():
+            await slots.acquire()
+            free += 1
+
+        msgs: list[Any] = []
+        try:
+            msgs = await sub.fetch(free, timeout=1.0)
+        except TimeoutError:
+            pass
+        except Exception:
+            logger.exception("subscribe fetch failed durable=%s", durable)
+            await asyncio.sleep(0.5)
+        finally:
+            for _ in range(free - len(msgs)):
+                slots.release()
+        return msgs
+
+    async def _run_handler(
+        self,
+        msg: Any,
+        model_class: type[BaseModel],
+        handler: Callable[[Any, JobMessageHandle], Awaitable[None]],
+        slots: asyncio.Semaphore,
+        durable: str,
+    ) -> None:
+        """Run *handler* for one message: heartbeat while it runs, nak on failure."""
+        handle = NatsJobMessageHandle(msg)
+        heartbeat = None
+        if self._heartbeat_interval:
+            heartbeat = asyncio.create_task(_heartbeat(handle, self._heartbeat_interval))
+        try:
+            obj = model_class.model_validate_json(msg.data.decode("utf-8"))
+            await handler(obj, handle)
+        except asyncio.CancelledError:
+            with contextlib.suppress(Exception):
+                await msg.nak()
+            raise
+        except Exception:
+            logger.exception("subscribe handler failed durable=%s", durable)
+            with contextlib.suppress(Exception):
+                await msg.nak()
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            slots.release()
+
     # ── worker: subscribe_jobs ────────────────────────────────────────────────
 
     async def subscribe_jobs(
@@ -368,26 +598,43 @@ class NatsJobQueue(JobQueue):
         Called by workers (co-located in the same process) to store progress
         events.  :meth:`get_events` and the SSE endpoint read from this buffer.
 
-        Also mirrors ``status`` event transitions into :attr:`_status`.
+        Also mirrors ``status`` event transitions into the job's status.
         """
-        bucket = self._events.setdefault(event.job_id, [])
-        event.seq = len(bucket)
-        bucket.append(event)
-
-        # Publish to NATS OUT — non-fatal: log warning but never break the worker.
-        try:
-            subject = jobs_out_subject(self._agent_name, event.job_id)
-            await self._js.publish(subject, event.model_dump_json().encode())  # type: ignore[attr-defined]
-        except Exception:
-            logger.warning(
-                "emit_event: NATS OUT publish failed for job %s (buffered in memory only)",
-                event.job_id,
-            )
-
-        if event.event_type == "status" and event.data and event.job_id in self._status:
+        if self._coalescer is not None:
+            await self._coalescer.add(event.job_id, event)
+        else:
+            await self._emit(event)
+
+    def publish_stats(self) -> dict[str, Any]:
+        """Return publish metrics of emitted events (see :class:`PipelinedPublisher`)."""
+        stats = self._publisher.stats()
+        stats["coalesced"] = self._coalescer.coalesced if self._coalescer else 0
+        return stats
+
+    async def _emit(self, event: JobEvent) -> None:
+        event.seq = self._buffer.next_seq(event.job_id)
+        payload = event.model_dump_json().encode()
+        self._buffer.append(event, len(payload))
+        new_events = self._new_events.pop(event.job_id, None)
+        if new_events is not None:
+            new_events.set()
+
+        # Publish to NATS OUT — non-fatal: failures are logged, never raised.
+        subject = jobs_out_subject(self._agent_name, event.job_id)
+        terminal = event.event_type in TERMINAL_EVENT_TYPES
+        if terminal:
+            # Store every earlier event before the terminal one
+            await self._publisher.flush()
+        await self._publisher.submit(subject, payload)
+        if terminal:
+            await self._publisher.flush()
+
+        if event.event_type == "status" and event.data:
             new_status = event.data.get("status")
-            if new_status:
-                self._status[event.job_id].status = new_status
-                self._status[event.job_id].updated_at = event.timestamp
+            status = self._buffer.get_status(event.job_id)
+            if new_status and status is not None:
+                status.status = new_status
+                status.updated_at = event.timestamp
                 if new_status == "failed":
-                    self._status[event.job_id].error = event.data.get("error")
+                    status.error = event.data.get("error")
+                self._buffer.set_status(status)
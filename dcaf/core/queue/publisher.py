@@ -0,0 +1,197 @@
+"""Pipelined publishing and text-event coalescing for queue events.
+
+``js.publish`` waits for the JetStream PubAck of every message, so a worker
+forwarding token-level progress runs at one event per NATS round trip.
+:class:`PipelinedPublisher` can instead send each message without waiting
+for the previous acknowledgement, keeping at most ``max_pending``
+unacknowledged messages (the outbound buffer) and waiting only when it is
+full or on :meth:`~PipelinedPublisher.flush`.  Callers flush before and
+after terminal events, so everything a client sees before "done" is stored.
+
+:class:`EventCoalescer` goes further for chatty streams: consecutive text
+events of a job or thread are merged into one event before they get a
+sequence number.
+
+Both are used by :class:`~dcaf.core.queue.nats_js.NatsJobQueue` and
+:class:`~dcaf.core.queue.channel.AgentChannel`; bind them to one event loop.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PipelinedPublisher:
+    """Publishes messages, optionally without waiting for each acknowledgement.
+
+    Messages are handed to the connection in submission order.  A failed publish is logged as a
+    warning and counted in :meth:`stats`; it is never raised to the caller.
+
+    Args:
+        publish: Coroutine function sending one message and returning once it
+                 is acknowledged (``js.publish``)
+        pipelined: Do not wait for each acknowledgement (default: wait)
+        max_pending: Unacknowledged messages after which :meth:`submit` waits
+        name: Name used in logs
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str, bytes], Awaitable[Any]],
+        pipelined: bool = False,
+        max_pending: int = 256,
+        name: str = "publish",
+    ) -> None:
+        self.pipelined = pipelined
+        self.max_pending = max(1, max_pending)
+        self.name = name
+        self._publish = publish
+        self._slots: asyncio.Semaphore | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+        self._counts = dict.fromkeys(("published", "failed", "peak_pending"), 0)
+
+    async def submit(self, subject: str, payload: bytes) -> None:
+        """Send a message; when pipelined, wait only while the buffer is full."""
+        if not self.pipelined:
+            await self._send(subject, payload)
+            return
+
+        if self._slots is None:
+            # Created here so that it binds to the running loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+        await self._slots.acquire()
+        task = asyncio.create_task(self._send(subject, payload))
+        self._pending.add(task)
+        task.add_done_callback(self._done)
+        self._counts["peak_pending"] = max(self._counts["peak_pending"], len(self._pending))
+
+    async def flush(self) -> None:
+        """Wait until every submitted message is acknowledged (or has failed)."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return publish metrics.
+
+        ``pending`` is the number of messages sent but not acknowledged yet;
+        ``peak_pending`` its highest value.
+        """
+        return {**self._counts, "pending": len(self._pending)}
+
+    async def _send(self, subject: str, payload: bytes) -> None:
+        try:
+            await self._publish(subject, payload)
+        except Exception as e:
+            self._counts["failed"] += 1
+            logger.warning("%s: NATS publish to %s failed (%s)", self.name, subject, e)
+        else:
+            self._counts["published"] += 1
+
+    def _done(self, task: asyncio.Task[None]) -> None:
+        self._pending.discard(task)
+        if self._slots is not None:
+            self._slots.release()
+
+
+class EventCoalescer:
+    """Merges consecutive text events of a stream into one.
+
+    Events whose ``event_type`` is in *event_types* and that carry only a
+    ``message`` (no ``data``) are held per key (job or thread); the next
+    such event of the same type and key is appended to the held one.  The
+    held event is passed to *release* when any other event of the key
+    arrives (before it), *window* seconds after it was first held, when its
+    message reaches *max_chars*, or on :meth:`flush`.  Events of one key are
+    released in order; keys do not wait for each other.
+
+    Args:
+        release: Coroutine function emitting one event
+        event_types: Event types that may be merged
+        window: Seconds an event is held at most
+        max_chars: Message length at which a held event is released
+    """
+
+    def __init__(
+        self,
+        release: Callable[[Any], Awaitable[None]],
+        event_types: Collection[str],
+        window: float = 0.05,
+        max_chars: int = 4096,
+    ) -> None:
+        self.event_types = frozenset(event_types)
+        self.window = window
+        self.max_chars = max_chars
+        self._release = release
+        self._held: dict[str, tuple[Any, asyncio.TimerHandle]] = {}
+        # Per-key locks and how many callers use each, so that idle keys are forgotten
+        self._locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._timers: set[asyncio.Task[None]] = set()
+        self.coalesced = 0
+
+    async def add(self, key: str, event: Any) -> None:
+        """Emit *event*, or hold it to merge it with the following events of *key*."""
+        async with self._locked(key):
+            held = self._held.get(key)
+            if held is not None and self._mergeable(event, held[0].event_type):
+                held[0].message = (held[0].message or "") + (event.message or "")
+                self.coalesced += 1
+                if len(held[0].message) >= self.max_chars:
+                    await self._release_held(key)
+                return
+
+            await self._release_held(key)
+            if self._mergeable(event, event.event_type):
+                timer = asyncio.get_running_loop().call_later(self.window, self._expire, key, event)
+                self._held[key] = (event, timer)
+            else:
+                await self._release(event)
+
+    async def flush(self, key: str | None = None) -> None:
+        """Release the held event of *key*, or of every key."""
+        for held_key in [key] if key is not None else list(self._held):
+            async with self._locked(held_key):
+                await self._release_held(held_key)
+
+    def _mergeable(self, event: Any, event_type: str) -> bool:
+        return event.event_type == event_type and event_type in self.event_types and not event.data
+
+    async def _release_held(self, key: str) -> None:
+        """Release the held event of *key* (lock of *key* held)."""
+        held = self._held.pop(key, None)
+        if held is not None:
+            held[1].cancel()
+            await self._release(held[0])
+
+    def _expire(self, key: str, event: Any) -> None:
+        task = asyncio.create_task(self._release_expired(key, event))
+        self._timers.add(task)
+        task.add_done_callback(self._timers.discard)
+
+    async def _release_expired(self, key: str, event: Any) -> None:
+        async with self._locked(key):
+            held = self._held.get(key)
+            # Skip events released since the timer fired
+            if held is not None and held[0] is event:
+                try:
+                    await self._release_held(key)
+                except Exception:
+                    logger.exception("Coalesced event release failed for %s", key)
+
+    @asynccontextmanager
+    async def _locked(self, key: str) -> AsyncIterator[None]:
+        lock, users = self._locks.get(key) or (asyncio.Lock(), 0)
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
@@ -1,7 +1,5 @@
 """FastAPI router for DCAF job queue endpoints."""
 
-from __future__ import annotations
-
 import logging
 from typing import Any
 
@@ -25,7 +23,6 @@ def create_queue_router(queue: JobQueue) -> Any:
                instance.  Typically a
                :class:`~dcaf.core.queue.nats_js.NatsJobQueue`.
     """
-    import asyncio
     import json
 
     from fastapi import APIRouter, HTTPException, Query, Request
@@ -33,7 +30,8 @@ def create_queue_router(queue: JobQueue) -> Any:
 
     router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
-    _TERMINAL_EVENTS = frozenset({"done", "error"})
+    # Seconds without events after which an SSE comment is sent
+    _KEEPALIVE_SECONDS = 15.0
 
     @router.get("/{job_id}/events/stream")
     async def stream_job_events(
@@ -48,36 +46,36 @@ def create_queue_router(queue: JobQueue) -> Any:
         The stream closes automatically when a terminal event
         (``event_type`` of ``"done"`` or ``"error"``) is delivered.
 
+        Events are delivered as the worker emits them
+        (:meth:`~dcaf.core.queue.interface.JobQueue.watch_events`); an idle
+        stream only sends a keepalive comment every 15 seconds.
+
         Reconnection support: on reconnect the browser sends the
         ``Last-Event-ID`` header automatically; callers may also pass
-        ``?after=N`` explicitly to resume from a known sequence number.
+        ``?after=N`` explicitly to resume from sequence number N.  Resuming
+        after the terminal event closes the stream right away.
         """
         if await queue.get_status(job_id) is None:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        # Honour Last-Event-ID header for transparent browser reconnection
+        # Honour Last-Event-ID header for transparent browser reconnection:
+        # resume after the last event the browser received
         last_event_id = request.headers.get("last-event-id", "")
         if last_event_id.isdigit():
-            after = max(after, int(last_event_id))
+            after = max(after, int(last_event_id) + 1)
 
         from collections.abc import AsyncGenerator
 
         async def event_generator() -> AsyncGenerator[str, None]:
-            cursor = after
-            while True:
-                events = await queue.get_events(job_id, cursor)
-                for evt in events:
-                    data_str = json.dumps(evt.model_dump(mode="json"))
-                    yield f"id: {evt.seq}\ndata: {data_str}\n\n"
-                    cursor = evt.seq + 1
-                    if evt.event_type in _TERMINAL_EVENTS:
-                        return
-
+            # Events are pushed as the worker emits them; the stream ends
+            # after the terminal event.
+            async for events in queue.watch_events(job_id, after, keepalive=_KEEPALIVE_SECONDS):
                 if not events:
                     # SSE comment — keeps the HTTP connection alive
                     yield ": keepalive\n\n"
-
-                await asyncio.sleep(0.5)
+                for evt in events:
+                    data_str = json.dumps(evt.model_dump(mode="json"))
+                    yield f"id: {evt.seq}\ndata: {data_str}\n\n"
 
         return StreamingResponse(
             event_generator(),
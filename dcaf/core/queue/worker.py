@@ -36,6 +36,7 @@ import contextlib
 import logging
 import signal
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from typing import Any, ClassVar
 
 from .channel import AgentChannel, AgentMessageHandle
@@ -62,9 +63,16 @@ class AgentWorker(ABC):
         nats_url: str | None = None,
         max_concurrent: int = 3,
         shutdown_timeout: int = 300,
+        async_publish: bool = False,
+        coalesce_event_types: Collection[str] = (),
     ) -> None:
         self._agent_name = agent_name
-        self._channel = AgentChannel(agent_name, nats_url)
+        self._channel = AgentChannel(
+            agent_name,
+            nats_url,
+            async_publish=async_publish,
+            coalesce_event_types=coalesce_event_types,
+        )
         self._max_concurrent = max_concurrent
         self._shutdown_timeout = shutdown_timeout
         self._log = logging.getLogger(f"dcaf.worker.{agent_name}")
@@ -44,9 +44,10 @@ Example - With custom routes:
     serve(agent, additional_routers=[custom_router])
 """
 
+import asyncio
 import inspect
 import logging
-from collections.abc import AsyncGenerator, Callable, Iterator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Union
 
 from .agent import Agent
@@ -57,15 +58,16 @@ if TYPE_CHECKING:
 
     from ..channel_routing import ChannelResponseRouter
     from .a2a.models import AgentCard
-    from .primitives import AgentResult
+    from .infrastructure.handler_pool import HandlerPool
     from .queue.interface import JobQueue
     from .schemas.messages import AgentMessage
     from .session import Session
 
 logger = logging.getLogger(__name__)
 
-# Type for agent handlers (can be 2-arg or 3-arg with session)
-AgentHandler = Callable[..., "AgentResult"]
+# Type for agent handlers (can be 2-arg or 3-arg with session; sync or async,
+# returning an AgentResult, dict or str, or streaming by yielding)
+AgentHandler = Callable[..., Any]
 
 # Server defaults
 DEFAULT_PORT = 8000
@@ -392,9 +394,11 @@ def create_app(
     """
     import contextlib
 
-    from fastapi import Body, FastAPI, HTTPException
+    from fastapi import Body, FastAPI, HTTPException, Request
     from fastapi.responses import StreamingResponse
 
+    from .infrastructure.response_cache import cache_mode, cache_mode_from_headers
+
     # Create the appropriate adapter based on agent type
     adapter = _create_adapter(agent)
 
@@ -414,11 +418,21 @@ def create_app(
 
     @contextlib.asynccontextmanager
     async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        from .adapters.outbound.agno.bedrock_client_pool import get_bedrock_client_pool
+
+        # Long-lived Bedrock clients, reused across requests on this loop.
+        # They are opened by the first call of each model; open() only logs
+        # the pool settings, and close() closes the clients on shutdown.
+        client_pool = get_bedrock_client_pool()
+        await client_pool.open()
         if queue_backend is not None:
             await queue_backend.connect()
         yield
         if queue_backend is not None:
             await queue_backend.close()
+        await client_pool.close()
+        if isinstance(adapter, CallableAdapter):
+            adapter.pool.shutdown()
 
     # Create FastAPI app
     app = FastAPI(title="DCAF Core Chat Service", version="2.0.0", lifespan=_lifespan)
@@ -432,7 +446,7 @@ def create_app(
     # V2 Handler logic
     # -------------------------------------------------------------------------
 
-    async def _handle_chat_v2(raw_body: dict[str, Any]) -> dict[str, Any]:
+    async def _handle_chat_v2(raw_body: dict[str, Any], mode: str = "use") -> dict[str, Any]:
         """V2 handler for synchronous chat endpoints."""
         # Validate messages field
         if "messages" not in raw_body:
@@ -446,7 +460,7 @@ def create_app(
         # Check channel router for Slack
         source = raw_body.get("source")
         if source == "slack" and channel_router:
-            should_respond = channel_router.should_agent_respond(raw_body["messages"])
+            should_respond = await channel_router.should_agent_respond_async(raw_body["messages"])
             if not should_respond.get("should_respond", True):
                 return {"role": "assistant", "content": ""}
 
@@ -469,7 +483,8 @@ def create_app(
 
         # Call the agent
         try:
-            result = await _invoke_agent(adapter, agent_input)
+            with cache_mode(mode):
+                result = await _invoke_agent(adapter, agent_input)
 
             # Build response
             response: dict[str, Any] = {
@@ -487,7 +502,9 @@ def create_app(
             logger.exception(f"V2 Chat endpoint error: {e}")
             raise HTTPException(status_code=500, detail=str(e)) from e
 
-    async def _handle_chat_stream_v2(raw_body: dict[str, Any]) -> StreamingResponse:
+    async def _handle_chat_stream_v2(
+        raw_body: dict[str, Any], mode: str = "use"
+    ) -> StreamingResponse:
         """V2 handler for streaming chat endpoints."""
         from .schemas.events import DoneEvent, ErrorEvent
 
@@ -503,7 +520,7 @@ def create_app(
         # Check channel router for Slack
         source = raw_body.get("source")
         if source == "slack" and channel_router:
-            should_respond = channel_router.should_agent_respond(raw_body["messages"])
+            should_respond = await channel_router.should_agent_respond_async(raw_body["messages"])
             if not should_respond.get("should_respond", True):
 
                 def done_generator() -> Iterator[str]:
@@ -518,13 +535,14 @@ def create_app(
 
         async def event_generator() -> Any:
             try:
-                async for event in _stream_agent(adapter, agent_input):
-                    if hasattr(event, "model_dump_json"):
-                        yield event.model_dump_json() + "\n"
-                    else:
-                        import json
+                with cache_mode(mode):
+                    async for event in _stream_agent(adapter, agent_input):
+                        if hasattr(event, "model_dump_json"):
+                            yield event.model_dump_json() + "\n"
+                        else:
+                            import json
 
-                        yield json.dumps(event) + "\n"
+                            yield json.dumps(event) + "\n"
             except Exception as e:
                 logger.exception(f"V2 Stream error: {e}")
                 yield ErrorEvent(error=str(e)).model_dump_json() + "\n"
@@ -536,36 +554,42 @@ def create_app(
     # -------------------------------------------------------------------------
 
     @app.post("/api/chat", tags=["chat"])
-    async def chat(raw_body: dict[str, Any] = Body(...)) -> dict[str, Any]:
+    async def chat(request: Request, raw_body: dict[str, Any] = Body(...)) -> dict[str, Any]:
         """Synchronous chat endpoint (V2 code path)."""
-        return await _handle_chat_v2(raw_body)
+        return await _handle_chat_v2(raw_body, cache_mode_from_headers(request.headers))
 
     @app.post("/api/chat-stream", tags=["chat"])
-    async def chat_stream(raw_body: dict[str, Any] = Body(...)) -> StreamingResponse:
+    async def chat_stream(
+        request: Request, raw_body: dict[str, Any] = Body(...)
+    ) -> StreamingResponse:
         """Streaming chat endpoint (V2 code path, NDJSON)."""
-        return await _handle_chat_stream_v2(raw_body)
+        return await _handle_chat_stream_v2(raw_body, cache_mode_from_headers(request.headers))
 
     # -------------------------------------------------------------------------
     # Legacy Endpoint Aliases (Deprecated) - Aliases to V2 endpoints
     # -------------------------------------------------------------------------
 
     @app.post("/api/sendMessage", tags=["legacy"], deprecated=True)
-    async def send_message(raw_body: dict[str, Any] = Body(...)) -> dict[str, Any]:
+    async def send_message(
+        request: Request, raw_body: dict[str, Any] = Body(...)
+    ) -> dict[str, Any]:
         """
         Synchronous chat endpoint (alias for /api/chat).
 
         Deprecated: Use POST /api/chat instead.
         """
-        return await _handle_chat_v2(raw_body)
+        return await _handle_chat_v2(raw_body, cache_mode_from_headers(request.headers))
 
     @app.post("/api/sendMessageStream", tags=["legacy"], deprecated=True)
-    async def send_message_stream(raw_body: dict[str, Any] = Body(...)) -> StreamingResponse:
+    async def send_message_stream(
+        request: Request, raw_body: dict[str, Any] = Body(...)
+    ) -> StreamingResponse:
         """
         Streaming chat endpoint (alias for /api/chat-stream).
 
         Deprecated: Use POST /api/chat-stream instead.
         """
-        return await _handle_chat_stream_v2(raw_body)
+        return await _handle_chat_stream_v2(raw_body, cache_mode_from_headers(request.headers))
 
     # -------------------------------------------------------------------------
     # WebSocket endpoint (V2 only)
@@ -642,6 +666,8 @@ async def _invoke_agent(adapter: Any, agent_input: dict[str, Any]) -> "AgentMess
 
     from .schemas.messages import AgentMessage
 
+    if isinstance(adapter, CallableAdapter):
+        return await adapter.ainvoke(agent_input)
     if hasattr(adapter, "invoke"):
         result = adapter.invoke(agent_input)
         # Handle coroutine result (async def invoke)
@@ -663,7 +689,7 @@ async def _stream_agent(adapter: Any, agent_input: dict[str, Any]) -> Any:
     from .schemas.events import DoneEvent, TextDeltaEvent
 
     if hasattr(adapter, "invoke_stream"):
-        result = adapter.invoke_stream(agent_input)
+        result = _open_stream(adapter, agent_input)
 
         # Check for generators BEFORE coroutines to avoid Python 3.11
         # asyncio.iscoroutine misidentifying generators.
@@ -694,6 +720,18 @@ async def _stream_agent(adapter: Any, agent_input: dict[str, Any]) -> Any:
         yield DoneEvent()
 
 
+def _open_stream(adapter: Any, agent_input: dict[str, Any]) -> Any:
+    """Start a streaming request; function agents use their non-blocking variant."""
+    if isinstance(adapter, CallableAdapter):
+        return adapter.ainvoke_stream(agent_input)
+    return adapter.invoke_stream(agent_input)
+
+
+def _is_stream(result: Any) -> bool:
+    """Whether a handler returned a stream rather than a single result."""
+    return hasattr(result, "__aiter__") or inspect.isgenerator(result)
+
+
 def _add_websocket_endpoint(
     app: "FastAPI",
     adapter: Any,
@@ -745,7 +783,9 @@ def _add_websocket_endpoint(
                 # Check channel router for Slack
                 source = data.get("source")
                 if source == "slack" and channel_router:
-                    should_respond = channel_router.should_agent_respond(data["messages"])
+                    should_respond = await channel_router.should_agent_respond_async(
+                        data["messages"]
+                    )
                     if not should_respond.get("should_respond", True):
                         await websocket.send_json({"type": "done"})
                         continue
@@ -762,7 +802,7 @@ def _add_websocket_endpoint(
                 try:
                     # Check if adapter has invoke_stream
                     if hasattr(adapter, "invoke_stream"):
-                        result = adapter.invoke_stream(agent_input)
+                        result = _open_stream(adapter, agent_input)
 
                         # Check generators BEFORE coroutines (Python 3.11 compat)
                         if hasattr(result, "__anext__"):
@@ -871,6 +911,11 @@ def _start_mcp_server(agent: Any, host: str, port: int, transport: str) -> Any:
     return process
 
 
+def _call_with_session(handler: AgentHandler, *args: Any) -> tuple[Any, "Session"]:
+    """Call a handler in a worker process; return its result and its session."""
+    return handler(*args), args[-1]
+
+
 class CallableAdapter:
     """
     Adapts a callable function to work with the FastAPI server.
@@ -886,12 +931,32 @@ class CallableAdapter:
         # New style with session
         def my_agent(messages: list, context: dict, session: Session) -> AgentResult:
             ...
+
+    Handlers may be synchronous or ``async def``.  Synchronous handlers run on a
+    bounded worker pool (see :class:`HandlerPool`) so they never block the
+    event loop; ``async def`` handlers are awaited directly.
+
+    Handlers can also stream by yielding (``def`` or ``async def`` with
+    ``yield``) or by returning an async iterator.  Yielded strings and
+    ``LLMStreamChunk`` text become text deltas; stream events are passed
+    through as-is:
+        async def my_agent(messages: list, context: dict):
+            yield "Looking into it... "
+            async for chunk in llm.astream(messages):
+                yield chunk
+
+        def my_agent(messages: list, context: dict):
+            return llm.astream(messages)
     """
 
-    def __init__(self, handler: AgentHandler):
+    def __init__(self, handler: AgentHandler, pool: "HandlerPool | None" = None):
+        from .infrastructure.handler_pool import HandlerPool
+
         self.handler = handler
+        self.pool = pool or HandlerPool.from_env()
         # Check if handler accepts session parameter
         self._accepts_session = self._check_accepts_session(handler)
+        self._is_async = inspect.iscoroutinefunction(handler)
 
     def _check_accepts_session(self, handler: AgentHandler) -> bool:
         """Check if the handler function accepts a session parameter."""
@@ -905,53 +970,23 @@ class CallableAdapter:
 
     def invoke(self, messages: dict) -> "AgentMessage":
         """
-        Handle a synchronous chat request.
+        Handle a synchronous chat request on the calling thread.
 
         Calls the user's handler function and converts the result
-        to the HelpDesk protocol format.
+        to the HelpDesk protocol format.  ``async def`` and streaming
+        handlers are run to completion on a private event loop, so this
+        must not be called from a running loop; the server uses
+        :meth:`ainvoke`.
         """
-        from .primitives import AgentResult
         from .schemas.messages import AgentMessage
 
-        # Extract messages and context
-        messages_list = messages.get("messages", [])
-        context = self._extract_context(messages_list)
-
-        # Extract session from request
-        session = self._extract_session(messages_list)
+        args, session = self._handler_args(messages)
 
-        # Add approved tool calls to context if present
-        approved = self._extract_approved_tools(messages_list)
-        if approved:
-            context["approved_tool_calls"] = approved
-
-        # Convert to simple format for user's handler
-        simple_messages = self._simplify_messages(messages_list)
-
-        # Call user's handler (with or without session based on signature)
         try:
-            if self._accepts_session:
-                result = self.handler(simple_messages, context, session)
-            else:
-                result = self.handler(simple_messages, context)
-
-            # Handle different return types
-            if isinstance(result, AgentResult):
-                # If handler didn't include session but modified it, include it
-                if not result.session and session.is_modified:
-                    result.session = session.to_dict()
-                # Use native to_message() conversion
-                return result.to_message()
-            elif isinstance(result, dict):
-                # Allow returning dict directly
-                return AgentMessage(
-                    content=result.get("text", result.get("content", "")),
-                )
-            elif isinstance(result, str):
-                # Allow returning string directly
-                return AgentMessage(content=result)
-            else:
-                return AgentMessage(content=str(result))
+            result = self.handler(*args)
+            if inspect.isawaitable(result) or _is_stream(result):
+                return asyncio.run(self._result_message(result, session))
+            return self._to_message(result, session)
 
         except Exception as e:  # Intentional catch-all: user handler code can raise anything
             logger.exception(f"Agent handler error: {e}")
@@ -959,10 +994,11 @@ class CallableAdapter:
 
     def invoke_stream(self, messages: dict[str, Any]) -> Iterator[Any]:
         """
-        Handle a streaming chat request.
+        Handle a streaming chat request on the calling thread.
 
-        For now, wraps the sync call. Users can implement
-        streaming in their handler by returning a generator.
+        Invokes the handler once (see :meth:`invoke`) and emits its result
+        as a single text delta; use :meth:`ainvoke_stream` to relay
+        streaming handlers event by event.
         """
         from .schemas.events import DoneEvent, ErrorEvent, TextDeltaEvent
 
@@ -973,11 +1009,178 @@ class CallableAdapter:
             if result.content:
                 yield TextDeltaEvent(text=result.content)
 
-            yield DoneEvent()
+            session = result.data.session
+            yield DoneEvent(meta_data={"session": session} if session else {})
 
         except Exception as e:  # Intentional catch-all: user handler code can raise anything
             yield ErrorEvent(error=str(e))
 
+    async def ainvoke(self, messages: dict) -> "AgentMessage":
+        """
+        Handle a chat request without blocking the event loop.
+
+        Synchronous handlers run on the worker pool and ``async def``
+        handlers are awaited; the result is converted as in :meth:`invoke`.
+        """
+        from .schemas.messages import AgentMessage
+
+        args, session = self._handler_args(messages)
+
+        try:
+            return await self._result_message(await self._call_handler(args), session)
+
+        except Exception as e:  # Intentional catch-all: user handler code can raise anything
+            logger.exception(f"Agent handler error: {e}")
+            return AgentMessage(content=f"Error: {str(e)}")
+
+    async def ainvoke_stream(self, messages: dict[str, Any]) -> AsyncIterator[Any]:
+        """
+        Handle a streaming chat request without blocking the event loop.
+
+        Streaming handlers (generators, or functions returning an async
+        iterator such as ``llm.astream(...)``) are relayed event by event;
+        other handlers are invoked once and their result is emitted as a
+        single text delta.
+        """
+        from .schemas.events import DoneEvent, ErrorEvent, TextDeltaEvent
+
+        args, session = self._handler_args(messages)
+        try:
+            result = await self._call_handler(args)
+        except Exception as e:  # Intentional catch-all: user handler code can raise anything
+            logger.exception(f"Agent handler error: {e}")
+            result = f"Error: {str(e)}"
+
+        if not _is_stream(result):
+            message = self._to_message(result, session)
+            if message.content:
+                yield TextDeltaEvent(text=message.content)
+            yield self._done_event(DoneEvent(), session)
+            return
+
+        try:
+            done = False
+            async for event in self._relay(result):
+                if isinstance(event, DoneEvent):
+                    done = True
+                    event = self._done_event(event, session)
+                yield event
+            if not done:
+                yield self._done_event(DoneEvent(), session)
+
+        except Exception as e:  # Intentional catch-all: user handler code can raise anything
+            logger.exception(f"Agent handler stream error: {e}")
+            yield ErrorEvent(error=str(e))
+
+    async def _call_handler(self, args: tuple[Any, ...]) -> Any:
+        """
+        Call the user's handler without blocking the event loop.
+
+        Generator handlers are only created here; their body runs while the
+        result is relayed.
+        """
+        if inspect.isasyncgenfunction(self.handler) or inspect.isgeneratorfunction(self.handler):
+            return self.handler(*args)
+        if self._is_async:
+            return await self.handler(*args)
+        if self.pool.mode == "process" and self._accepts_session:
+            # The session is pickled into the worker: bring its changes back
+            session = args[-1]
+            result, worker_session = await self.pool.run(_call_with_session, self.handler, *args)
+            if worker_session.is_modified:
+                session.clear()
+                session.update(worker_session.to_dict())
+            return result
+        return await self.pool.run(self.handler, *args)
+
+    async def _result_message(self, result: Any, session: "Session") -> "AgentMessage":
+        """Convert a handler's result, awaiting it or collecting its stream first."""
+        from .primitives import AgentResult
+        from .schemas.events import TextDeltaEvent
+
+        if inspect.isawaitable(result):
+            result = await result
+        if _is_stream(result):
+            # Collect the streamed text into a single message
+            text = [
+                event.text
+                async for event in self._relay(result)
+                if isinstance(event, TextDeltaEvent)
+            ]
+            result = AgentResult(text="".join(text))
+        return self._to_message(result, session)
+
+    def _done_event(self, event: Any, session: "Session") -> Any:
+        """Add the session to a ``done`` event if the handler modified it."""
+        if session.is_modified and "session" not in event.meta_data:
+            event = event.model_copy(
+                update={"meta_data": {**event.meta_data, "session": session.to_dict()}}
+            )
+        return event
+
+    def _handler_args(self, messages: dict[str, Any]) -> tuple[tuple[Any, ...], "Session"]:
+        """Build the handler's arguments from a request (and return the session)."""
+        # Extract messages and context
+        messages_list = messages.get("messages", [])
+        context = self._extract_context(messages_list)
+
+        # Extract session from request
+        session = self._extract_session(messages_list)
+
+        # Add approved tool calls to context if present
+        approved = self._extract_approved_tools(messages_list)
+        if approved:
+            context["approved_tool_calls"] = approved
+
+        # Convert to simple format for user's handler
+        simple_messages = self._simplify_messages(messages_list)
+
+        # Call user's handler with or without session based on signature
+        if self._accepts_session:
+            return (simple_messages, context, session), session
+        return (simple_messages, context), session
+
+    def _to_message(self, result: Any, session: "Session") -> "AgentMessage":
+        """Convert a handler's return value to an AgentMessage."""
+        from .primitives import AgentResult
+        from .schemas.messages import AgentMessage
+
+        # Handle different return types
+        if isinstance(result, AgentResult):
+            # If handler didn't include session but modified it, include it
+            if not result.session and session.is_modified:
+                result.session = session.to_dict()
+            # Use native to_message() conversion
+            return result.to_message()
+        elif isinstance(result, dict):
+            # Allow returning dict directly
+            content = result.get("text", result.get("content", ""))
+            return AgentMessage(
+                content="" if content is None else str(content),
+            )
+        elif isinstance(result, str):
+            # Allow returning string directly
+            return AgentMessage(content=result)
+        else:
+            return AgentMessage(content=str(result))
+
+    async def _relay(self, stream: Any) -> AsyncIterator[Any]:
+        """Relay a handler's stream as stream events."""
+        from .llm import LLMStreamChunk
+        from .schemas.events import TextDeltaEvent
+
+        # Sync generators are advanced on the worker pool
+        items = stream if hasattr(stream, "__aiter__") else self.pool.iterate(stream)
+
+        async for item in items:
+            if isinstance(item, str):
+                yield TextDeltaEvent(text=item)
+            elif isinstance(item, LLMStreamChunk):
+                if item.text:
+                    yield TextDeltaEvent(text=item.text)
+            else:
+                yield item
+
     def _simplify_messages(self, messages_list: list) -> list[dict]:
         """Convert to simple format for user's handler."""
         simple = []
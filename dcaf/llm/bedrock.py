@@ -15,6 +15,7 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from dcaf.llm.base import LLM
+from dcaf.llm.tokens import CACHE_MIN_TOKENS, cache_min_tokens, count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -26,19 +27,7 @@ class BedrockLLM(LLM):
     """
 
     # Minimum tokens required for caching by model family
-    CACHE_MIN_TOKENS = {
-        "claude-haiku-4-5": 4096,
-        "claude-sonnet-4-5": 1024,
-        "claude-sonnet-4": 1024,
-        "claude-opus-4": 1024,
-        "claude-3-7-sonnet": 1024,
-        "claude-3-5-sonnet": 1024,
-        "claude-3-5-haiku": 2048,
-        "nova-micro": 1000,
-        "nova-lite": 1000,
-        "nova-pro": 1000,
-        "nova-premier": 1000,
-    }
+    CACHE_MIN_TOKENS = CACHE_MIN_TOKENS
 
     def __init__(self, region_name: str = "us-east-1", boto3_config: Config | None = None):
         """
@@ -83,11 +72,43 @@ class BedrockLLM(LLM):
         Returns:
             Minimum token count for caching, or 0 if model not recognized
         """
-        model_id_lower = model_id.lower()
-        for model_key, min_tokens in self.CACHE_MIN_TOKENS.items():
-            if model_key in model_id_lower:
-                return min_tokens
-        return 0
+        return cache_min_tokens(model_id)
+
+    def _build_system_content(
+        self, system_prompt: str, model_id: str, cache_system_prompt: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Build the Converse ``system`` blocks, with a cache checkpoint if requested.
+
+        Args:
+            system_prompt: System prompt string
+            model_id: The Bedrock model ID
+            cache_system_prompt: Whether to add a cache checkpoint
+
+        Returns:
+            System content blocks
+        """
+        system_content: list[dict[str, Any]] = [{"text": system_prompt}]
+        if not cache_system_prompt:
+            return system_content
+
+        # Note: TTL parameter requires newer boto3 version (1.35+)
+        # Default TTL is 5 minutes, which resets on each cache hit
+        system_content.append({"cachePoint": {"type": "default"}})
+
+        min_tokens = self._get_cache_min_tokens(model_id)
+        prompt_tokens = count_tokens(system_prompt, model_id)
+        logger.info(
+            f"[CACHE CONFIG] System prompt caching enabled for {model_id}. "
+            f"Prompt: ~{prompt_tokens} tokens, min tokens required: {min_tokens}, "
+            f"TTL: 5m (default)"
+        )
+        if prompt_tokens < min_tokens:
+            logger.warning(
+                f"[CACHE CONFIG] System prompt (~{prompt_tokens} tokens) is below the "
+                f"{min_tokens} token minimum for {model_id}; Bedrock will not cache it."
+            )
+        return system_content
 
     def _log_cache_metrics(self, response: dict[str, Any], model_id: str) -> None:
         """
@@ -165,20 +186,9 @@ class BedrockLLM(LLM):
         }
 
         if system_prompt:
-            system_content = [{"text": system_prompt}]
-            if cache_system_prompt:
-                # Note: TTL parameter requires newer boto3 version (1.35+)
-                # Default TTL is 5 minutes, which resets on each cache hit
-                cache_point = {"cachePoint": {"type": "default"}}
-                system_content.append(cache_point)
-
-                # Log cache configuration
-                min_tokens = self._get_cache_min_tokens(model_id)
-                logger.info(
-                    f"[CACHE CONFIG] System prompt caching enabled for {model_id}. "
-                    f"Min tokens required: {min_tokens}, TTL: 5m (default)"
-                )
-            request["system"] = system_content
+            request["system"] = self._build_system_content(
+                system_prompt, model_id, cache_system_prompt
+            )
 
         if tools:
             request["toolConfig"] = {"tools": tools}
@@ -286,20 +296,9 @@ class BedrockLLM(LLM):
 
         # Add system prompt with optional caching
         if system_prompt:
-            system_content = [{"text": system_prompt}]
-            if cache_system_prompt:
-                # Note: TTL parameter requires newer boto3 version (1.35+)
-                # Default TTL is 5 minutes, which resets on each cache hit
-                cache_point = {"cachePoint": {"type": "default"}}
-                system_content.append(cache_point)
-
-                # Log cache configuration with model requirements
-                min_tokens = self._get_cache_min_tokens(model_id)
-                logger.info(
-                    f"[CACHE CONFIG] System prompt caching enabled for {model_id}. "
-                    f"Min tokens required: {min_tokens}, TTL: 5m (default)"
-                )
-            request["system"] = system_content
+            request["system"] = self._build_system_content(
+                system_prompt, model_id, cache_system_prompt
+            )
 
         # Add inference configuration
         inference_config = {
@@ -0,0 +1,244 @@
+"""
+Token counting for prompt-cache thresholds and context budgeting.
+
+Bedrock has no local tokenizer, so token counts are estimated.  The default
+:class:`HeuristicTokenCounter` splits text into words, numbers, punctuation and
+non-ASCII characters and weights them per model family.  Unlike
+``len(text) // 4`` it does not badly undercount code (lots of punctuation) or
+non-English text (roughly one token per CJK character).
+
+Counts are memoized by content hash, so checking the same static system prompt
+on every request costs one hash, not a re-count.
+
+The counter is pluggable - install a real tokenizer with
+:func:`set_token_counter`:
+
+    import tiktoken
+    from dcaf.llm.tokens import set_token_counter
+
+    class TiktokenCounter:
+        def __init__(self):
+            self._encoding = tiktoken.get_encoding("cl100k_base")
+
+        def count(self, text: str, model_id: str | None = None) -> int:
+            return len(self._encoding.encode(text))
+
+    set_token_counter(TiktokenCounter())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+# Minimum tokens a Bedrock cache checkpoint needs, by model family
+CACHE_MIN_TOKENS = {
+    "claude-haiku-4-5": 4096,
+    "claude-sonnet-4-5": 1024,
+    "claude-sonnet-4": 1024,
+    "claude-opus-4": 1024,
+    "claude-3-7-sonnet": 1024,
+    "claude-3-5-sonnet": 1024,
+    "claude-3-5-haiku": 2048,
+    "nova-micro": 1000,
+    "nova-lite": 1000,
+    "nova-pro": 1000,
+    "nova-premier": 1000,
+}
+
+
+def cache_min_tokens(model_id: str, default: int = 0) -> int:
+    """
+    Return the minimum token count Bedrock needs to cache a prompt prefix.
+
+    Args:
+        model_id: Bedrock model ID (or inference profile ID)
+        default: Value returned when the model family is not recognized
+
+    Returns:
+        Minimum token count for caching
+    """
+    model_id_lower = model_id.lower()
+    for model_key, min_tokens in CACHE_MIN_TOKENS.items():
+        if model_key in model_id_lower:
+            return min_tokens
+    return default
+
+
+# Context window sizes, by model family
+CONTEXT_WINDOW_TOKENS = {
+    "claude": 200_000,
+    "nova-micro": 128_000,
+    "nova": 300_000,
+    "llama": 128_000,
+    "mistral": 32_000,
+    "gemini": 1_000_000,
+    "gpt-4o": 128_000,
+}
+
+
+def context_window_tokens(model_id: str, default: int = 32_000) -> int:
+    """
+    Return the context window size of a model.
+
+    Args:
+        model_id: Model ID (any provider)
+        default: Value returned when the model family is not recognized
+
+    Returns:
+        Context window size in tokens
+    """
+    model_id_lower = model_id.lower()
+    for model_key, tokens in CONTEXT_WINDOW_TOKENS.items():
+        if model_key in model_id_lower:
+            return tokens
+    return default
+
+
+class TokenCounter(Protocol):
+    """Anything that can count the tokens of a text for a given model."""
+
+    def count(self, text: str, model_id: str | None = None) -> int: ...
+
+
+@dataclass(frozen=True)
+class TokenizerProfile:
+    """
+    Per-family weights used by :class:`HeuristicTokenCounter`.
+
+    Attributes:
+        letters_per_token: Average ASCII letters per token inside a word
+        digits_per_token: Digits per token in a number
+        non_ascii_tokens_per_char: Tokens per non-ASCII character
+    """
+
+    letters_per_token: float = 7.0
+    digits_per_token: float = 3.0
+    non_ascii_tokens_per_char: float = 1.0
+
+
+# Matched in order: words, numbers, whitespace, non-ASCII, other symbols
+_PIECES = re.compile(r"[A-Za-z]+|[0-9]+|\s+|[^\x00-\x7f]|[^\sA-Za-z0-9]")
+
+_DEFAULT_PROFILE = TokenizerProfile()
+
+_PROFILES = {
+    "claude": TokenizerProfile(letters_per_token=7.0, digits_per_token=3.0),
+    "nova": TokenizerProfile(letters_per_token=7.5, digits_per_token=3.0),
+    "llama": TokenizerProfile(letters_per_token=7.5, digits_per_token=3.0),
+    "mistral": TokenizerProfile(letters_per_token=6.5, digits_per_token=1.0),
+}
+
+
+def profile_for(model_id: str | None) -> TokenizerProfile:
+    """Return the tokenizer profile for a model ID (default if unknown)."""
+    if model_id:
+        model_id_lower = model_id.lower()
+        for family, profile in _PROFILES.items():
+            if family in model_id_lower:
+                return profile
+    return _DEFAULT_PROFILE
+
+
+class HeuristicTokenCounter:
+    """
+    Fast local token estimate, weighted per model family.
+
+    - Words: one token per ``letters_per_token`` letters, at least one
+    - Numbers: one token per ``digits_per_token`` digits
+    - Punctuation/symbols: one token each
+    - Non-ASCII characters: ``non_ascii_tokens_per_char`` each
+    - Whitespace: free after a word, one token for line breaks/indentation
+    """
+
+    def count(self, text: str, model_id: str | None = None) -> int:
+        if not text:
+            return 0
+        profile = profile_for(model_id)
+        total = 0.0
+        for match in _PIECES.finditer(text):
+            piece = match.group()
+            first = piece[0]
+            if first.isascii() and first.isalpha():
+                total += math.ceil(len(piece) / profile.letters_per_token)
+            elif first.isascii() and first.isdigit():
+                total += math.ceil(len(piece) / profile.digits_per_token)
+            elif first.isspace():
+                total += 0 if piece == " " else 1
+            elif not first.isascii():
+                total += profile.non_ascii_tokens_per_char
+            else:
+                total += 1
+        return max(1, round(total))
+
+
+class MemoizedTokenCounter:
+    """
+    Wraps a counter with an LRU cache keyed by (model ID, content hash).
+
+    Short texts are counted directly; hashing them costs about as much as
+    counting.  Thread-safe.
+    """
+
+    MIN_MEMOIZED_CHARS = 256
+
+    def __init__(self, counter: TokenCounter, maxsize: int = 1024):
+        self._counter = counter
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, text: str, model_id: str | None = None) -> int:
+        if len(text) < self.MIN_MEMOIZED_CHARS:
+            return self._counter.count(text, model_id)
+
+        key = (model_id or "", hashlib.blake2b(text.encode(), digest_size=16).digest())
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        tokens = self._counter.count(text, model_id)
+        with self._lock:
+            self._cache[key] = tokens
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def clear(self) -> None:
+        """Forget all memoized counts."""
+        with self._lock:
+            self._cache.clear()
+
+
+_default_counter: TokenCounter = MemoizedTokenCounter(HeuristicTokenCounter())
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the process-wide token counter."""
+    return _default_counter
+
+
+def set_token_counter(counter: TokenCounter | None, memoize: bool = True) -> None:
+    """
+    Replace the process-wide token counter.
+
+    Args:
+        counter: The new counter, or None to restore the built-in heuristic
+        memoize: Wrap the counter in a :class:`MemoizedTokenCounter`
+    """
+    global _default_counter
+    if counter is None:
+        counter = HeuristicTokenCounter()
+        memoize = True
+    _default_counter = MemoizedTokenCounter(counter) if memoize else counter
+
+
+def count_tokens(text: str, model_id: str | None = None) -> int:
+    """Count the tokens of ``text`` with the process-wide counter."""
+    return get_token_counter().count(text, model_id)
@@ -12,6 +12,7 @@ from dcaf.core.application.dto.responses import (
     DataDTO,
     ToolCallDTO,
 )
+from dcaf.core.infrastructure.response_cache import ResponseCache
 from dcaf.core.interceptors import InterceptorError, LLMRequest, LLMResponse
 from dcaf.core.models import ChatMessage
 from dcaf.core.session import Session
@@ -162,6 +163,53 @@ class TestAgentRun:
         assert response.is_complete is True
         assert response.needs_approval is False
 
+    @pytest.mark.asyncio
+    async def test_coalesce_requests_shares_identical_runs(self):
+        import asyncio
+
+        runtime = FakeRuntime()
+        invoke = runtime.invoke
+
+        async def slow_invoke(**kwargs):
+            await asyncio.sleep(0.02)
+            return await invoke(**kwargs)
+
+        runtime.invoke = slow_invoke
+        agent = _create_agent(runtime=runtime, coalesce_requests=True)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        await asyncio.gather(agent.run(messages=messages), agent.run(messages=messages))
+
+        assert len(runtime._invoke_calls) == 1
+        assert agent.coalescing_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_response_cache_scoped_per_tenant(self):
+        runtime = FakeRuntime()
+        agent = _create_agent(runtime=runtime, response_cache=ResponseCache())
+        messages = [{"role": "user", "content": "List pods"}]
+
+        await agent.run(messages=messages, context={"tenant_name": "a", "request_id": "1"})
+        cached = await agent.run(messages=messages, context={"tenant_name": "a", "request_id": "2"})
+        await agent.run(messages=messages, context={"tenant_name": "b"})
+
+        assert len(runtime._invoke_calls) == 2
+        assert cached.text == "Hello from agent"
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_pending_approvals(self):
+        runtime = FakeRuntime()
+        runtime.will_respond_with_tool_calls(
+            [ToolCallDTO(id="tc-1", name="delete_pod", input={}, requires_approval=True)]
+        )
+        agent = _create_agent(runtime=runtime, response_cache=ResponseCache())
+        messages = [{"role": "user", "content": "Delete the pod"}]
+
+        await agent.run(messages=messages)
+        await agent.run(messages=messages)
+
+        assert len(runtime._invoke_calls) == 2
+
     @pytest.mark.asyncio
     async def test_empty_messages_raises_error(self):
         agent = _create_agent()
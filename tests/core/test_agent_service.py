@@ -1,5 +1,6 @@
 """Tests for AgentService (dcaf.core.application.services.agent_service)."""
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -8,6 +9,7 @@ from dcaf.core.application.dto.requests import AgentRequest
 from dcaf.core.application.dto.responses import AgentResponse, ToolCallDTO
 from dcaf.core.application.services.agent_service import AgentService
 from dcaf.core.domain.entities import Message
+from dcaf.core.infrastructure.single_flight import SingleFlight
 from dcaf.core.testing import (
     FakeConversationRepository,
     FakeEventPublisher,
@@ -382,3 +384,49 @@ class TestCreateFromMessageHistory:
             context=PlatformContext.empty(),
         )
         assert len(conv.messages) == 1
+
+
+# =============================================================================
+# Request coalescing
+# =============================================================================
+
+
+class SlowRuntime(AsyncFakeRuntime):
+    async def invoke(self, *args, **kwargs) -> AgentResponse:
+        await asyncio.sleep(0.05)
+        return await super().invoke(*args, **kwargs)
+
+
+class TestAgentServiceCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_run(self):
+        runtime = SlowRuntime()
+        flight = SingleFlight(name="agent")
+        service = AgentService(
+            runtime=runtime, conversations=FakeConversationRepository(), coalescer=flight
+        )
+
+        first, second = await asyncio.gather(
+            service.execute(AgentRequest(content="Restart the pod", context={"request_id": "a"})),
+            service.execute(AgentRequest(content="Restart the pod", context={"request_id": "b"})),
+        )
+
+        assert first is second
+        assert runtime.invoke_count == 1
+        assert flight.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_requests_run_separately(self):
+        runtime = SlowRuntime()
+        service = AgentService(
+            runtime=runtime,
+            conversations=FakeConversationRepository(),
+            coalescer=SingleFlight(),
+        )
+
+        await asyncio.gather(
+            service.execute(AgentRequest(content="Restart the pod")),
+            service.execute(AgentRequest(content="Restart the pod", context={"tenant": "b"})),
+        )
+
+        assert runtime.invoke_count == 2
@@ -946,5 +946,100 @@ class TestAgnoResponseConverterWithRealAgnoObjects:
         )
 
 
+# =============================================================================
+# Test: Agent cache
+# =============================================================================
+
+
+class TestAgentCache:
+    """Tests for reusing compiled Agno agents across requests."""
+
+    @pytest.fixture
+    def adapter(self, monkeypatch):
+        from dcaf.core.adapters.outbound.agno.adapter import AgnoAdapter
+
+        monkeypatch.delenv("AGNO_AGENT_CACHE_SIZE", raising=False)
+        adapter = AgnoAdapter(model_id="test", provider="bedrock")
+        model = MagicMock()
+
+        async def fake_model():
+            return model
+
+        adapter._get_or_create_model_async = fake_model
+        return adapter
+
+    async def test_same_request_shape_reuses_agent(self, adapter, mock_tool):
+        tools = [mock_tool]
+        with patch("dcaf.core.adapters.outbound.agno.adapter.AgnoAgent") as agent_cls:
+            first = await adapter._create_agent_async(tools, "prompt")
+            second = await adapter._create_agent_async(tools, "prompt")
+
+        assert first is second
+        assert agent_cls.call_count == 1
+
+    @pytest.mark.parametrize(
+        "changes",
+        [{"system_prompt": "other prompt"}, {"stream": True}, {"tools": []}],
+    )
+    async def test_different_request_shape_builds_new_agent(self, adapter, mock_tool, changes):
+        tools = [mock_tool]
+        kwargs = {"tools": tools, "system_prompt": "prompt", "stream": False, **changes}
+        with patch("dcaf.core.adapters.outbound.agno.adapter.AgnoAgent") as agent_cls:
+            await adapter._create_agent_async(tools, "prompt")
+            await adapter._create_agent_async(**kwargs)
+
+        assert agent_cls.call_count == 2
+
+    async def test_invalidate_agent_cache(self, adapter, mock_tool):
+        with patch("dcaf.core.adapters.outbound.agno.adapter.AgnoAgent") as agent_cls:
+            await adapter._create_agent_async([mock_tool], "prompt")
+            adapter.invalidate_agent_cache()
+            await adapter._create_agent_async([mock_tool], "prompt")
+
+        assert agent_cls.call_count == 2
+
+    async def test_cache_is_bounded(self, adapter, mock_tool):
+        adapter._agent_cache_size = 2
+        with patch("dcaf.core.adapters.outbound.agno.adapter.AgnoAgent"):
+            for prompt in ("a", "b", "c"):
+                await adapter._create_agent_async([mock_tool], prompt)
+
+        assert len(adapter._agent_cache) == 2
+
+    async def test_cache_disabled(self, adapter, mock_tool):
+        adapter._agent_cache_size = 0
+        with patch("dcaf.core.adapters.outbound.agno.adapter.AgnoAgent") as agent_cls:
+            await adapter._create_agent_async([mock_tool], "prompt")
+            await adapter._create_agent_async([mock_tool], "prompt")
+
+        assert agent_cls.call_count == 2
+        assert not adapter._agent_cache
+
+    def test_unbound_wrapper_reads_run_context(self, mock_tool_with_context):
+        """Cached wrappers resolve platform_context from the active run."""
+        from dcaf.core.adapters.outbound.agno.adapter import AgnoAdapter
+        from dcaf.core.adapters.outbound.agno.run_context import _active_platform_context
+
+        captured = []
+        mock_decorator = MagicMock()
+        mock_decorator.return_value = lambda f: captured.append(f) or f
+
+        with patch("dcaf.core.adapters.outbound.agno.adapter.agno_tool_decorator", mock_decorator):
+            adapter = AgnoAdapter(model_id="test", provider="bedrock")
+            adapter._convert_tools_to_agno([mock_tool_with_context])
+
+        wrapper = captured[0]
+        assert "platform_context" not in inspect.signature(wrapper).parameters
+
+        for tenant in ("tenant-a", "tenant-b"):
+            token = _active_platform_context.set({"tenant_name": tenant})
+            try:
+                assert tenant in wrapper(query="q")
+            finally:
+                _active_platform_context.reset(token)
+
+        assert "unknown" in wrapper(query="q")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
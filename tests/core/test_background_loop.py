@@ -0,0 +1,77 @@
+"""Tests for the process-wide background event loop."""
+
+import asyncio
+
+import pytest
+
+from dcaf.core.infrastructure.background_loop import BackgroundLoop
+
+
+@pytest.fixture
+def background():
+    loop = BackgroundLoop(name="test-background-loop")
+    yield loop
+    loop.shutdown()
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestBackgroundLoop:
+    def test_runs_coroutine_and_returns_result(self, background):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert background.run(add(1, 2)) == 3
+
+    def test_same_loop_for_every_call(self, background):
+        first = background.run(_current_loop())
+        second = background.run(_current_loop())
+
+        assert first is second
+        assert not first.is_closed()
+
+    def test_exceptions_propagate(self, background):
+        async def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            background.run(boom())
+
+    def test_timeout_cancels_coroutine(self, background):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            background.run(slow(), timeout=0.05)
+
+        background.run(asyncio.wait_for(cancelled.wait(), 1))
+
+    async def test_usable_from_inside_another_loop(self, background):
+        loop = background.run(_current_loop())
+
+        assert loop is not asyncio.get_running_loop()
+
+    def test_calling_from_background_loop_raises(self, background):
+        async def nested():
+            return background.run(_current_loop())
+
+        with pytest.raises(RuntimeError, match="inside it"):
+            background.run(nested())
+
+    def test_restarts_after_shutdown(self, background):
+        first = background.run(_current_loop())
+        background.shutdown()
+
+        second = background.run(_current_loop())
+
+        assert first.is_closed()
+        assert second is not first
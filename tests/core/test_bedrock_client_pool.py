@@ -0,0 +1,229 @@
+"""Tests for the pooled Bedrock client used by CachingAwsBedrock."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from agno.models.message import Message
+
+from dcaf.core.adapters.outbound.agno.bedrock_client_pool import BedrockClientPool
+from dcaf.core.adapters.outbound.agno.caching_bedrock import CachingAwsBedrock
+from dcaf.core.infrastructure.llm_capture import LLMCaptureConfig, configure_llm_capture
+
+
+class FakeClientContext:
+    """Stands in for the async context manager returned by session.client()."""
+
+    def __init__(self, kwargs):
+        self.kwargs = kwargs
+        self.client = object()
+        self.closed = False
+
+    async def __aenter__(self):
+        await asyncio.sleep(0)
+        return self.client
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self):
+        self.opened: list[FakeClientContext] = []
+
+    def client(self, **kwargs):
+        context = FakeClientContext(kwargs)
+        self.opened.append(context)
+        return context
+
+
+def _kwargs(region="us-east-1", **creds):
+    return {"service_name": "bedrock-runtime", "region_name": region, **creds}
+
+
+def _config(max_pool_connections):
+    return {"max_pool_connections": max_pool_connections}
+
+
+@pytest.fixture
+def pool():
+    return BedrockClientPool(max_pool_connections=7, max_clients=2)
+
+
+class TestBedrockClientPool:
+    async def test_reuses_client_across_calls(self, pool):
+        session = FakeSession()
+
+        for _ in range(3):
+            async with pool.client(session, _kwargs(), _config) as client:
+                assert client is session.opened[0].client
+
+        assert len(session.opened) == 1
+        assert session.opened[0].kwargs["config"] == {"max_pool_connections": 7}
+        stats = pool.stats()
+        assert (stats["misses"], stats["hits"], stats["open_clients"]) == (1, 2, 1)
+
+    async def test_concurrent_first_use_opens_one_client(self, pool):
+        session = FakeSession()
+        all_leased = asyncio.Event()
+
+        async def call():
+            async with pool.client(session, _kwargs(), _config) as client:
+                if pool.stats()["in_flight"] == 5:
+                    all_leased.set()
+                await all_leased.wait()
+                return client
+
+        clients = await asyncio.gather(*(call() for _ in range(5)))
+
+        assert len(session.opened) == 1
+        assert len(set(map(id, clients))) == 1
+        assert pool.stats()["peak_in_flight"] == 5
+        assert pool.stats()["in_flight"] == 0
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            _kwargs(region="eu-west-1"),
+            _kwargs(aws_access_key_id="AKIA2", aws_secret_access_key="secret"),
+        ],
+    )
+    async def test_region_and_credentials_get_own_client(self, pool, other):
+        session = FakeSession()
+
+        async with pool.client(session, _kwargs(), _config):
+            pass
+        async with pool.client(session, other, _config):
+            pass
+
+        assert len(session.opened) == 2
+
+    async def test_sessions_get_own_client(self, pool):
+        first, second = FakeSession(), FakeSession()
+
+        async with pool.client(first, _kwargs(), _config):
+            pass
+        async with pool.client(second, _kwargs(), _config):
+            pass
+
+        assert len(first.opened) == len(second.opened) == 1
+
+    async def test_evicts_least_recently_used_client(self, pool):
+        session = FakeSession()
+
+        for region in ("r1", "r2", "r1", "r3"):
+            async with pool.client(session, _kwargs(region=region), _config):
+                pass
+
+        closed = [c.kwargs["region_name"] for c in session.opened if c.closed]
+        assert closed == ["r2"]
+        assert pool.stats()["evictions"] == 1
+        assert pool.stats()["open_clients"] == 2
+
+    async def test_client_opened_during_eviction_is_not_evicted(self):
+        pool = BedrockClientPool(max_clients=1)
+        session = FakeSession()
+        async with pool.client(session, _kwargs("us-east-1"), _config):
+            pass
+        closing = asyncio.Event()
+
+        async def slow_close(*exc):
+            closing.set()
+            await asyncio.sleep(0.01)
+
+        session.opened[0].__aexit__ = slow_close
+
+        async def call(region):
+            async with pool.client(session, _kwargs(region), _config) as client:
+                return client
+
+        first = asyncio.create_task(call("us-west-2"))  # evicts us-east-1, slowly
+        await closing.wait()
+        await call("eu-west-1")  # over the limit while us-west-2 is still being handed out
+
+        assert await first is session.opened[1].client
+        assert not session.opened[1].closed
+
+    async def test_close_closes_all_clients(self, pool):
+        session = FakeSession()
+        async with pool.client(session, _kwargs(region="r1"), _config):
+            pass
+        async with pool.client(session, _kwargs(region="r2"), _config):
+            pass
+
+        await pool.close()
+
+        assert all(c.closed for c in session.opened)
+        assert pool.stats()["open_clients"] == 0
+
+    def test_clients_are_not_shared_across_event_loops(self, pool):
+        session = FakeSession()
+
+        async def call():
+            async with pool.client(session, _kwargs(), _config) as client:
+                return client
+
+        first = asyncio.run(call())
+        second = asyncio.run(call())
+
+        assert first is not second
+        assert pool.stats()["open_clients"] == 1
+
+
+class TestCachingAwsBedrockClient:
+    async def test_get_async_client_leases_from_pool(self, monkeypatch):
+        pool = BedrockClientPool(max_pool_connections=3)
+        monkeypatch.setattr(
+            "dcaf.core.adapters.outbound.agno.caching_bedrock.get_bedrock_client_pool",
+            lambda: pool,
+        )
+        session = FakeSession()
+        model = CachingAwsBedrock(
+            id="anthropic.claude-3-7-sonnet-20250219-v1:0",
+            aws_region="us-west-2",
+            async_session=session,
+        )
+
+        async with model.get_async_client():
+            pass
+        async with model.get_async_client():
+            pass
+
+        assert len(session.opened) == 1
+        kwargs = session.opened[0].kwargs
+        assert kwargs["region_name"] == "us-west-2"
+        assert kwargs["config"].max_pool_connections == 3
+        assert not session.opened[0].closed
+
+    async def test_stream_failure_is_still_captured(self, monkeypatch, tmp_path):
+        path = tmp_path / "capture.jsonl"
+        capture = configure_llm_capture(LLMCaptureConfig(enabled=True, path=str(path)))
+
+        async def stream():
+            yield {"contentBlockDelta": {"delta": {"text": "hi"}}}
+            raise ConnectionError("reset by peer")
+
+        class Client:
+            async def converse_stream(self, **_kwargs):
+                return {"stream": stream()}
+
+        @asynccontextmanager
+        async def client():
+            yield Client()
+
+        model = CachingAwsBedrock(id="anthropic.claude-3-7-sonnet-20250219-v1:0")
+        monkeypatch.setattr(model, "get_async_client", client)
+
+        with pytest.raises(ConnectionError):
+            async for _ in model.ainvoke_stream(
+                [Message(role="user", content="hello")], Message(role="assistant")
+            ):
+                pass
+        capture.close()
+        configure_llm_capture(LLMCaptureConfig())
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        (response,) = [r for r in records if r["kind"] == "response"]
+        assert response["payload"]["chunk_count"] == 1
+        assert response["payload"]["error"] == "ConnectionError: reset by peer"
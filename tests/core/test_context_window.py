@@ -0,0 +1,178 @@
+"""Tests for the token-budgeted conversation window."""
+
+import pytest
+
+from dcaf.core.adapters.outbound.agno.context_window import (
+    MESSAGE_OVERHEAD_TOKENS,
+    SUMMARY_PREFIX,
+    ConversationWindow,
+    build_summary_request,
+    default_history_budget,
+)
+from dcaf.llm.tokens import set_token_counter
+
+
+class WordCounter:
+    def count(self, text, model_id=None):
+        return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def word_counter():
+    set_token_counter(WordCounter(), memoize=False)
+    yield
+    set_token_counter(None)
+
+
+class FakeSummarizer:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def __call__(self, previous, messages):
+        self.calls.append((previous, [m["content"] for m in messages]))
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return f"summary-{len(self.calls)}"
+
+
+def _turns(count: int, words: int = 100) -> list[dict]:
+    """Alternating user/assistant messages, each ``words`` tokens long."""
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i} " + "w " * (words - 1)}
+        for i in range(count)
+    ]
+
+
+def _window(summarizer=None, max_tokens=2000) -> ConversationWindow:
+    window = ConversationWindow("model", max_tokens=max_tokens, summarizer=summarizer)
+    window.SUMMARY_RESERVE_TOKENS = 100
+    return window
+
+
+def _ids(messages: list[dict]) -> list[str]:
+    return [m["content"].split()[0] for m in messages]
+
+
+class TestConversationWindow:
+    async def test_history_within_budget_is_unchanged(self):
+        summarizer = FakeSummarizer()
+        messages = _turns(5)
+
+        result, report = await _window(summarizer).fit(messages)
+
+        assert result == messages
+        assert report.trimmed_messages == 0
+        assert report.history_tokens == 5 * (100 + MESSAGE_OVERHEAD_TOKENS)
+        assert summarizer.calls == []
+
+    async def test_older_turns_collapse_into_summary(self):
+        summarizer = FakeSummarizer()
+
+        result, report = await _window(summarizer).fit(_turns(25))
+
+        assert result[0] == {"role": "user", "content": SUMMARY_PREFIX + "summary-1"}
+        assert result[1]["role"] == "assistant"
+        # Kept turns start on a user message and end with the newest one
+        assert result[2]["role"] == "user"
+        assert _ids(result)[-1] == "m24"
+        assert report.summarized is True
+        assert report.trimmed_messages == len(summarizer.calls[0][1])
+        assert report.trimmed_tokens == report.trimmed_messages * 104
+        assert report.sent_tokens < 2000
+
+    async def test_summary_is_reused_on_following_turns(self):
+        summarizer = FakeSummarizer()
+        window = _window(summarizer)
+        first, _ = await window.fit(_turns(25))
+
+        second, report = await window.fit(_turns(27))
+
+        assert len(summarizer.calls) == 1
+        assert report.summarized is False
+        assert _ids(second)[:3] == _ids(first)[:3]
+
+    async def test_summary_rolls_forward_from_previous_summary(self):
+        summarizer = FakeSummarizer()
+        window = _window(summarizer)
+        await window.fit(_turns(25))
+        first_dropped = summarizer.calls[0][1]
+
+        _, report = await window.fit(_turns(45))
+
+        assert len(summarizer.calls) == 2
+        previous, dropped = summarizer.calls[1]
+        assert previous == "summary-1"
+        # Only the newly dropped turns are sent to the summarizer
+        assert dropped[0].split()[0] == f"m{len(first_dropped)}"
+        assert report.trimmed_messages == len(first_dropped) + len(dropped)
+
+    async def test_without_summarizer_older_turns_are_dropped(self):
+        result, report = await _window(None).fit(_turns(25))
+
+        assert result[0]["role"] == "user"
+        assert not result[0]["content"].startswith(SUMMARY_PREFIX)
+        assert report.trimmed_messages > 0
+        assert report.summary_tokens == 0
+
+    async def test_failed_summary_is_retried_next_turn(self):
+        summarizer = FakeSummarizer(fail=True)
+        window = _window(summarizer)
+
+        result, report = await window.fit(_turns(25))
+        assert report.trimmed_messages > 0
+        assert report.summarized is False
+        assert not result[0]["content"].startswith(SUMMARY_PREFIX)
+
+        summarizer.fail = False
+        _, report = await window.fit(_turns(25))
+        assert report.summarized is True
+        assert len(summarizer.calls) == 2
+
+    async def test_zero_budget_disables_window(self):
+        messages = _turns(50)
+
+        result, report = await _window(FakeSummarizer(), max_tokens=0).fit(messages)
+
+        assert result == messages
+        assert report.trimmed_messages == 0
+
+    async def test_newest_turn_kept_even_if_over_budget(self):
+        messages = _turns(3, words=5000)
+
+        result, _ = await _window(None).fit(messages)
+
+        assert _ids(result) == ["m2"]
+
+
+class TestHelpers:
+    def test_summary_request_includes_previous_summary_and_transcript(self):
+        request = build_summary_request("old summary", [{"role": "user", "content": "hi"}])
+
+        assert "old summary" in request
+        assert "user: hi" in request
+
+    def test_default_budget_capped_by_context_window(self):
+        assert default_history_budget("anthropic.claude-3-7-sonnet") == 24_000
+        assert default_history_budget("mistral.mistral-large") == 8_000
+
+
+class TestAdapterIntegration:
+    async def test_prepare_messages_applies_window(self, monkeypatch):
+        from dcaf.core.adapters.outbound.agno.adapter import AgnoAdapter
+
+        adapter = AgnoAdapter(model_config={"max_history_tokens": 2000, "summarize_history": False})
+        adapter._conversation_window.SUMMARY_RESERVE_TOKENS = 100
+
+        result, report = await adapter._prepare_messages(_turns(25))
+
+        assert report.trimmed_messages > 0
+        assert result[0]["role"] == "user"
+        assert _ids(result)[-1] == "m24"
+
+    def test_budget_from_env(self, monkeypatch):
+        from dcaf.core.adapters.outbound.agno.adapter import AgnoAdapter
+
+        monkeypatch.setenv("AGNO_MAX_HISTORY_TOKENS", "0")
+
+        assert AgnoAdapter()._conversation_window.max_tokens == 0
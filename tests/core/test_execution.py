@@ -0,0 +1,143 @@
+"""Tests for the async execution engine used by ServerAdapter."""
+
+import asyncio
+import time
+
+import pytest
+
+from dcaf.core.adapters.inbound.execution import (
+    ExecutionEngine,
+    ExecutionTimeoutError,
+    cap_output,
+)
+
+
+class TestCapOutput:
+    def test_short_text_unchanged(self):
+        assert cap_output("hello", 100) == "hello"
+
+    def test_long_text_truncated(self):
+        result = cap_output("a" * 1000, 100)
+
+        assert result.startswith("a" * 100)
+        assert "[output truncated: 900 more bytes]" in result
+
+    def test_zero_disables_cap(self):
+        assert cap_output("a" * 1000, 0) == "a" * 1000
+
+
+class TestGather:
+    async def test_results_in_order(self):
+        engine = ExecutionEngine()
+
+        async def call(i):
+            await asyncio.sleep(0.05 - i * 0.01)
+            return i
+
+        results = await engine.gather([lambda i=i: call(i) for i in range(5)])
+
+        assert results == [0, 1, 2, 3, 4]
+
+    async def test_calls_run_in_order_by_default(self):
+        engine = ExecutionEngine()
+        log = []
+
+        async def call(i):
+            log.append(("start", i))
+            await asyncio.sleep(0.01)
+            log.append(("end", i))
+
+        await engine.gather([lambda i=i: call(i) for i in range(2)])
+
+        assert log == [("start", 0), ("end", 0), ("start", 1), ("end", 1)]
+
+    async def test_calls_run_concurrently(self):
+        engine = ExecutionEngine(max_concurrency=4)
+
+        start = time.monotonic()
+        await engine.gather([lambda: asyncio.sleep(0.2) for _ in range(4)])
+
+        assert time.monotonic() - start < 0.6
+
+    async def test_concurrency_is_bounded(self):
+        engine = ExecutionEngine(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        await engine.gather([call for _ in range(6)])
+
+        assert peak == 2
+
+
+class TestRunSync:
+    async def test_does_not_block_event_loop(self):
+        engine = ExecutionEngine()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        result = await engine.run_sync(lambda: time.sleep(0.2) or "done")
+        task.cancel()
+
+        assert result == "done"
+        assert ticks > 5
+
+    async def test_timeout(self):
+        engine = ExecutionEngine(timeout=0.05)
+
+        with pytest.raises(ExecutionTimeoutError):
+            await engine.run_sync(time.sleep, 0.5)
+
+        engine.shutdown()
+
+
+class TestRunShell:
+    async def test_captures_stdout_and_stderr(self):
+        result = await ExecutionEngine().run_shell("echo out; echo err >&2; exit 3")
+
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert result.returncode == 3
+
+    async def test_runs_in_cwd(self, tmp_path):
+        (tmp_path / "marker.txt").write_text("x")
+
+        result = await ExecutionEngine().run_shell("ls", cwd=str(tmp_path))
+
+        assert "marker.txt" in result.stdout
+
+    async def test_output_capped(self):
+        result = await ExecutionEngine(max_output_bytes=100).run_shell("yes | head -c 100000")
+
+        assert len(result.stdout) < 200
+        assert "[output truncated: 99900 more bytes]" in result.stdout
+
+    async def test_timeout_kills_command(self):
+        engine = ExecutionEngine(timeout=0.2)
+
+        start = time.monotonic()
+        with pytest.raises(ExecutionTimeoutError):
+            await engine.run_shell("sleep 5; echo late")
+
+        assert time.monotonic() - start < 2
+
+    async def test_timeout_is_one_deadline_for_output_and_exit(self):
+        engine = ExecutionEngine(timeout=1.0)
+
+        start = time.monotonic()
+        with pytest.raises(ExecutionTimeoutError):
+            await engine.run_shell("sleep 0.8; exec >&- 2>&-; sleep 5")
+
+        assert time.monotonic() - start < 1.5
@@ -0,0 +1,234 @@
+"""Tests for running function agents (CallableAdapter) off the event loop."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from dcaf.core.infrastructure import HandlerPool
+from dcaf.core.llm import LLMStreamChunk
+from dcaf.core.primitives import AgentResult
+from dcaf.core.schemas.events import DoneEvent, ErrorEvent, TextDeltaEvent
+from dcaf.core.server import CallableAdapter
+
+REQUEST = {"messages": [{"role": "user", "content": "hi"}]}
+
+
+def counting_agent(messages, context, session):
+    # Module level, so it can be pickled into a worker process
+    session.set("count", session.get("count", 0) + 1)
+    return AgentResult(text=str(os.getpid()))
+
+
+class TestHandlerPool:
+    async def test_runs_on_worker_thread(self):
+        pool = HandlerPool(max_workers=2)
+
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("dcaf-handler")
+        pool.shutdown()
+
+    async def test_queue_depth_reported(self):
+        pool = HandlerPool(max_workers=1)
+        release = threading.Event()
+
+        tasks = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        stats = pool.stats()
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert stats["running"] == 1
+        assert stats["queued"] == 2
+        assert pool.stats()["completed"] == 3
+        assert pool.stats()["peak_queued"] >= 2
+
+    async def test_failures_counted_and_raised(self):
+        pool = HandlerPool(max_workers=1)
+
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await pool.run(boom)
+
+        assert pool.stats()["failed"] == 1
+
+    async def test_process_mode(self):
+        pool = HandlerPool(mode="process", max_workers=1)
+
+        pid = await pool.run(os.getpid)
+
+        assert pid != os.getpid()
+        pool.shutdown(wait=True)
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            HandlerPool(mode="fibers")  # type: ignore[arg-type]
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DCAF_HANDLER_POOL_MODE", "process")
+        monkeypatch.setenv("DCAF_HANDLER_POOL_WORKERS", "3")
+
+        pool = HandlerPool.from_env()
+
+        assert (pool.mode, pool.max_workers) == ("process", 3)
+
+
+class TestCallableAdapter:
+    async def test_sync_handler_does_not_block_event_loop(self):
+        def slow_agent(messages, context):
+            time.sleep(0.3)
+            return AgentResult(text="done")
+
+        adapter = CallableAdapter(slow_agent, pool=HandlerPool(max_workers=4))
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(adapter.ainvoke(REQUEST) for _ in range(4)))
+
+        assert [r.content for r in results] == ["done"] * 4
+        assert time.monotonic() - start < 1.0
+
+    async def test_process_mode_keeps_session_changes(self):
+        pool = HandlerPool(mode="process", max_workers=1)
+        request = {
+            "messages": [{"role": "user", "content": "hi", "data": {"session": {"count": 1}}}]
+        }
+
+        result = await CallableAdapter(counting_agent, pool=pool).ainvoke(request)
+        pool.shutdown(wait=True)
+
+        assert result.content != str(os.getpid())
+        assert result.data.session == {"count": 2}
+
+    def test_sync_invoke_kept_for_direct_callers(self):
+        async def async_agent(messages, context):
+            return AgentResult(text="async")
+
+        def agent(messages, context):
+            return {"text": None}
+
+        assert CallableAdapter(async_agent).invoke(REQUEST).content == "async"
+        assert CallableAdapter(agent).invoke(REQUEST).content == ""
+        assert [e.type for e in CallableAdapter(agent).invoke_stream(REQUEST)] == ["done"]
+
+    async def test_async_handler_awaited(self):
+        async def agent(messages, context, session):
+            session.set("seen", True)
+            return AgentResult(text=messages[-1]["content"])
+
+        result = await CallableAdapter(agent).ainvoke(REQUEST)
+
+        assert result.content == "hi"
+        assert result.data.session == {"seen": True}
+
+    async def test_handler_error_returned_as_message(self):
+        def agent(messages, context):
+            raise ValueError("bad input")
+
+        result = await CallableAdapter(agent).ainvoke(REQUEST)
+
+        assert result.content == "Error: bad input"
+
+    async def test_async_generator_handler_streams(self):
+        async def agent(messages, context):
+            yield "Hello, "
+            yield "world"
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert events == [TextDeltaEvent(text="Hello, "), TextDeltaEvent(text="world"), DoneEvent()]
+
+    async def test_sync_generator_handler_streams_on_pool(self):
+        threads = []
+
+        def agent(messages, context):
+            threads.append(threading.current_thread().name)
+            yield TextDeltaEvent(text="a")
+            yield "b"
+            yield DoneEvent()
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert [e.type for e in events] == ["text_delta", "text_delta", "done"]
+        assert threads[0].startswith("dcaf-handler")
+
+    async def test_generator_handler_invoke_collects_text(self):
+        async def agent(messages, context):
+            yield "a"
+            yield "b"
+
+        result = await CallableAdapter(agent).ainvoke(REQUEST)
+
+        assert result.content == "ab"
+
+    async def test_stream_error_event(self):
+        async def agent(messages, context):
+            yield "partial"
+            raise RuntimeError("lost connection")
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert events[-1] == ErrorEvent(error="lost connection")
+
+    async def test_handler_returning_async_iterator_streams(self):
+        async def astream():
+            yield LLMStreamChunk(text="Hel")
+            yield LLMStreamChunk(usage={"total_tokens": 3})
+            yield LLMStreamChunk(text="lo")
+
+        def agent(messages, context):
+            return astream()
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert events == [TextDeltaEvent(text="Hel"), TextDeltaEvent(text="lo"), DoneEvent()]
+
+    async def test_async_handler_returning_async_iterator_invoke(self):
+        async def astream():
+            yield LLMStreamChunk(text="a")
+            yield LLMStreamChunk(text="b")
+
+        async def agent(messages, context):
+            return astream()
+
+        result = await CallableAdapter(agent).ainvoke(REQUEST)
+
+        assert result.content == "ab"
+
+    async def test_streaming_handler_session_changes_kept(self):
+        async def agent(messages, context, session):
+            yield "a"
+            session.set("step", 2)
+            yield "b"
+
+        adapter = CallableAdapter(agent)
+
+        events = [e async for e in adapter.ainvoke_stream(REQUEST)]
+        result = await adapter.ainvoke(REQUEST)
+
+        assert events[-1] == DoneEvent(meta_data={"session": {"step": 2}})
+        assert (result.content, result.data.session) == ("ab", {"step": 2})
+
+    async def test_stream_of_plain_handler_carries_session(self):
+        def agent(messages, context, session):
+            session.set("seen", True)
+            return AgentResult(text="ok")
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert events == [
+            TextDeltaEvent(text="ok"),
+            DoneEvent(meta_data={"session": {"seen": True}}),
+        ]
+
+    async def test_handler_error_before_stream(self):
+        def agent(messages, context):
+            raise ValueError("bad input")
+
+        events = [e async for e in CallableAdapter(agent).ainvoke_stream(REQUEST)]
+
+        assert events == [TextDeltaEvent(text="Error: bad input"), DoneEvent()]
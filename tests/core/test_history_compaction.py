@@ -0,0 +1,71 @@
+"""Tests for compaction of re-injected execution history."""
+
+from dcaf.core.adapters.inbound.history_compaction import (
+    DUPLICATE_OUTPUT,
+    HistoryCompactor,
+    excerpt,
+)
+
+
+class TestExcerpt:
+    def test_short_text_unchanged(self):
+        assert excerpt("hello", 100) == "hello"
+
+    def test_keeps_head_and_tail(self):
+        text = "HEAD" + "x" * 1000 + "TAIL"
+
+        result = excerpt(text, 100)
+
+        assert result.startswith("HEAD")
+        assert result.endswith("TAIL")
+        assert "[908 bytes omitted]" in result
+
+    def test_does_not_split_multibyte_characters(self):
+        result = excerpt("é" * 100, 51)
+
+        result.encode()  # valid UTF-8
+        assert "omitted" in result
+
+
+class TestHistoryCompactor:
+    def test_small_history_unchanged(self):
+        outputs = ["pod-a Running", "pod-b Running"]
+
+        assert HistoryCompactor().compact(outputs) == outputs
+
+    def test_identical_outputs_sent_once(self):
+        output = "NAME READY STATUS\npod-a 1/1 Running"
+
+        result = HistoryCompactor().compact([output, "other", output])
+
+        assert result == [DUPLICATE_OUTPUT, "other", output]
+
+    def test_large_outputs_excerpted(self):
+        result = HistoryCompactor(max_output_bytes=100).compact(["a" * 1000])
+
+        assert len(result[0]) < 200
+        assert "omitted" in result[0]
+
+    def test_oldest_outputs_dropped_past_budget(self):
+        outputs = [f"{i}" * 400 for i in range(5)]
+
+        result = HistoryCompactor(max_total_bytes=1000).compact(outputs)
+
+        assert result[3:] == outputs[3:]
+        assert result[:3] == ["[output omitted: 400 bytes]"] * 3
+
+    def test_zero_limits_disable_compaction(self):
+        outputs = ["a" * 10_000, "b" * 10_000]
+
+        result = HistoryCompactor(max_output_bytes=0, max_total_bytes=0).compact(outputs)
+
+        assert result == outputs
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DCAF_HISTORY_OUTPUT_MAX_BYTES", "10")
+        monkeypatch.setenv("DCAF_HISTORY_OUTPUT_BUDGET_BYTES", "20")
+
+        compactor = HistoryCompactor.from_env()
+
+        assert compactor.max_output_bytes == 10
+        assert compactor.max_total_bytes == 20
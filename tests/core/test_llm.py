@@ -1,11 +1,14 @@
 """Tests for the LLM layer (dcaf.core.llm)."""
 
-from dataclasses import fields
+from dataclasses import dataclass, field, fields
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
 
-from dcaf.core.llm import LLM, LLMResponse, create_llm
+from dcaf.core.infrastructure.response_cache import ResponseCache
+from dcaf.core.llm import LLM, InferenceConfig, LLMResponse, LLMStreamChunk, create_llm
 
 # =============================================================================
 # LLMResponse Tests
@@ -196,20 +199,8 @@ class TestLLMAInvoke:
     @patch("dcaf.core.llm.get_default_gcp_metadata_manager")
     async def test_per_call_overrides(self, mock_gcp, mock_factory_cls):
         mock_gcp.return_value = MagicMock()
-
-        mock_model_response = MagicMock()
-        mock_model_response.content = "ok"
-        mock_model_response.tool_calls = None
-        mock_model_response.input_tokens = None
-        mock_model_response.output_tokens = None
-        mock_model_response.total_tokens = None
-
-        mock_model = MagicMock()
-        mock_model.ainvoke = AsyncMock(return_value=mock_model_response)
-
-        mock_factory = MagicMock()
-        mock_factory.create_model = AsyncMock(return_value=mock_model)
-        mock_factory_cls.return_value = mock_factory
+        model = _FakeModel()
+        mock_factory_cls.return_value.create_model = AsyncMock(return_value=model)
 
         llm = LLM(provider="bedrock", model="test-model", max_tokens=4096, temperature=0.1)
         await llm.ainvoke(
@@ -218,9 +209,219 @@ class TestLLMAInvoke:
             temperature=0.0,
         )
 
-        # Verify per-call overrides were applied to the model
-        assert mock_model.max_tokens == 200
-        assert mock_model.temperature == 0.0
+        # The call saw the overrides; the shared model was not changed
+        assert model.calls == [(200, 0.0)]
+        assert (model.max_tokens, model.temperature) == (4096, 0.1)
+
+    @patch("dcaf.core.llm.AgnoModelFactory")
+    @patch("dcaf.core.llm.get_default_gcp_metadata_manager")
+    async def test_concurrent_overrides_do_not_interfere(self, mock_gcp, mock_factory_cls):
+        import asyncio
+
+        mock_gcp.return_value = MagicMock()
+        model = _FakeModel()
+        mock_factory_cls.return_value.create_model = AsyncMock(return_value=model)
+
+        llm = LLM(provider="bedrock", model="test-model")
+        await asyncio.gather(
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}], max_tokens=100),
+            llm.ainvoke(messages=[{"role": "user", "content": "b"}], temperature=0.9),
+            llm.ainvoke(messages=[{"role": "user", "content": "c"}]),
+        )
+
+        assert sorted(model.calls) == sorted([(100, 0.1), (4096, 0.9), (4096, 0.1)])
+
+    async def test_coalesce_shares_identical_concurrent_calls(self):
+        import asyncio
+
+        model = _FakeModel()
+        llm = LLM(provider="bedrock", model="test-model", coalesce=True)
+        llm.get_model = AsyncMock(return_value=model)
+
+        responses = await asyncio.gather(
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}]),
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}]),
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}], max_tokens=100),
+        )
+
+        assert len(model.calls) == 2
+        assert responses[0] is responses[1]
+        assert llm.coalescer.stats()["coalesced"] == 1
+
+    async def test_cache_answers_repeated_call(self):
+        model = _FakeModel()
+        model.ainvoke = AsyncMock(return_value=ModelResponse(content="4"))
+        llm = LLM(provider="bedrock", model="test-model", temperature=0.0, cache=ResponseCache())
+        llm.get_model = AsyncMock(return_value=model)
+        messages = [{"role": "user", "content": "a"}]
+
+        first = await llm.ainvoke(messages=messages)
+        second = await llm.ainvoke(messages=messages)
+        await llm.ainvoke(messages=messages, system_prompt="Be brief.")
+
+        assert model.ainvoke.await_count == 2
+        assert second.text == first.text == "4"
+        assert llm.cache.stats()["hits"] == 1
+
+    async def test_cache_skips_sampled_calls(self):
+        model = _FakeModel()
+        llm = LLM(provider="bedrock", model="test-model", cache=ResponseCache())
+        llm.get_model = AsyncMock(return_value=model)
+        messages = [{"role": "user", "content": "a"}]
+
+        await llm.ainvoke(messages=messages, temperature=0.9)
+        await llm.ainvoke(messages=messages, temperature=0.9)
+
+        assert len(model.calls) == 2
+
+    async def test_no_coalescing_by_default(self):
+        import asyncio
+
+        model = _FakeModel()
+        llm = LLM(provider="bedrock", model="test-model")
+        llm.get_model = AsyncMock(return_value=model)
+
+        await asyncio.gather(
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}]),
+            llm.ainvoke(messages=[{"role": "user", "content": "a"}]),
+        )
+
+        assert len(model.calls) == 2
+        assert llm.coalescer is None
+
+
+@dataclass
+class _FakeModel:
+    """Model stand-in recording the settings each call ran with."""
+
+    max_tokens: int = 4096
+    temperature: float = 0.1
+    calls: list = field(default_factory=list)
+
+    async def ainvoke(self, **kwargs):
+        import asyncio
+
+        await asyncio.sleep(0.01)
+        self.calls.append((self.max_tokens, self.temperature))
+        response = MagicMock()
+        response.content = "ok"
+        response.tool_calls = None
+        return response
+
+
+@dataclass
+class _FakeStreamingModel(_FakeModel):
+    """Model stand-in streaming a fixed sequence of deltas."""
+
+    deltas: list = field(default_factory=list)
+
+    async def ainvoke_stream(self, **kwargs):
+        self.calls.append((self.max_tokens, self.temperature))
+        for delta in self.deltas:
+            yield delta
+
+
+class TestLLMAStream:
+    async def _collect(self, model, **kwargs):
+        llm = LLM(provider="bedrock", model="test-model")
+        llm.get_model = AsyncMock(return_value=model)
+        return [
+            c async for c in llm.astream(messages=[{"role": "user", "content": "Hi"}], **kwargs)
+        ]
+
+    async def test_yields_text_deltas(self):
+        model = _FakeStreamingModel(
+            deltas=[ModelResponse(content="Hel"), ModelResponse(content="lo"), ModelResponse()]
+        )
+
+        chunks = await self._collect(model)
+
+        assert [c.text for c in chunks] == ["Hel", "lo"]
+
+    async def test_tool_calls_normalized(self):
+        tool_call = {"function": {"name": "get_weather", "arguments": '{"city": "NYC"}'}}
+        model = _FakeStreamingModel(deltas=[ModelResponse(tool_calls=[tool_call])])
+
+        chunks = await self._collect(model)
+
+        assert chunks == [
+            LLMStreamChunk(tool_calls=[{"name": "get_weather", "input": {"city": "NYC"}}])
+        ]
+
+    async def test_usage_reported(self):
+        usage = Metrics(input_tokens=10, output_tokens=5, total_tokens=15)
+        model = _FakeStreamingModel(deltas=[ModelResponse(response_usage=usage)])
+
+        chunks = await self._collect(model)
+
+        assert chunks[-1].usage == {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+
+    async def test_overrides_not_applied_to_shared_model(self):
+        model = _FakeStreamingModel(deltas=[ModelResponse(content="ok")])
+
+        await self._collect(model, max_tokens=100, temperature=0.9)
+
+        assert model.calls == [(100, 0.9)]
+        assert (model.max_tokens, model.temperature) == (4096, 0.1)
+
+
+@dataclass
+class _FakeGeminiModel:
+    max_output_tokens: int = 4096
+    temperature: float = 0.1
+
+
+@dataclass
+class _FakeOllamaModel:
+    options: dict | None = None
+
+
+class TestInferenceConfig:
+    def test_default_returns_shared_model(self):
+        model = _FakeModel()
+
+        assert InferenceConfig().apply(model) is model
+
+    def test_overrides_apply_to_copy(self):
+        model = _FakeModel()
+
+        view = InferenceConfig(max_tokens=10).apply(model)
+
+        assert view is not model
+        assert (view.max_tokens, view.temperature) == (10, 0.1)
+        assert model.max_tokens == 4096
+        assert view.calls is model.calls
+
+    def test_gemini_attribute_names(self):
+        view = InferenceConfig(max_tokens=10, temperature=0.5).apply(_FakeGeminiModel())
+
+        assert (view.max_output_tokens, view.temperature) == (10, 0.5)
+
+    def test_ollama_options(self):
+        model = _FakeOllamaModel(options={"top_k": 5})
+
+        view = InferenceConfig(max_tokens=10).apply(model)
+
+        assert view.options == {"top_k": 5, "num_predict": 10}
+        assert model.options == {"top_k": 5}
+
+    def test_shared_client_created_before_copy(self):
+        @dataclass
+        class ClientModel:
+            max_tokens: int = 1
+            async_client: object | None = None
+
+            def get_async_client(self):
+                if self.async_client is None:
+                    self.async_client = object()
+                return self.async_client
+
+        model = ClientModel()
+
+        view = InferenceConfig(max_tokens=5).apply(model)
+
+        assert model.async_client is not None
+        assert view.async_client is model.async_client
 
 
 # =============================================================================
@@ -254,6 +455,31 @@ class TestLLMInvoke:
         assert isinstance(response, LLMResponse)
         assert response.text == "Sync hello"
 
+    @patch("dcaf.core.llm.AgnoModelFactory")
+    @patch("dcaf.core.llm.get_default_gcp_metadata_manager")
+    def test_sync_invoke_reuses_one_event_loop(self, mock_gcp, mock_factory_cls):
+        import asyncio
+
+        loops = []
+
+        async def ainvoke(**kwargs):
+            loops.append(asyncio.get_running_loop())
+            response = MagicMock()
+            response.content = "ok"
+            response.tool_calls = None
+            return response
+
+        mock_model = MagicMock()
+        mock_model.ainvoke = ainvoke
+        mock_factory_cls.return_value.create_model = AsyncMock(return_value=mock_model)
+
+        llm = LLM(provider="bedrock", model="test-model")
+        llm.invoke(messages=[{"role": "user", "content": "one"}])
+        llm.invoke(messages=[{"role": "user", "content": "two"}])
+
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+
 
 # =============================================================================
 # create_llm() factory
@@ -375,6 +601,21 @@ class TestConvertResponse:
         result = LLM._convert_response(mock_resp)
         assert result.tool_calls[0]["input"] == {"key": "value"}
 
+    def test_usage_includes_cache_tokens(self):
+        from agno.models.metrics import Metrics
+        from agno.models.response import ModelResponse
+
+        resp = ModelResponse(
+            content="hi",
+            input_tokens=10,
+            response_usage=Metrics(input_tokens=10, cache_read_tokens=900),
+        )
+
+        result = LLM._convert_response(resp)
+        assert result.usage["input_tokens"] == 10
+        assert result.usage["cache_read_tokens"] == 900
+        assert "cache_write_tokens" not in result.usage
+
 
 # =============================================================================
 # _build_messages
@@ -0,0 +1,133 @@
+"""Tests for LLM.abatch (dcaf.core.llm_batch)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dcaf.core.llm import LLM, LLMResponse
+from dcaf.core.llm_batch import estimate_request_tokens
+
+
+def _request(text: str) -> dict:
+    return {"messages": [{"role": "user", "content": text}]}
+
+
+@pytest.fixture
+def llm():
+    with (
+        patch("dcaf.core.llm.AgnoModelFactory") as factory_cls,
+        patch("dcaf.core.llm.get_default_gcp_metadata_manager"),
+    ):
+        factory_cls.return_value.create_model = AsyncMock(return_value=MagicMock())
+        yield LLM(provider="bedrock", model="test-model")
+
+
+class TestAbatch:
+    async def test_results_stream_in_completion_order(self, llm):
+        async def ainvoke(messages, **kwargs):
+            delay = float(messages[0]["content"])
+            await asyncio.sleep(delay)
+            return LLMResponse(text=str(delay), usage={"input_tokens": 3, "output_tokens": 2})
+
+        llm.ainvoke = ainvoke
+        batch = llm.abatch([_request("0.06"), _request("0.0"), _request("0.03")])
+
+        indexes = [result.index async for result in batch]
+
+        assert indexes == [1, 2, 0]
+        assert batch.stats.succeeded == 3
+        assert batch.stats.input_tokens == 9
+        assert batch.stats.output_tokens == 6
+
+    async def test_concurrency_is_bounded(self, llm):
+        running = peak = 0
+
+        async def ainvoke(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return LLMResponse(text="ok")
+
+        llm.ainvoke = ainvoke
+        results = await llm.abatch([_request("x")] * 10, max_concurrency=3).collect()
+
+        assert len(results) == 10
+        assert peak == 3
+
+    async def test_collect_returns_request_order(self, llm):
+        async def ainvoke(messages, **kwargs):
+            await asyncio.sleep(0.01 if messages[0]["content"] == "a" else 0)
+            return LLMResponse(text=messages[0]["content"])
+
+        llm.ainvoke = ainvoke
+        results = await llm.abatch([_request("a"), _request("b")]).collect()
+
+        assert [r.response.text for r in results] == ["a", "b"]
+
+    async def test_failed_item_retried(self, llm):
+        llm.ainvoke = AsyncMock(side_effect=[TimeoutError("timed out"), LLMResponse(text="ok")])
+
+        batch = llm.abatch([_request("x")], retry_backoff=0.001)
+        [result] = await batch.collect()
+
+        assert result.ok
+        assert result.attempts == 2
+        assert batch.stats.retries == 1
+
+    async def test_item_error_reported_without_aborting(self, llm):
+        async def ainvoke(messages, **kwargs):
+            if messages[0]["content"] == "bad":
+                raise ValueError("invalid request")
+            return LLMResponse(text="ok")
+
+        llm.ainvoke = ainvoke
+        batch = llm.abatch([_request("bad"), _request("good")], max_retries=1, retry_backoff=0)
+        results = await batch.collect()
+
+        assert not results[0].ok
+        assert isinstance(results[0].error, ValueError)
+        # Not a transient error, so not retried
+        assert results[0].attempts == 1
+        assert batch.stats.retries == 0
+        assert results[1].ok
+        assert (batch.stats.succeeded, batch.stats.failed) == (1, 1)
+
+    async def test_early_exit_cancels_in_flight_calls(self, llm):
+        cancelled = 0
+
+        async def ainvoke(messages, **kwargs):
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(0 if messages[0]["content"] == "fast" else 10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return LLMResponse(text="ok")
+
+        llm.ainvoke = ainvoke
+        async for _ in llm.abatch([_request("fast")] + [_request("slow")] * 3):
+            break
+        # The abandoned iterator is closed by the event loop
+        await asyncio.sleep(0.05)
+
+        assert cancelled == 3
+
+    async def test_batch_iterated_once(self, llm):
+        llm.ainvoke = AsyncMock(return_value=LLMResponse(text="ok"))
+        batch = llm.abatch([_request("x")])
+        await batch.collect()
+
+        with pytest.raises(RuntimeError):
+            await batch.collect()
+
+
+def test_estimate_request_tokens_counts_all_parts():
+    small = estimate_request_tokens(_request("hi"))
+    large = estimate_request_tokens(
+        {**_request("hi"), "system_prompt": "You are a helpful assistant. " * 20}
+    )
+
+    assert 0 < small < large
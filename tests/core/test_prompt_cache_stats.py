@@ -0,0 +1,150 @@
+"""Tests for prompt-cache telemetry."""
+
+from dcaf.core.adapters.outbound.agno.caching_bedrock import CachingAwsBedrock
+from dcaf.core.adapters.outbound.agno.prompt_cache_stats import (
+    PromptCacheStats,
+    cache_token_counts,
+    hash_prompt,
+)
+from dcaf.core.adapters.outbound.agno.response_converter import AgnoResponseConverter
+
+MODEL_ID = "anthropic.claude-3-7-sonnet-20250219-v1:0"
+
+
+class TestPromptCacheStats:
+    def test_counts_hits_writes_and_misses(self):
+        stats = PromptCacheStats()
+
+        stats.record("m", "h", {"inputTokens": 100, "cacheWriteInputTokens": 900})
+        stats.record("m", "h", {"inputTokens": 100, "cacheReadInputTokens": 900})
+        stats.record("m", "h", {"inputTokens": 1000})
+
+        (entry,) = stats.snapshot()
+        assert (entry["calls"], entry["hits"], entry["writes"], entry["misses"]) == (3, 1, 1, 1)
+        assert entry["cache_read_tokens"] == 900
+        assert entry["cache_write_tokens"] == 900
+        assert entry["hit_ratio"] == 1 / 3
+        assert entry["token_hit_ratio"] == 900 / 3000
+        assert entry["consecutive_misses"] == 1
+
+    def test_groups_by_model_and_prompt_hash(self):
+        stats = PromptCacheStats()
+
+        stats.record("m", "old", {"cacheReadInputTokens": 10})
+        stats.record("m", "new", {"cacheWriteInputTokens": 10})
+        stats.record("other", "new", {"cacheReadInputTokens": 10})
+
+        keys = {(e["model_id"], e["prompt_hash"]) for e in stats.snapshot()}
+        assert keys == {("m", "old"), ("m", "new"), ("other", "new")}
+
+    def test_least_recently_called_groups_forgotten(self):
+        stats = PromptCacheStats(max_entries=2)
+
+        stats.record("m", "a", {"inputTokens": 1})
+        stats.record("m", "b", {"inputTokens": 1})
+        stats.record("m", "a", {"inputTokens": 1})
+        stats.record("m", "c", {"inputTokens": 1})
+
+        assert {e["prompt_hash"] for e in stats.snapshot()} == {"a", "c"}
+
+    def test_reset(self):
+        stats = PromptCacheStats()
+        stats.record("m", "h", {"inputTokens": 1})
+
+        stats.reset()
+
+        assert stats.snapshot() == []
+
+    def test_cache_creation_tokens_count_as_writes(self):
+        assert cache_token_counts({"cacheCreationInputTokens": 7}) == (0, 7)
+
+
+class TestCachingBedrockTelemetry:
+    def _body(self, static: str) -> dict:
+        return {
+            "system": [
+                {"text": static},
+                {"cachePoint": {"type": "default"}},
+                {"text": "Tenant: acme"},
+            ]
+        }
+
+    def test_get_metrics_includes_cache_tokens(self):
+        model = CachingAwsBedrock(id=MODEL_ID)
+
+        metrics = model._get_metrics(
+            {
+                "inputTokens": 10,
+                "outputTokens": 5,
+                "cacheReadInputTokens": 900,
+                "cacheWriteInputTokens": 0,
+            }
+        )
+
+        assert metrics.input_tokens == 10
+        assert metrics.cache_read_tokens == 900
+        assert metrics.cache_write_tokens == 0
+
+    def test_static_prompt_hash_ignores_dynamic_part(self):
+        body = self._body("Static instructions.")
+        other_tenant = self._body("Static instructions.")
+        other_tenant["system"][2]["text"] = "Tenant: globex"
+
+        assert CachingAwsBedrock._static_prompt_hash(body) == hash_prompt("Static instructions.")
+        assert CachingAwsBedrock._static_prompt_hash(
+            other_tenant
+        ) == CachingAwsBedrock._static_prompt_hash(body)
+        assert CachingAwsBedrock._static_prompt_hash(
+            self._body("Changed instructions.")
+        ) != CachingAwsBedrock._static_prompt_hash(body)
+
+    def test_record_cache_usage_only_when_caching_enabled(self, monkeypatch):
+        stats = PromptCacheStats()
+        monkeypatch.setattr(
+            "dcaf.core.adapters.outbound.agno.caching_bedrock.get_prompt_cache_stats",
+            lambda: stats,
+        )
+        usage = {"inputTokens": 10, "cacheReadInputTokens": 900}
+
+        CachingAwsBedrock(id=MODEL_ID)._record_cache_usage(self._body("s"), usage)
+        assert stats.snapshot() == []
+
+        CachingAwsBedrock(id=MODEL_ID, cache_tools=True)._record_cache_usage(self._body("s"), usage)
+        (entry,) = stats.snapshot()
+        assert entry["model_id"] == MODEL_ID
+        assert entry["hits"] == 1
+
+
+class TestUsageInResponseMetadata:
+    def test_convert_run_output_adds_usage(self):
+        from agno.models.metrics import Metrics
+        from agno.run.agent import RunOutput
+
+        run_output = RunOutput(
+            content="done",
+            metrics=Metrics(
+                input_tokens=10,
+                output_tokens=5,
+                total_tokens=15,
+                cache_read_tokens=900,
+                cache_write_tokens=0,
+            ),
+        )
+
+        response = AgnoResponseConverter().convert_run_output(run_output, conversation_id="c1")
+
+        usage = response.metadata["usage"]
+        assert usage["input_tokens"] == 10
+        assert usage["cache_read_tokens"] == 900
+        assert usage["cache_write_tokens"] == 0
+
+    def test_agent_reads_usage_from_message_end(self):
+        from dcaf.core.agent import Agent
+        from dcaf.core.application.dto.responses import AgentResponse, StreamEvent
+
+        response = AgentResponse(
+            conversation_id="c1", text="done", metadata={"usage": {"cache_read_tokens": 900}}
+        )
+
+        assert Agent._stream_usage(StreamEvent.message_end(response)) == {"cache_read_tokens": 900}
+        assert Agent._stream_usage(StreamEvent.message_start()) == {}
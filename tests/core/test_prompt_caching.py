@@ -1,8 +1,12 @@
 """Tests for Bedrock prompt caching functionality."""
 
+import asyncio
 import logging
 
+from agno.models.message import Message
+
 from dcaf.core.adapters.outbound.agno.caching_bedrock import CachingAwsBedrock
+from dcaf.core.adapters.outbound.agno.run_context import run_scope
 
 
 class TestCachingAwsBedrock:
@@ -148,6 +152,150 @@ class TestCachingAwsBedrock:
         assert "950 tokens" in caplog.text
 
 
+class TestRunScopedSystemParts:
+    """System prompt parts published by the active run override the model defaults."""
+
+    def _model(self, **kwargs) -> CachingAwsBedrock:
+        return CachingAwsBedrock(
+            id="anthropic.claude-3-7-sonnet-20250219-v1:0",
+            cache_system_prompt=True,
+            **kwargs,
+        )
+
+    def test_run_parts_override_constructor_parts(self):
+        """Parts from run_scope are used instead of the constructor values."""
+        model = self._model(static_system="Default static." * 300)
+
+        with run_scope(static_system="Run static prompt." * 300, dynamic_system="Tenant: acme"):
+            result = model._build_cached_system_message()
+
+        assert result[0]["text"].startswith("Run static prompt.")
+        assert result[2] == {"text": "Tenant: acme"}
+
+    def test_constructor_parts_used_outside_a_run(self):
+        """Without an active run the constructor values still apply."""
+        model = self._model(dynamic_system="Default dynamic.")
+
+        with run_scope(dynamic_system="Run dynamic."):
+            pass
+
+        assert model._build_cached_system_message() == [{"text": "Default dynamic."}]
+
+    async def test_concurrent_runs_are_isolated(self):
+        """Concurrent requests sharing one model each see their own parts."""
+        model = self._model()
+        static = "Shared instructions." * 300
+
+        async def run(tenant: str) -> list[dict]:
+            with run_scope(static_system=static, dynamic_system=f"Tenant: {tenant}"):
+                await asyncio.sleep(0)  # let the other run publish its parts
+                return model._build_cached_system_message()
+
+        results = await asyncio.gather(*(run(t) for t in ("acme", "globex", "initech")))
+
+        assert [r[2]["text"] for r in results] == [
+            "Tenant: acme",
+            "Tenant: globex",
+            "Tenant: initech",
+        ]
+        assert model._static_system is None
+        assert model._dynamic_system is None
+
+
+class TestCacheCheckpoints:
+    """Tests for tool and conversation cache checkpoints."""
+
+    CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+    TOOLS = [
+        {
+            "type": "function",
+            "function": {
+                "name": f"tool_{i}",
+                "description": "A tool",
+                "parameters": {"type": "object", "properties": {}},
+            },
+        }
+        for i in range(3)
+    ]
+
+    def _model(self, **kwargs) -> CachingAwsBedrock:
+        return CachingAwsBedrock(id="anthropic.claude-3-7-sonnet-20250219-v1:0", **kwargs)
+
+    def _conversation(self) -> list[Message]:
+        return [
+            Message(role="user", content="list my pods"),
+            Message(role="assistant", content="calling tools"),
+            Message(role="user", content="tool output"),
+            Message(role="assistant", content="more tools"),
+            Message(role="user", content="more output"),
+        ]
+
+    def _checkpointed(self, formatted: list[dict]) -> list[int]:
+        return [i for i, m in enumerate(formatted) if self.CACHE_POINT in m["content"]]
+
+    def test_no_checkpoints_by_default(self):
+        formatted, body = self._model()._build_request(self._conversation(), self.TOOLS, False)
+
+        assert self.CACHE_POINT not in body["toolConfig"]["tools"]
+        assert self._checkpointed(formatted) == []
+
+    def test_tool_checkpoint_after_definitions(self):
+        _, body = self._model(cache_tools=True)._build_request(
+            self._conversation(), self.TOOLS, False
+        )
+
+        tools = body["toolConfig"]["tools"]
+        assert len(tools) == 4
+        assert tools[-1] == self.CACHE_POINT
+
+    def test_rolling_checkpoints_on_latest_user_turns(self):
+        formatted, _ = self._model(cache_messages=True)._build_request(
+            self._conversation(), None, False
+        )
+
+        assert self._checkpointed(formatted) == [2, 4]
+
+    def test_checkpoints_roll_forward_as_conversation_grows(self):
+        model = self._model(cache_messages=True)
+        conversation = self._conversation()
+        first, _ = model._build_request(conversation, None, False)
+
+        conversation += [
+            Message(role="assistant", content="final tool"),
+            Message(role="user", content="final output"),
+        ]
+        second, _ = model._build_request(conversation, None, False)
+
+        # The newest turn of the first request is the cache-hit point of the second
+        assert self._checkpointed(first) == [2, 4]
+        assert self._checkpointed(second) == [4, 6]
+
+    def test_message_checkpoints_do_not_mutate_input(self):
+        messages = [{"role": "user", "content": [{"text": "hi"}]}]
+
+        result = CachingAwsBedrock._add_message_checkpoints(messages, 1)
+
+        assert messages == [{"role": "user", "content": [{"text": "hi"}]}]
+        assert result[0]["content"][-1] == self.CACHE_POINT
+
+    def test_checkpoint_limit_respected(self):
+        model = self._model(
+            cache_system_prompt=True,
+            cache_tools=True,
+            cache_messages=True,
+            static_system="Static instructions." * 300,
+        )
+        model.MAX_CACHE_CHECKPOINTS = 3
+
+        formatted, body = model._build_request(self._conversation(), self.TOOLS, False)
+
+        assert self.CACHE_POINT in body["system"]
+        assert body["toolConfig"]["tools"][-1] == self.CACHE_POINT
+        # Only one checkpoint left for the conversation: the newest user turn
+        assert self._checkpointed(formatted) == [4]
+
+
 class TestAgentWithCaching:
     """Tests for Agent class with caching enabled."""
 
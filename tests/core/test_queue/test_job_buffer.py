@@ -0,0 +1,155 @@
+"""Tests for the retention policy of JobBuffer."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+from dcaf.core.queue.buffer import BufferLimits, JobBuffer
+from dcaf.core.queue.models import JobEvent, JobStatus
+
+
+def _status(job_id: str = "job-1", status: str = "queued") -> JobStatus:
+    return JobStatus(
+        job_id=job_id, status=status, agent_name="test-agent", created_at=datetime.now(UTC)
+    )
+
+
+def _emit(buffer: JobBuffer, event_type: str = "log", job_id: str = "job-1", size: int = 10):
+    event = JobEvent(job_id=job_id, event_type=event_type)
+    event.seq = buffer.next_seq(job_id)
+    buffer.append(event, size)
+    return event
+
+
+def test_events_after_cursor() -> None:
+    buffer = JobBuffer(BufferLimits())
+    for _ in range(3):
+        _emit(buffer)
+
+    assert [e.seq for e in buffer.events("job-1", after=1)] == [1, 2]
+    assert buffer.events("unknown") == []
+
+
+def test_per_job_cap_spills_oldest_events() -> None:
+    buffer = JobBuffer(BufferLimits(max_events_per_job=2))
+    for _ in range(5):
+        _emit(buffer)
+
+    assert [e.seq for e in buffer.events("job-1")] == [3, 4]
+    assert buffer.spilled_before("job-1") == 3
+    assert buffer.stats()["spilled_events"] == 3
+    assert _emit(buffer).seq == 5
+
+
+def test_finished_job_expires_after_ttl() -> None:
+    buffer = JobBuffer(BufferLimits(finished_ttl_seconds=0.01))
+    buffer.set_status(_status())
+    _emit(buffer)
+    _emit(buffer, "done")
+    assert buffer.get_status("job-1") is not None
+    assert buffer.terminal_seq("job-1") == 1
+
+    time.sleep(0.02)
+
+    assert buffer.get_status("job-1") is None
+    assert buffer.stats()["expired_jobs"] == 1
+    assert buffer.needs_replay("job-1")
+
+
+def test_running_job_does_not_expire() -> None:
+    buffer = JobBuffer(BufferLimits(finished_ttl_seconds=0.0))
+    buffer.set_status(_status(status="running"))
+
+    assert buffer.get_status("job-1") is not None
+
+
+def test_unfinished_job_dropped_when_idle() -> None:
+    buffer = JobBuffer(BufferLimits(idle_ttl_seconds=0.05))
+    buffer.set_status(_status("stalled", status="running"))
+    buffer.set_status(_status("active", status="running"))
+
+    time.sleep(0.03)
+    _emit(buffer, job_id="active")
+    time.sleep(0.03)
+
+    assert buffer.get_status("stalled") is None
+    assert buffer.get_status("active") is not None
+    assert buffer.stats()["idle_jobs"] == 1
+    assert buffer.needs_replay("stalled")
+
+
+def test_job_cap_drops_least_recently_used_finished_job_first() -> None:
+    buffer = JobBuffer(BufferLimits(max_jobs=2))
+    buffer.set_status(_status("finished"))
+    _emit(buffer, "done", job_id="finished")
+    buffer.set_status(_status("running", status="running"))
+    buffer.get_status("finished")  # most recently used, but finished
+
+    buffer.set_status(_status("new"))
+
+    assert buffer.get_status("finished") is None
+    assert buffer.get_status("running") is not None
+    assert buffer.stats()["evicted_jobs"] == 1
+
+
+def test_job_cap_spills_running_jobs_instead_of_dropping_them() -> None:
+    buffer = JobBuffer(BufferLimits(max_jobs=2))
+    for job_id in ("job-1", "job-2", "job-3"):
+        buffer.set_status(_status(job_id, status="running"))
+        _emit(buffer, job_id=job_id)
+        _emit(buffer, job_id=job_id)
+
+    assert all(buffer.get_status(job_id) for job_id in ("job-1", "job-2", "job-3"))
+    assert buffer.events("job-1") == []
+    assert buffer.spilled_before("job-1") == 2
+    assert len(buffer.events("job-3")) == 2
+    assert buffer.stats()["evicted_jobs"] == 0
+    assert _emit(buffer, job_id="job-1").seq == 2
+
+
+def test_byte_cap_spills_running_jobs_but_keeps_their_status() -> None:
+    buffer = JobBuffer(BufferLimits(max_bytes=100))
+    buffer.set_status(_status(status="running"))
+    for _ in range(15):
+        _emit(buffer, size=10)
+
+    stats = buffer.stats()
+    assert stats["bytes"] <= 100
+    assert stats["events"] == len(buffer.events("job-1"))
+    assert buffer.get_status("job-1") is not None
+    assert _emit(buffer).seq == 15
+
+
+def test_restore_keeps_newest_events_and_sequence() -> None:
+    buffer = JobBuffer(BufferLimits(max_events_per_job=2))
+    events = [JobEvent(job_id="job-1", event_type="log", seq=seq) for seq in range(4)]
+
+    buffer.restore("job-1", [(event, 10) for event in events])
+
+    assert [e.seq for e in buffer.events("job-1")] == [2, 3]
+    assert buffer.spilled_before("job-1") == 2
+    assert not buffer.needs_replay("job-1")
+    assert _emit(buffer).seq == 4
+
+
+def test_restore_ignored_when_events_buffered() -> None:
+    buffer = JobBuffer(BufferLimits())
+    _emit(buffer)
+
+    buffer.restore("job-1", [(JobEvent(job_id="job-1", event_type="done", seq=0), 10)])
+
+    assert [e.event_type for e in buffer.events("job-1")] == ["log"]
+
+
+def test_limits_from_env(monkeypatch) -> None:
+    monkeypatch.setenv("DCAF_JOBS_BUFFER_TTL_SECONDS", "60")
+    monkeypatch.setenv("DCAF_JOBS_BUFFER_IDLE_TTL_SECONDS", "600")
+    monkeypatch.setenv("DCAF_JOBS_BUFFER_MAX_EVENTS_PER_JOB", "50")
+
+    limits = BufferLimits.from_env()
+
+    assert limits.finished_ttl_seconds == 60.0
+    assert limits.idle_ttl_seconds == 600.0
+    assert limits.max_events_per_job == 50
+    assert limits.max_jobs == BufferLimits.max_jobs
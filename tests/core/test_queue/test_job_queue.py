@@ -0,0 +1,464 @@
+"""Tests for NatsJobQueue buffering and event delivery (NATS mocked)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from dcaf.core.queue.buffer import BufferLimits
+from dcaf.core.queue.interface import JobQueue
+from dcaf.core.queue.models import JobEvent, JobRequest, JobStatus
+from dcaf.core.queue.nats_js import NatsJobQueue
+from dcaf.core.queue.router import create_queue_router
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_queue() -> NatsJobQueue:
+    """Return a NatsJobQueue whose JetStream context is a mock."""
+    queue = NatsJobQueue(nats_url="nats://test", agent_name="test-agent")
+    queue._js = MagicMock()
+    queue._js.publish = AsyncMock()
+    return queue
+
+
+async def _enqueue(queue: NatsJobQueue, job_id: str = "job-1") -> str:
+    return await queue.enqueue(JobRequest(job_id=job_id, agent_name="test-agent", messages=[]))
+
+
+def _event(event_type: str, job_id: str = "job-1", **data: str) -> JobEvent:
+    return JobEvent(job_id=job_id, event_type=event_type, data=data or None)
+
+
+# ---------------------------------------------------------------------------
+# watch_events
+# ---------------------------------------------------------------------------
+
+
+async def test_watch_delivers_events_when_emitted() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    await queue.emit_event(_event("log", message="first"))
+    received: list[tuple[float, list[int]]] = []
+
+    async def watch() -> None:
+        async for batch in queue.watch_events("job-1"):
+            received.append((time.monotonic(), [e.seq for e in batch]))
+
+    watcher = asyncio.create_task(watch())
+    await asyncio.sleep(0.01)
+    emitted_at = time.monotonic()
+    await queue.emit_event(_event("log", message="second"))
+    await queue.emit_event(_event("done"))
+    await asyncio.wait_for(watcher, 1)
+
+    assert [seq for _, seqs in received for seq in seqs] == [0, 1, 2]
+    assert received[-1][0] - emitted_at < 0.1
+
+
+async def test_watch_resumes_after_cursor_and_stops_at_terminal() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    for event_type in ("log", "log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    batches = [batch async for batch in queue.watch_events("job-1", after=1)]
+
+    assert [[e.seq for e in batch] for batch in batches] == [[1, 2]]
+
+
+async def test_watch_after_terminal_event_ends() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    for event_type in ("log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    batches = [batch async for batch in queue.watch_events("job-1", after=2, keepalive=0.05)]
+
+    assert batches == []
+
+
+async def test_watch_after_terminal_event_of_replayed_job_ends() -> None:
+    queue = _make_queue()
+    events = [_event("log"), _event("done")]
+    for seq, event in enumerate(events):
+        event.seq = seq
+    queue._read_from_jetstream = AsyncMock(return_value=[(event, 10) for event in events])
+
+    batches = [batch async for batch in queue.watch_events("job-1", after=2, keepalive=0.05)]
+
+    assert batches == []
+
+
+async def test_watch_keepalive_when_idle() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    queue._read_from_jetstream = AsyncMock(return_value=[])  # nothing to replay
+    watch = queue.watch_events("job-1", keepalive=0.01)
+
+    assert await anext(watch) == []
+    await watch.aclose()
+
+
+async def test_disconnected_watchers_leave_nothing_behind() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    queue._read_from_jetstream = AsyncMock(return_value=[])
+    watchers = [asyncio.create_task(anext(queue.watch_events("job-1"))) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    assert "job-1" in queue._new_events
+
+    watchers[0].cancel()
+    await asyncio.sleep(0)
+    assert "job-1" in queue._new_events  # still awaited by the other watcher
+    watchers[1].cancel()
+    await asyncio.gather(*watchers, return_exceptions=True)
+
+    assert queue._new_events == {}
+    assert queue._waiting == {}
+
+
+async def test_default_watch_polls_get_events() -> None:
+    events = [_event("log"), _event("done")]
+    for seq, event in enumerate(events):
+        event.seq = seq
+
+    class ListQueue(JobQueue):
+        connect = enqueue = subscribe_jobs = emit_event = close = AsyncMock()
+        publish = subscribe = AsyncMock()
+
+        async def get_status(self, job_id: str) -> JobStatus | None:
+            return None
+
+        async def get_events(self, job_id: str, after: int = 0) -> list[JobEvent]:
+            return events[after:]
+
+    batches = [batch async for batch in ListQueue().watch_events("job-1")]
+
+    assert batches == [events]
+    resumed = ListQueue().watch_events("job-1", after=2, keepalive=0.05)
+    assert [batch async for batch in resumed] == []
+
+
+# ---------------------------------------------------------------------------
+# SSE router
+# ---------------------------------------------------------------------------
+
+
+def _client(queue: NatsJobQueue) -> TestClient:
+    app = FastAPI()
+    app.include_router(create_queue_router(queue))
+    return TestClient(app)
+
+
+async def test_sse_stream_sends_events_until_terminal() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    for event_type in ("status", "log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    body = _client(queue).get("/api/jobs/job-1/events/stream").text
+
+    assert [line for line in body.splitlines() if line.startswith("id:")] == [
+        "id: 0",
+        "id: 1",
+        "id: 2",
+    ]
+
+
+async def test_sse_last_event_id_resumes_after_received_event() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    for event_type in ("status", "log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    response = _client(queue).get("/api/jobs/job-1/events/stream", headers={"Last-Event-ID": "0"})
+
+    assert [line for line in response.text.splitlines() if line.startswith("id:")] == [
+        "id: 1",
+        "id: 2",
+    ]
+
+
+async def test_sse_reconnect_after_done_ends_stream() -> None:
+    queue = _make_queue()
+    await _enqueue(queue)
+    for event_type in ("status", "log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    response = _client(queue).get("/api/jobs/job-1/events/stream", headers={"Last-Event-ID": "2"})
+
+    assert response.status_code == 200
+    assert "id:" not in response.text
+
+
+async def test_sse_unknown_job_404() -> None:
+    assert _client(_make_queue()).get("/api/jobs/missing/events/stream").status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Bounded buffer
+# ---------------------------------------------------------------------------
+
+
+async def test_spilled_events_are_read_back_from_jetstream() -> None:
+    queue = NatsJobQueue(
+        nats_url="nats://test",
+        agent_name="test-agent",
+        buffer_limits=BufferLimits(max_events_per_job=2),
+    )
+    queue._js = MagicMock()
+    published: list[tuple[JobEvent, int]] = []
+
+    async def publish(subject: str, payload: bytes) -> None:
+        if subject.startswith("dcaf.jobs.out."):
+            published.append((JobEvent.model_validate_json(payload), len(payload)))
+
+    queue._js.publish = publish
+    queue._read_from_jetstream = AsyncMock(return_value=published)
+    await _enqueue(queue)
+    for event_type in ("log", "log", "log", "done"):
+        await queue.emit_event(_event(event_type))
+
+    assert [e.seq for e in await queue.get_events("job-1", after=1)] == [1, 2, 3]
+    assert [e.seq for e in await queue.get_events("job-1", after=2)] == [2, 3]
+    queue._read_from_jetstream.assert_awaited_once()
+    assert queue.buffer_stats()["events"] == 2
+
+
+async def test_dropped_job_events_are_replayed() -> None:
+    queue = _make_queue()
+    stored = [(JobEvent(job_id="job-1", event_type="done", seq=0), 10)]
+    queue._read_from_jetstream = AsyncMock(return_value=stored)
+
+    assert [e.event_type for e in await queue.get_events("job-1")] == ["done"]
+    assert [e.event_type for e in await queue.get_events("job-1")] == ["done"]
+    queue._read_from_jetstream.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# subscribe
+# ---------------------------------------------------------------------------
+
+
+class _FakeSubscription:
+    """Pull subscription serving queued messages; records fetch batch sizes."""
+
+    def __init__(self, count: int) -> None:
+        self.pending = [self._message(f"job-{i}") for i in range(count)]
+        self.batches: list[int] = []
+
+    @staticmethod
+    def _message(job_id: str) -> MagicMock:
+        msg = MagicMock()
+        request = JobRequest(job_id=job_id, agent_name="test-agent", messages=[])
+        msg.data = request.model_dump_json().encode()
+        msg.ack, msg.nak, msg.in_progress = AsyncMock(), AsyncMock(), AsyncMock()
+        return msg
+
+    async def fetch(self, batch: int, timeout: float) -> list[MagicMock]:
+        if not self.pending:
+            await asyncio.sleep(0.01)
+            raise TimeoutError
+        self.batches.append(batch)
+        msgs, self.pending = self.pending[:batch], self.pending[batch:]
+        return msgs
+
+
+def _subscriber(count: int, **kwargs: object) -> tuple[NatsJobQueue, _FakeSubscription]:
+    queue = NatsJobQueue(nats_url="nats://test", agent_name="test-agent", **kwargs)
+    sub = _FakeSubscription(count)
+    queue._js = MagicMock()
+    queue._js.pull_subscribe = AsyncMock(return_value=sub)
+    queue._ensure_consumer = AsyncMock()
+    return queue, sub
+
+
+async def _run_until(queue: NatsJobQueue, handler, condition) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.create_task(queue.subscribe_jobs(handler, stop))
+    for _ in range(200):
+        if condition():
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(loop, 3)
+
+
+async def test_subscribe_runs_handlers_concurrently() -> None:
+    queue, sub = _subscriber(5, max_in_flight=3)
+    running, peak, done = 0, 0, []
+
+    async def handler(job: JobRequest, handle) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        await handle.ack()
+        done.append(job.job_id)
+
+    await _run_until(queue, handler, lambda: len(done) == 5)
+
+    assert peak == 3
+    assert sorted(done) == [f"job-{i}" for i in range(5)]
+    assert sub.batches[0] == 3
+    assert all(batch <= 3 for batch in sub.batches)
+
+
+async def test_subscribe_heartbeats_and_naks_failed_jobs() -> None:
+    queue, sub = _subscriber(1, heartbeat_interval=0.01)
+    msg = sub.pending[0]
+    finished = asyncio.Event()
+
+    async def handler(job: JobRequest, handle) -> None:
+        await asyncio.sleep(0.05)
+        finished.set()
+        raise RuntimeError("boom")
+
+    await _run_until(queue, handler, finished.is_set)
+
+    assert msg.in_progress.await_count >= 2
+    msg.nak.assert_awaited_once()
+
+
+async def test_subscribe_stop_waits_for_running_handlers() -> None:
+    queue, sub = _subscriber(1, shutdown_timeout=1.0)
+    started, finished = asyncio.Event(), asyncio.Event()
+
+    async def handler(job: JobRequest, handle) -> None:
+        started.set()
+        await asyncio.sleep(0.05)
+        finished.set()
+
+    await _run_until(queue, handler, started.is_set)
+
+    assert finished.is_set()
+
+
+async def test_subscribe_cancels_handlers_after_shutdown_timeout() -> None:
+    queue, sub = _subscriber(1, shutdown_timeout=0.01)
+    msg = sub.pending[0]
+    started = asyncio.Event()
+
+    async def handler(job: JobRequest, handle) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    await _run_until(queue, handler, started.is_set)
+
+    msg.nak.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# Replay from DCAF_JOBS_OUT
+# ---------------------------------------------------------------------------
+
+
+class _OrderedSubscription:
+    """Ordered consumer stand-in delivering stored events, then nothing."""
+
+    def __init__(self, events: list[JobEvent]) -> None:
+        self.pending = list(events)
+        self.unsubscribe = AsyncMock()
+
+    async def next_msg(self, timeout: float) -> MagicMock:
+        if not self.pending:
+            await asyncio.sleep(timeout)  # a real consumer would wait for new messages
+            raise TimeoutError
+        event = self.pending.pop(0)
+        msg = MagicMock()
+        msg.data = event.model_dump_json().encode()
+        msg.metadata.sequence.stream = 100 + event.seq
+        return msg
+
+
+def _stored_queue(events: list[JobEvent]) -> tuple[NatsJobQueue, _OrderedSubscription]:
+    queue = _make_queue()
+    sub = _OrderedSubscription(events)
+
+    async def subscribe(subject: str, **kwargs: object) -> _OrderedSubscription:
+        await asyncio.sleep(0.01)
+        return sub
+
+    queue._js.get_last_msg = AsyncMock(return_value=MagicMock(seq=100 + events[-1].seq))
+    queue._js.subscribe = AsyncMock(side_effect=subscribe)
+    return queue, sub
+
+
+def _stored_events() -> list[JobEvent]:
+    return [JobEvent(job_id="job-1", event_type=t, seq=i) for i, t in enumerate(["log", "done"])]
+
+
+async def test_replay_stops_at_last_sequence() -> None:
+    queue, sub = _stored_queue(_stored_events())
+
+    start = time.monotonic()
+    events = await queue.get_events("job-1")
+
+    assert [e.event_type for e in events] == ["log", "done"]
+    assert time.monotonic() - start < 0.5
+    assert queue._js.subscribe.call_args.kwargs["ordered_consumer"] is True
+    sub.unsubscribe.assert_awaited_once()
+
+
+async def test_concurrent_replays_of_a_job_share_one_read() -> None:
+    queue, _ = _stored_queue(_stored_events())
+
+    results = await asyncio.gather(*(queue.get_events("job-1") for _ in range(5)))
+
+    assert all(len(events) == 2 for events in results)
+    queue._js.subscribe.assert_awaited_once()
+    await queue.get_events("job-1")
+    queue._js.get_last_msg.assert_awaited_once()
+
+
+async def test_replay_of_job_without_events() -> None:
+    import nats.js.errors
+
+    queue = _make_queue()
+    queue._js.get_last_msg = AsyncMock(side_effect=nats.js.errors.NotFoundError)
+    queue._js.subscribe = AsyncMock()
+
+    assert await queue.get_events("job-1") == []
+    queue._js.subscribe.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Pipelined publishing
+# ---------------------------------------------------------------------------
+
+
+async def test_async_publish_acknowledges_everything_before_terminal_event() -> None:
+    queue = NatsJobQueue(
+        nats_url="nats://test",
+        agent_name="test-agent",
+        async_publish=True,
+        coalesce_event_types={"text"},
+    )
+    queue._js = MagicMock()
+    acked: list[JobEvent] = []
+
+    async def publish(subject: str, payload: bytes) -> None:
+        await asyncio.sleep(0.01)
+        if subject.startswith("dcaf.jobs.out."):
+            acked.append(JobEvent.model_validate_json(payload))
+
+    queue._js.publish = publish
+    await _enqueue(queue)
+    for token in ("Hel", "lo"):
+        await queue.emit_event(JobEvent(job_id="job-1", event_type="text", message=token))
+    await queue.emit_event(_event("done"))
+
+    assert [(e.event_type, e.message, e.seq) for e in acked] == [
+        ("text", "Hello", 0),
+        ("done", None, 1),
+    ]
+    assert [e.seq for e in await queue.get_events("job-1")] == [0, 1]
+    assert queue.publish_stats()["pending"] == 0
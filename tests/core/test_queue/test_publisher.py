@@ -0,0 +1,179 @@
+"""Tests for pipelined publishing and event coalescing (NATS mocked)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+from dcaf.core.queue.channel import AgentChannel, AgentEvent
+from dcaf.core.queue.publisher import EventCoalescer, PipelinedPublisher
+
+
+class _SlowJetStream:
+    """Records published payloads; each acknowledgement takes *delay* seconds."""
+
+    def __init__(self, delay: float = 0.05, fail: set[bytes] | None = None) -> None:
+        self.delay = delay
+        self.fail = fail or set()
+        self.sent: list[bytes] = []
+        self.acked: list[bytes] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def publish(self, subject: str, payload: bytes) -> None:
+        self.sent.append(payload)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if payload in self.fail:
+            raise RuntimeError("no stream")
+        self.acked.append(payload)
+
+
+# ---------------------------------------------------------------------------
+# PipelinedPublisher
+# ---------------------------------------------------------------------------
+
+
+async def test_pipelined_publishes_do_not_wait_for_acks() -> None:
+    js = _SlowJetStream(delay=0.05)
+    publisher = PipelinedPublisher(js.publish, pipelined=True, max_pending=20)
+
+    start = time.monotonic()
+    for i in range(10):
+        await publisher.submit("s", b"%d" % i)
+    submitted = time.monotonic() - start
+    await publisher.flush()
+
+    assert submitted < 0.05
+    assert js.sent == [b"%d" % i for i in range(10)]
+    assert publisher.stats()["published"] == 10
+    assert publisher.stats()["pending"] == 0
+
+
+async def test_pending_publishes_are_bounded() -> None:
+    js = _SlowJetStream(delay=0.01)
+    publisher = PipelinedPublisher(js.publish, pipelined=True, max_pending=3)
+
+    for i in range(10):
+        await publisher.submit("s", b"%d" % i)
+    await publisher.flush()
+
+    assert js.peak == 3
+    assert publisher.stats()["peak_pending"] == 3
+
+
+async def test_failed_publish_is_counted_not_raised(caplog) -> None:
+    js = _SlowJetStream(delay=0.0, fail={b"bad"})
+    publisher = PipelinedPublisher(js.publish, pipelined=True, name="test")
+
+    await publisher.submit("s", b"bad")
+    await publisher.submit("s", b"good")
+    await publisher.flush()
+
+    assert publisher.stats()["failed"] == 1
+    assert publisher.stats()["published"] == 1
+    assert "test: NATS publish to s failed" in caplog.text
+
+
+async def test_default_mode_waits_for_each_ack() -> None:
+    js = _SlowJetStream(delay=0.01)
+    publisher = PipelinedPublisher(js.publish)
+
+    await publisher.submit("s", b"1")
+
+    assert js.acked == [b"1"]
+
+
+# ---------------------------------------------------------------------------
+# EventCoalescer
+# ---------------------------------------------------------------------------
+
+
+def _agent_event(event_type: str, message: str = "", **data: str) -> AgentEvent:
+    return AgentEvent(thread_id="t-1", event_type=event_type, message=message, data=data or None)
+
+
+async def test_consecutive_text_events_are_merged() -> None:
+    released: list[AgentEvent] = []
+
+    async def release(event: AgentEvent) -> None:
+        released.append(event)
+
+    coalescer = EventCoalescer(release, {"text"}, window=10)
+    for event in (
+        _agent_event("text", "Hel"),
+        _agent_event("text", "lo"),
+        _agent_event("status", status="running"),
+        _agent_event("text", "!"),
+    ):
+        await coalescer.add("t-1", event)
+    await coalescer.flush()
+
+    assert [(e.event_type, e.message) for e in released] == [
+        ("text", "Hello"),
+        ("status", ""),
+        ("text", "!"),
+    ]
+    assert coalescer.coalesced == 1
+
+
+async def test_held_event_released_after_window() -> None:
+    released: list[AgentEvent] = []
+
+    async def release(event: AgentEvent) -> None:
+        released.append(event)
+
+    coalescer = EventCoalescer(release, {"text"}, window=0.01)
+    await coalescer.add("t-1", _agent_event("text", "partial"))
+    assert released == []
+
+    await asyncio.sleep(0.05)
+
+    assert [e.message for e in released] == ["partial"]
+
+
+async def test_keys_are_released_independently() -> None:
+    async def release(event: AgentEvent) -> None:
+        await asyncio.sleep(0.05)  # a publish waiting for its acknowledgement
+
+    coalescer = EventCoalescer(release, {"text"})
+
+    start = time.monotonic()
+    await asyncio.gather(
+        coalescer.add("t-1", _agent_event("status")),
+        coalescer.add("t-2", _agent_event("status")),
+    )
+
+    assert time.monotonic() - start < 0.09
+    assert coalescer._locks == {}
+
+
+# ---------------------------------------------------------------------------
+# AgentChannel.emit
+# ---------------------------------------------------------------------------
+
+
+async def test_channel_flushes_before_completing() -> None:
+    js = _SlowJetStream(delay=0.02)
+    channel = AgentChannel("test-agent", async_publish=True, coalesce_event_types={"text"})
+    channel._js = MagicMock()
+    channel._js.publish = js.publish
+
+    for token in ("a", "b", "c"):
+        await channel.emit("t-1", "text", message=token)
+    await channel.emit("t-1", "log", message="step done")
+    await channel.emit("t-1", "complete", data={"pr_url": "..."})
+
+    events = [json.loads(payload) for payload in js.acked]
+    assert [(e["event_type"], e["message"], e["seq"]) for e in events] == [
+        ("text", "abc", 0),
+        ("log", "step done", 1),
+        ("complete", "", 2),
+    ]
+    assert channel.publish_stats()["coalesced"] == 2
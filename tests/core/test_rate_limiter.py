@@ -0,0 +1,234 @@
+"""Tests for the process-wide LLM rate limiter."""
+
+import asyncio
+import copy
+import time
+
+import pytest
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+from dcaf.core.adapters.outbound.agno.model_factory import AgnoModelFactory, ModelConfig
+from dcaf.core.adapters.outbound.agno.rate_limit import apply_rate_limiter
+from dcaf.core.infrastructure.rate_limiter import RateLimiter, RateLimiterRegistry
+
+# 6000 tokens/min = 100 tokens/s
+
+
+class TestRateLimiter:
+    async def test_no_wait_within_budget(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+
+        reservation = await limiter.acquire(1000)
+
+        assert reservation.wait_seconds == 0
+
+    async def test_waits_when_budget_spent(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire(6000)
+
+        start = time.monotonic()
+        await limiter.acquire(10)
+
+        assert time.monotonic() - start >= 0.08
+
+    async def test_settle_returns_unused_tokens(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        reservation = await limiter.acquire(6000)
+
+        reservation.settle(100)
+
+        assert (await limiter.acquire(1000)).wait_seconds == 0
+
+    async def test_settle_charges_extra_usage(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        reservation = await limiter.acquire(100)
+
+        reservation.settle(6000)
+
+        assert (await limiter.acquire(0)).wait_seconds == 0
+        assert limiter.stats()["available_tokens"] <= 100
+
+    async def test_waiters_served_in_arrival_order(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire(6000)
+        order = []
+
+        async def call(name, tokens):
+            await limiter.acquire(tokens)
+            order.append(name)
+
+        # The small request arrives last and does not overtake the large one
+        await asyncio.gather(call("large", 10), call("small", 1))
+
+        assert order == ["large", "small"]
+
+    async def test_cancelled_waiter_returns_reservation(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire(6000)
+
+        task = asyncio.create_task(limiter.acquire(3000))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = limiter.stats()
+        assert stats["waiting"] == 0
+        assert stats["available_tokens"] >= -10
+
+    async def test_requests_per_minute(self):
+        limiter = RateLimiter(requests_per_minute=600)  # 10 requests/s
+        await asyncio.gather(*(limiter.acquire() for _ in range(600)))
+
+        reservation = await limiter.acquire()
+
+        assert reservation.wait_seconds > 0.05
+
+    async def test_oversized_request_capped(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+
+        reservation = await limiter.acquire(1_000_000)
+
+        assert reservation.tokens == 6000
+        assert reservation.wait_seconds == 0
+
+    async def test_wait_metrics(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire(6000)
+        await limiter.acquire(10)
+
+        stats = limiter.stats()
+
+        assert (stats["acquired"], stats["waited"], stats["waiting"]) == (2, 1, 0)
+        assert stats["max_wait_ms"] >= 80
+        assert stats["avg_wait_ms"] >= 40
+
+    def test_sync_acquire(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        limiter.acquire_sync(6000)
+
+        start = time.monotonic()
+        limiter.acquire_sync(10)
+
+        assert time.monotonic() - start >= 0.08
+
+    async def test_configure_does_not_refill(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+        await limiter.acquire(6000)
+
+        limiter.configure(tokens_per_minute=12000)
+
+        assert limiter.tokens_per_minute == 12000
+        assert limiter.stats()["available_tokens"] < 100
+
+    def test_copies_share_the_limiter(self):
+        limiter = RateLimiter(tokens_per_minute=6000)
+
+        assert copy.copy(limiter) is limiter
+        assert copy.deepcopy(limiter) is limiter
+
+
+class TestRateLimiterRegistry:
+    def test_one_limiter_per_model_and_region(self):
+        registry = RateLimiterRegistry()
+
+        a = registry.get("bedrock", "claude", "us-east-1", tokens_per_minute=1000)
+        b = registry.get("Bedrock", "claude", "us-east-1")
+        c = registry.get("bedrock", "claude", "us-west-2", tokens_per_minute=1000)
+
+        assert a is b
+        assert a is not c
+        assert set(registry.stats()) == {"bedrock/claude/us-east-1", "bedrock/claude/us-west-2"}
+
+    async def test_conflicting_limits_keep_the_first(self, caplog):
+        registry = RateLimiterRegistry()
+        limiter = registry.get("bedrock", "claude", tokens_per_minute=6000)
+        await limiter.acquire(6000)
+
+        for _ in range(2):
+            assert registry.get("bedrock", "claude", tokens_per_minute=9000) is limiter
+
+        assert limiter.tokens_per_minute == 6000
+        assert limiter.stats()["available_tokens"] < 100
+        assert sum("ignoring 9000 tokens/min" in r.message for r in caplog.records) == 1
+
+    def test_no_limits_no_limiter(self, monkeypatch):
+        monkeypatch.delenv("DCAF_RATE_LIMIT_TOKENS_PER_MINUTE", raising=False)
+        monkeypatch.delenv("DCAF_RATE_LIMIT_REQUESTS_PER_MINUTE", raising=False)
+
+        assert RateLimiterRegistry().get("bedrock", "claude") is None
+
+    def test_limits_from_env(self, monkeypatch):
+        monkeypatch.setenv("DCAF_RATE_LIMIT_TOKENS_PER_MINUTE", "50000")
+        monkeypatch.setenv("DCAF_RATE_LIMIT_REQUESTS_PER_MINUTE", "100")
+
+        limiter = RateLimiterRegistry().get("bedrock", "claude")
+
+        assert (limiter.tokens_per_minute, limiter.requests_per_minute) == (50000, 100)
+
+
+class _FakeModel:
+    """Stand-in for an Agno model class."""
+
+    id = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, **kwargs):
+        self.calls += 1
+        return ModelResponse(content="ok", response_usage=Metrics(total_tokens=500))
+
+    async def ainvoke_stream(self, **kwargs):
+        yield ModelResponse(content="o")
+        yield ModelResponse(content="k", response_usage=Metrics(total_tokens=500))
+
+
+def _request():
+    return {
+        "messages": [Message(role="user", content="Hello " * 100)],
+        "assistant_message": Message(role="assistant"),
+    }
+
+
+class TestRateLimitedModel:
+    async def test_reserves_estimate_and_settles_usage(self):
+        limiter = RateLimiter(tokens_per_minute=60_000)
+        model = apply_rate_limiter(_FakeModel(), limiter)
+
+        response = await model.ainvoke(**_request())
+
+        stats = limiter.stats()
+        assert response.content == "ok"
+        assert stats["tokens_reserved"] > 50
+        assert stats["tokens_used"] == 500
+
+    async def test_stream_settled_with_final_usage(self):
+        limiter = RateLimiter(tokens_per_minute=60_000)
+        model = apply_rate_limiter(_FakeModel(), limiter)
+
+        deltas = [d async for d in model.ainvoke_stream(**_request())]
+
+        assert [d.content for d in deltas] == ["o", "k"]
+        assert limiter.stats()["tokens_used"] == 500
+
+    def test_class_name_kept_and_copies_share_limiter(self):
+        limiter = RateLimiter(tokens_per_minute=60_000)
+        model = apply_rate_limiter(_FakeModel(), limiter)
+
+        assert type(model).__name__ == "_FakeModel"
+        assert isinstance(model, _FakeModel)
+        assert apply_rate_limiter(model, limiter).__class__ is type(model)
+        assert copy.deepcopy(model).rate_limiter is limiter
+
+    async def test_factory_attaches_shared_limiter(self):
+        config = ModelConfig(model_id="claude-test", provider="anthropic", tokens_per_minute=1000)
+
+        first = await AgnoModelFactory(config).create_model()
+        second = await AgnoModelFactory(config).create_model()
+
+        assert type(first).__name__ == "Claude"
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter.tokens_per_minute == 1000
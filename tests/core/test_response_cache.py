@@ -0,0 +1,218 @@
+"""Tests for the deterministic response cache."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dcaf.core import create_app
+from dcaf.core.infrastructure.response_cache import (
+    ResponseCache,
+    cache_mode,
+    cache_mode_from_headers,
+    current_cache_mode,
+)
+
+
+class TestResponseCache:
+    def test_returns_copies(self):
+        cache = ResponseCache()
+        value = {"text": "4"}
+        cache.set("k", value)
+
+        hit = cache.get("k")
+        hit["text"] = "changed"
+
+        assert hit is not value
+        assert cache.get("k") == {"text": "4"}
+
+    def test_least_recently_used_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        cache = ResponseCache(ttl_seconds=0.01)
+        cache.set("k", 1)
+        time.sleep(0.02)
+
+        assert cache.get("k") is None
+
+    def test_scopes_are_separate(self):
+        cache = ResponseCache()
+        cache.set("k", "tenant-a answer", scope="tenant-a")
+
+        assert cache.get("k", scope="tenant-b") is None
+        assert cache.get("k") is None
+
+    def test_invalidate_scope(self):
+        cache = ResponseCache()
+        cache.set("k", 1, scope="tenant-a")
+        cache.set("k", 2, scope="tenant-b")
+
+        cache.invalidate("tenant-a")
+
+        assert (cache.get("k", scope="tenant-a"), cache.get("k", scope="tenant-b")) == (None, 2)
+
+    def test_unpicklable_value_not_stored(self):
+        cache = ResponseCache()
+        cache.set("k", threading.Lock())
+
+        assert cache.get("k") is None
+
+    def test_cacheable_temperature(self):
+        cache = ResponseCache(max_temperature=0.1)
+
+        assert cache.cacheable(0.0)
+        assert cache.cacheable(0.1)
+        assert not cache.cacheable(0.7)
+
+    def test_stats(self):
+        cache = ResponseCache()
+        cache.set("k", 1)
+        cache.get("k")
+        cache.get("other")
+
+        stats = cache.stats()
+
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+        assert stats["hit_ratio"] == 0.5
+
+
+class TestSqliteTier:
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = ResponseCache(path=path)
+        first.set("k", {"text": "4"}, scope="tenant-a")
+        first.close()
+
+        second = ResponseCache(path=path)
+
+        assert second.get("k", scope="tenant-a") == {"text": "4"}
+        assert second.get("k", scope="tenant-a") == {"text": "4"}
+        assert (second.stats()["disk_hits"], second.stats()["memory_hits"]) == (1, 1)
+
+    def test_invalidate_reaches_disk(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = ResponseCache(path=path)
+        cache.set("k", 1, scope="tenant-a")
+
+        cache.invalidate("tenant-a")
+
+        assert ResponseCache(path=path).get("k", scope="tenant-a") is None
+
+    def test_expired_rows_ignored(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        ResponseCache(path=path, ttl_seconds=0.01).set("k", 1)
+        time.sleep(0.02)
+
+        assert ResponseCache(path=path).get("k") is None
+
+    async def test_async_access_uses_worker_thread(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "cache.db")
+        first = ResponseCache(path=path)
+        await first.aset("k", {"text": "4"})
+        first.close()
+        second = ResponseCache(path=path)
+        threads = []
+        load = second._load
+        monkeypatch.setattr(
+            second, "_load", lambda *args: threads.append(threading.get_ident()) or load(*args)
+        )
+
+        assert await second.aget("k") == {"text": "4"}
+        assert await second.aget("k") == {"text": "4"}
+        assert threads and threading.get_ident() not in threads
+        assert (second.stats()["disk_hits"], second.stats()["memory_hits"]) == (1, 1)
+
+    async def test_memory_hits_do_not_wait_for_disk(self, tmp_path, monkeypatch):
+        cache = ResponseCache(path=str(tmp_path / "cache.db"))
+        cache.set("k", 1)
+        execute = cache._execute
+        monkeypatch.setattr(cache, "_execute", lambda *args: time.sleep(0.3) or execute(*args))
+
+        write = asyncio.create_task(cache.aset("other", 2))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+
+        assert await cache.aget("k") == 1
+        assert time.monotonic() - started < 0.1
+        await write
+
+    async def test_ainvalidate_reaches_disk(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = ResponseCache(path=path)
+        await cache.aset("k", 1, scope="tenant-a")
+
+        await cache.ainvalidate("tenant-a")
+
+        assert cache.get("k", scope="tenant-a") is None
+        assert ResponseCache(path=path).get("k", scope="tenant-a") is None
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        cache = ResponseCache(path=str(tmp_path / "missing" / "cache.db"))
+        cache.set("k", 1)
+
+        assert cache.get("k") == 1
+
+
+class TestCacheMode:
+    def test_refresh_skips_lookup_but_stores(self):
+        cache = ResponseCache()
+        cache.set("k", "old")
+
+        with cache_mode("refresh"):
+            assert cache.get("k") is None
+            cache.set("k", "new")
+
+        assert cache.get("k") == "new"
+        assert cache.stats()["bypassed"] == 1
+
+    def test_bypass_skips_lookup_and_store(self):
+        cache = ResponseCache()
+
+        with cache_mode("bypass"):
+            cache.set("k", "value")
+
+        assert cache.get("k") is None
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError), cache_mode("sometimes"):
+            pass
+
+    @pytest.mark.parametrize(
+        ("headers", "mode"),
+        [
+            ({}, "use"),
+            ({"X-DCAF-Cache": "bypass"}, "bypass"),
+            ({"x-dcaf-cache": "Refresh"}, "refresh"),
+            ({"Cache-Control": "no-cache"}, "refresh"),
+            ({"Cache-Control": "max-age=0, no-store"}, "bypass"),
+            ({"X-DCAF-Cache": "use", "Cache-Control": "no-store"}, "use"),
+        ],
+    )
+    def test_mode_from_headers(self, headers, mode):
+        assert cache_mode_from_headers(headers) == mode
+
+    def test_server_applies_request_headers(self):
+        seen = []
+
+        def handler(messages, context):
+            seen.append(current_cache_mode())
+            return "ok"
+
+        client = TestClient(create_app(handler))
+        body = {"messages": [{"role": "user", "content": "hi"}]}
+
+        client.post("/api/chat", json=body)
+        client.post("/api/chat", json=body, headers={"X-DCAF-Cache": "bypass"})
+        client.post("/api/chat-stream", json=body, headers={"Cache-Control": "no-cache"})
+
+        assert seen == ["use", "bypass", "refresh"]
@@ -0,0 +1,64 @@
+"""Tests for classifying model errors as transient or not."""
+
+import pytest
+from agno.exceptions import ModelProviderError, ModelRateLimitError
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+from dcaf.core.infrastructure.retry import is_retryable
+
+
+def _client_error(code, status):
+    return ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "Converse",
+    )
+
+
+def _wrapped(cause):
+    try:
+        raise ModelProviderError(str(cause)) from cause
+    except ModelProviderError as e:
+        return e
+
+
+class TestIsRetryable:
+    @pytest.mark.parametrize(
+        "code, status",
+        [
+            ("ThrottlingException", 429),
+            ("ServiceUnavailableException", 503),
+            ("ModelTimeoutException", 408),
+            ("InternalServerException", 500),
+            ("SomethingNew", 502),
+        ],
+    )
+    def test_transient_client_errors(self, code, status):
+        assert is_retryable(_client_error(code, status))
+        assert is_retryable(_wrapped(_client_error(code, status)))
+
+    @pytest.mark.parametrize(
+        "code, status",
+        [
+            ("ValidationException", 400),
+            ("AccessDeniedException", 403),
+            ("ResourceNotFoundException", 404),
+        ],
+    )
+    def test_request_errors(self, code, status):
+        assert not is_retryable(_client_error(code, status))
+        # The wrapper's generic 502 does not count
+        assert not is_retryable(_wrapped(_client_error(code, status)))
+
+    def test_timeouts_and_connection_errors(self):
+        assert is_retryable(TimeoutError())
+        assert is_retryable(ConnectionResetError())
+        assert is_retryable(EndpointConnectionError(endpoint_url="https://bedrock"))
+        assert is_retryable(_wrapped(ReadTimeoutError(endpoint_url="https://bedrock")))
+
+    def test_status_codes_without_cause(self):
+        assert is_retryable(ModelRateLimitError("slow down"))
+        assert not is_retryable(ModelProviderError("bad request", status_code=400))
+
+    def test_programming_errors(self):
+        assert not is_retryable(TypeError("unexpected keyword"))
+        assert not is_retryable(_wrapped(ValueError("bad image")))
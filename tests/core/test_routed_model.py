@@ -0,0 +1,341 @@
+"""Tests for failover and hedged model routing (with fake models)."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from botocore.exceptions import ClientError
+
+from dcaf.core.adapters.outbound.agno.model_factory import ModelConfig
+from dcaf.core.adapters.outbound.agno.routed_model import (
+    CircuitBreaker,
+    ModelRouter,
+    RoutedModelFactory,
+    RouteTarget,
+    RoutingPolicy,
+    route_model,
+)
+from dcaf.core.llm import LLM
+
+
+class FakeModel:
+    """Model stand-in with a configurable delay and failure."""
+
+    def __init__(self, name, delay=0.0, error=None):
+        self.id = name
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error:
+            raise self.error
+        return ModelResponse(content=self.name)
+
+    async def ainvoke_stream(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        for part in (self.name, "!"):
+            yield ModelResponse(content=part)
+
+    def invoke(self, **kwargs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return ModelResponse(content=self.name)
+
+
+def _bedrock_error(code, status):
+    """An error as Agno raises it for a failed Bedrock call."""
+    error = ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "Converse",
+    )
+    try:
+        raise ModelProviderError(str(error.response)) from error
+    except ModelProviderError as e:
+        return e
+
+
+def _router(*models, **policy):
+    policy = RoutingPolicy(**policy)
+    return ModelRouter([RouteTarget(m.name, m, policy) for m in models], policy)
+
+
+def _request():
+    return {
+        "messages": [Message(role="user", content="hi")],
+        "assistant_message": Message(role="assistant"),
+    }
+
+
+class TestFailover:
+    async def test_uses_first_target(self):
+        east, west = FakeModel("east"), FakeModel("west")
+
+        response = await _router(east, west).ainvoke(**_request())
+
+        assert response.content == "east"
+        assert west.calls == 0
+
+    async def test_fails_over_to_next_target(self):
+        east = FakeModel("east", error=_bedrock_error("ThrottlingException", 429))
+        west = FakeModel("west")
+        router = _router(east, west)
+
+        response = await router.ainvoke(**_request())
+
+        assert response.content == "west"
+        assert router.stats()["east"]["failures"] == 1
+
+    async def test_all_targets_failing_raises_last_error(self):
+        router = _router(
+            FakeModel("east", error=ConnectionError("east down")),
+            FakeModel("west", error=ConnectionError("west down")),
+        )
+
+        with pytest.raises(ConnectionError, match="west down"):
+            await router.ainvoke(**_request())
+
+    async def test_validation_error_neither_fails_over_nor_opens_breaker(self):
+        east = FakeModel("east", error=_bedrock_error("ValidationException", 400))
+        west = FakeModel("west")
+        router = _router(east, west, failure_threshold=1)
+
+        for _ in range(3):
+            with pytest.raises(ModelProviderError):
+                await router.ainvoke(**_request())
+        with pytest.raises(ModelProviderError):
+            [c async for c in router.ainvoke_stream(**_request())]
+        with pytest.raises(ModelProviderError):
+            router.invoke(**_request())
+
+        assert west.calls == 0
+        assert router.stats()["east"]["state"] == "closed"
+        assert router.stats()["east"]["failures"] == 0
+
+    async def test_programming_error_is_not_failed_over(self):
+        east, west = FakeModel("east", error=TypeError("bad kwarg")), FakeModel("west")
+
+        with pytest.raises(TypeError):
+            await _router(east, west).ainvoke(**_request())
+
+        assert west.calls == 0
+
+    def test_sync_invoke_fails_over(self):
+        router = _router(FakeModel("east", error=ConnectionError("down")), FakeModel("west"))
+
+        assert router.invoke(**_request()).content == "west"
+
+    async def test_stream_fails_over_before_first_chunk(self):
+        router = _router(FakeModel("east", error=ConnectionError("down")), FakeModel("west"))
+
+        chunks = [c.content async for c in router.ainvoke_stream(**_request())]
+
+        assert chunks == ["west", "!"]
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=30)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.available()
+
+    def test_half_open_after_cooldown(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == "half_open"
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_success_closes(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0.0)
+        breaker.record_failure()
+
+        breaker.record_success()
+
+        assert breaker.state == "closed"
+
+    async def test_open_target_skipped(self):
+        east, west = FakeModel("east", error=ConnectionError("down")), FakeModel("west")
+        router = _router(east, west, failure_threshold=2)
+
+        for _ in range(3):
+            await router.ainvoke(**_request())
+
+        assert east.calls == 2
+        assert router.stats()["east"]["state"] == "open"
+
+    async def test_all_open_still_tries(self):
+        east = FakeModel("east", error=ConnectionError("down"))
+        router = _router(east, failure_threshold=1)
+        with pytest.raises(ConnectionError):
+            await router.ainvoke(**_request())
+
+        east.error = None
+        response = await router.ainvoke(**_request())
+
+        assert response.content == "east"
+
+
+class TestHedging:
+    async def test_slow_target_hedged(self):
+        east, west = FakeModel("east", delay=1.0), FakeModel("west", delay=0.01)
+        router = _router(east, west, hedge=True, hedge_max_delay=0.05)
+
+        start = time.monotonic()
+        response = await router.ainvoke(**_request())
+
+        assert response.content == "west"
+        assert time.monotonic() - start < 0.5
+        assert east.cancelled == 1
+        assert router.stats()["west"]["hedge_wins"] == 1
+
+    async def test_fast_target_not_hedged(self):
+        east, west = FakeModel("east", delay=0.01), FakeModel("west")
+        router = _router(east, west, hedge=True, hedge_max_delay=0.2)
+
+        await router.ainvoke(**_request())
+
+        assert west.calls == 0
+
+    async def test_no_hedging_by_default(self):
+        east, west = FakeModel("east", delay=0.2), FakeModel("west")
+
+        response = await _router(east, west, hedge_max_delay=0.01).ainvoke(**_request())
+
+        assert response.content == "east"
+        assert west.calls == 0
+
+    async def test_delay_follows_latency_percentile(self):
+        policy = RoutingPolicy(hedge_min_delay=0.01, min_samples=10, hedge_percentile=0.9)
+        target = RouteTarget("east", FakeModel("east"), policy)
+        # Without latency history the longest delay is used
+        assert target.hedge_delay(policy) == policy.hedge_max_delay
+
+        for i in range(1, 11):
+            target.record_success(i / 10)
+
+        assert target.hedge_delay(policy) == pytest.approx(1.0)
+
+    async def test_stream_hedged_on_first_token(self):
+        east, west = FakeModel("east", delay=1.0), FakeModel("west", delay=0.01)
+        router = _router(east, west, hedge=True, hedge_max_delay=0.05)
+
+        chunks = [c.content async for c in router.ainvoke_stream(**_request())]
+
+        assert chunks == ["west", "!"]
+
+    async def test_hedge_gets_own_assistant_message(self):
+        seen = []
+
+        class Recording(FakeModel):
+            async def ainvoke(self, **kwargs):
+                seen.append(kwargs["assistant_message"])
+                return await super().ainvoke(**kwargs)
+
+        router = _router(
+            Recording("east", delay=0.5), Recording("west"), hedge=True, hedge_max_delay=0.01
+        )
+        await router.ainvoke(**_request())
+
+        assert seen[0] is not seen[1]
+
+
+class TestRoutedModel:
+    async def test_routed_model_sends_requests_through_router(self):
+        east, west = FakeModel("east", error=ConnectionError("down")), FakeModel("west")
+        model = route_model(_router(east, west))
+
+        response = await model.ainvoke(**_request())
+
+        assert response.content == "west"
+        assert type(model).__name__ == "FakeModel"
+        assert model is not east
+
+    @patch("dcaf.core.adapters.outbound.agno.model_factory.CachingAwsBedrock")
+    @patch("dcaf.core.adapters.outbound.agno.model_factory.aioboto3")
+    async def test_llm_routes_create_one_target_per_region(self, mock_aioboto3, mock_bedrock):
+        mock_bedrock.side_effect = lambda **kw: FakeModel(kw["aws_region"])
+
+        llm = LLM(
+            provider="bedrock",
+            model="claude",
+            aws_region="us-east-1",
+            routes=[{"aws_region": "us-west-2"}],
+            gcp_metadata_manager=MagicMock(),
+        )
+        await llm.get_model()
+
+        assert isinstance(llm._model_factory, RoutedModelFactory)
+        assert list(llm.router.stats()) == [
+            "bedrock/claude/us-east-1",
+            "bedrock/claude/us-west-2",
+        ]
+
+    @patch("dcaf.core.adapters.outbound.agno.model_factory.CachingAwsBedrock")
+    @patch("dcaf.core.adapters.outbound.agno.model_factory.aioboto3")
+    async def test_llm_call_settings_reach_every_target(self, mock_aioboto3, mock_bedrock):
+        seen = []
+
+        class Configurable(FakeModel):
+            max_tokens = 4096
+            temperature = 0.7
+
+            async def ainvoke(self, **kwargs):
+                seen.append((self.name, self.max_tokens, self.temperature))
+                return await super().ainvoke(**kwargs)
+
+        targets = {
+            "us-east-1": Configurable("east", error=ConnectionError("down")),
+            "us-west-2": Configurable("west"),
+        }
+        mock_bedrock.side_effect = lambda **kw: targets[kw["aws_region"]]
+        llm = LLM(
+            provider="bedrock",
+            model="claude",
+            aws_region="us-east-1",
+            routes=[{"aws_region": "us-west-2"}],
+            gcp_metadata_manager=MagicMock(),
+        )
+
+        response = await llm.ainvoke(
+            messages=[{"role": "user", "content": "hi"}], max_tokens=10, temperature=0.0
+        )
+
+        assert response.text == "west"
+        assert seen == [("east", 10, 0.0), ("west", 10, 0.0)]
+        assert (targets["us-west-2"].max_tokens, targets["us-west-2"].temperature) == (4096, 0.7)
+
+    def test_factory_requires_configs(self):
+        with pytest.raises(ValueError):
+            RoutedModelFactory([])
+
+    def test_factory_reports_preferred_target(self):
+        factory = RoutedModelFactory(
+            [ModelConfig(model_id="gemini", provider="google", google_location="us-east5")]
+        )
+
+        assert factory.model_id == "gemini"
+        assert factory.provider == "google"
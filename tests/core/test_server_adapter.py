@@ -17,12 +17,12 @@ def _make_adapter(**kwargs):
 
 
 class TestProcessApprovedCommandsReceivesContext:
-    def test_context_is_passed_to_execute_cmd(self):
-        """_process_approved_commands must forward platform_context to _execute_cmd."""
+    async def test_context_is_passed_to_execute_cmd(self):
+        """_aprocess_approved_commands must forward platform_context to _aexecute_cmd."""
         adapter = _make_adapter()
         ctx = {"tenant_name": "acme", "kubeconfig": "/home/user/.kube/config"}
 
-        with patch.object(adapter, "_execute_cmd", return_value="ok") as mock_exec:
+        with patch.object(adapter, "_aexecute_cmd", return_value="ok") as mock_exec:
             messages = [
                 {
                     "role": "user",
@@ -30,12 +30,12 @@ class TestProcessApprovedCommandsReceivesContext:
                     "data": {"cmds": [{"command": "kubectl get pods", "execute": True}]},
                 }
             ]
-            adapter._process_approved_commands(messages, ctx)
-            mock_exec.assert_called_once_with("kubectl get pods", files=None, context=ctx)
+            await adapter._aprocess_approved_commands(messages, ctx)
+            mock_exec.assert_awaited_once_with("kubectl get pods", files=None, context=ctx)
 
-    def test_empty_context_is_forwarded(self):
+    async def test_empty_context_is_forwarded(self):
         adapter = _make_adapter()
-        with patch.object(adapter, "_execute_cmd", return_value="ok") as mock_exec:
+        with patch.object(adapter, "_aexecute_cmd", return_value="ok") as mock_exec:
             messages = [
                 {
                     "role": "user",
@@ -43,17 +43,17 @@ class TestProcessApprovedCommandsReceivesContext:
                     "data": {"cmds": [{"command": "ls", "execute": True}]},
                 }
             ]
-            adapter._process_approved_commands(messages, {})
-            mock_exec.assert_called_once_with("ls", files=None, context={})
+            await adapter._aprocess_approved_commands(messages, {})
+            mock_exec.assert_awaited_once_with("ls", files=None, context={})
 
 
 class TestProcessApprovedCommandsPassesFiles:
-    def test_files_extracted_and_passed_to_execute_cmd(self):
-        """Files in data.cmds[].files must be forwarded to _execute_cmd."""
+    async def test_files_extracted_and_passed_to_execute_cmd(self):
+        """Files in data.cmds[].files must be forwarded to _aexecute_cmd."""
         adapter = _make_adapter()
         files = [{"file_path": "values.yaml", "file_content": "replicaCount: 2"}]
 
-        with patch.object(adapter, "_execute_cmd", return_value="ok") as mock_exec:
+        with patch.object(adapter, "_aexecute_cmd", return_value="ok") as mock_exec:
             messages = [
                 {
                     "role": "user",
@@ -69,12 +69,12 @@ class TestProcessApprovedCommandsPassesFiles:
                     },
                 }
             ]
-            adapter._process_approved_commands(messages, {})
-            mock_exec.assert_called_once_with("helm install myapp .", files=files, context={})
+            await adapter._aprocess_approved_commands(messages, {})
+            mock_exec.assert_awaited_once_with("helm install myapp .", files=files, context={})
 
-    def test_no_files_passes_none(self):
+    async def test_no_files_passes_none(self):
         adapter = _make_adapter()
-        with patch.object(adapter, "_execute_cmd", return_value="ok") as mock_exec:
+        with patch.object(adapter, "_aexecute_cmd", return_value="ok") as mock_exec:
             messages = [
                 {
                     "role": "user",
@@ -82,23 +82,23 @@ class TestProcessApprovedCommandsPassesFiles:
                     "data": {"cmds": [{"command": "ls", "execute": True}]},
                 }
             ]
-            adapter._process_approved_commands(messages, {})
-            mock_exec.assert_called_once_with("ls", files=None, context={})
+            await adapter._aprocess_approved_commands(messages, {})
+            mock_exec.assert_awaited_once_with("ls", files=None, context={})
 
 
 class TestExecuteCmdWithFiles:
-    def test_files_are_written_to_tempdir(self):
-        """When files are provided, _execute_cmd writes them before running the command."""
+    async def test_files_are_written_to_tempdir(self):
+        """When files are provided, _aexecute_cmd writes them before running the command."""
         adapter = _make_adapter()
         files = [{"file_path": "hello.txt", "file_content": "world"}]
 
         # Command that reads the file we wrote
-        result = adapter._execute_cmd("cat hello.txt", files=files, context={})
+        result = await adapter._aexecute_cmd("cat hello.txt", files=files, context={})
 
         assert result.strip() == "world"
 
-    def test_tempdir_is_cleaned_up_after_execution(self):
-        """Temp directory must not persist after _execute_cmd returns."""
+    async def test_tempdir_is_cleaned_up_after_execution(self):
+        """Temp directory must not persist after _aexecute_cmd returns."""
         adapter = _make_adapter()
         captured_dirs: list[str] = []
 
@@ -111,12 +111,12 @@ class TestExecuteCmdWithFiles:
 
         files = [{"file_path": "f.txt", "file_content": "x"}]
         with patch("tempfile.mkdtemp", side_effect=recording_mkdtemp):
-            adapter._execute_cmd("echo done", files=files, context={})
+            await adapter._aexecute_cmd("echo done", files=files, context={})
 
         assert len(captured_dirs) == 1
         assert not os.path.exists(captured_dirs[0]), "Temp dir should be deleted"
 
-    def test_tempdir_cleaned_up_on_error(self):
+    async def test_tempdir_cleaned_up_on_error(self):
         """Temp directory is cleaned up even when file writing raises."""
         adapter = _make_adapter()
         captured_dirs: list[str] = []
@@ -134,21 +134,21 @@ class TestExecuteCmdWithFiles:
             # Simulate file-write failure
             patch("builtins.open", side_effect=OSError("disk full")),
         ):
-            result = adapter._execute_cmd("echo nope", files=files, context={})
+            result = await adapter._aexecute_cmd("echo nope", files=files, context={})
 
         assert "Error" in result
         assert not os.path.exists(captured_dirs[0]), "Temp dir should be deleted on error"
 
-    def test_no_files_runs_in_default_cwd(self):
+    async def test_no_files_runs_in_default_cwd(self):
         """Without files, command runs normally (no tempdir created)."""
         adapter = _make_adapter()
         with patch("tempfile.mkdtemp") as mock_mkdtemp:
-            adapter._execute_cmd("echo hello", files=None, context={})
+            await adapter._aexecute_cmd("echo hello", files=None, context={})
             mock_mkdtemp.assert_not_called()
 
 
 class TestCustomExecutorCallback:
-    def test_custom_executor_called_instead_of_subprocess(self):
+    async def test_custom_executor_called_instead_of_subprocess(self):
         """When execute_cmd is provided, it is called instead of the built-in subprocess."""
         calls: list[tuple] = []
 
@@ -162,31 +162,33 @@ class TestCustomExecutorCallback:
 
         adapter = _make_adapter(execute_cmd=my_executor)
 
-        with patch("subprocess.run") as mock_run:
-            result = adapter._execute_cmd("echo hello", files=None, context={"tenant": "acme"})
+        with patch.object(adapter._engine, "run_shell") as mock_shell:
+            result = await adapter._aexecute_cmd(
+                "echo hello", files=None, context={"tenant": "acme"}
+            )
 
         assert result == "custom output"
         assert calls == [("echo hello", None, {"tenant": "acme"})]
-        mock_run.assert_not_called()
+        mock_shell.assert_not_called()
 
-    def test_custom_executor_receives_files(self):
+    async def test_custom_executor_receives_files(self):
         files = [{"file_path": "values.yaml", "file_content": "x: 1"}]
 
         def my_executor(command, files, context):
             return f"got {len(files)} file(s)"
 
         adapter = _make_adapter(execute_cmd=my_executor)
-        result = adapter._execute_cmd("helm install .", files=files, context={})
+        result = await adapter._aexecute_cmd("helm install .", files=files, context={})
         assert result == "got 1 file(s)"
 
-    def test_no_executor_uses_default_subprocess(self):
+    async def test_no_executor_uses_default_subprocess(self):
         """Without a custom executor, the built-in subprocess path is used."""
         adapter = _make_adapter()  # no execute_cmd kwarg
-        result = adapter._execute_cmd("echo default", files=None, context={})
+        result = await adapter._aexecute_cmd("echo default", files=None, context={})
         assert "default" in result
 
-    def test_custom_executor_wires_through_process_approved_commands(self):
-        """Custom executor is called end-to-end from _process_approved_commands."""
+    async def test_custom_executor_wires_through_process_approved_commands(self):
+        """Custom executor is called end-to-end from _aprocess_approved_commands."""
         calls: list[str] = []
 
         def my_executor(command, files, context):
@@ -201,7 +203,7 @@ class TestCustomExecutorCallback:
                 "data": {"cmds": [{"command": "kubectl get pods", "execute": True}]},
             }
         ]
-        results = adapter._process_approved_commands(messages, {})
+        results = await adapter._aprocess_approved_commands(messages, {})
         assert calls == ["kubectl get pods"]
         assert results[0].output == "custom result"
 
@@ -317,7 +319,7 @@ class TestInvokeStreamEmitsApprovalsEvent:
 
 
 class TestThreadIdFlowsThroughContext:
-    def test_thread_id_in_platform_context_reaches_custom_executor(self):
+    async def test_thread_id_in_platform_context_reaches_custom_executor(self):
         """thread_id placed in platform_context flows to the custom executor via context."""
         received: list[dict] = []
 
@@ -335,6 +337,127 @@ class TestThreadIdFlowsThroughContext:
             }
         ]
         ctx = adapter._extract_platform_context(messages)
-        adapter._process_approved_commands(messages, ctx)
+        await adapter._aprocess_approved_commands(messages, ctx)
 
         assert received[0].get("thread_id") == "thread-abc"
+
+
+class TestConvertMessagesCompactsHistory:
+    def _messages(self, turns: int, output: str) -> list[dict]:
+        messages = []
+        for i in range(turns):
+            messages.append(
+                {
+                    "role": "user",
+                    "content": f"question {i}",
+                    "data": {
+                        "executed_cmds": [
+                            {"command": f"kubectl get pods -n ns{i}", "output": output}
+                        ]
+                    },
+                }
+            )
+            messages.append({"role": "assistant", "content": f"answer {i}"})
+        return messages
+
+    def test_history_format_preserved(self):
+        adapter = _make_adapter()
+
+        core = adapter._convert_messages(self._messages(1, "pod-a Running"))
+
+        assert core[0]["content"] == (
+            "question 0\n\nPreviously executed: kubectl get pods -n ns0\nOutput: pod-a Running"
+        )
+
+    def test_repeated_output_is_not_resent(self):
+        adapter = _make_adapter()
+        output = "NAME READY STATUS\n" + "pod Running\n" * 50
+
+        core = adapter._convert_messages(self._messages(3, output))
+
+        assert output in core[4]["content"]
+        assert output not in core[0]["content"]
+        assert "kubectl get pods -n ns0" in core[0]["content"]
+
+    def test_total_output_bounded(self):
+        from dcaf.core.adapters.inbound import HistoryCompactor
+
+        adapter = _make_adapter(
+            history_compactor=HistoryCompactor(max_output_bytes=2_000, max_total_bytes=10_000)
+        )
+        messages = self._messages(30, "")
+        for i, msg in enumerate(messages[::2]):
+            msg["data"]["executed_cmds"][0]["output"] = f"turn {i} " + "x" * 50_000
+
+        core = adapter._convert_messages(messages)
+
+        total = sum(len(m["content"]) for m in core)
+        assert total < 15_000
+        # The newest output survives as an excerpt, the oldest is omitted
+        assert "turn 29" in core[-2]["content"]
+        assert "[output omitted" in core[0]["content"]
+
+
+class TestInvokeExecutesApprovalsConcurrently:
+    async def test_approved_commands_run_concurrently_in_order(self):
+        """Approved commands run in parallel off the event loop; results keep their order."""
+        import time
+
+        from dcaf.core.adapters.inbound import ExecutionEngine
+
+        def slow_executor(command, files, context):
+            time.sleep(0.3)
+            return f"ran {command}"
+
+        agent = _make_agent_that_streams(DoneEvent())
+        adapter = ServerAdapter(
+            agent, execute_cmd=slow_executor, execution_engine=ExecutionEngine(max_concurrency=4)
+        )
+        cmds = [{"command": f"cmd{i}", "execute": True} for i in range(4)]
+        messages = {"messages": [{"role": "user", "content": "go", "data": {"cmds": cmds}}]}
+
+        start = time.monotonic()
+        events = [e async for e in adapter.invoke_stream(messages)]
+        elapsed = time.monotonic() - start
+
+        executed = next(e for e in events if e.type == "executed_commands")
+        assert [c.output for c in executed.executed_cmds] == [f"ran cmd{i}" for i in range(4)]
+        assert elapsed < 1.0
+
+    async def test_approvals_run_in_request_order_by_default(self, tmp_path):
+        """A command can depend on the one approved before it."""
+        agent = _make_agent_that_streams(DoneEvent())
+        adapter = ServerAdapter(agent)
+        target = tmp_path / "out.txt"
+        cmds = [
+            {"command": f"sleep 0.1; echo first > {target}", "execute": True},
+            {"command": f"cat {target}", "execute": True},
+        ]
+        messages = {"messages": [{"role": "user", "content": "go", "data": {"cmds": cmds}}]}
+
+        events = [e async for e in adapter.invoke_stream(messages)]
+
+        executed = next(e for e in events if e.type == "executed_commands")
+        assert executed.executed_cmds[1].output.startswith("first")
+
+    async def test_executor_output_coerced_to_text(self):
+        adapter = _make_adapter(execute_cmd=MagicMock(return_value=None))
+
+        assert await adapter._aexecute_cmd("noop", files=None, context={}) == ""
+
+    async def test_default_path_runs_command_asynchronously(self):
+        adapter = _make_adapter()
+
+        result = await adapter._aexecute_cmd("echo async; echo oops >&2", files=None, context={})
+
+        assert result == "async\n\n\nErrors:\noops\n"
+
+    async def test_timed_out_command_reports_error(self):
+        from dcaf.core.adapters.inbound import ExecutionEngine
+
+        adapter = _make_adapter(execution_engine=ExecutionEngine(timeout=0.1))
+
+        result = await adapter._aexecute_cmd("sleep 5", files=None, context={})
+
+        assert result.startswith("Error executing command:")
+        assert "timed out" in result
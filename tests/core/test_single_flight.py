@@ -0,0 +1,147 @@
+"""Tests for single-flight coalescing of identical in-flight calls."""
+
+import asyncio
+
+import pytest
+
+from dcaf.core.infrastructure.single_flight import SingleFlight, request_key
+
+
+class TestRequestKey:
+    def test_dict_key_order_ignored(self):
+        assert request_key({"a": 1, "b": 2}) == request_key({"b": 2, "a": 1})
+
+    def test_different_parts_differ(self):
+        assert request_key("hello", None) != request_key("hello", "system")
+
+
+class TestRun:
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return object()
+
+        results = await asyncio.gather(*(flight.run("k", work) for _ in range(3)))
+
+        assert calls == 1
+        assert results[0] is results[1] is results[2]
+        assert flight.stats() == {
+            "calls": 3,
+            "executions": 1,
+            "coalesced": 2,
+            "coalesce_ratio": pytest.approx(2 / 3),
+            "in_flight": 0,
+        }
+
+    async def test_sequential_calls_not_cached(self):
+        flight = SingleFlight()
+
+        async def work():
+            return object()
+
+        assert await flight.run("k", work) is not await flight.run("k", work)
+
+    async def test_exception_raised_to_every_caller(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("throttled")
+
+        results = await asyncio.gather(
+            flight.run("k", work), flight.run("k", work), return_exceptions=True
+        )
+
+        assert [str(r) for r in results] == ["throttled", "throttled"]
+
+    async def test_cancelling_one_caller_keeps_execution(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.create_task(flight.run("k", work))
+        second = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+
+    async def test_cancelling_last_caller_cancels_execution(self):
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+
+class TestStream:
+    async def test_late_joiner_receives_all_events(self):
+        flight = SingleFlight()
+        executions = 0
+
+        async def events():
+            nonlocal executions
+            executions += 1
+            for i in range(3):
+                await asyncio.sleep(0.01)
+                yield i
+
+        async def consume(delay):
+            await asyncio.sleep(delay)
+            return [e async for e in flight.stream("k", events)]
+
+        first, late = await asyncio.gather(consume(0), consume(0.015))
+
+        assert first == late == [0, 1, 2]
+        assert executions == 1
+
+    async def test_error_raised_to_subscribers(self):
+        flight = SingleFlight()
+
+        async def events():
+            yield 1
+            raise RuntimeError("stream broke")
+
+        received = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for event in flight.stream("k", events):
+                received.append(event)
+
+        assert received == [1]
+
+    async def test_last_subscriber_leaving_stops_stream(self):
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def events():
+            try:
+                yield 1
+                await asyncio.sleep(1)
+                yield 2
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        stream = flight.stream("k", events)
+        assert await anext(stream) == 1
+        await stream.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert flight.stats()["in_flight"] == 0
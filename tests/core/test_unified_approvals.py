@@ -237,7 +237,7 @@ def _make_mock_agent_with_tool(tool_name: str, tool_result: str):
 
 
 class TestProcessApprovals:
-    def test_approved_approval_executes_tool(self):
+    async def test_approved_approval_executes_tool(self):
         agent, tool = _make_mock_agent_with_tool("list_pods", "pod1\npod2")
         adapter = ServerAdapter(agent)
 
@@ -259,7 +259,7 @@ class TestProcessApprovals:
             }
         ]
 
-        result = adapter._process_approvals(messages_list, {})
+        result = await adapter._aprocess_approvals(messages_list, {})
 
         assert len(result) == 1
         assert result[0].id == "ap-1"
@@ -268,7 +268,7 @@ class TestProcessApprovals:
         assert result[0].output == "pod1\npod2"
         tool.execute.assert_called_once_with({"namespace": "default"}, {})
 
-    def test_rejected_approval_does_not_execute(self):
+    async def test_rejected_approval_does_not_execute(self):
         agent, tool = _make_mock_agent_with_tool("delete_pod", "deleted")
         adapter = ServerAdapter(agent)
 
@@ -291,7 +291,7 @@ class TestProcessApprovals:
             }
         ]
 
-        result = adapter._process_approvals(messages_list, {})
+        result = await adapter._aprocess_approvals(messages_list, {})
 
         assert len(result) == 1
         assert result[0].id == "ap-2"
@@ -299,21 +299,21 @@ class TestProcessApprovals:
         assert "Too dangerous" in result[0].output
         tool.execute.assert_not_called()
 
-    def test_empty_approvals_returns_empty(self):
+    async def test_empty_approvals_returns_empty(self):
         agent, _ = _make_mock_agent_with_tool("list_pods", "pod1")
         adapter = ServerAdapter(agent)
 
-        result = adapter._process_approvals([{"role": "user", "content": "hi"}], {})
+        result = await adapter._aprocess_approvals([{"role": "user", "content": "hi"}], {})
         assert result == []
 
-    def test_no_data_returns_empty(self):
+    async def test_no_data_returns_empty(self):
         agent, _ = _make_mock_agent_with_tool("list_pods", "pod1")
         adapter = ServerAdapter(agent)
 
-        result = adapter._process_approvals([], {})
+        result = await adapter._aprocess_approvals([], {})
         assert result == []
 
-    def test_mixed_approve_reject(self):
+    async def test_mixed_approve_reject(self):
         agent = MagicMock()
         tool_a = MagicMock()
         tool_a.name = "list_pods"
@@ -349,7 +349,7 @@ class TestProcessApprovals:
             }
         ]
 
-        result = adapter._process_approvals(messages_list, {})
+        result = await adapter._aprocess_approvals(messages_list, {})
 
         assert len(result) == 2
         assert result[0].output == "pod1"
@@ -357,11 +357,11 @@ class TestProcessApprovals:
         tool_a.execute.assert_called_once()
         tool_b.execute.assert_not_called()
 
-    def test_command_type_approval(self):
+    async def test_command_type_approval(self):
         """Command-type approvals with type='command' route to subprocess, not tool registry."""
         agent, tool = _make_mock_agent_with_tool("execute_terminal_cmd", "NAME  READY\nnginx  1/1")
         adapter = ServerAdapter(agent)
-        adapter._execute_cmd = MagicMock(return_value="NAME  READY\nnginx  1/1")
+        adapter._aexecute_cmd = AsyncMock(return_value="NAME  READY\nnginx  1/1")
 
         messages_list = [
             {
@@ -381,12 +381,12 @@ class TestProcessApprovals:
             }
         ]
 
-        result = adapter._process_approvals(messages_list, {})
+        result = await adapter._aprocess_approvals(messages_list, {})
 
         assert len(result) == 1
         assert result[0].type == "command"
         assert result[0].output == "NAME  READY\nnginx  1/1"
-        adapter._execute_cmd.assert_called_once_with("kubectl get pods", files=None, context={})
+        adapter._aexecute_cmd.assert_awaited_once_with("kubectl get pods", files=None, context={})
         tool.execute.assert_not_called()
 
 
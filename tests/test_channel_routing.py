@@ -1,6 +1,6 @@
 """Tests for SlackResponseRouter decision logic."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from dcaf.channel_routing import SlackResponseRouter
 from dcaf.core.llm import LLMResponse
@@ -96,3 +96,114 @@ class TestSlackResponseRouter:
         result = router.should_agent_respond("hello")
         assert result["should_respond"] is False
         assert "Router error" in result["reasoning"]
+
+
+class TestPrefilter:
+    def _router(self, **kwargs) -> tuple[SlackResponseRouter, MagicMock]:
+        llm = MagicMock()
+        llm.invoke.return_value = _tool_response(True, "llm")
+        router = SlackResponseRouter(llm_client=llm, agent_name="TestBot", model_id="m", **kwargs)
+        return router, llm
+
+    def test_mention_responds_without_llm(self):
+        router, llm = self._router()
+
+        result = router.should_agent_respond([{"role": "user", "content": "@testbot list pods"}])
+
+        assert result["should_respond"] is True
+        llm.invoke.assert_not_called()
+
+    def test_other_agent_mention_stays_silent(self):
+        router, llm = self._router(other_agents=["Other Bot"])
+
+        result = router.should_agent_respond([{"role": "user", "content": "@OtherBot help"}])
+
+        assert result["should_respond"] is False
+        llm.invoke.assert_not_called()
+
+    def test_other_mentions_left_to_llm(self):
+        router, llm = self._router()
+
+        for content in ("@here is prod down?", "@alice can you check?", "<@U123ABC> ping"):
+            result = router.should_agent_respond([{"role": "user", "content": content}])
+            assert result["should_respond"] is True
+
+        assert llm.invoke.call_count == 3
+
+    def test_email_address_is_not_a_mention(self):
+        router, llm = self._router()
+
+        router.should_agent_respond([{"role": "user", "content": "mail ops@example.com?"}])
+
+        llm.invoke.assert_called_once()
+
+    def test_bot_authored_message_stays_silent(self):
+        router, llm = self._router()
+        thread = [
+            {"role": "user", "content": "@TestBot help"},
+            {"role": "assistant", "content": "Sure"},
+        ]
+
+        assert router.should_agent_respond(thread)["should_respond"] is False
+        llm.invoke.assert_not_called()
+
+    def test_addressed_by_name_responds(self):
+        router, llm = self._router()
+
+        result = router.should_agent_respond([{"role": "user", "content": "Hey TestBot, why?"}])
+
+        assert result["should_respond"] is True
+        llm.invoke.assert_not_called()
+
+    def test_prefilter_can_be_disabled(self):
+        llm = MagicMock()
+        llm.invoke.return_value = _tool_response(False)
+        router = SlackResponseRouter(llm_client=llm, agent_name="TestBot", prefilter=False)
+
+        router.should_agent_respond([{"role": "user", "content": "@TestBot help"}])
+
+        llm.invoke.assert_called_once()
+
+
+class TestDecisionCache:
+    THREAD = [{"role": "user", "user": {"name": "Alice"}, "content": "what is failing?"}]
+
+    def test_same_thread_asks_llm_once(self):
+        llm = MagicMock()
+        llm.invoke.return_value = _tool_response(True, "question")
+        router = SlackResponseRouter(llm_client=llm, agent_name="TestBot")
+
+        first = router.should_agent_respond(self.THREAD)
+        second = router.should_agent_respond(self.THREAD)
+
+        assert first == second
+        llm.invoke.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        llm = MagicMock()
+        llm.invoke.side_effect = [RuntimeError("throttled"), _tool_response(True)]
+        router = SlackResponseRouter(llm_client=llm, agent_name="TestBot")
+
+        assert router.should_agent_respond(self.THREAD)["should_respond"] is False
+        assert router.should_agent_respond(self.THREAD)["should_respond"] is True
+
+    async def test_async_uses_ainvoke_and_shares_cache(self):
+        llm = MagicMock()
+        llm.ainvoke = AsyncMock(return_value=_tool_response(True, "question"))
+        router = SlackResponseRouter(llm_client=llm, agent_name="TestBot")
+
+        result = await router.should_agent_respond_async(self.THREAD)
+
+        assert result == {"should_respond": True, "reasoning": "question"}
+        assert router.should_agent_respond(self.THREAD) == result
+        llm.ainvoke.assert_awaited_once()
+        llm.invoke.assert_not_called()
+
+    async def test_async_falls_back_to_sync_llm(self):
+        router = SlackResponseRouter(
+            llm_client=_FakeLLM(_tool_response(False)), agent_name="TestBot"
+        )
+
+        result = await router.should_agent_respond_async(self.THREAD)
+
+        assert result["should_respond"] is False
@@ -0,0 +1,124 @@
+"""Tests for dcaf.llm.tokens."""
+
+import pytest
+
+from dcaf.llm.bedrock import BedrockLLM
+from dcaf.llm.tokens import (
+    HeuristicTokenCounter,
+    MemoizedTokenCounter,
+    cache_min_tokens,
+    count_tokens,
+    get_token_counter,
+    set_token_counter,
+)
+
+CLAUDE = "anthropic.claude-3-7-sonnet-20250219-v1:0"
+
+
+class CountingCounter:
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text, model_id=None):
+        self.calls += 1
+        return len(text)
+
+
+@pytest.fixture
+def restore_counter():
+    yield
+    set_token_counter(None)
+
+
+class TestHeuristicTokenCounter:
+    def test_empty_text(self):
+        assert HeuristicTokenCounter().count("") == 0
+
+    def test_english_close_to_word_count(self):
+        text = "Please list the pods in the default namespace and describe the failing ones. "
+        tokens = HeuristicTokenCounter().count(text * 10, CLAUDE)
+
+        assert 130 <= tokens <= 180
+
+    def test_code_counts_more_than_chars_over_four(self):
+        code = 'def f(x):\n    return {"a": x[0], "b": [i * 2 for i in range(10)]}\n' * 10
+
+        assert HeuristicTokenCounter().count(code, CLAUDE) > len(code) // 4 * 1.5
+
+    def test_cjk_counts_about_one_token_per_character(self):
+        text = "你好我需要帮助管理我的集群" * 10
+
+        assert HeuristicTokenCounter().count(text, CLAUDE) == len(text)
+
+
+class TestMemoizedTokenCounter:
+    def test_memoizes_long_texts_by_content(self):
+        inner = CountingCounter()
+        counter = MemoizedTokenCounter(inner)
+        text = "x" * 1000
+
+        assert counter.count(text, "m") == 1000
+        assert counter.count("".join(["x"] * 1000), "m") == 1000
+        assert inner.calls == 1
+
+        counter.count(text, "other-model")
+        assert inner.calls == 2
+
+    def test_short_texts_not_memoized(self):
+        inner = CountingCounter()
+        counter = MemoizedTokenCounter(inner)
+
+        counter.count("short")
+        counter.count("short")
+
+        assert inner.calls == 2
+
+    def test_evicts_least_recently_used(self):
+        inner = CountingCounter()
+        counter = MemoizedTokenCounter(inner, maxsize=2)
+        a, b, c = ("a" * 300, "b" * 300, "c" * 300)
+
+        for text in (a, b, a, c, a, b):
+            counter.count(text)
+
+        # b was evicted by c, so it is counted twice; a stays cached
+        assert inner.calls == 4
+
+
+class TestPluggableCounter:
+    def test_set_token_counter(self, restore_counter):
+        inner = CountingCounter()
+        set_token_counter(inner, memoize=False)
+
+        assert get_token_counter() is inner
+        assert count_tokens("abc") == 3
+
+    def test_none_restores_default(self, restore_counter):
+        set_token_counter(CountingCounter())
+        set_token_counter(None)
+
+        assert count_tokens("hello world") == 2
+
+
+class TestCacheMinTokens:
+    def test_known_families(self):
+        assert cache_min_tokens(CLAUDE) == 1024
+        assert cache_min_tokens("us.anthropic.claude-haiku-4-5-20251001-v1:0") == 4096
+        assert cache_min_tokens("amazon.nova-pro-v1:0") == 1000
+
+    def test_unknown_family_uses_default(self):
+        assert cache_min_tokens("meta.llama3-70b") == 0
+        assert cache_min_tokens("meta.llama3-70b", default=1024) == 1024
+
+    def test_bedrock_llm_uses_shared_table(self):
+        llm = BedrockLLM.__new__(BedrockLLM)
+
+        assert llm._get_cache_min_tokens("anthropic.claude-3-5-haiku-20241022-v1:0") == 2048
+
+    def test_bedrock_llm_warns_when_prompt_below_minimum(self, caplog):
+        llm = BedrockLLM.__new__(BedrockLLM)
+
+        content = llm._build_system_content("Short prompt", CLAUDE, cache_system_prompt=True)
+
+        assert content[-1] == {"cachePoint": {"type": "default"}}
+        assert "below the 1024 token minimum" in caplog.text